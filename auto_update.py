@@ -6,6 +6,8 @@ import schedule
 import datetime
 import os
 
+from data_codec import write_packed
+
 def job():
     print(f"\n[Auto-Update] Starting data fetch at {datetime.datetime.now()}...")
     try:
@@ -37,6 +39,7 @@ def job():
 
         with open(file_path, "w", encoding='utf-8') as f:
             f.write(content)
+        write_packed({"SOXL": soxl_json, "QQQ": qqq_json}, "js/data_packed.js")
 
         print(f"[Auto-Update] Success! Updated js/data.js. SOXL: {len(soxl_json)} records.")
         print(f"Last Date: {soxl_json[-1]['date']}")
@@ -0,0 +1,619 @@
+
+import json
+import os
+import re
+from decimal import ROUND_HALF_UP, Decimal
+
+import numpy as np
+
+from data_codec import decode_bars
+
+# --- CONFIGURATION ---
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_JS = os.path.join(BASE_DIR, "js", "data.js")
+DATA_PACKED_JS = os.path.join(BASE_DIR, "js", "data_packed.js")
+MARKET_CACHE_DIR = os.path.join(BASE_DIR, "cache", "market")
+HISTORY_START = "2010-01-01"
+
+# Default simulation window (same span DeepMind searches over in js/deep_mind.js)
+START_DATE = "2011-03-11"
+END_DATE = "2025-12-31"
+
+RSI_PERIOD = 14
+REBALANCE_DAYS = 10
+CENT = Decimal("0.01")
+
+
+# --- DATA LOADING ---
+def load_market_data(path=None):
+    """
+    Read the bars written by update_data.py. Uses js/data_packed.js when
+    present, otherwise the plain js/data.js arrays.
+    Returns {"SOXL": bars, "QQQ": bars} where bars is a dict of numpy columns
+    ("date" as datetime64[D], "open", "high", "low", "close", "volume").
+    """
+    if path is None:
+        path = DATA_PACKED_JS if os.path.exists(DATA_PACKED_JS) else DATA_JS
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+
+    market = {}
+    for name, payload in re.findall(r"export const (\w+)_DATA = decodeBars\((\{.*?\})\);", content, re.S):
+        market[name] = decode_bars(json.loads(payload))
+
+    for name, payload in re.findall(r"export const (\w+)_DATA = (\[.*?\]);", content, re.S):
+        rows = json.loads(payload)
+        market[name] = {
+            "date": np.array([r["date"] for r in rows], dtype="datetime64[D]"),
+            "open": np.array([r["open"] for r in rows], dtype=np.float64),
+            "high": np.array([r["high"] for r in rows], dtype=np.float64),
+            "low": np.array([r["low"] for r in rows], dtype=np.float64),
+            "close": np.array([r["close"] for r in rows], dtype=np.float64),
+            "volume": np.array([r["volume"] for r in rows], dtype=np.int64),
+        }
+    return market
+
+
+def fetch_bars(ticker, start=HISTORY_START):
+    # Tickers that js/data.js does not carry (TQQQ, TECL, ...) come straight from Yahoo
+    import yfinance as yf
+
+    print(f"Fetching {ticker}...")
+    df = yf.Ticker(ticker).history(start=start, auto_adjust=False)
+    if df.empty:
+        raise ValueError(f"{ticker} returned empty dataframe")
+    return {
+        "date": np.array(df.index.strftime("%Y-%m-%d"), dtype="datetime64[D]"),
+        "close": round2(df["Close"].to_numpy(dtype=np.float64)),
+    }
+
+
+# --- MEMORY-MAPPED MARKET CACHE ---
+# cache/market/dates.npy   (n_days,) datetime64[D], union calendar of all tickers
+# cache/market/close.npy   (n_days, n_tickers) float64, NaN before a ticker lists
+# cache/market/tickers.json
+# Rows are days, so a date-ordered pass reads one contiguous row per step.
+def build_market_cache(tickers, cache_dir=MARKET_CACHE_DIR, market=None):
+    market = market if market is not None else load_market_data()
+    bars = {t: market[t] if t in market else fetch_bars(t) for t in tickers}
+    dates = np.unique(np.concatenate([b["date"] for b in bars.values()]))
+
+    close = np.full((len(dates), len(tickers)), np.nan)
+    for j, t in enumerate(tickers):
+        close[np.searchsorted(dates, bars[t]["date"]), j] = bars[t]["close"]
+
+    os.makedirs(cache_dir, exist_ok=True)
+    np.save(os.path.join(cache_dir, "dates.npy"), dates)
+    np.save(os.path.join(cache_dir, "close.npy"), close)
+    with open(os.path.join(cache_dir, "tickers.json"), "w", encoding="utf-8") as f:
+        json.dump(list(tickers), f)
+
+
+def open_market_cache(tickers=(), cache_dir=MARKET_CACHE_DIR):
+    """
+    Memory-map the price cache, (re)building it when a ticker is missing or
+    js/data*.js is newer than the cache. Returns {"dates", "close", "tickers", "col"}.
+    """
+    index_path = os.path.join(cache_dir, "tickers.json")
+    cached = []
+    if os.path.exists(index_path):
+        with open(index_path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        sources = [p for p in (DATA_PACKED_JS, DATA_JS) if os.path.exists(p)]
+        if any(os.path.getmtime(p) > os.path.getmtime(index_path) for p in sources):
+            cached = []
+
+    missing = [t for t in tickers if t not in cached]
+    if missing or not cached:
+        cached = list(dict.fromkeys(list(cached) + list(tickers) + ["SOXL", "QQQ"]))
+        build_market_cache(cached, cache_dir)
+
+    return {
+        "tickers": cached,
+        "col": {t: j for j, t in enumerate(cached)},
+        "dates": np.load(os.path.join(cache_dir, "dates.npy"), mmap_mode="r"),
+        "close": np.load(os.path.join(cache_dir, "close.npy"), mmap_mode="r"),
+    }
+
+
+def load_user_params(path):
+    # Same mapping daily_bot.js applies to users/*.json
+    with open(path, "r", encoding="utf-8") as f:
+        user = json.load(f)
+    p = user.get("params", {})
+    return {
+        "initialCapital": float(user.get("initialCapital", 10000)),
+        "startDate": user.get("startDate", START_DATE),
+        "endDate": END_DATE,
+        "safe": p.get("safe", {}),
+        "offensive": p.get("offensive", {}),
+        "rebalance": p.get("rebalance", {}),
+        "feeRate": p.get("feeRate", 0),
+        "useRealTier": p.get("useRealTier", False),
+    }
+
+
+def round2(x):
+    """
+    parseFloat(n.toFixed(2)) from logic.js. toFixed rounds the exact binary
+    value half away from zero, so values whose scaled form lands within float
+    noise of a .5 boundary (2.5 * 1.01 -> 2.52, not 2.53) are settled with Decimal.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    scaled = x * 100
+    out = np.array(np.floor(scaled + 0.5))
+    near = np.abs(scaled - np.floor(scaled) - 0.5) < 1e-6
+    if near.any():
+        flat_x, flat_out = x.reshape(-1), out.reshape(-1)
+        for i in np.flatnonzero(near):
+            flat_out[i] = float(Decimal(float(flat_x[i])).quantize(CENT, rounding=ROUND_HALF_UP) * 100)
+    return out / 100
+
+
+# --- REGIME (QQQ WEEKLY RSI MODES) ---
+def week_ids(dates):
+    # Monday-based week number since epoch; same grouping as the ISO week keys in logic.js
+    return (dates.astype("datetime64[D]").astype(np.int64) + 3) // 7
+
+
+def sma_rsi(closes, period=RSI_PERIOD):
+    """
+    Cutler's RSI along the last axis, summed in the same order as
+    calculateSMARSI so threshold comparisons match the JS engine.
+    NaN where fewer than `period` diffs are available.
+    """
+    closes = np.asarray(closes, dtype=np.float64)
+    n = closes.shape[-1]
+    rsi = np.full(closes.shape, np.nan)
+    if n <= period:
+        return rsi
+
+    diff = np.diff(closes, axis=-1)
+    gains = np.zeros(closes.shape[:-1] + (n - period,))
+    losses = np.zeros_like(gains)
+    for j in range(period):
+        d = diff[..., period - 1 - j:n - 1 - j]
+        gains += np.where(d > 0, d, 0)
+        losses -= np.where(d < 0, d, 0)
+
+    avg_gain = gains / period
+    avg_loss = losses / period
+    with np.errstate(divide="ignore", invalid="ignore"):
+        value = 100 - (100 / (1 + avg_gain / avg_loss))
+    rsi[..., period:] = np.where(avg_loss == 0, 100.0, value)
+    return rsi
+
+
+def weekly_modes(closes):
+    """
+    determineWeeklyModes() over weekly closes (last axis = weeks, leading axes
+    are independent paths). Returns a bool array, True = Offensive.
+    """
+    rsi = sma_rsi(closes)
+    modes = np.zeros(rsi.shape, dtype=bool)
+    current = np.zeros(rsi.shape[:-1], dtype=bool)
+
+    for i in range(15, rsi.shape[-1]):
+        cur = rsi[..., i]
+        prev = rsi[..., i - 1]
+        rising = cur > prev
+        falling = cur < prev
+
+        to_safe = (falling & (prev >= 65)) | (falling & (cur > 40) & (cur < 50)) | ((prev >= 50) & (cur < 50))
+        to_off = ((prev < 50) & (cur >= 50)) | (rising & (cur >= 50) & (cur < 70)) | (rising & (cur < 35))
+
+        current = np.where(to_safe, False, np.where(to_off, True, current))
+        modes[..., i] = current
+    return modes
+
+
+def regime_offensive(dates, qqq_dates, qqq_close):
+    """
+    Mode for each trading day in `dates`: the mode of the previous QQQ week
+    (getModeForDate in logic.js). `qqq_close` may carry leading path axes.
+    """
+    qqq_weeks = week_ids(qqq_dates)
+    last_of_week = np.append(np.flatnonzero(np.diff(qqq_weeks) != 0), len(qqq_weeks) - 1)
+    weekly_keys = qqq_weeks[last_of_week]
+    modes = weekly_modes(np.asarray(qqq_close)[..., last_of_week])
+
+    day_weeks = week_ids(dates)
+    idx = np.searchsorted(weekly_keys, day_weeks)
+    found = (idx < len(weekly_keys)) & (weekly_keys[np.minimum(idx, len(weekly_keys) - 1)] == day_weeks)
+    usable = found & (idx > 0)
+    offensive = modes[..., np.maximum(idx - 1, 0)]
+    return offensive & usable
+
+
+def regime_table(cache, assets):
+    # (n_days, n_assets) Offensive flags on the market-cache calendar, each asset on its own trading days
+    dates, close = cache["dates"], cache["close"]
+    table = np.zeros((len(dates), len(assets)), dtype=bool)
+    for a, asset in enumerate(assets):
+        own = ~np.isnan(close[:, cache["col"][asset["ticker"]]])
+        src_col = close[:, cache["col"][asset["regime"]]]
+        src = ~np.isnan(src_col)
+        table[own, a] = regime_offensive(dates[own], dates[src], src_col[src])
+    return table
+
+
+# --- VECTORIZED ENGINE ---
+def _mode_table(params):
+    # Row 0 = Safe, row 1 = Offensive
+    safe, off = params["safe"], params["offensive"]
+    max_tiers = max(len(safe.get("weights", [])), len(off.get("weights", [])))
+    time_cut = np.array([safe["timeCut"], off["timeCut"]], dtype=np.int64)
+    slots = int(max(time_cut.max(), 1)) + 1
+
+    weights = np.zeros((2, max(slots, max_tiers) + 1))
+    for row, p in enumerate((safe, off)):
+        w = p.get("weights", [])
+        weights[row, :len(w)] = w
+
+    return {
+        "buy_limit": np.array([safe["buyLimit"], off["buyLimit"]], dtype=np.float64) / 100,
+        "target": np.array([safe["target"], off["target"]], dtype=np.float64) / 100,
+        "time_cut": time_cut,
+        "weights": weights / 100,
+        "slots": slots,
+    }
+
+
+def path_table(params, n_paths):
+    # Per-path strategy table; `params` is one dict for every path or a list
+    # (one per path: search candidates, portfolio sleeves)
+    shared = isinstance(params, dict)
+    plist = [params] if shared else list(params)
+    if not shared and len(plist) != n_paths:
+        raise ValueError(f"got {len(plist)} parameter sets for {n_paths} paths")
+    tables = [_mode_table(p) for p in plist]
+    width = max(t["weights"].shape[1] for t in tables)
+    weights = np.zeros((len(plist), 2, width))
+    for i, t in enumerate(tables):
+        weights[i, :, :t["weights"].shape[1]] = t["weights"]
+    table = {
+        "buy_limit": np.array([t["buy_limit"] for t in tables]),
+        "target": np.array([t["target"] for t in tables]),
+        "time_cut": np.array([t["time_cut"] for t in tables]),
+        "weights": weights,
+        "slots": max(t["slots"] for t in tables),
+        "fee_rate": np.array([float(p.get("feeRate", 0) or 0) / 100 for p in plist]),
+        "real_tier": np.array([bool(p.get("useRealTier")) for p in plist]),
+        "profit_add": np.array([p["rebalance"].get("profitAdd", 0) / 100 for p in plist]),
+        "loss_sub": np.array([p["rebalance"].get("lossSub", 0) / 100 for p in plist]),
+        "capital": np.array([float(p["initialCapital"]) for p in plist]),
+    }
+    if shared:
+        for name, value in table.items():
+            if name != "slots":
+                table[name] = np.repeat(value, n_paths, axis=0)
+    return table
+
+
+def simulate(close, offensive, params, injections=None, record_equity=False, ledger=None):
+    """
+    Run the tiered LOC strategy of runSimulation() over many price paths at once.
+
+    close, offensive: (n_paths, n_days). Day 0 only provides "yesterday's close";
+    days 1.. are simulated. injections: optional (n_days,) cash added at the start
+    of each day. Open positions live in fixed slot arrays, so the state is
+    O(n_paths * max timeCut) regardless of history length. `params` may also be
+    a list with one parameter set per path (e.g. candidates of a search).
+
+    Returns per-path summary arrays; the daily equity curve (n_paths, n_days - 1)
+    is only kept when record_equity is set. No ledger is built unless `ledger`
+    (ledger.ColumnarLedger / StreamingLedger, see ledger.make_ledger) is given;
+    its output is returned under "ledger".
+    """
+    close = np.atleast_2d(np.asarray(close, dtype=np.float64))
+    offensive = np.atleast_2d(np.asarray(offensive, dtype=bool))
+    if not isinstance(params, dict) and close.shape[0] == 1:
+        close = np.repeat(close, len(params), axis=0)
+        offensive = np.repeat(offensive, len(params), axis=0)
+    n_paths, n_days = close.shape
+    table = path_table(params, n_paths)
+    mode = offensive.astype(np.int64)
+    fee_rate = table["fee_rate"]
+    slot_fee = fee_rate[:, None]
+    real_tier = table["real_tier"]
+    profit_add = table["profit_add"]
+    loss_sub = table["loss_sub"]
+    rows = np.arange(n_paths)
+
+    # Position slots; open holdings always occupy a chronological prefix [0, count)
+    shape = (n_paths, table["slots"])
+    pos = {
+        "qty": np.zeros(shape),
+        "buy_price": np.zeros(shape),
+        "days_held": np.zeros(shape, dtype=np.int64),
+        "day_limit": np.zeros(shape, dtype=np.int64),
+        "target": np.zeros(shape),
+        "buy_day": np.zeros(shape, dtype=np.int64),   # ledger row the holding settles into
+    }
+    count = np.zeros(n_paths, dtype=np.int64)
+    slot_idx = np.arange(table["slots"])
+
+    seed = table["capital"].copy()
+    balance = seed.copy()
+    pending = np.zeros(n_paths)
+    period_pnl = np.zeros(n_paths)
+    timer = 0
+
+    # Trade stats (closed trades, as tallied from the ledger in deep_mind.js)
+    trades = np.zeros(n_paths, dtype=np.int64)
+    wins = np.zeros(n_paths, dtype=np.int64)
+    pct_sum = np.zeros(n_paths)
+    pct_sq_sum = np.zeros(n_paths)
+    gross_profit = np.zeros(n_paths)
+    gross_loss = np.zeros(n_paths)
+
+    # Equity-curve stats, updated online
+    peak = np.zeros(n_paths)
+    max_dd = np.zeros(n_paths)
+    max_dd_day = np.full(n_paths, -1, dtype=np.int64)
+    underwater = np.zeros(n_paths, dtype=np.int64)
+    longest_underwater = np.zeros(n_paths, dtype=np.int64)
+    underwater_days = np.zeros(n_paths, dtype=np.int64)
+    min_equity = np.full(n_paths, np.inf)
+    equity = np.zeros(n_paths)
+    curve = np.zeros((n_paths, n_days - 1)) if record_equity else None
+
+    pending_due = False
+    if ledger is not None:
+        ledger.begin(n_paths, n_days, table["slots"])
+        accum_pnl = np.zeros(n_paths)
+
+    for t in range(1, n_days):
+        c = close[:, t]
+        m = mode[:, t]
+        if ledger is not None:
+            fund_refresh = np.full(n_paths, np.nan)
+            day_pnl = np.zeros(n_paths)
+
+        if injections is not None and injections[t]:
+            seed += injections[t]
+            balance += injections[t]
+            if ledger is not None:
+                fund_refresh[:] = injections[t]
+        if ledger is not None and pending_due:
+            fund_refresh = np.nan_to_num(fund_refresh) + round2(pending)
+        seed += pending
+        pending[:] = 0
+        pending_due = False
+
+        # --- SELL ---
+        # Settled newest-first like the reverse splice loop in logic.js, so cash
+        # and holdings value are summed in the same order as the JS engine.
+        start_count = count.copy()
+        active = slot_idx < count[:, None]
+        pos["days_held"] += active
+        sell = active & ((c[:, None] >= pos["target"]) | (pos["days_held"] >= pos["day_limit"]))
+        keep = active & ~sell
+        value = pos["qty"] * c[:, None]
+        holdings_value = np.zeros(n_paths)
+        sold = sell.any()
+        if sold:
+            revenue = np.where(sell, value, 0)
+            buy_cost = np.where(sell, pos["qty"] * pos["buy_price"], 0)
+            sell_fee = revenue * slot_fee
+            buy_fee = buy_cost * slot_fee
+            pnl = revenue - buy_cost - sell_fee - buy_fee
+            cash_in = revenue - sell_fee
+
+            net = round2(pnl)
+            invested = round2(buy_cost)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                pct = np.where(invested != 0, round2((net + sell_fee + buy_fee) / invested * 100), 0)
+            pct = np.where(sell, pct, 0)
+            trades += sell.sum(axis=1)
+            wins += (pct > 0).sum(axis=1)
+            pct_sum += pct.sum(axis=1)
+            pct_sq_sum += (pct * pct).sum(axis=1)
+            gross_profit += np.where(sell & (net > 0), net, 0).sum(axis=1)
+            gross_loss -= np.where(sell & (net < 0), net, 0).sum(axis=1)
+            if ledger is not None:
+                # Trade row fee: buy fee (rounded on the buy day) + sell fee
+                fee_total = round2(round2(buy_fee) + sell_fee)
+                moc = sell & (c[:, None] < pos["target"])
+                ledger.settle(t, sell, pos["buy_day"], c, pos["qty"], revenue, fee_total, net, pct, moc)
+
+        for k in range(int(count.max()) - 1, -1, -1):
+            if sold:
+                balance += np.where(sell[:, k], cash_in[:, k], 0)
+                period_pnl += np.where(sell[:, k], pnl[:, k], 0)
+                if ledger is not None:
+                    day_pnl += np.where(sell[:, k], pnl[:, k], 0)
+            holdings_value += np.where(keep[:, k], value[:, k], 0)
+
+        if sold:
+            order = np.argsort(~keep, axis=1, kind="stable")
+            for name in pos:
+                pos[name] = np.take_along_axis(pos[name], order, axis=1)
+            count = keep.sum(axis=1)
+
+        # --- BUY ---
+        tier = np.where(real_tier, count, start_count)
+        weight = table["weights"][rows, m, np.minimum(tier, table["weights"].shape[2] - 1)]
+        loc = close[:, t - 1] * (1 + table["buy_limit"][rows, m])
+        buy = c <= loc
+        if ledger is not None:
+            row = {
+                "close": c,
+                "mode": m.astype(bool),
+                "changePct": (c - close[:, t - 1]) / close[:, t - 1] * 100,
+                "fundRefresh": fund_refresh,
+                "tier": tier + 1,
+                "locTarget": round2(loc),
+                "fee": np.zeros(n_paths),
+            }
+        if buy.any():
+            allocation = seed * weight
+            funded = allocation > 0
+            with np.errstate(divide="ignore", invalid="ignore"):
+                target_qty = np.where(funded, np.floor(allocation / loc), 0)
+                affordable = np.floor(balance / (c * (1 + fee_rate)))
+            need = target_qty * c + target_qty * c * fee_rate
+            bought = np.where(funded, np.where(balance >= need, target_qty, affordable), 0)
+            bought = np.where(buy, bought, 0)
+            cost = bought * c
+            balance -= np.where(bought > 0, cost + cost * fee_rate, 0)
+            holdings_value += cost
+
+            r, k = rows[buy], count[buy]
+            pos["qty"][r, k] = bought[buy]
+            pos["buy_price"][r, k] = c[buy]
+            pos["days_held"][r, k] = 0
+            pos["day_limit"][r, k] = table["time_cut"][r, m[buy]]
+            pos["target"][r, k] = round2(c[buy] * (1 + table["target"][r, m[buy]]))
+            pos["buy_day"][r, k] = t
+            count = count + buy
+
+            if ledger is not None:
+                no_buy = np.full(n_paths, np.nan)
+                row["targetAllocation"] = np.where(buy, round2(allocation), no_buy)
+                row["targetQty"] = np.where(buy, target_qty, no_buy)
+                row["buyPrice"] = np.where(buy, c, no_buy)
+                row["buyQty"] = np.where(buy, bought, no_buy)
+                row["buyAmount"] = np.where(buy, round2(cost), no_buy)
+                row["targetSell"] = np.where(buy, round2(c * (1 + table["target"][rows, m])), no_buy)
+                row["fee"] = np.where(bought > 0, round2(cost * fee_rate), 0)
+
+        # --- REBALANCE ---
+        timer += 1
+        if timer >= REBALANCE_DAYS:
+            pending = np.where(period_pnl > 0, period_pnl * profit_add,
+                               np.where(period_pnl < 0, period_pnl * loss_sub, 0))
+            period_pnl[:] = 0
+            timer = 0
+            pending_due = True
+
+        # --- EQUITY STATS ---
+        equity = np.floor(holdings_value + balance)
+        peak = np.maximum(peak, equity)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            dd = np.where(peak > 0, (equity - peak) / peak * 100, 0)
+        deeper = dd < max_dd
+        max_dd = np.where(deeper, dd, max_dd)
+        max_dd_day = np.where(deeper, t - 1, max_dd_day)
+        below = equity < peak
+        underwater = np.where(below, underwater + 1, 0)
+        longest_underwater = np.maximum(longest_underwater, underwater)
+        underwater_days += below
+        min_equity = np.minimum(min_equity, equity)
+        if record_equity:
+            curve[:, t - 1] = equity
+
+        if ledger is not None:
+            accum_pnl += day_pnl
+            row.update({
+                "accumPnL": np.floor(accum_pnl),
+                "totalSeed": np.floor(seed),
+                "totalAsset": equity,
+                "cash": np.floor(balance),
+                "drawdown": round2(dd),
+            })
+            ledger.record(t, row)
+            # Rows older than every open holding's buy day are final
+            oldest = np.where(count > 0, pos["buy_day"][:, 0], t + 1)
+            ledger.release(int(oldest.min()))
+
+    return {
+        "final_equity": equity,
+        "max_drawdown": max_dd,
+        "max_drawdown_day": max_dd_day,
+        "longest_underwater": longest_underwater,
+        "underwater_days": underwater_days,
+        "min_equity": min_equity,
+        "trades": trades,
+        "wins": wins,
+        "pct_sum": pct_sum,
+        "pct_sq_sum": pct_sq_sum,
+        "gross_profit": gross_profit,
+        "gross_loss": gross_loss,
+        "equity": curve,
+        "ledger": ledger.finish() if ledger is not None else None,
+        "final_state": {
+            "positions": pos, "count": count,
+            "balance": balance, "seed": seed, "pending": pending, "rebalance_timer": timer,
+        },
+    }
+
+
+def cagr(final_equity, initial_capital, years):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return (np.power(np.maximum(final_equity, 0) / initial_capital, 1 / years) - 1) * 100
+
+
+def summarize(result, params):
+    # KPI set reported by runDeepMind (CAGR, MDD, win rate, SQN, profit factor)
+    years = (np.datetime64(params["endDate"]) - np.datetime64(params["startDate"])).astype(np.int64) / 365
+    n = result["trades"]
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = np.where(n > 0, result["pct_sum"] / n, 0)
+        var = np.where(n > 1, (result["pct_sq_sum"] - n * mean * mean) / (n - 1), 0)
+        std = np.sqrt(np.maximum(var, 0))
+        sqn = np.where((n > 1) & (std > 0), mean / std * np.sqrt(n), 0)
+        win_rate = np.where(n > 0, result["wins"] / n * 100, 0)
+        pf = np.where(result["gross_loss"] > 0, result["gross_profit"] / result["gross_loss"], result["gross_profit"])
+    return {
+        "cagr": cagr(result["final_equity"], params["initialCapital"], years),
+        "mdd": result["max_drawdown"],
+        "winRate": win_rate,
+        "sqn": sqn,
+        "pf": pf,
+    }
+
+
+def window(dates, params):
+    # Slice bounds [first - 1, last + 1) so day 0 is the bar before startDate
+    first = int(np.searchsorted(dates, np.datetime64(params["startDate"]), side="left"))
+    last = int(np.searchsorted(dates, np.datetime64(params["endDate"]), side="right"))
+    return max(first, 1) - 1, last
+
+
+def collect(results, sizes, on_progress=None):
+    # Gather process-pool results in order, reporting progress as (done, total) units
+    out = []
+    total = sum(sizes)
+    done = 0
+    for size, result in zip(sizes, results):
+        out.append(result)
+        done += size
+        if on_progress:
+            on_progress(done, total)
+    return out
+
+
+def run_simulation(market, params, injections=(), ledger=None):
+    """
+    Single historical run on js/data.js bars (Python counterpart of runSimulation).
+    Summary-only unless a ledger (ledger.make_ledger) is passed.
+    """
+    soxl, qqq = market["SOXL"], market["QQQ"]
+    offensive = regime_offensive(soxl["date"], qqq["date"], qqq["close"])
+    lo, hi = window(soxl["date"], params)
+    dates = soxl["date"][lo:hi]
+
+    inj = None
+    if injections:
+        inj = np.zeros(len(dates))
+        for item in injections:
+            hit = np.flatnonzero(dates == np.datetime64(item["date"]))
+            if len(hit) and hit[0] > 0:
+                inj[hit[0]] += float(item.get("amount", 0) or 0)
+
+    if ledger is not None and ledger.dates is None:
+        ledger.dates = dates
+    result = simulate(round2(soxl["close"][lo:hi]), offensive[lo:hi], params, inj, record_equity=True, ledger=ledger)
+    dd_day = int(result["max_drawdown_day"][0])
+    return {
+        "params": params,
+        "dates": dates[1:],
+        "equity": result["equity"][0],
+        "finalBalance": float(result["final_equity"][0]),
+        "maxDrawdown": float(result["max_drawdown"][0]),
+        "maxDrawdownDate": str(dates[1 + dd_day]) if dd_day >= 0 else None,
+        "summary": {k: float(v[0]) for k, v in summarize(result, params).items()},
+        "ledger": result["ledger"],
+        "raw": result,
+    }
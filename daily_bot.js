@@ -1,6 +1,6 @@
 import fs from 'fs';
 import path from 'path';
-import { SOXL_DATA, QQQ_DATA } from './js/data.js';
+import { SOXL_DATA, QQQ_DATA } from './js/data_packed.js';
 import { runSimulation, generateOrderSheetData, calculateNettingOrders, getNextBusinessDay } from './js/logic.js';
 import admin from 'firebase-admin';
 
@@ -0,0 +1,103 @@
+
+import json
+import math
+import os
+import re
+from datetime import date
+
+import numpy as np
+
+# Packed market-data format (decoded by js/data_codec.js)
+#
+#   {"v": 1, "start": "2010-03-11",
+#    "days":   [0, 1, 1, 3, ...],      calendar-day gap to the previous bar
+#    "open":   [64, 2, -4, ...],        cents; first value absolute, then deltas
+#    "high": [...], "low": [...], "close": [...],
+#    "volume": [3702000, ...]}          raw share counts
+#
+# Keys are written once per series instead of once per bar, and 2-decimal
+# prices become small integers, so the file is several times smaller than
+# js/data.js. A missing price (NaN from Yahoo) is written as null and the
+# delta chain continues from the last valid price.
+
+FORMAT_VERSION = 1
+PRICE_FIELDS = ("open", "high", "low", "close")
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DATA_JS = os.path.join(BASE_DIR, "js", "data.js")
+PACKED_JS = os.path.join(BASE_DIR, "js", "data_packed.js")
+
+
+def to_cents(price):
+    # None for a missing (None / NaN) price
+    if price is None or math.isnan(float(price)):
+        return None
+    return int(round(float(price) * 100))
+
+
+def encode_bars(rows):
+    # rows: [{"date", "open", "high", "low", "close", "volume"}, ...] as written to js/data.js
+    packed = {"v": FORMAT_VERSION, "start": rows[0]["date"] if rows else None, "days": []}
+    for field in PRICE_FIELDS:
+        packed[field] = []
+    packed["volume"] = []
+
+    prev_day = None
+    prev = dict.fromkeys(PRICE_FIELDS, 0)
+    for row in rows:
+        day = date.fromisoformat(row["date"]).toordinal()
+        packed["days"].append(0 if prev_day is None else day - prev_day)
+        prev_day = day
+
+        for field in PRICE_FIELDS:
+            cents = to_cents(row[field])
+            if cents is None:
+                packed[field].append(None)
+                continue
+            packed[field].append(cents - prev[field])
+            prev[field] = cents
+        packed["volume"].append(int(row.get("volume", 0)))
+    return packed
+
+
+def decode_bars(packed):
+    # Packed dict -> numpy columns ("date" as datetime64[D]; missing prices as NaN)
+    start = np.datetime64(packed["start"], "D")
+    bars = {"date": start + np.cumsum(np.asarray(packed["days"], dtype=np.int64))}
+    for field in PRICE_FIELDS:
+        deltas = np.array(packed[field], dtype=np.float64)
+        missing = np.isnan(deltas)
+        cents = np.cumsum(np.where(missing, 0, deltas).astype(np.int64))
+        bars[field] = np.where(missing, np.nan, cents / 100)
+    bars["volume"] = np.asarray(packed["volume"], dtype=np.int64)
+    return bars
+
+
+def packed_js(datasets):
+    # datasets: {"SOXL": rows, "QQQ": rows} -> ES module exporting SOXL_DATA / QQQ_DATA
+    lines = ["import { decodeBars } from './data_codec.js';", ""]
+    for name, rows in datasets.items():
+        payload = json.dumps(encode_bars(rows), separators=(",", ":"))
+        lines.append(f"export const {name}_DATA = decodeBars({payload});")
+    return "\n".join(lines) + "\n"
+
+
+def write_packed(datasets, path=PACKED_JS):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(packed_js(datasets))
+    return path
+
+
+def read_plain(path=DATA_JS):
+    with open(path, "r", encoding="utf-8") as f:
+        content = f.read()
+    return {name: json.loads(payload)
+            for name, payload in re.findall(r"export const (\w+)_DATA = (\[.*?\]);", content, re.S)}
+
+
+if __name__ == "__main__":
+    # Rebuild js/data_packed.js from the current js/data.js
+    datasets = read_plain()
+    out = write_packed(datasets)
+    print(f"Packed {', '.join(f'{k}: {len(v)}' for k, v in datasets.items())} -> {out} "
+          f"({os.path.getsize(DATA_JS):,} -> {os.path.getsize(out):,} bytes)")
@@ -4,6 +4,8 @@ import json
 import os
 from datetime import datetime
 
+from data_codec import write_packed
+
 def fetch_and_save():
     print("Fetching Real Data from Yahoo Finance...")
 
@@ -113,6 +115,7 @@ def fetch_and_save():
 
     with open(file_path, "w", encoding='utf-8') as f:
         f.write(content)
+    write_packed({"SOXL": soxl_json, "QQQ": qqq_json}, "js/data_packed.js")
 
     print(f"\nSuccessfully updated {file_path}")
     print(f"SOXL Records: {len(soxl_json)}")
@@ -1,6 +1,6 @@
 // app.js
 import { runSimulation } from './logic.js';
-import { SOXL_DATA, QQQ_DATA } from './data.js';
+import { SOXL_DATA, QQQ_DATA } from './data_packed.js';
 
 let mainChartInstance = null;
 let ddChartInstance = null;
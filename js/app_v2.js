@@ -1,5 +1,5 @@
 import { runSimulation, generateOrderSheetData, calculateNettingOrders, sortOrdersDesc, getNextBusinessDay, isBusinessDay } from './logic.js?v=debug3';
-import { SOXL_DATA, QQQ_DATA } from './data.js';
+import { SOXL_DATA, QQQ_DATA } from './data_packed.js';
 import { runDeepMind, runRobustnessTest, runSensitivityTest, calculateSQN } from './deep_mind.js';
 import { initializeApp } from "https://www.gstatic.com/firebasejs/10.8.0/firebase-app.js";
 import { getFirestore, doc, getDoc, setDoc } from "https://www.gstatic.com/firebasejs/10.8.0/firebase-firestore.js";
@@ -0,0 +1,49 @@
+
+// data_codec.js - Decoder for the packed market-data format (see data_codec.py)
+// Dates: start date + calendar-day gaps. Prices: integer cents, delta-coded.
+
+const DAY_MS = 86400000;
+
+export function decodeColumns(packed) {
+    const n = packed.days.length;
+    const cols = {
+        date: new Array(n),
+        open: new Float64Array(n),
+        high: new Float64Array(n),
+        low: new Float64Array(n),
+        close: new Float64Array(n),
+        volume: packed.volume
+    };
+
+    let t = Date.parse(packed.start + "T00:00:00Z");
+    let o = 0, h = 0, l = 0, c = 0;
+    for (let i = 0; i < n; i++) {
+        t += packed.days[i] * DAY_MS;
+        cols.date[i] = new Date(t).toISOString().slice(0, 10);
+
+        // n / 100 is the same double JSON.parse gives for the 2-decimal literal;
+        // null marks a missing price (NaN in js/data.js) and leaves the running value alone
+        if (packed.open[i] === null) cols.open[i] = NaN; else { o += packed.open[i]; cols.open[i] = o / 100; }
+        if (packed.high[i] === null) cols.high[i] = NaN; else { h += packed.high[i]; cols.high[i] = h / 100; }
+        if (packed.low[i] === null) cols.low[i] = NaN; else { l += packed.low[i]; cols.low[i] = l / 100; }
+        if (packed.close[i] === null) cols.close[i] = NaN; else { c += packed.close[i]; cols.close[i] = c / 100; }
+    }
+    return cols;
+}
+
+// Expand into the [{date, open, high, low, close, volume}] rows runSimulation expects
+export function decodeBars(packed) {
+    const cols = decodeColumns(packed);
+    const bars = new Array(cols.date.length);
+    for (let i = 0; i < bars.length; i++) {
+        bars[i] = {
+            date: cols.date[i],
+            open: cols.open[i],
+            high: cols.high[i],
+            low: cols.low[i],
+            close: cols.close[i],
+            volume: cols.volume[i]
+        };
+    }
+    return bars;
+}
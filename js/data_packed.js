@@ -0,0 +1,4 @@
+import { decodeBars } from './data_codec.js';
+
+export const SOXL_DATA = decodeBars({"v":1,"start":"2010-03-11","days":[0,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,4,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,2,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,5,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,2,1,1,3,2,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,2,1,3,1,2,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,2,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,4,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,4,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,2,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,4,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,2,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,2,1,3,1,1,1,1,3,1,1,1,1,3,2,1,1,3,2,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,2,1,3,1,2,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,4,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,4,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,2,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,4,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,2,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,2,1,3,1,2,1,3,1,1,2,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,2,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1],"open":[64,2,-3,0,7,0,-3,-3,7,3,-1,-1,-1,1,0,1,1,2,0,-1,0,2,1,6,7,-2,-5,2,3,-5,8,-1,-3,-4,0,0,-8,3,-10,-2,-7,8,-4,4,2,-5,-6,5,-7,-3,-2,4,-7,9,1,5,-4,-2,5,0,-6,-7,1,0,1,7,-1,7,4,-2,3,-5,-3,-1,-4,-1,-2,-4,-3,0,3,-3,9,-2,2,4,4,-4,-1,-3,-2,6,-4,4,1,4,-4,-2,-5,2,0,-1,1,-2,1,-1,-6,-6,2,-2,2,1,0,-1,1,-4,-1,2,-2,1,-3,-1,3,4,-1,-1,0,-1,0,2,1,0,3,-1,0,0,-3,4,4,-1,1,3,-1,-2,-1,2,-2,0,2,1,2,0,0,0,-3,0,1,-1,4,0,0,5,0,2,0,1,3,5,0,1,-3,-5,2,2,-5,-1,2,1,4,0,2,3,-2,-1,3,4,2,3,2,-2,3,0,1,-3,-3,-1,1,1,0,0,0,-1,1,0,0,0,2,1,-2,3,5,-1,5,1,4,1,6,-3,-7,2,-4,5,1,3,5,-10,4,3,3,1,7,-3,-2,-4,4,5,1,-1,0,8,-9,-8,-5,7,7,-4,-9,9,2,-3,-9,-2,-12,-4,3,-9,7,-3,4,-1,2,-3,6,5,-1,-1,5,-3,1,-5,1,5,2,0,-4,-5,-2,-3,2,-1,-2,9,5,-2,1,3,0,-2,3,-5,0,-4,6,-1,0,0,-4,5,-4,-4,-2,3,-1,-4,-1,-4,2,5,4,1,-8,-3,-2,1,-3,-3,-1,-3,0,0,-2,-1,-5,2,2,-2,5,-5,2,3,0,5,4,-3,1,0,-2,-5,-3,-2,-2,-1,0,6,-3,3,2,1,-2,-6,-4,5,-5,-3,-1,-6,-10,0,1,1,6,-1,0,-2,-4,-5,2,-1,4,0,-3,5,2,2,-2,-5,-4,5,2,-1,-2,6,3,5,0,-2,2,-2,-8,-2,5,1,1,-4,-5,-3,-5,5,4,3,1,1,2,-1,6,-2,-3,3,-5,1,2,3,0,3,2,0,-8,1,1,2,2,2,-4,-2,0,3,-1,1,0,-5,-4,-2,-2,-3,3,0,2,4,2,0,-1,0,0,-3,-1,0,-4,0,-1,0,-1,2,0,3,0,0,-1,1,2,-1,0,2,1,4,-2,3,-1,0,1,7,2,1,-2,2,1,-3,0,1,1,2,3,0,-3,2,3,-3,0,-2,3,-1,8,-3,-5,0,1,-2,2,3,-2,-2,-2,-7,2,3,1,2,-1,4,0,3,-1,1,1,-2,1,2,1,0,-4,4,-2,0,-6,-2,-2,0,-1,1,2,-1,0,-1,0,-1,-7,1,1,1,3,0,0,-1,2,-5,-4,0,-3,3,-2,0,0,-1,-3,-2,-3,3,-3,2,-2,3,0,-1,-4,-2,-1,4,4,-4,4,-3,1,0,-1,1,4,1,1,-5,0,-3,1,-1,4,3,-1,1,-2,-2,-2,-2,-2,-1,0,0,-2,6,1,-5,2,0,4,1,2,0,1,-2,3,1,1,2,1,1,1,-1,-3,2,2,-1,0,-2,0,-2,2,-1,0,-1,0,1,-2,1,3,-1,-2,1,0,2,2,-2,-1,-1,0,-2,-1,-5,1,2,0,0,0,-1,1,-1,-1,-2,0,-2,0,2,1,0,-1,-2,-2,3,-2,0,1,0,4,-3,3,-1,-1,-2,1,-1,0,-2,-1,1,0,0,1,1,1,-1,2,0,1,-2,1,0,2,-1,2,3,-2,-2,0,2,1,0,-2,1,-1,-1,-2,1,5,2,0,-1,0,-1,2,0,0,1,0,2,1,0,1,-2,2,2,-1,-1,1,1,0,0,1,1,-1,2,0,2,-2,3,-1,2,-6,0,4,-5,1,2,-1,1,1,3,0,2,-2,0,1,2,0,-6,1,0,1,-2,2,-1,0,3,-1,-1,-1,-6,-1,1,3,2,3,-2,-1,-1,0,-3,-2,1,2,2,4,-1,0,3,2,-1,4,1,1,-1,2,2,2,-2,1,2,0,1,0,0,-7,1,6,-5,4,1,-1,2,0,-4,1,4,-2,-2,-5,7,-1,3,3,-6,-5,-2,0,5,1,-1,2,-1,-3,6,3,-5,0,7,2,2,-1,2,0,-5,2,-1,0,-7,2,-2,0,2,3,1,-1,0,-3,0,-1,-2,2,1,-5,-3,0,0,0,0,3,-1,-3,-3,2,3,1,0,5,2,-2,5,2,1,-3,5,-2,2,3,-2,-1,-1,2,1,-3,-3,3,0,1,0,0,1,-5,2,2,-1,5,-2,0,5,0,1,-5,-4,1,0,3,4,-2,2,0,-4,3,-1,-5,2,0,1,4,-1,2,-3,-3,-1,4,1,0,0,3,1,-3,2,-1,5,1,-2,0,-3,-2,1,2,3,2,-2,5,1,1,1,-1,2,0,-3,0,-2,4,4,-4,1,-3,8,2,-3,1,0,1,-3,-5,-4,0,3,-2,2,-7,0,2,5,3,3,6,-1,7,4,-1,0,3,0,-1,-1,1,2,-6,6,3,2,3,-3,2,-6,7,-10,2,4,4,-3,13,-4,-3,5,-9,-1,5,7,5,-1,4,-20,0,7,2,-18,0,2,4,-4,9,4,3,3,-5,-10,-2,-1,5,-3,1,2,-1,-2,4,0,8,-6,-4,-3,3,5,0,1,1,9,2,0,0,4,0,4,4,2,2,1,0,4,3,1,3,4,-1,-1,2,-4,-4,2,-2,2,7,8,0,4,-6,0,-7,7,3,1,1,-3,-8,5,5,-2,-12,-8,-7,0,1,-3,-7,4,-1,-5,7,-8,6,1,2,4,4,4,1,3,5,3,3,-6,0,-1,7,3,-1,0,0,5,1,-5,-2,2,-6,-8,11,6,8,-11,-9,3,5,-7,-3,8,-6,-14,3,-1,-8,-7,10,-27,-19,-2,-7,3,19,-5,12,13,-4,1,2,7,4,0,9,9,-1,4,-1,-2,-4,4,-6,4,-3,4,1,10,-9,17,0,7,-1,15,-3,-4,4,15,0,5,-22,11,-9,-6,-2,-12,-1,23,4,-1,12,-6,3,-3,-6,2,-1,-10,-7,-11,11,13,-6,-5,-18,7,-10,10,3,9,1,0,-6,3,-13,-2,-5,3,6,5,6,-8,4,13,6,11,1,2,-4,2,6,-5,10,0,2,3,13,-16,6,-7,-5,-3,-5,-8,8,5,4,0,5,8,5,-9,-4,-47,1,23,1,-6,-2,-9,11,-2,1,14,1,-2,-3,-1,-2,-1,10,0,-7,1,-10,0,0,-3,-1,15,-4,-11,-1,11,0,-1,-1,6,6,-2,10,-3,-1,5,-2,-1,28,1,6,-6,-2,-14,-4,1,-15,5,7,-7,-8,0,7,1,9,1,2,-7,-2,-11,-21,-4,4,-5,-3,-4,-11,3,-10,7,1,6,0,-6,3,-8,-11,2,8,-17,1,8,-1,4,-8,-2,-2,5,-10,6,6,-14,8,-7,-4,7,-9,-9,-19,-30,29,-6,13,5,2,-10,3,6,-7,9,13,-13,-2,6,1,4,1,-10,1,-12,-1,-7,8,-6,-7,7,8,-9,17,6,3,2,4,-4,-3,0,18,2,-2,1,6,3,16,-1,-13,3,-5,-5,5,3,4,-1,-7,9,-10,-3,-2,-6,-4,7,3,6,2,0,-9,9,2,3,6,7,3,-9,8,-13,2,-6,-2,-6,0,7,5,-15,2,7,0,2,0,4,2,-7,-16,6,-15,-17,-1,-8,5,-1,-12,-10,4,-10,10,9,-2,-2,0,1,-3,12,0,-5,-2,4,-18,-7,5,-11,8,6,10,9,-6,7,-1,-8,11,7,1,2,7,2,4,-2,2,-5,4,4,3,-2,-1,5,6,4,1,0,-10,6,-4,11,1,-5,7,-10,1,3,-1,1,-3,2,4,1,-9,5,-9,6,-3,-1,3,-3,7,-12,-11,-1,-5,2,-4,2,1,3,1,-9,2,6,-6,8,7,11,3,11,3,0,5,1,1,7,-1,-1,3,-4,-2,-7,-2,5,-9,5,6,0,-1,7,-21,-14,-7,11,5,3,-4,-9,6,10,14,7,5,4,-1,6,2,1,8,-6,6,9,28,-13,1,0,-4,-15,8,9,7,-1,6,-6,2,6,8,-5,-2,8,6,5,0,-4,2,4,2,-3,0,11,0,-7,-10,-5,-30,16,-2,8,24,-1,-1,-4,13,-3,-13,-5,17,1,17,8,-2,-4,4,8,0,-11,-18,-11,7,-5,10,-11,3,0,12,12,-9,13,-13,0,2,-11,-5,-9,17,9,-20,23,-16,24,-1,11,22,4,8,12,3,7,-4,-3,0,-9,-55,22,7,9,25,20,-21,2,8,2,24,-13,0,0,11,-10,9,23,-37,12,-17,-5,0,-9,10,8,5,3,-7,3,-15,9,11,-1,2,36,4,-3,3,-8,7,-5,14,5,9,2,0,-5,-6,-3,-1,10,-5,22,12,-6,-42,23,15,-4,8,-18,-9,6,13,-5,12,12,2,4,16,-4,0,16,-43,15,17,-27,23,2,-6,11,1,-21,7,-17,2,7,-18,-9,-29,2,7,23,7,8,19,10,4,-1,7,-18,5,-19,14,1,0,-4,33,12,11,7,29,-4,-52,41,12,12,1,10,2,7,27,-11,10,8,-4,24,21,39,-134,47,-12,-60,19,10,22,-20,16,-10,23,-43,-26,5,-27,-4,-26,7,23,22,13,31,17,0,20,-24,27,10,-12,0,-11,17,12,-47,5,-11,16,-24,-4,2,27,-23,-3,-46,37,31,4,-15,-27,-4,-1,-2,33,-5,-13,-20,32,35,19,-13,-6,1,-7,-4,30,-6,-1,24,43,23,2,-36,-16,8,-9,-1,24,24,20,12,0,16,-20,32,28,-12,22,2,18,3,3,-19,32,9,9,-7,-14,34,0,50,38,-33,23,69,13,-6,-14,-26,-5,17,-23,14,48,-21,53,24,-22,0,-12,-18,-106,-44,29,-111,-13,54,33,-38,4,-12,-9,8,65,22,28,-1,-54,-20,0,26,-3,-15,70,61,9,6,31,-74,10,5,41,15,57,39,-6,38,-23,-6,-61,45,-51,27,-41,-20,-87,-167,133,-36,-74,38,-1,0,112,-9,-6,85,-43,7,64,42,15,-52,-102,85,74,-10,58,13,82,39,-72,-6,-8,-40,-34,13,-42,-50,-30,86,-175,-30,9,-49,-68,138,-92,-12,45,7,42,67,-43,7,17,-67,-80,-18,-28,-29,21,44,-50,-33,46,-33,18,96,-1,39,45,21,34,-23,-10,27,-27,28,13,-40,44,13,8,14,-1,8,61,26,9,25,-80,4,7,10,14,-28,-1,-60,38,14,-52,-80,-39,9,-92,49,-41,51,-32,38,72,-8,-25,-34,27,-13,-26,76,-2,-4,-19,34,-55,38,40,-20,-10,8,-40,60,1,36,9,1,-84,-16,17,-43,1,-56,12,3,36,22,16,52,44,-2,-2,-29,12,35,-21,-92,24,-9,-48,30,21,-3,-15,14,23,20,-36,24,-54,-11,-2,34,-7,22,-30,-48,-76,-22,-27,-86,39,-32,19,62,-37,-36,-37,-59,10,-94,-16,43,-55,105,2,83,-37,-20,61,-26,-20,-44,-49,36,-23,-1,31,-113,75,-25,36,-2,35,15,-5,94,-28,-148,39,-71,55,12,9,-40,-11,-2,2,-73,-1,-46,-12,31,49,19,-46,14,-40,48,38,-10,8,26,3,-2,7,-31,47,6,-25,12,70,-44,41,2,19,4,25,11,36,4,-60,44,28,34,-19,39,-23,17,18,-1,49,-30,-22,-29,38,16,-21,-13,-52,-56,55,47,18,-3,16,47,12,11,-23,77,-87,18,-9,-34,18,51,25,41,20,35,-11,5,-19,33,22,14,-3,153,-13,-17,35,19,29,-133,44,-16,72,-76,69,-125,19,-67,-56,-9,-82,-11,-3,15,-51,-94,25,-49,-51,24,-25,-51,35,-19,22,20,77,-42,39,58,79,-72,-15,-84,10,11,89,44,-46,0,2,16,41,53,105,-62,-28,-53,-11,-10,69,3,4,63,-7,4,-10,60,-4,71,46,61,-17,-37,-14,5,-115,-91,-106,3,-53,90,16,-49,-14,16,-1,8,104,-20,24,2,-48,-50,1,-49,74,51,-44,27,100,37,21,-24,51,68,-20,-47,1,15,18,-15,-89,66,-102,77,-23,-41,37,-86,-17,62,39,-52,-26,17,86,9,24,40,7,-40,-4,46,-104,42,46,94,50,-16,-44,30,107,57,-18,45,-60,2,38,-42,17,56,-14,9,-67,-49,-7,19,53,11,-13,-27,-162,92,25,44,17,-5,14,71,132,34,17,2,9,54,70,-24,16,16,-48,-59,109,-51,-77,67,43,64,-9,-25,34,10,-23,74,-12,67,26,106,-336,14,39,-122,-14,-129,167,127,29,-63,-123,177,128,-33,109,-172,106,48,-113,-412,67,-182,-163,-197,303,71,-90,-12,-119,-286,99,-41,-295,30,-208,-67,-72,-38,100,-69,104,79,11,1,-15,43,-107,-51,60,35,178,-52,65,-88,83,-2,19,70,-66,-56,-14,58,-22,81,46,-16,65,-149,-92,84,22,44,7,18,47,-74,-88,-2,88,52,49,48,-71,80,-33,13,-37,39,16,99,42,129,33,-85,74,-115,-51,-123,215,-11,-9,53,-61,49,-36,-62,16,-55,50,81,-3,58,19,0,37,40,42,-150,121,-87,52,7,105,-44,2,-139,57,50,-18,26,116,-8,54,70,-9,-7,-35,-13,-8,117,-43,21,42,-47,-83,7,84,-1,62,16,-65,83,29,150,-6,-295,-191,50,64,-82,52,60,44,-184,126,-182,117,10,-137,81,114,57,9,82,-85,12,107,51,80,85,107,16,9,-154,141,-34,-51,-20,-43,-25,-60,-36,-145,-80,63,24,19,163,237,82,281,-296,-47,131,-18,61,89,-24,-69,114,6,110,-16,35,52,151,47,101,1,250,-29,16,-299,-21,58,129,43,21,-19,-173,70,-8,-45,145,-75,-20,110,90,-123,109,212,386,-254,270,95,60,97,-68,365,-77,-39,1,-96,-418,-187,34,-25,404,34,-313,199,-87,218,103,21,261,385,-224,-290,244,-64,-550,48,309,-413,265,235,-404,-407,-261,49,-237,385,-89,-78,128,303,-155,148,-275,193,143,-174,-470,188,357,-126,131,362,448,-41,-13,76,-92,-11,28,-161,-4,116,-174,-276,-108,244,-205,177,269,-210,52,-285,-63,-331,66,-87,231,-51,-698,108,-57,96,49,73,-325,429,255,-30,233,-30,-15,119,145,-125,-44,25,118,54,-124,-76,125,76,99,-31,-180,60,-174,35,70,128,129,33,181,106,-22,-58,7,16,-525,163,198,59,79,-175,-176,-482,203,143,223,39,-71,22,-126,169,96,300,10,87,201,-184,57,-53,-131,-162,-94,41,-98,-164,-211,178,144,258,20,34,33,293,-1,-54,-88,-21,122,-126,-119,173,116,60,-34,-32,90,-489,29,42,243,-3,-34,-162,-234,-150,-56,-119,-171,-28,321,37,-214,45,-151,194,239,-89,197,102,-80,151,-24,142,-179,161,13,182,203,225,335,462,206,317,-522,67,150,251,-235,362,187,-1,168,-471,-184,11,85,333,26,-628,464,-384,470,417,-150,3,-144,-802,184,717,-1167,-120,503,130,353,210,597,-365,8,-180,35,353,-299,-550,99,-774,175,590,251,-874,215,-343,-536,-690,-422,77,201,-38,-703,262,690,258,-289,-350,156,-89,568,-85,-102,-681,215,217,5,-298,-291,184,-826,819,20,58,-331,318,-402,-181,-515,445,-105,109,-415,-156,459,221,136,209,9,-28,-69,425,-87,364,-13,-345,-219,-249,51,-624,-60,-39,-282,100,-127,178,-329,142,339,-47,-350,-221,82,-309,158,110,-192,195,136,84,-329,-142,-37,-92,-202,206,129,122,32,-285,99,-161,-24,-96,88,399,154,20,-194,115,70,-223,114,-177,-241,-305,-92,34,-121,-149,89,-50,54,6,167,-31,-200,-97,-54,-175,118,99,22,12,-7,-100,99,158,108,-22,122,169,32,-161,-30,39,154,-29,84,2,55,149,-51,-31,-142,-15,139,-23,100,24,-130,-46,34,-196,-102,17,21,179,-377,2,-81,-166,81,-93,-49,22,162,57,-168,-87,-5,-76,15,23,-9,-59,-110,-16,13,-47,13,-80,19,149,-5,76,-111,-111,-126,-32,-107,184,-79,57,-77,43,-5,99,16,-6,42,-60,74,11,-14,-149,94,55,84,-37,106,148,71,135,-141,-159,165,-92,7,76,23,-77,-41,-11,225,-160,31,-26,-113,48,60,-35,258,-121,-128,-103,-8,-87,38,-9,-95,-1,-48,18,-1,90,-29,-8,15,158,-15,60,61,-22,51,57,-97,-37,107,111,-58,131,-52,-15,-68,106,260,-55,-66,10,111,0,-127,-7,7,75,-16,-67,-119,-68,102,-84,67,-56,41,-80,104,78,-64,-33,89,-64,-150,115,-16,-12,201,-35,87,-33,34,8,-34,-89,47,142,-20,36,-5,-162,-80,-23,150,-6,-127,25,-54,92,-82,-41,30,-31,-36,-80,-29,43,70,20,-54,-62,12,84,-39,31,-5,-15,-8,88,50,86,125,-67,28,-131,227,189,452,-286,-23,121,-94,-120,160,-36,124,17,259,-48,44,102,-191,-69,-189,-33,37,-3,89,93,46,69,-27,-239,48,8,152,76,107,83,-106,147,66,-262,-78,-10,40,-11,180,99,47,-65,-31,-321,53,64,-96,-10,-74,-173,-107,176,-91,-109,-140,129,220,-176,294,-355,92,-17,183,25,118,-60,12,-201,-14,52,-124,-12,98,-62,-195,47,-10,-190,14,-29,13,-10,-7,186,-48,-35,-42,40,-56,90,64,75,36,13,-167,-50,-26,39,-134,-107,31,-28,-125,17,-48,-28,41,195,70,85,-29,50,38,2,105,140,110,-24,10,62,48,-34,-26,-18,-29,96,-1,-107,-2,-68,115,-81,99,138,136,95,192,184,10,-23,-13,-45,87,31,163,3,-42,-228,-330,-163,69,84,101,114,-39,33,-43,22,235,170,326,-45,187,240,-463,-64,33,-264,36,7,220,82,-93,130,212,155,-370,243,186,-16,-260,-213,534,169,-92,59,-207,147,319,560,-199,176,238,379,-900,150,-54,-240,-369,289,-399,88,603,-194,-118,232,-59,8,42,-90,-154,384,-543,180,87,-226,60,-39,-33,-324,85,-456,-208,-238,124,409,-163,204,228,48,-400,-10,277,122,156,-247,134,75,45,-42,349,229,6,-106,59,270,390,-313,332,-219,-31,-54,51,-235,157,376,-156,-171,286,387,282,-112,205,242,210,-710,-197,-222,93,-83,54,49,-100,374,376,40,287,76,412,-717,210,8,-642,-444,-238,-173,45,-207,-692,73,113,-99,-8,-25,-1149,-704,508,272,-275,214,40,155,352,117,144,49,177,-30,176,-335,59,-324,158,-103,162,-188,-773,-2,6,-193,36,135,286,77,-49,128,-77,214,-63,-8,87,-13,549,-20,-375,34,-274,22,324,-139,50,87,-19,-17,251,105,-474,142,-92,-141,-44,1,17,61,11,16,-49,-196,-232,-8,-25,289,252,-21,-121,-198,-154,-24,-258,-131,67,-3,71,20,133,46,-236,-13,101,102,196,-79,-155,-13,36,-110,12,192,75,46,20,-381,-215,207,237,-36,8,-174,-4,-7,19,349,176,-277,-174,-262,203,118,181,57,130,136,-125,150,-728,-222,67,47,105,-283,54,75,108,70,-95,-24,-50,131,100,71,99,187,-15,-275,-250,-67,79,-498,192,-344,97,-154,-21,-16,-129,49,-16,68,45,68,-30,-28,-79,166,35,-53,-213,-84,-226,66,-54,-138,-376,-217,253,-193,244,-157,180,-55,-147,42,-88,29,162,47,58,53,-35,-82,155,35,4,-60,28,123,37,268,47,161,-65,21,-138,47,-6,-59,-176,153,69,75,-128,-84,87,175,81,-9,31,113,152,-112,-92,51,78,11,42,-96,148,174,78,3,28,-111,13,189,-67,-10,100,76,-54,-21,141,-145,36,70,-10,-44,-147,1,-49,121,103,34,-105,-312,101,83,-158,164,-32,87,18,244,-53,59,-161,47,-146,-71,16,179,18,8,80,-109,-324,133,-100,241,14,21,131,58,31,-23,119,-5,248,80,-36,150,-74,-152,149,110,-96,11,478,52,335,-5,-391,371,-6,-429,-161,293,190,-184,155,65,-173,-235,570,206,95,293,-87,27,73,-473,-155,324,-536,396,-134,29,-184,-643,216,-259,-59,407,-794,184,165,310,221,-7,321,166,144,58,109,-52,61,36,-109,-381,-236,25,-103,-37,485,-183,110,103,-177,117,-26,124,522,76,109,-40,-71,130,330,-80,607,23,-385,290,666,-442,-173,256,569,140,-328,-766,735,-737,-813,509,359,468,254,246,-574,-191,324,-93,-57,209,226,278,14,-952,-340,-299,84,-64,-523,-458,785,214,-197,-165],"high":[66,1,-3,4,3,-1,-3,3,5,-1,0,-2,-1,2,0,3,1,0,1,-3,1,4,0,10,2,-3,-2,2,2,-1,2,2,-3,-3,-1,-3,-3,-2,-8,-1,-8,6,2,2,1,-8,-2,3,-6,-2,2,-2,-3,5,3,1,-2,0,3,-2,-5,-8,4,0,2,4,7,2,0,-1,3,-3,-4,-3,-4,2,-5,-3,-2,-1,2,4,2,0,2,4,3,-4,-2,0,0,1,1,1,2,1,-2,-3,-5,2,-1,0,1,-1,1,-3,-6,-4,1,-1,2,0,0,-1,0,-3,0,0,0,-1,-2,2,1,3,-1,-2,0,-1,2,3,-1,1,1,0,0,-1,1,4,0,1,2,1,-1,-3,2,-1,-1,1,3,0,0,1,0,-1,0,-2,0,2,3,-1,4,1,1,1,0,1,6,3,0,-1,-3,-2,3,-2,-3,-1,2,3,2,0,4,0,-1,-2,6,4,1,0,3,-1,2,-1,1,-3,-2,-1,2,0,1,-1,0,0,0,-1,1,0,4,-1,0,4,2,2,1,5,2,6,0,-3,-8,2,2,0,1,6,1,-8,7,2,-1,7,2,-3,-1,-1,3,5,-3,1,5,1,-9,-8,-1,8,2,-4,0,3,-1,-2,-7,-5,-10,-1,2,-5,1,-2,1,3,-2,1,6,2,0,0,3,-2,-1,-4,4,3,0,1,-5,-5,-1,-2,3,-4,-1,11,2,0,3,0,0,0,0,-4,-1,1,3,-3,1,0,2,-1,-2,-7,3,-2,0,-5,-1,0,2,3,3,0,-6,-3,-3,1,-4,-2,-2,-2,2,-2,-3,-1,-4,5,0,1,0,-3,2,1,5,5,0,-4,5,-4,0,-7,-2,0,-5,0,4,2,-1,5,-2,3,-5,-3,-3,2,-4,-3,-3,-4,-9,0,1,4,1,0,-1,0,-7,-2,-1,3,1,0,0,4,0,2,-2,-5,-2,5,2,-1,0,4,5,1,1,-2,0,-1,-9,2,1,4,-2,-3,-5,-3,-1,4,2,2,2,0,2,2,2,-2,1,-1,-4,3,4,-1,0,6,-1,-1,-6,0,3,2,0,1,-4,-2,5,0,0,1,-3,-5,-4,0,-4,-2,2,1,5,1,2,0,-1,1,0,-2,-4,1,-4,0,0,-1,1,0,3,0,1,-1,-1,0,3,-2,2,0,3,2,0,2,-2,0,7,3,1,1,0,0,1,-2,-2,1,4,1,3,-2,-1,3,0,-2,0,-1,3,3,2,-3,-3,-1,1,0,2,0,-2,-1,-3,-6,3,3,1,0,2,3,1,1,1,-1,1,-2,0,3,2,-2,-2,2,-1,-1,-6,-1,-2,0,0,3,-1,-2,2,-1,1,-4,-7,1,2,4,0,0,1,-1,0,-4,-3,-2,0,0,2,-3,0,-2,-2,-3,0,0,-1,0,0,3,-2,-1,-3,-2,1,4,2,-2,2,-2,0,-1,1,3,1,2,-1,-4,-1,-2,1,-1,5,1,1,-1,-2,-2,-1,-3,-2,0,-1,0,3,3,-1,-3,0,3,2,3,0,1,-1,1,1,1,3,0,1,1,0,0,-1,2,-1,-1,1,-2,-1,0,0,0,0,-2,1,0,-1,4,-1,-1,-1,1,1,3,-1,-2,-1,-1,1,-3,0,-5,3,-1,1,-1,0,0,2,-3,-1,-2,0,-1,1,2,1,-1,-2,-2,0,1,-2,1,0,4,0,0,1,-1,-2,0,-1,-1,1,-3,-1,1,0,0,3,0,0,1,1,-1,1,-1,0,1,1,1,2,1,-1,-2,0,2,1,-1,-1,1,-1,-2,0,1,6,0,-1,0,-1,0,2,1,0,-1,1,3,0,-1,2,0,1,0,-1,1,0,2,0,0,0,0,1,1,0,1,1,1,0,0,-5,1,2,-4,4,0,-1,0,3,1,0,1,-1,1,1,1,-1,-4,0,0,0,0,1,-1,1,1,-1,-1,-1,-4,-1,2,3,3,0,-1,-1,-1,-2,-1,-3,2,3,3,2,-2,2,2,0,1,3,1,0,2,2,1,0,-1,3,0,0,1,-1,2,-6,0,4,-1,4,0,-1,2,-3,-2,2,1,-2,-1,-1,2,2,3,1,-7,-3,-3,3,2,1,0,1,0,0,2,2,-4,3,5,1,1,1,0,0,-4,1,1,-2,-4,-1,-1,1,2,3,-1,0,-1,-3,0,-1,0,3,-2,-5,0,-1,0,-1,1,1,0,-4,0,2,0,2,4,2,0,2,4,0,0,-1,3,0,2,2,-1,-2,0,1,0,-3,0,2,0,1,1,-1,-1,-4,4,1,2,0,0,2,1,1,0,-5,-3,1,2,3,1,1,0,-1,-1,0,-1,-2,0,2,2,0,1,0,-2,-3,2,1,0,2,1,1,0,0,0,0,3,1,-1,0,-4,-1,3,3,1,0,2,2,1,1,1,0,2,-2,-3,0,0,5,1,-2,0,3,4,-1,-1,-1,5,-3,-3,-6,-1,1,2,-1,-2,-6,1,4,5,2,5,3,4,2,2,1,1,1,1,-2,3,-2,0,-3,6,2,2,2,-2,1,-1,2,-8,3,4,3,5,2,-4,2,2,-8,1,5,6,1,3,0,-15,-1,5,0,-13,-2,1,2,6,2,5,0,2,-5,-8,-1,1,4,-3,0,1,-2,7,-6,7,1,-5,-3,-1,5,1,0,2,3,5,2,1,0,3,4,2,3,3,3,-1,4,-1,4,2,4,0,-1,0,1,1,-5,0,-2,6,10,0,3,0,-4,1,-2,0,3,0,4,-6,-3,3,4,-4,-11,-9,-7,3,2,-6,-2,1,-2,0,1,-5,7,-1,3,1,7,0,5,4,2,2,2,-4,0,3,4,0,0,3,1,4,-2,-5,0,-1,-5,2,7,5,2,-10,-4,3,-1,-2,1,-1,-6,-14,4,-1,-8,3,-1,-27,-15,0,-2,6,7,0,16,4,-3,4,2,6,2,-3,17,4,-1,3,-2,-2,-2,1,-3,5,0,-2,11,-1,1,8,5,1,12,4,-2,-5,15,4,3,1,-10,-1,-3,-9,-1,-6,2,11,3,6,4,-3,1,-3,-3,3,-3,-10,-10,-6,20,-1,-6,2,-15,1,-5,8,7,2,1,-1,-7,8,-14,-1,-11,10,6,2,6,-11,15,5,8,7,1,-1,2,3,-1,6,0,3,-1,17,-2,-14,5,-6,-3,-5,-1,-8,6,10,-4,8,0,11,-1,-6,-8,-41,16,8,-4,-7,2,-2,5,0,7,2,4,-6,5,-4,-7,4,7,5,-9,-3,-2,-5,-3,-1,12,2,-7,-8,3,8,0,-5,5,6,2,4,5,-1,-1,3,-3,26,3,2,3,-8,-2,-11,-5,-1,-14,10,1,-6,-6,4,2,10,0,2,0,-6,-4,-11,-16,-8,5,-3,-2,-9,-7,-1,-6,4,6,0,0,-5,3,-2,-18,13,-3,-15,10,-1,3,-1,-7,-3,5,-3,-7,13,-4,-4,0,-8,3,-1,-9,-9,-13,-4,-2,-1,15,3,2,-8,-2,9,-8,13,7,-10,-3,3,4,1,3,-10,-2,-11,-1,-4,6,-6,-5,11,-1,4,10,1,8,1,0,-3,-2,15,5,-2,2,-2,9,9,8,-4,-10,6,-11,0,4,4,1,-3,4,-2,-9,1,-5,-6,1,7,1,6,0,-3,0,3,1,6,7,4,2,-1,-2,-7,-1,-1,-9,-5,5,3,4,-14,4,3,2,3,-4,9,-1,-8,-12,2,-16,-11,-6,-5,3,-1,-6,-15,3,-1,6,4,-2,1,0,-4,12,4,-7,-4,5,-4,-18,1,0,-9,5,13,8,2,-1,6,-3,0,5,4,4,5,2,2,8,0,-6,-3,6,5,0,-3,5,4,6,1,1,-3,-6,2,5,7,-3,1,0,-5,2,-2,1,2,-5,9,-4,0,-4,0,-1,-2,2,-3,7,2,-1,-16,-7,-4,-3,1,-4,3,2,3,-3,-5,7,-1,6,-3,11,8,8,4,2,3,3,3,-1,6,0,2,0,-1,-7,0,-5,3,-4,0,8,-4,4,9,-18,-24,-1,11,8,-4,-6,-4,9,12,8,8,2,3,-1,9,-1,10,-1,-2,5,29,4,-6,-4,-2,-4,-9,7,10,3,4,-1,-3,4,11,-2,-5,5,9,1,6,-2,-2,6,1,1,-6,6,4,0,-6,-7,-9,-9,2,-1,18,7,5,-7,4,8,-7,-12,10,6,12,15,0,-6,4,0,4,2,-14,-19,-11,14,-6,5,-7,8,-4,16,3,0,6,-7,-6,3,-9,-6,-6,17,8,-8,9,3,4,9,10,15,4,8,11,3,2,-1,-1,-4,-9,-41,14,12,23,14,6,-19,14,-1,17,5,-6,-9,2,11,-3,17,6,-33,10,-12,-8,1,-5,14,4,1,-2,3,-7,1,7,9,-9,19,20,0,6,-7,-7,11,3,4,4,9,3,-3,-5,2,-10,8,3,5,20,2,-5,-22,14,2,2,5,-20,1,10,5,-6,17,9,-5,14,5,-3,14,2,-27,1,22,-12,7,-5,7,4,-3,-12,4,-19,7,-3,-19,-8,-12,-2,6,20,12,-6,22,14,-3,11,-6,-8,-5,-5,2,1,2,11,32,11,-1,26,25,-18,-28,20,14,1,6,13,2,17,12,-11,18,12,10,10,30,22,-126,32,-7,-42,9,15,9,-11,3,7,11,-47,-8,-11,-23,-7,-3,5,19,18,11,32,11,5,6,-9,18,9,-17,-2,-4,25,0,-39,2,-13,14,-23,3,18,16,-28,-12,-29,43,7,7,-11,-29,-11,16,9,5,0,-12,6,29,19,17,-15,-12,2,-8,18,10,3,15,26,40,2,-6,-35,6,-13,-9,31,9,20,23,3,-1,11,1,20,17,12,9,7,5,-1,11,-11,26,15,7,-11,-8,55,16,20,16,-14,45,45,3,6,-31,-15,10,2,-23,45,6,10,36,8,-1,-22,-10,-18,-95,-44,18,-53,-36,30,25,-24,-15,4,-9,30,54,5,24,-7,-39,-28,22,0,-2,41,51,28,20,23,-4,-63,5,22,41,61,29,2,12,28,-26,-14,-2,20,-56,11,10,-77,-44,-70,3,-52,-49,50,-14,63,32,25,45,-8,-33,35,71,47,-24,-53,-7,41,45,7,19,57,61,30,-95,3,-5,-42,-15,43,-67,-79,15,34,-155,16,-33,-54,37,17,-63,12,25,11,38,32,-43,49,-21,-73,-67,-29,-6,-50,34,31,-38,1,7,4,54,35,7,42,54,4,46,-49,23,10,-50,40,10,-6,19,22,5,17,-15,41,32,23,13,8,-67,4,2,30,1,-18,-31,-48,33,8,-47,-84,-32,10,-69,34,-16,14,5,40,27,27,-40,-25,2,-2,23,29,-1,-10,-9,30,-53,57,29,-37,22,-14,2,6,16,28,12,-18,-76,3,-3,-43,-4,-44,7,45,10,23,22,73,2,5,-4,-14,24,5,-32,-49,-12,-9,-57,70,8,-15,3,1,36,2,-12,-12,-40,-13,17,26,17,-19,-36,-37,-71,-24,-44,-40,5,-28,52,21,-44,-25,-36,-13,-46,-57,-15,12,11,37,84,-1,-42,16,25,1,-40,-52,1,0,43,-24,-12,-49,10,-12,19,19,30,4,9,72,-31,-108,0,-42,46,12,-6,-16,-13,3,-18,-62,-10,-49,32,10,41,-6,13,-43,-3,39,3,24,12,31,-33,12,-6,0,44,-30,-19,77,44,-35,-8,26,10,17,2,20,68,-37,-35,13,49,20,6,8,-1,21,-9,4,49,-27,-34,-9,26,15,-22,-15,-52,-18,65,12,17,-7,65,0,18,7,72,-28,-72,10,-13,-23,13,65,8,86,-1,5,8,-20,17,11,23,3,78,101,-34,-2,42,64,-50,-93,9,20,49,-9,-11,-63,-42,-26,-75,7,-106,15,30,-37,-22,-135,21,-40,-63,26,-28,-21,25,-14,10,53,25,-2,25,88,25,-72,-15,-66,-3,93,4,47,-30,-12,4,42,41,16,128,-88,-28,-33,-17,15,60,-22,47,39,-24,0,37,20,38,39,120,-32,-16,-13,-6,-29,-20,-157,-131,24,-10,71,-21,-37,71,-69,-25,51,73,-19,21,3,-32,-75,8,-22,80,25,-50,51,134,-20,33,-13,53,46,-24,-31,-3,1,19,-24,-29,7,-16,3,-23,-36,61,-115,24,59,9,-70,1,45,82,-34,80,-11,1,-41,27,14,-83,53,77,72,28,-43,-39,78,100,35,-41,50,-24,-15,38,-21,-22,74,-19,-2,-49,-63,-5,67,-7,19,-21,-19,-140,76,24,54,3,10,70,130,46,15,-10,1,26,65,34,-19,14,12,-45,-16,109,-58,-89,101,11,36,-10,12,52,-40,20,42,16,89,-16,94,-327,70,-26,-87,-59,-84,153,125,0,-57,-6,145,69,40,28,-163,153,-14,-130,-336,-9,-115,-143,-47,115,80,-33,-20,-172,-178,-2,-64,-221,-19,-163,-111,-73,-19,36,-49,133,74,26,-45,-2,28,-92,-36,16,122,80,-18,43,-71,97,-52,46,46,-32,-80,41,16,4,54,37,56,-19,-149,-53,79,23,16,46,20,4,-78,-7,-48,116,41,55,-15,-63,86,-16,19,-4,-11,53,108,43,116,-21,-25,37,-122,-56,-14,116,5,-19,38,-41,43,-40,-49,2,-39,103,-9,24,79,2,-8,76,-9,76,-100,25,-44,23,77,27,-14,4,-111,67,-27,42,73,10,60,63,14,-18,6,-50,24,69,-8,-1,21,9,-44,-65,12,65,34,33,4,11,32,64,193,-116,-224,-175,8,39,-60,37,84,9,-81,23,-117,55,21,-38,14,118,54,13,68,-63,48,96,-11,65,107,105,13,-9,-76,39,4,-74,-27,-33,-44,-35,-46,-158,81,-72,22,86,171,252,119,192,-331,62,18,22,114,-23,23,-4,57,31,28,29,75,54,178,17,59,150,55,53,-11,-234,-96,82,101,3,27,-12,-118,13,-2,-14,107,-86,102,29,247,-114,165,196,182,-7,89,17,268,-130,149,172,0,-104,-34,-109,-400,-47,-76,171,163,64,-219,72,180,41,77,285,185,184,-211,-247,325,-158,-420,309,-82,-331,286,43,-400,-380,-223,-3,15,111,85,-145,204,296,56,-223,-127,255,-70,-137,-295,456,-83,-113,320,346,286,-33,-97,100,-50,-71,34,-66,19,-2,-135,-276,124,-16,-4,189,45,-222,53,-205,-138,-334,134,-39,215,-155,-369,-175,-6,218,-158,98,9,281,36,180,61,-7,58,101,127,-96,-130,171,-55,53,-108,48,12,168,43,-71,28,-159,-142,67,80,160,46,239,61,4,-36,-67,44,-23,-353,156,139,-1,147,-299,-135,-352,215,277,-23,-1,18,-94,65,219,81,239,-91,217,4,-92,0,-70,-145,-162,10,-17,-148,-99,-70,49,304,65,121,-32,217,150,-103,-67,-58,113,-44,-104,-11,237,-46,80,-27,83,-88,-445,32,205,198,-32,-5,-239,-311,-73,-125,-118,-13,-25,289,-96,-68,-108,-101,278,121,68,151,25,99,51,-56,78,-84,149,55,231,186,199,602,257,231,92,-313,-51,226,49,169,-30,277,97,262,-588,29,-192,370,66,162,-622,321,-466,923,-132,39,-114,-174,-634,597,116,-792,-282,493,184,322,425,107,-184,-89,-124,201,210,-279,-503,-34,-586,325,296,278,-464,-316,-322,-496,-427,-345,-213,375,-365,-504,634,135,340,-170,-328,100,136,435,98,-456,-580,444,21,-211,-304,21,-26,-125,179,39,-93,-42,-1,-345,-182,-126,132,-246,122,-357,87,468,60,267,30,105,-103,226,12,44,319,-80,-336,-251,-111,-98,-514,-68,-146,-225,113,-30,8,-95,122,196,-28,-401,-80,-86,-131,271,-35,-140,113,246,-152,-175,-227,-45,-15,-201,292,-40,223,-39,-231,-39,-82,-95,84,211,261,16,12,56,-133,63,-84,-28,-90,-305,-310,-119,121,-224,-117,141,-46,-38,126,61,12,-254,-21,-123,-70,60,139,28,-72,0,11,70,89,103,99,127,68,-21,-154,-13,188,40,47,62,26,85,55,-15,-73,-216,79,158,12,25,-23,-154,116,-98,-223,-9,-47,179,-5,-328,-48,-87,-144,88,-111,29,48,105,20,-156,-75,-7,-57,34,-40,88,-160,-118,22,-8,7,-61,-13,39,110,56,26,-164,-119,-107,-40,74,-9,-60,54,-41,62,22,17,66,20,-23,12,-21,17,25,-148,77,63,87,-74,235,124,10,93,-145,-41,45,-83,74,81,-49,-50,-58,167,28,-100,3,-56,-67,79,27,2,190,-88,-165,-90,-33,-40,52,-71,-75,-22,-16,40,-13,51,6,-27,107,120,-28,44,65,-8,43,33,-124,34,205,-6,-22,67,6,-74,-7,273,112,-27,-127,99,-16,21,-168,40,91,6,-42,-105,-81,-90,93,-80,47,26,-5,2,53,48,-83,48,64,-129,-71,100,-69,167,38,-11,74,49,15,-95,-30,-104,159,82,5,-18,-26,-159,-30,49,29,-5,-79,24,-57,74,-98,52,-81,-5,-62,-63,-19,67,52,12,-29,-62,68,2,-58,52,-21,-6,77,43,77,146,-16,8,-17,-132,316,387,154,-213,8,14,-114,31,104,-63,102,119,140,62,-13,22,-124,-106,-111,-110,104,117,-5,-33,106,58,-57,-213,98,41,30,111,160,58,50,2,-11,-238,-47,-15,115,-86,232,39,31,-3,-122,-190,35,-17,-123,-11,-3,-241,96,-14,-104,-103,-32,160,79,7,103,-275,42,172,39,58,23,7,-29,-224,14,12,-33,-11,6,-66,-109,-37,11,-179,24,-9,-36,16,114,44,-8,-19,-58,6,92,-26,109,6,89,-68,-89,-24,-97,14,-114,-53,-13,-61,-84,-11,-46,-8,99,139,135,-12,24,8,74,108,-58,219,79,-27,38,113,-82,52,-97,39,-65,141,-83,-27,-76,-35,80,51,64,234,34,168,209,110,-88,27,-36,-21,67,145,21,4,-43,-245,-285,-72,29,205,47,-46,36,-6,85,-128,276,368,158,-56,291,61,-398,-42,0,-126,-115,120,168,-12,1,246,159,179,-337,131,85,66,-311,-152,590,63,-88,36,-166,263,582,246,-241,285,421,93,-920,190,-165,-170,-220,112,-331,185,496,-126,-32,19,-83,76,269,-383,102,131,-396,66,66,-108,128,-250,-15,-223,-32,-405,-222,-173,181,282,70,211,54,66,-343,-115,267,180,53,-141,12,162,-17,137,363,96,-65,192,-111,181,320,-113,282,-297,-58,-62,21,-228,522,-8,-89,168,-10,497,204,-94,260,304,-36,-565,-269,-204,77,-64,300,-303,220,377,86,212,165,285,108,-278,-54,-117,-629,-513,-180,58,-88,-328,-509,-70,200,-233,209,-134,-1183,-144,65,114,-34,19,80,284,121,383,-24,152,17,44,52,-167,-92,-132,-11,7,29,-241,-512,-49,-203,-144,66,403,27,103,-108,92,44,244,-204,-2,132,76,405,-50,-260,-42,-94,56,92,-29,59,93,-34,63,201,13,-544,161,-103,-95,-35,-15,-14,213,-78,236,-275,-268,-119,-16,-18,301,187,-9,-187,-186,-133,-38,-235,-66,20,-47,136,-23,141,15,-250,129,176,-52,128,-69,-101,46,-79,10,-80,248,164,-86,39,-447,36,139,81,53,-92,-140,-21,48,107,351,10,-272,-192,-122,109,150,126,99,182,162,-123,2,-686,-228,50,137,158,-276,11,135,-15,48,-73,35,-36,101,27,141,166,75,-68,-270,-234,8,-10,-368,51,-147,-10,-114,7,-129,-130,61,16,66,135,-88,97,-80,-108,188,-35,-51,-210,-82,-161,1,90,-277,-369,55,-14,227,-197,-75,77,-14,-127,-20,-81,66,150,119,50,-6,-26,-6,60,88,-28,-46,45,94,13,300,139,51,-46,-31,-39,-21,59,-116,-143,151,6,64,-131,20,128,88,73,-4,111,104,50,-53,-101,116,31,-15,-5,-35,205,57,76,48,-34,-33,122,33,-67,98,38,32,-19,-77,169,-141,46,39,60,-122,-137,-12,-17,137,117,-3,-139,-191,35,50,-156,176,-5,106,119,125,33,-95,-106,21,-175,-21,242,-74,64,1,88,-176,-207,13,32,124,46,-6,146,78,-6,48,62,60,289,-54,115,55,-91,-33,17,126,-53,202,234,74,331,-35,-8,-10,0,-337,-46,116,176,-113,224,-101,-122,66,269,300,45,315,-79,2,20,-331,155,-144,-525,378,-148,59,-199,-204,-52,-407,129,189,-615,327,14,370,118,103,225,207,-58,195,55,-55,204,-119,-152,-396,-176,-34,-90,194,220,-76,56,43,-46,42,-60,394,313,308,-156,-93,295,39,248,-219,623,52,-114,406,185,-360,-140,403,494,105,-212,-292,68,-659,-554,676,280,16,389,176,-461,-29,249,-294,271,-57,235,236,-125,-735,-94,-696,186,-3,-433,42,400,-4,-386,8],"low":[64,0,-3,2,6,-2,-3,-1,8,-1,0,-3,3,0,0,0,-1,6,-1,-3,2,3,1,7,5,-6,-4,7,-5,-1,7,4,-9,-3,4,-8,1,-10,-2,-22,9,14,-1,4,-2,-9,0,0,-2,-5,0,4,-7,8,3,0,-2,0,6,-7,-5,-4,2,2,1,6,1,5,1,2,-2,-3,-2,-3,-2,1,-6,-2,-4,1,1,2,4,2,2,4,1,-3,-3,1,-3,3,1,2,1,2,-3,-5,-2,3,-1,0,1,-1,1,-4,-6,-3,1,-1,2,1,-1,0,-1,-3,-1,1,-2,1,-3,2,2,3,-1,-1,0,-2,2,2,1,1,1,0,1,-3,-1,5,2,-1,3,-1,0,-2,2,-1,0,0,3,0,1,0,0,0,-3,1,-1,2,4,-2,2,3,2,-1,2,0,5,4,0,-2,-2,-5,3,1,-4,0,3,1,3,1,2,2,-3,0,4,3,3,0,2,0,2,0,-1,-2,-2,-1,3,-1,2,-2,2,-3,2,0,0,0,2,-1,0,4,0,3,4,2,3,3,4,-6,-7,2,1,1,2,6,-8,0,6,3,0,4,4,-2,-1,-3,3,6,-3,3,0,5,-14,-10,4,9,-2,-4,0,9,-4,-10,1,-7,-7,-1,2,-10,1,4,0,4,-1,-2,7,4,0,-3,4,-1,-4,-3,6,4,-2,-1,-2,-6,0,-2,2,-3,1,9,3,0,1,1,0,1,-1,-5,-2,2,3,-1,1,-2,0,1,-4,-5,3,-1,1,-5,-2,-1,3,5,3,-6,-2,-3,-2,1,-5,-1,-4,-1,3,-3,-4,-2,0,1,4,-4,2,-2,4,1,2,4,2,-3,4,-3,-2,-7,-1,-2,-1,-2,3,2,-2,6,0,3,-8,-2,-3,0,-3,-3,-5,-7,-4,-1,2,4,3,1,-2,0,-8,-2,1,1,3,-1,-2,7,1,0,-2,-3,-4,6,1,-1,-1,5,3,4,2,-4,1,-3,-8,1,1,5,-4,-4,-2,-4,-1,4,3,3,3,0,3,-1,3,-3,-1,1,-4,4,2,1,-2,7,2,-3,-6,0,0,4,0,2,-6,0,3,1,1,0,-7,0,-4,0,-4,-1,2,0,4,2,2,1,-1,-1,-1,-2,-1,-2,-2,0,1,-3,2,0,2,2,1,-1,-1,1,1,-1,1,2,2,3,-1,1,-1,1,2,7,1,0,0,0,0,0,-3,1,3,3,2,-2,-1,3,1,-3,-2,2,3,-1,3,-3,0,-2,2,-3,4,-1,0,-2,-5,-3,2,3,2,0,1,2,2,2,0,-1,1,-1,-1,4,2,-4,-1,2,-2,-1,-6,1,-2,-3,3,1,-1,-1,3,-2,-1,-4,-3,-1,3,2,2,1,-1,0,-3,-3,-1,-4,0,1,1,-1,-1,-2,-3,-3,0,2,-2,0,1,3,-1,-3,-3,-2,1,4,1,-1,0,1,0,-1,1,1,3,2,-5,1,-4,0,1,-1,5,1,1,-1,-3,-1,-3,-1,-2,1,-1,-2,1,6,-1,-4,1,2,3,1,1,2,-1,-1,3,2,1,1,1,1,-2,0,0,2,1,-2,1,-2,-1,0,1,-1,0,-1,0,-1,0,2,2,-2,0,0,0,3,-1,0,-1,-2,1,-3,-3,-3,3,1,-1,0,0,0,1,-2,-2,-1,0,0,0,2,1,-1,-3,-1,-1,0,1,1,0,1,1,0,2,-2,-1,0,-1,0,-2,-1,-2,3,0,1,1,1,0,-2,3,0,0,0,0,1,1,0,2,1,-2,-1,0,2,2,-1,-3,1,0,-2,0,0,5,2,0,-1,-1,1,2,0,0,0,0,3,1,-1,1,-1,2,1,-1,0,0,1,0,0,1,-1,2,1,1,0,0,1,1,-2,-5,3,-1,-1,2,2,-2,0,3,2,1,-1,0,1,0,3,-4,-3,-1,3,-2,1,0,1,-1,2,-3,-1,-4,0,-1,2,2,3,2,-2,-3,1,-4,-1,-1,1,4,2,4,-1,0,2,0,1,4,1,-1,2,2,2,-1,0,1,1,1,1,0,-4,-4,2,4,-2,4,0,-2,3,-3,-2,2,3,-4,-3,0,4,2,2,0,-8,-1,-4,4,3,2,-2,2,-1,-1,4,-3,3,0,6,3,0,0,1,-2,-2,1,-1,-4,-2,0,-1,2,2,3,-1,0,-2,-2,0,-1,0,1,-1,-5,0,-1,1,-1,1,1,0,-6,1,2,0,1,2,6,-2,2,5,0,0,-1,4,0,0,2,-1,-2,1,1,0,-2,-3,4,1,-2,3,-1,-4,-3,5,2,0,2,0,0,3,2,-1,-9,3,0,1,3,1,1,-1,1,-3,2,-4,-1,2,1,1,2,0,-1,-3,-1,1,3,-1,2,1,2,0,-1,-1,2,3,1,-1,-3,-2,-1,3,2,-2,4,1,4,2,1,0,0,2,-4,-1,-1,1,4,-1,1,-3,1,8,-1,-2,0,3,-2,-6,-4,0,1,3,-3,-5,0,-2,5,4,4,3,5,0,5,2,2,0,1,2,-4,3,-1,0,-4,8,2,2,1,-2,-1,-2,-3,0,3,2,3,0,6,-5,5,-3,-4,2,5,5,3,0,-11,-6,3,5,-10,-7,1,-1,1,5,6,6,2,-2,-10,-7,5,1,3,-1,-1,2,-3,2,0,4,3,-4,-7,2,4,1,2,3,1,6,2,3,-1,1,3,4,2,4,3,-2,3,0,4,2,4,-2,1,3,0,-5,-3,0,2,3,7,6,2,-2,-7,2,-4,6,4,-6,9,-13,2,4,5,-12,-5,-12,-5,5,2,-10,0,1,-2,-1,-3,2,7,-3,6,3,1,4,5,2,4,2,-1,1,-2,-1,8,-3,3,2,0,5,-4,-3,-1,-3,-6,-1,12,4,0,-8,-3,4,-7,5,-3,1,-14,-11,10,-5,-7,-4,1,-37,-4,4,-7,5,15,-2,12,5,5,2,0,8,1,-7,20,6,-3,4,-2,-6,3,2,-2,2,-3,2,6,3,-3,13,4,5,2,10,-7,-1,10,9,4,-8,-7,-3,3,-10,-8,-3,-3,23,1,6,6,0,1,-4,-2,-3,-7,-7,-15,2,12,4,-8,-6,-7,1,-4,10,4,-2,11,-3,-8,1,-11,-1,-10,14,5,5,2,-7,8,7,12,7,3,0,1,0,1,-2,8,3,0,8,-1,-9,6,-7,1,-11,2,-7,4,10,-1,-5,13,8,0,-7,-35,-23,13,19,-1,-8,3,-9,12,-1,2,12,-2,-9,5,2,-9,6,5,2,-7,-10,4,-6,-1,-3,7,11,-14,-5,7,10,-1,-6,5,4,4,3,2,2,-2,8,-8,6,22,5,0,-6,-5,-9,-5,-9,-6,10,6,-8,-10,7,3,5,2,5,-3,-6,-2,-19,-17,0,3,2,-9,-18,0,-5,6,4,6,-2,-1,-1,0,-1,-19,10,-7,-9,4,7,1,-1,-3,-7,6,-9,2,8,-5,-8,8,-6,-2,-2,-6,-15,-11,-26,14,4,19,6,0,-14,5,9,-8,11,-1,-3,0,6,3,0,0,-9,-1,-9,-2,-10,8,-7,-2,10,-3,1,17,-1,6,3,2,0,-4,2,16,1,0,1,3,8,9,-5,-4,3,-10,2,4,3,2,-9,4,2,-9,2,-6,-7,2,6,1,6,3,-6,-5,11,3,3,7,2,-5,1,6,-10,-4,2,-9,-8,8,1,1,-7,3,3,4,3,-4,7,-1,-8,-13,2,-18,-12,-6,-3,3,-8,-3,-12,3,-5,10,9,-3,0,-2,-2,4,11,-9,-6,8,-9,-13,1,0,-6,3,11,10,5,-1,7,-5,-7,9,9,1,3,7,1,4,0,-5,0,0,10,2,-3,1,5,5,3,1,-3,-6,3,-2,14,-1,-6,4,-5,-2,-1,3,2,-8,10,-1,0,-3,-5,1,1,-1,0,4,-2,-5,-15,1,-2,-4,1,-4,4,0,5,-11,4,2,2,-2,3,10,11,4,8,4,3,2,2,2,2,1,3,1,-4,-5,-2,-5,5,-10,1,10,0,1,7,-28,-22,9,10,6,3,-12,-5,11,10,13,8,3,1,1,9,-1,4,1,-4,11,9,16,-4,-3,2,-13,-1,6,10,4,2,-3,2,4,6,2,-4,3,7,4,7,-9,0,4,8,-4,-2,1,6,-3,-3,-5,-28,-7,12,1,10,12,5,-3,3,11,-8,-10,1,13,-4,27,0,-5,5,-1,2,4,-29,-3,-16,20,-4,8,-10,1,2,15,8,-6,0,-5,5,-18,2,-2,-8,18,6,-17,-8,18,15,5,14,11,11,9,13,2,3,0,-6,-1,-61,2,18,14,6,28,-4,-10,11,6,7,-1,8,-3,3,3,1,11,-11,-12,-10,-6,8,-7,-3,18,8,1,-19,18,-16,5,9,10,-12,14,26,-1,12,-14,-9,16,-4,18,0,7,3,-7,-12,14,-10,5,7,-4,27,7,-27,-18,23,-5,6,2,-8,-7,10,10,-6,20,10,-8,7,13,2,3,-28,-1,12,9,-15,19,1,3,4,-14,-3,-7,-12,12,-6,-30,-6,-6,4,4,20,6,0,27,10,-7,13,-17,1,-7,1,6,-2,4,4,33,0,17,12,24,-56,-2,47,12,-10,18,6,-1,21,3,0,9,20,-4,22,9,-96,-21,42,-17,-13,6,23,-6,2,6,3,-14,-40,-6,-33,8,-16,7,2,21,19,17,32,6,11,5,-12,29,-2,-6,1,-18,30,-43,6,-10,1,-11,-3,4,10,14,-17,-36,-11,42,15,8,-42,-4,-16,24,-5,18,-2,-1,-14,30,32,19,-40,11,4,-22,22,19,0,3,25,44,8,-46,1,8,-31,2,27,19,22,20,12,-5,10,0,30,1,16,15,7,6,2,-12,-14,51,4,9,-41,29,20,17,41,-13,7,22,70,12,6,-79,40,-2,3,-30,40,13,13,44,-3,14,-28,-14,-157,30,-85,-15,-18,1,53,1,-1,-11,1,-7,6,61,20,11,-11,-18,-33,20,16,-24,11,73,34,21,14,-3,-59,22,12,17,44,58,9,9,42,-86,-34,37,19,-32,12,-18,-74,-154,-41,81,-120,-31,113,14,4,50,52,-6,29,-16,34,58,43,-34,-90,-7,67,79,1,30,41,73,-56,-18,13,12,-121,55,6,-75,-112,32,-60,-51,12,-82,32,-36,69,-78,26,45,18,43,1,-8,43,-22,-114,-35,-29,-36,-20,61,-3,-27,3,26,-30,30,97,1,34,54,11,38,-52,25,3,-33,15,33,-26,27,33,-10,28,-13,22,54,28,7,-23,-36,11,-1,22,3,-15,-36,-60,55,-33,-28,-128,35,-57,-11,38,-45,7,30,29,35,37,-53,-25,30,-1,-21,69,-8,-10,-40,22,-36,73,-1,-22,29,-11,-26,55,-3,45,10,-13,-97,17,-6,-70,19,-57,8,39,23,34,20,49,13,21,-15,-4,6,1,-64,-18,11,-18,-86,90,20,-24,16,6,31,2,-25,-19,-26,3,0,32,0,-18,-53,-70,-29,5,-101,-40,25,3,32,24,-53,-36,3,-62,-78,13,-33,-21,27,83,27,22,-27,31,29,-4,-40,-83,20,3,7,-2,-29,-50,60,-16,24,7,7,41,-15,84,-91,-63,-28,0,33,24,-1,-20,-33,25,-76,-24,-10,-37,-4,37,51,8,-22,-50,22,39,2,37,9,21,-8,6,-8,-22,51,-35,-15,53,58,-36,9,16,24,21,6,24,42,-41,-24,31,45,23,-3,15,1,17,-11,17,37,-24,-51,9,16,-5,10,-33,-41,-33,57,31,31,-13,28,24,36,-29,21,3,-55,28,-39,-2,41,46,24,51,22,17,2,-23,13,16,29,-17,37,113,12,-13,40,28,-67,-76,56,9,2,-7,31,-97,-52,6,-106,1,-89,35,8,-9,-50,-114,47,-41,-69,16,-21,-20,33,-18,-4,32,24,26,40,56,20,-47,-2,-65,-1,25,67,25,-9,1,-34,55,46,22,62,-34,-22,-29,-7,-6,60,-5,26,56,-33,15,12,38,19,53,64,10,8,-37,0,-121,-60,-48,-133,31,-14,69,-5,-31,-7,-6,-14,55,83,-17,29,-18,-114,22,-15,-18,93,24,-55,63,98,17,25,-28,53,43,-5,-39,4,-10,29,-79,10,-36,-27,71,-76,27,-11,-60,-16,99,24,-107,36,23,86,-1,35,-2,-4,-53,60,13,-92,61,51,95,3,-25,-46,72,120,34,-62,53,-24,11,26,-28,1,54,-15,-23,-61,-33,4,52,22,31,-34,-67,-106,95,16,64,-6,3,27,75,88,68,-1,6,14,57,49,-13,15,-11,-67,10,88,-48,-84,69,37,6,3,34,30,-55,63,45,18,54,-22,-29,-202,39,-13,-106,-111,37,149,94,12,-72,-40,177,120,-29,15,-93,121,-117,-110,-274,-148,8,-187,-121,157,10,62,-1,-153,-233,6,-51,-262,-27,-126,-89,-81,28,40,-16,146,16,56,-22,11,0,-105,7,3,92,85,8,-7,-3,98,-43,32,44,-27,-123,64,34,-12,91,-4,43,-26,-135,-19,72,36,18,30,25,-48,-83,-23,24,103,44,56,-35,-29,72,-70,35,17,30,20,115,26,135,-37,-18,58,-236,-24,-14,131,70,-3,-9,-30,71,-105,-28,7,-33,92,24,34,76,-19,5,12,41,-35,-73,73,0,47,3,62,-3,-71,-88,109,-17,40,35,15,94,49,39,-18,-65,-11,5,39,50,4,47,-15,-31,-63,8,70,41,38,-67,31,49,48,125,-252,-193,-54,54,-24,-24,102,89,-27,-128,-3,-63,66,-29,-19,15,154,85,-1,74,-106,49,63,95,60,97,88,3,-34,-91,78,-51,-1,-29,-64,-7,-144,33,-164,4,-12,41,87,99,305,60,62,-214,109,8,70,82,18,-1,-59,123,17,23,60,81,-45,226,54,56,35,171,35,-242,-49,-86,153,95,-5,48,-62,-139,58,3,25,34,-109,132,58,-25,51,84,234,101,30,178,69,182,-211,230,154,15,-33,-214,37,-646,163,-127,174,283,-90,-104,106,86,159,-66,250,212,281,-367,-112,320,-404,-511,300,-237,10,375,-110,-363,-638,-71,-23,250,62,223,-100,133,305,-172,-106,-107,324,-211,-96,-245,261,179,-22,207,370,286,-84,27,126,-47,-133,-23,-94,99,86,-423,-121,30,-7,103,170,96,-165,-83,-192,-148,-308,175,-59,275,-403,-319,-88,49,128,-15,79,-200,445,114,110,133,-5,52,117,-14,17,-139,153,10,-85,32,-10,105,49,68,-167,58,-190,-16,81,120,128,41,116,143,79,-154,12,-89,-67,-293,149,256,29,-24,-331,-196,-188,114,275,130,5,63,-387,231,221,84,281,-127,244,39,-24,-66,-204,-107,-87,73,-36,-259,-76,-144,187,239,198,73,-40,98,244,-176,46,-13,26,-4,-216,113,162,-58,121,-38,26,-105,-481,119,166,241,36,-122,-351,-227,22,-194,-149,69,-34,335,-119,-72,-189,77,210,196,-86,219,100,-33,47,39,38,-98,201,5,183,236,161,315,464,228,-8,-434,230,180,9,75,169,233,85,-165,-388,-14,-136,337,-33,16,-337,102,-392,994,177,-283,-49,-317,-306,30,-122,-116,-139,330,284,431,208,157,3,-171,-6,56,-235,-210,-209,-271,-532,406,476,-306,-102,-306,-477,-492,-241,-678,276,72,-410,-290,520,399,417,-431,-178,249,-32,417,-113,-716,-56,381,137,-237,-290,-94,-120,-408,661,40,-321,188,-41,-346,-386,-102,459,-227,-30,-320,71,405,226,128,128,175,-204,71,245,-43,379,-243,-226,-380,155,-364,-297,-90,-51,-181,-48,45,-77,-38,106,202,-243,-144,-69,-133,-87,92,-30,-29,194,-45,-55,-81,-262,40,-75,-101,222,102,164,-231,-63,-224,179,-101,28,76,411,16,-104,59,20,-2,-94,-12,-139,-237,-332,-13,26,-248,-21,171,-55,-60,123,80,-85,-149,-65,-125,-60,99,139,5,-31,7,-59,41,150,59,87,100,118,-53,-72,-18,92,41,74,71,8,76,135,-65,-100,-266,148,129,30,82,-41,-168,79,-61,-212,24,-24,65,-147,-100,-99,-30,-169,66,-56,16,14,182,11,-235,-1,-35,-41,39,-14,-5,-113,-80,5,-11,6,-65,-6,14,166,-33,84,-205,-114,-66,3,-102,66,33,-16,16,39,-4,53,67,-20,-7,1,26,19,-74,-67,89,46,73,-43,138,127,90,58,-144,-56,76,-33,11,99,-1,-123,-10,2,142,-64,-10,-82,-5,32,53,-24,120,-60,-122,-55,-42,-19,44,-149,12,-10,-39,44,-12,13,39,-5,3,172,-9,46,17,45,40,14,-119,13,138,103,-83,97,5,-62,-9,104,233,-41,-74,27,22,-14,-96,32,10,76,-25,-114,-115,-35,74,-32,54,-19,17,-82,99,39,-55,36,-5,-99,-66,139,-79,55,153,-5,16,26,43,-59,-23,-91,140,128,-15,-30,-62,-113,-29,5,97,-84,-23,4,-13,46,-43,-23,-27,-12,-119,1,-66,102,78,-41,-10,-59,22,63,-33,17,-27,-5,38,100,17,118,74,-17,-10,-130,214,240,256,-150,-26,70,-87,-23,106,-3,63,104,159,12,58,-29,-115,-128,-48,-70,53,-4,110,6,112,39,-85,-179,79,25,20,172,121,-31,-13,132,-5,-317,63,1,80,-110,179,115,80,-51,-265,-72,1,90,-155,-48,-64,-130,-35,104,-123,-76,-60,128,71,-20,-66,-84,136,21,140,77,37,-13,-72,-166,22,-63,26,-6,26,-160,-25,-12,-64,-105,24,-29,-35,-10,46,131,-23,-90,24,5,-16,79,84,53,27,-124,25,-119,7,-75,-66,-74,59,-171,-23,45,-91,-1,92,145,112,23,33,22,0,55,75,180,80,-4,23,68,-60,37,-7,-15,-63,117,-95,-35,-55,5,7,41,113,136,129,82,219,174,-89,83,-224,130,53,103,94,20,-116,-363,-138,-108,60,103,92,-26,-31,83,9,-74,285,209,232,0,204,26,-282,-19,-46,-191,6,97,125,-76,80,218,153,148,-349,245,89,-53,-331,-8,529,-46,99,38,-163,162,347,476,-374,346,338,-330,-370,90,-91,-291,-56,71,-338,167,544,-81,-111,74,-97,210,71,-234,-17,-223,-4,156,-33,-98,47,-163,-193,11,-257,-211,-433,30,209,201,4,237,170,-59,-447,47,398,138,80,-132,35,121,56,-3,294,222,-188,148,60,169,-55,180,240,-110,-167,-460,174,31,314,166,-42,-39,128,511,149,5,60,415,-431,-276,-300,-68,50,-3,127,-184,203,290,261,241,22,259,-379,43,140,-82,-1101,-210,-237,206,119,-775,-486,332,55,-448,464,-800,-528,-464,367,-123,93,271,65,196,108,359,121,-18,121,123,-322,148,-168,-139,-23,34,143,-766,-67,10,-333,65,9,84,327,201,-152,52,-31,283,-184,115,39,107,206,39,-205,-231,42,82,147,12,9,87,-17,50,249,-571,36,121,-36,-112,12,-156,124,164,-42,19,-103,-468,115,-37,24,215,304,-60,-336,-110,-91,-9,-295,-13,79,-109,47,137,90,-128,-188,192,96,94,84,-136,2,-29,-205,123,-5,175,90,16,-355,-94,-47,227,180,10,-117,-127,-39,11,112,365,-121,-142,-174,-119,93,212,69,149,102,191,-140,-70,-847,-9,110,129,56,-239,89,34,118,-92,110,-22,-73,145,71,60,105,94,-230,-174,-184,70,-379,-71,-131,-71,112,-111,-26,-165,-59,139,-32,141,51,2,-6,13,-122,200,-2,-215,-84,-162,-134,43,20,-363,-322,-95,37,64,11,56,106,44,-208,57,-75,70,125,75,66,-6,17,-87,130,84,-2,-75,11,115,36,276,78,115,-61,-6,-67,35,-79,-17,-138,125,55,0,-166,80,54,164,20,73,53,101,30,10,-125,95,55,-11,-86,-9,235,124,72,-31,40,-110,87,178,-161,74,53,77,-11,-123,189,-230,151,34,68,-210,-50,11,-12,151,16,43,-273,-163,167,-63,-66,158,37,55,23,263,-36,-88,-4,-93,-244,125,43,147,71,-24,68,-229,-187,32,-14,162,108,-11,150,90,-18,13,87,-63,327,-31,107,48,-86,-145,147,116,-42,41,416,-52,404,-296,-2,233,-684,320,-142,176,157,-96,281,-61,-455,158,541,218,80,211,-78,-56,132,-550,68,-106,-511,642,-181,120,-485,-285,38,-238,105,-379,-229,453,-60,525,195,21,257,112,129,186,40,-23,54,-235,-360,-26,-156,-354,241,139,323,-51,137,22,-146,122,-156,307,355,244,-23,-271,218,204,308,-243,501,149,-228,224,358,-289,-55,294,544,-533,-236,-119,-208,-769,68,566,362,213,181,-46,-134,-187,451,-111,62,-11,288,413,-885,-97,-261,-669,302,-325,-433,-227,883,199,-582,51],"close":[66,-2,-2,5,3,-2,-3,5,4,-4,0,-1,2,1,-1,0,6,-1,1,-3,2,2,1,10,1,-3,-3,4,-3,5,1,0,-9,1,3,-11,5,-10,-3,-5,-4,10,-1,5,-6,-6,3,-5,1,-5,3,-3,1,0,8,-3,-4,6,3,-9,-6,-1,-1,6,2,1,10,0,0,0,-2,-4,1,-5,0,0,-7,-3,0,0,0,7,0,1,3,3,0,-1,-6,4,0,-3,5,1,2,-1,-3,-4,-1,2,-1,1,-1,0,1,-4,-7,-1,-2,1,1,2,-3,1,-2,-2,1,-2,2,-3,-2,3,3,2,-3,0,0,-2,4,2,0,1,0,1,-1,-2,1,5,0,2,1,-1,-1,-2,3,-1,0,1,1,1,1,-1,1,-1,-2,1,-1,3,2,-1,5,0,2,-1,1,2,6,2,0,-3,0,-2,-1,-1,-3,0,3,4,2,-2,6,-1,-1,-3,7,5,1,-1,0,3,0,0,-1,-2,-3,1,2,-1,2,0,-1,1,-1,0,1,-1,2,0,1,5,1,3,1,5,0,8,-1,-8,-3,-2,7,-2,3,5,-9,2,7,2,0,6,-1,0,-2,1,2,3,-3,3,5,-1,-15,-5,5,8,-4,-6,4,6,-3,-10,1,-9,-7,2,-1,-3,-5,3,0,5,-2,2,7,-1,0,3,0,-2,-4,-2,6,5,-2,-2,-3,-6,1,0,2,-5,1,11,0,0,5,0,-2,1,-3,-3,0,0,3,-1,1,-2,4,-4,-4,-4,5,-2,-1,-5,-2,2,2,3,4,-8,0,-5,-2,1,-5,1,-4,-2,4,-5,-2,-3,0,5,-1,3,-5,1,3,0,5,5,-2,-2,5,-4,-4,-6,-1,-3,1,-3,6,0,1,5,-3,2,-8,0,-2,0,-6,2,-10,-3,-7,5,-3,6,0,3,-3,-1,-8,-2,1,5,0,-3,3,5,0,-1,-3,-3,0,5,-1,-1,3,3,4,2,1,-2,-2,-3,-5,2,0,3,-5,-1,-5,-4,4,4,1,1,4,-1,2,3,1,-4,3,-3,-3,3,5,-3,1,7,0,-4,-5,0,5,2,-1,1,-7,1,5,-2,2,-1,-6,-1,-3,-2,-4,-1,3,0,6,1,0,1,0,2,-4,1,-4,-3,-2,0,1,-3,4,-1,4,1,0,-2,1,-1,2,0,2,0,3,1,1,2,-4,1,7,4,1,-1,1,1,-2,0,-2,1,4,1,3,-3,0,3,1,-5,1,1,1,5,-2,-3,-1,1,-1,0,4,-4,0,-2,-5,-1,2,3,2,-2,4,0,4,0,2,-2,1,-1,0,3,0,-3,1,0,0,-3,-5,1,-3,-3,3,3,-4,1,2,-1,-2,-5,-2,-1,4,3,1,-1,0,1,-4,-4,0,-1,-1,0,1,-2,-2,-2,-3,-3,3,0,0,-2,2,3,-3,-1,-5,-1,3,4,-2,2,-3,3,-2,0,2,2,2,1,-6,2,-4,0,2,-1,5,0,2,-1,-4,-1,-3,-2,-1,1,-2,0,3,3,-2,-1,-1,2,3,3,-1,1,0,0,2,1,3,1,1,1,-2,-1,1,3,-1,-2,0,-1,-1,1,-1,0,0,-2,2,-1,-2,6,-1,-3,1,0,1,2,-1,-1,-1,-1,0,-2,-4,-1,3,-1,0,0,0,1,-1,-1,-2,-2,0,0,1,3,0,-1,-4,0,0,-1,1,1,0,4,-3,2,2,-3,-2,0,0,-1,-1,-2,0,2,0,0,2,1,-1,2,0,0,-1,1,0,1,0,1,3,-1,-1,-1,1,2,0,0,-2,0,-1,-1,0,2,6,-1,-1,0,-2,2,2,1,-1,-1,2,3,-1,0,2,-2,2,1,-1,0,-1,3,-2,2,1,-1,2,0,1,0,2,-1,2,-4,-3,3,-3,1,3,1,-2,0,3,0,1,0,1,1,0,1,-3,-3,0,2,-3,2,0,1,1,1,-4,-2,-3,2,-1,2,2,4,-1,-1,-4,3,-6,-2,2,1,4,2,2,-2,3,2,-2,2,2,2,0,2,2,2,-3,2,2,-2,3,0,-1,-3,0,0,2,1,3,-2,0,1,-4,0,3,2,-6,-2,4,-1,4,3,-2,-8,1,-5,5,1,1,1,0,0,1,3,-5,3,2,6,1,0,1,0,-2,-1,0,-1,-5,1,-2,-1,3,1,4,-1,-1,-2,-2,0,-1,1,2,-3,-6,1,-2,2,-2,3,0,-1,-5,2,3,-2,1,6,2,-1,3,5,-1,-1,1,1,2,2,-1,-1,-2,2,0,0,-2,0,3,0,-1,2,-2,-4,-1,6,1,2,-3,3,2,0,2,-1,-10,2,1,2,4,-1,2,-2,0,-1,1,-5,3,0,1,3,-1,2,-3,-3,-2,5,0,0,2,2,0,-1,1,-1,1,3,1,-1,-3,-3,0,4,3,2,-2,3,2,2,1,-1,1,3,-5,-1,-2,3,5,-3,2,-4,7,3,-2,-2,2,4,-4,-8,-2,1,-1,4,-2,-7,0,1,5,5,2,4,3,5,2,1,0,3,-2,1,-2,3,0,-1,-2,7,1,3,-1,-1,-2,4,-7,-3,5,6,0,8,-4,-2,3,-5,-3,3,7,7,-1,1,-13,-4,5,5,-14,-7,3,3,-1,8,4,4,-1,3,-15,-3,3,3,-2,1,1,-2,0,3,-1,8,-4,-3,-5,4,4,-2,2,2,4,6,1,1,0,3,4,3,2,2,2,1,3,-2,5,3,5,-3,1,1,-2,-4,2,-2,1,5,8,2,4,-5,-2,3,-3,0,3,-2,7,-15,7,2,3,-14,-4,-11,-1,-1,5,-11,2,2,-5,2,-7,5,5,0,5,0,6,2,4,4,3,0,-2,0,1,4,2,-2,1,2,5,1,-5,0,1,-8,-7,10,5,8,-7,-8,-1,7,-11,6,1,-5,-13,-3,2,-4,-10,11,-14,-32,-9,7,2,5,3,7,15,-6,6,5,2,7,1,-6,19,4,-2,5,-4,-6,4,-1,-1,1,4,-2,10,-3,5,6,6,0,14,1,-8,4,14,1,7,-10,-1,-13,3,-11,-6,-3,13,12,-2,10,-1,0,1,-2,-4,-4,0,-13,-14,6,18,0,-13,-6,-3,-5,6,7,7,4,-2,2,-13,-3,1,-13,2,10,3,6,-4,-6,20,2,11,5,2,-2,2,5,-5,9,-4,5,-2,21,-15,-1,0,-7,2,-14,2,-1,5,11,-5,5,2,11,-7,-7,-35,-9,18,9,-8,-5,-2,3,1,4,9,2,-4,-7,11,-3,-10,6,5,10,-12,-11,2,0,-4,-5,17,-1,-15,-1,8,6,0,-5,3,9,1,6,-2,1,4,2,-6,29,1,2,1,-9,-6,-7,1,-14,-2,9,0,-7,-1,2,1,10,-2,5,-5,-7,-1,-18,-19,2,2,3,-9,-3,-14,-9,10,4,7,-4,1,-2,-4,1,-14,8,-12,-4,11,1,2,-7,-1,-6,6,-9,3,12,-12,3,-5,-3,5,-11,-4,-18,-9,-10,-4,17,15,3,-2,-15,9,3,-8,18,-8,2,0,2,5,1,-4,-8,-1,-10,-3,0,2,-11,3,13,-4,8,8,2,7,2,-4,1,-6,17,5,0,0,-1,1,18,7,-12,-3,9,-17,5,4,3,2,-12,13,-5,-10,0,-6,-5,6,4,5,1,2,-7,6,1,4,6,7,-3,-3,10,-6,-4,-8,3,-11,-3,8,4,-8,-7,10,1,4,2,-3,7,-6,-8,-6,-5,-13,-16,-7,2,3,-13,8,-18,1,2,5,7,-6,4,-4,-2,17,2,-14,1,6,-13,-9,-2,-3,-2,7,11,9,-2,2,6,-7,5,6,2,-1,12,2,1,5,1,-11,4,2,10,-2,-1,4,4,7,1,-1,-7,0,-1,7,5,-3,4,-5,-4,6,-9,3,0,-1,12,-5,-5,1,-7,5,-3,1,-3,7,5,-14,-13,3,-5,-6,1,1,-1,6,-2,-8,2,7,-3,7,-3,14,4,12,4,2,3,3,4,-1,2,-1,6,-1,1,-10,-3,-1,0,0,-5,7,2,-1,15,-35,-21,12,10,10,-6,-9,0,7,15,6,8,1,4,0,9,-2,10,-5,4,4,28,-2,-4,-4,2,-12,1,7,9,-1,7,-7,4,3,11,-5,-1,6,7,1,4,-7,3,4,3,-2,0,7,-1,-3,-6,-1,-31,15,-8,7,19,0,1,-3,11,3,-9,-9,15,2,10,15,-7,-2,7,5,-1,-5,-20,-3,-11,7,-5,10,-4,6,-2,16,0,-2,-4,-6,5,-8,-6,-2,-5,24,2,-5,-19,32,-5,18,12,11,7,5,14,2,2,-4,-2,-7,-55,13,12,14,22,10,-5,-9,13,-1,20,-13,12,-7,0,6,6,15,-24,-1,-18,0,4,-11,9,12,6,4,-10,7,-19,16,-6,16,-8,23,19,-8,17,-7,-18,21,-1,7,5,5,2,-12,-1,3,-4,11,2,7,20,0,-24,-1,14,-19,22,-15,-1,0,4,3,2,17,11,-4,12,-2,3,11,-36,15,-4,11,3,5,-5,9,-1,-9,-8,-11,2,7,-12,-12,-25,-9,18,5,8,23,-7,21,16,-14,22,-27,14,-16,5,-1,5,-5,15,34,5,5,27,26,-82,31,19,19,-7,11,11,7,13,0,1,20,5,7,16,36,-92,-11,13,-21,-15,-7,34,-21,21,-5,6,-16,-50,29,-44,-9,-23,33,-7,26,21,14,29,-5,25,-9,6,18,6,-18,-6,0,19,-30,-7,-14,11,-14,-7,0,32,-7,-6,-52,9,46,4,3,-51,6,-13,27,8,0,-9,4,5,31,19,9,-29,4,3,-24,37,9,2,10,35,28,8,-32,-9,11,-43,-1,48,16,19,14,7,6,1,11,17,16,16,-9,17,12,-2,9,-8,13,14,19,-36,16,55,9,21,-9,13,53,44,-3,11,-66,19,9,-3,-28,46,-14,37,39,-22,30,-43,-1,-144,17,-33,-68,1,9,26,-14,15,-27,0,-2,39,62,-5,21,-32,-3,-28,10,6,-29,76,50,18,19,25,-32,-40,18,17,11,93,17,3,28,27,-86,-60,105,-4,-74,29,-17,-95,-140,93,-67,-118,75,47,-2,63,37,-12,53,-36,-8,67,70,-11,-32,-54,55,31,52,10,5,76,41,-63,0,-4,-1,-74,28,9,-102,-114,129,-128,-65,62,-118,51,37,-31,-87,16,85,0,56,-24,6,57,-33,-133,-33,-35,-20,-3,50,-19,-28,40,-12,15,62,25,20,42,54,-26,41,-38,42,-13,-45,32,18,17,11,27,-21,22,-25,74,29,16,23,-33,-31,-9,18,-4,20,-2,-37,-41,18,-43,-26,-94,10,-73,23,4,18,-55,74,37,19,32,-83,21,-13,-4,44,23,-8,-15,4,-34,16,56,-16,-30,19,-6,33,5,19,27,9,-35,-83,4,-3,-42,-7,-22,-2,56,13,3,44,50,13,9,-32,19,26,-17,-90,-13,34,-32,-35,35,33,-48,29,6,36,-10,11,-57,-29,13,19,8,2,2,-56,-70,-33,0,-118,-24,41,-21,75,-10,-62,-36,14,-12,-145,40,-33,-18,72,23,93,-35,-18,25,27,-10,-42,-93,23,7,66,-26,-80,3,7,0,35,4,45,-17,29,57,-112,-11,-72,24,11,27,-8,-26,-23,23,-76,-14,-23,-43,77,10,11,10,15,-101,60,32,-9,43,16,17,-29,4,-15,20,42,-55,-12,100,43,-44,-30,57,1,24,11,11,61,-55,-3,11,48,7,7,13,-5,23,-19,26,22,-18,-31,2,22,0,-12,-42,-27,-2,56,10,10,-14,73,-6,35,-27,95,-86,-36,28,-41,-4,40,67,4,67,4,24,8,-37,27,-3,45,-24,105,55,2,1,38,37,-72,-32,-7,28,-31,41,25,-63,-90,-27,-40,4,-152,66,24,-51,-57,-108,50,-53,-40,-19,-20,9,17,-32,6,91,-16,33,25,66,7,-65,17,-69,-16,102,2,24,-18,5,-39,81,42,4,80,-45,-16,-16,-24,22,21,8,58,25,-36,9,49,-7,65,45,112,-68,-1,10,-9,-122,-69,-51,-134,36,19,78,-58,-34,82,-95,-8,75,57,-17,29,-1,-137,23,-10,17,65,17,-54,80,99,5,16,16,53,11,-11,-25,11,2,-19,-68,36,-60,58,3,-86,35,-31,-52,53,60,-26,-105,52,32,75,0,78,-55,12,-41,68,-29,-72,84,76,69,-36,0,-25,91,92,9,-34,29,24,-25,14,-1,-13,39,-9,-24,-52,-50,-1,103,-20,32,-50,-65,-64,63,17,66,-25,16,98,128,-28,48,22,-2,41,58,10,14,7,-21,-39,12,114,-105,-58,92,4,32,-39,74,12,-70,94,39,-4,48,47,-71,-237,129,-106,-7,-196,62,157,121,1,-138,82,115,89,5,-14,-87,156,-97,-186,-270,-149,13,-210,93,135,-152,198,-139,-85,-335,188,-199,-298,186,-334,53,-152,33,-40,40,159,-25,121,-111,65,-43,-103,49,-34,166,-9,71,-51,26,99,-68,57,21,-55,-112,115,-20,49,34,-13,122,-103,-132,20,39,28,24,75,-3,-78,-46,64,-54,113,-11,104,-79,14,29,42,-67,72,-12,65,95,31,87,-7,2,12,-248,43,48,61,33,-6,-24,32,10,-84,29,-72,39,94,-53,45,100,-50,54,54,-14,-70,70,-14,-17,26,85,-31,17,-68,-66,125,-85,88,85,-26,90,69,-4,-6,-56,1,-53,156,-56,-6,63,-29,-32,-43,35,46,54,19,-68,96,-5,100,169,-350,-47,-236,118,-64,-5,92,81,-50,-7,-74,-7,54,-115,42,64,126,14,2,105,-160,159,-30,106,65,101,89,-3,-34,-16,-30,-32,-7,-42,7,-29,-124,-18,-179,129,-85,26,101,187,260,115,-89,-204,224,-88,81,168,-59,-51,108,-39,108,41,-27,86,98,144,22,4,239,41,40,-273,-6,-101,106,122,-6,16,-40,-59,-12,-61,83,-16,-23,151,33,-43,178,-24,355,3,130,73,10,247,-257,385,-35,184,-237,18,-191,-592,199,-173,395,170,-242,91,-82,341,-51,38,416,161,81,-257,-132,311,-499,-83,377,-753,249,385,-401,-354,-503,277,-523,493,-173,375,-105,215,141,144,-471,104,225,-297,-144,22,488,-190,-27,269,420,259,-162,0,141,-31,-139,-40,-142,220,-72,-315,-189,304,-277,217,206,-87,-192,89,-341,-129,-164,58,85,153,-500,18,-398,120,260,-83,-81,176,259,-50,239,41,24,68,92,-44,85,-207,262,-83,-74,-47,134,45,168,-113,-86,113,-299,80,48,45,203,-42,299,99,-10,-197,75,-28,-180,-146,199,156,-71,-46,-274,-266,8,150,351,-111,81,-10,-230,203,227,94,82,76,164,-44,-54,-48,-170,-28,-155,86,-47,-255,-180,97,80,326,4,105,-10,262,44,-119,-59,34,94,-47,-182,60,104,128,0,72,48,-232,-345,30,266,184,-15,-26,-546,-211,-8,3,-305,163,41,133,-106,-95,-133,60,340,79,102,157,-23,139,-154,101,-10,-87,291,65,231,186,185,541,183,263,-14,-545,369,171,-15,295,-163,346,63,-318,-69,214,-551,704,-374,-151,9,-32,-33,939,-130,-479,170,-526,-82,660,-889,-27,-141,595,188,203,558,-247,48,-264,-35,409,-103,-706,153,-580,26,329,129,-438,428,-850,-516,-483,-228,174,-526,193,-576,205,617,133,343,-671,83,-5,319,442,-460,-688,5,642,9,-523,-124,-102,-270,403,184,-77,-443,354,-257,-278,-519,158,377,-218,-206,-278,360,479,65,222,-17,59,-290,540,-8,70,287,-423,-257,-249,167,-508,-237,0,-222,-180,-25,179,-242,137,177,-25,-229,-176,122,-324,-48,363,-334,226,61,291,-403,-64,-363,137,-194,26,308,-112,321,-373,-34,-15,27,-153,109,235,272,-40,-115,249,-227,-2,69,-169,-182,-228,-326,21,85,-304,13,110,-51,-28,180,-1,-124,-101,-45,-150,25,24,162,20,-100,6,32,78,104,-19,203,125,90,-145,-35,-87,230,64,46,18,-9,163,52,-51,-102,-285,222,-13,182,18,-64,-159,134,-172,-213,29,8,191,-334,-93,-58,-43,-82,-36,-44,57,66,100,13,-269,37,-55,15,20,-56,-30,-89,-48,-48,26,36,-88,-43,84,134,38,-23,-198,-93,-71,-23,66,-107,40,7,17,13,88,10,58,-25,-49,98,-58,18,-86,-35,110,60,58,-93,284,114,-45,110,-174,24,12,-60,101,42,-46,-102,-11,209,-32,-47,-44,-87,-2,92,-30,66,65,-63,-160,-29,-42,-28,73,-136,-1,-50,-41,81,0,-31,71,-50,130,66,44,43,42,13,11,-24,-105,102,195,-30,9,71,-26,-118,72,228,112,-99,-83,149,-110,9,-78,62,91,21,-126,-78,-149,-18,125,-77,19,15,3,33,67,-51,-52,116,-90,-86,-3,120,-53,173,-29,48,6,-43,125,-92,-60,-34,145,87,35,-49,-102,-87,-26,73,-18,-88,34,-9,0,20,-52,-6,-34,-23,-143,17,17,69,43,-31,-51,-24,87,18,-71,37,-24,-5,109,-6,109,153,-28,14,-61,-89,312,373,-1,-172,101,-14,-105,76,-9,64,12,220,96,108,-69,-71,-59,-187,32,-121,20,228,-65,9,102,66,-164,-87,-2,136,2,135,159,-105,183,20,-97,-300,63,-2,123,-107,140,169,26,12,-325,-13,-27,78,-120,-137,-28,-167,179,-113,-127,-62,24,173,-53,125,-219,25,76,165,33,46,16,0,-58,-157,-37,-5,-51,29,42,-186,14,-50,-95,-106,42,38,-98,44,96,23,21,-119,75,-24,107,-9,67,46,17,-170,83,-51,-102,-85,-79,-25,65,-207,-24,37,-57,37,105,113,130,-13,35,7,-28,221,-58,212,49,9,41,105,-134,16,9,-12,-43,68,-41,26,-76,-38,-46,171,52,241,54,127,227,38,-28,46,-265,216,25,165,19,-13,-82,-336,-179,-67,35,250,-1,-25,29,-36,109,-76,276,367,40,66,150,-30,-311,103,-151,-143,35,120,145,-127,153,179,217,-17,-231,228,-1,-78,-191,-28,528,-125,104,-10,-131,304,549,144,-293,338,510,-637,-218,281,-350,-255,-79,-20,-112,198,291,12,-54,-86,147,3,146,-211,31,-382,125,38,139,-230,271,-429,-173,76,-348,-215,-412,128,204,138,192,239,81,-243,-381,208,252,233,-94,5,-45,107,24,194,379,-74,-86,285,-27,140,-57,263,260,-306,-98,-141,0,-100,593,-101,-64,208,22,455,214,-76,257,257,-522,-182,-498,208,-52,-98,156,0,224,279,42,350,-6,434,-660,195,20,116,-1375,11,-466,593,-240,-763,-312,214,-11,-457,715,-939,-566,-145,69,-236,524,-45,40,387,-23,487,-19,187,-151,164,-422,289,-303,112,-189,-41,260,-872,23,-55,-379,147,92,387,-41,162,-127,0,-102,398,-157,37,115,67,391,-199,-98,-285,113,25,147,-27,105,115,-78,84,215,-635,-1,75,6,-18,-40,-89,49,99,7,263,-397,-392,74,-48,103,274,209,-80,-264,-110,-198,-9,-294,101,18,-72,136,0,84,-120,-115,108,214,-47,115,-176,49,-38,-217,206,-66,224,181,-138,-330,-153,100,229,89,9,-88,-175,-63,36,215,267,-134,-97,-212,-21,27,182,5,250,120,146,-23,-227,-759,31,31,147,-13,-141,64,145,-1,-136,102,5,14,93,8,144,148,23,-289,-205,-169,122,-454,98,-222,14,130,-272,165,-289,-58,89,-21,171,99,-86,45,-45,-65,172,-45,-176,-103,-173,-8,0,31,-485,-268,42,-90,452,-314,60,24,13,-126,-14,-49,47,111,171,34,-5,-43,30,-6,119,-24,-41,64,38,45,302,147,24,-37,-8,-33,-9,-97,-49,-78,156,-25,16,-103,73,140,79,-28,37,140,131,-25,5,-165,186,-48,19,-40,37,237,63,62,-9,0,-40,134,38,-146,140,28,72,-8,-79,79,-26,29,1,17,-118,-54,-16,-2,128,15,58,-263,-90,92,-48,-53,101,71,-10,239,127,15,-205,16,-129,-44,-45,210,-15,64,24,35,-249,-79,-34,74,80,63,10,142,57,13,70,48,-1,317,-62,141,-13,-10,-35,17,0,82,202,222,-85,348,-288,395,-54,-803,493,-251,335,59,-28,195,-73,-312,278,197,370,12,242,-199,39,80,-578,403,-382,-127,322,-315,190,-449,-36,-202,-249,161,-515,92,413,31,302,207,5,249,278,-142,134,149,-20,186,-86,-708,-53,-69,-448,257,314,154,44,51,0,-39,-15,-164,521,198,479,-172,-264,430,70,142,-69,270,267,-281,554,24,-212,-90,426,513,38,-868,341,-400,-801,6,850,228,-69,471,-495,149,-24,194,-106,188,-125,267,333,-652,-257,-1,-934,320,-182,-691,543,127,150,-581,44],"volume":[3702000,4548000,534000,1260000,2610000,1584000,1596000,3804000,6114000,2034000,2034000,2322000,1380000,1920000,1080000,1644000,1500000,1998000,3414000,4470000,1254000,2400000,2904000,6504000,12666000,4452000,5712000,2922000,5772000,6594000,3600000,3846000,5112000,6864000,5838000,10104000,4926000,19164000,7920000,17448000,12372000,7206000,27720000,42330000,28992000,15846000,19140000,16128000,21306000,10638000,11220000,10944000,10818000,14250000,10578000,9288000,4530000,11094000,9102000,13650000,18312000,12504000,8634000,9504000,6510000,6924000,14508000,14226000,8724000,4656000,9054000,9888000,8076000,11754000,8718000,4248000,23970000,10842000,10716000,7032000,24060000,13650000,14706000,7512000,8718000,11688000,16902000,11166000,7878000,7908000,14142000,10890000,10308000,7092000,8622000,10470000,17106000,24666000,13908000,19812000,11742000,8508000,7224000,7914000,7584000,18732000,30720000,27768000,9888000,15528000,14430000,10218000,11196000,8682000,15390000,13998000,19578000,15816000,22824000,11874000,17046000,21294000,32310000,39972000,24540000,55176000,16536000,50568000,34164000,29940000,20400000,15978000,14418000,39192000,18630000,25320000,21150000,25266000,20460000,25440000,31692000,36396000,24258000,25332000,24222000,22194000,20838000,29346000,20370000,18330000,27384000,19338000,22374000,21282000,37842000,24378000,22062000,29832000,12414000,10962000,19632000,13932000,10818000,19554000,11472000,18366000,18684000,18162000,17436000,14748000,14172000,24570000,16152000,14220000,16314000,7788000,10518000,9654000,32064000,22074000,24210000,6378000,12354000,14658000,16272000,13560000,10824000,11808000,22344000,8406000,7170000,7374000,8994000,11034000,13974000,5910000,5250000,24018000,7824000,10470000,4158000,7362000,6186000,3360000,3732000,6024000,11646000,10098000,4482000,9810000,21936000,9960000,9942000,9696000,8448000,18042000,13842000,14754000,18720000,12576000,12990000,13026000,16392000,19854000,36168000,12234000,22254000,18420000,10446000,16854000,21102000,8292000,12252000,12342000,8436000,15360000,14406000,10158000,15246000,13470000,40812000,35844000,41208000,38130000,38628000,37800000,51600000,33474000,31500000,50460000,26598000,66846000,60888000,37662000,37458000,39852000,35268000,37530000,32274000,39534000,24156000,25218000,44664000,31548000,22812000,29970000,29814000,20958000,33942000,27054000,44274000,30012000,20022000,20496000,18594000,31302000,33960000,18072000,17262000,29268000,22242000,52812000,22464000,13536000,30864000,26574000,25950000,12540000,21006000,33096000,20118000,41994000,40860000,18708000,19446000,18096000,25260000,16488000,23142000,35832000,17988000,20982000,10974000,23688000,23982000,19098000,14706000,19008000,15954000,17838000,16122000,38124000,18660000,14688000,36198000,25770000,22752000,18828000,15768000,13464000,17418000,23820000,18750000,30174000,20856000,41520000,21660000,15390000,24696000,16728000,30492000,25212000,15444000,10506000,18822000,16896000,22608000,46284000,27108000,41184000,24444000,25644000,31746000,21420000,32058000,40338000,17520000,30282000,54816000,23532000,33750000,41922000,44364000,48840000,70020000,60150000,42156000,49818000,35904000,29616000,27114000,22326000,25092000,17232000,38010000,28344000,21594000,51924000,51954000,33522000,38676000,29448000,25152000,29664000,26106000,22992000,29136000,43224000,32784000,39306000,34446000,43494000,86268000,61032000,62544000,54882000,72882000,117186000,61854000,52566000,98616000,75846000,57690000,82098000,47844000,52956000,89970000,78738000,78432000,53652000,30468000,30294000,41778000,45486000,47322000,36648000,52332000,44826000,53466000,28434000,81846000,63798000,38490000,55464000,25170000,29562000,40368000,15834000,44694000,40914000,44898000,42258000,41424000,21204000,34920000,29382000,45540000,36810000,73242000,32286000,39312000,28380000,31662000,22728000,23802000,23424000,51342000,24264000,28338000,29232000,16620000,20436000,26226000,35904000,28650000,41736000,31500000,20004000,18036000,36264000,36492000,24912000,28410000,15252000,19536000,23736000,13962000,15528000,20838000,19632000,25092000,19224000,27516000,20658000,16698000,20850000,24198000,17028000,50442000,41148000,17694000,22410000,11994000,29904000,22794000,9660000,15960000,17148000,39444000,22602000,26310000,16218000,18906000,28428000,20448000,28206000,18954000,20418000,32016000,32184000,18594000,19566000,12120000,14346000,8700000,16248000,25620000,17994000,11220000,15672000,37602000,25242000,33216000,18336000,25692000,16902000,29352000,32916000,32976000,17574000,17856000,16914000,10542000,12330000,17070000,19938000,11262000,20256000,13368000,17772000,16848000,24684000,43110000,13242000,20418000,19278000,15714000,29892000,13854000,26910000,25710000,18018000,19344000,40272000,27534000,19170000,29502000,28902000,29844000,15000000,19788000,15480000,26280000,31662000,21600000,33234000,33318000,21144000,23736000,18600000,18522000,32856000,27282000,48906000,43740000,29538000,27300000,28086000,21594000,18396000,22146000,21192000,45294000,27960000,36054000,41736000,32898000,22326000,29760000,36006000,21486000,21318000,16392000,31980000,23340000,39066000,48192000,21888000,41736000,24744000,23748000,30120000,48804000,17688000,18162000,17106000,30462000,25698000,48462000,34476000,49020000,30048000,27762000,49782000,82602000,54054000,30600000,36108000,30174000,43992000,42372000,44328000,21042000,64002000,20508000,21774000,25608000,15390000,31686000,15552000,14832000,13224000,17268000,21054000,13752000,14346000,16194000,60024000,14460000,16560000,12726000,11352000,7974000,10518000,8772000,13566000,18720000,33096000,15120000,33888000,13488000,19014000,15582000,18390000,30066000,22680000,13680000,8472000,11808000,18546000,10662000,20208000,29880000,29124000,22788000,18846000,17454000,12186000,11076000,13104000,21108000,13800000,26988000,33456000,24282000,20214000,23754000,25398000,19134000,17580000,56556000,23040000,41184000,38772000,27804000,28536000,17892000,59682000,29826000,21156000,36810000,49578000,29484000,39966000,20754000,25692000,41352000,44232000,43050000,43926000,28992000,13506000,39354000,27870000,26604000,30288000,28662000,17814000,20892000,11244000,11466000,22764000,12366000,10578000,43932000,21654000,27486000,18882000,17166000,29934000,24540000,15660000,23190000,9054000,11136000,24114000,12612000,29208000,59640000,23976000,14664000,14658000,20568000,15072000,31482000,11706000,11772000,11472000,16008000,35070000,25674000,14790000,19140000,15810000,17778000,9876000,12882000,14028000,17040000,23550000,17340000,13062000,8304000,14106000,20130000,7806000,12744000,9024000,8382000,15144000,14514000,25884000,27420000,29910000,27048000,17646000,12156000,18894000,21294000,10890000,24552000,22008000,15654000,29580000,9966000,10350000,12882000,10014000,22080000,22266000,18228000,21108000,20580000,14652000,13764000,9618000,9366000,11640000,14892000,23736000,25308000,17364000,27174000,14004000,19890000,29310000,13578000,11412000,22998000,15036000,26514000,19272000,22866000,22254000,29820000,17994000,18084000,9282000,10020000,9654000,9882000,12612000,21360000,17496000,10182000,10608000,15090000,12012000,14652000,11418000,8250000,8520000,9216000,16860000,9300000,25668000,18678000,6270000,11004000,5958000,11388000,9222000,14388000,24846000,13428000,11610000,11730000,10980000,16632000,17346000,14190000,8658000,12372000,15378000,16416000,19248000,19020000,22710000,13842000,11466000,11340000,11352000,8286000,12954000,6444000,11562000,29700000,10788000,14016000,13638000,8298000,8160000,11532000,13026000,14046000,12150000,6804000,13200000,20934000,9228000,10296000,7278000,7872000,7854000,11010000,5070000,3534000,4620000,6234000,4242000,4308000,3732000,8910000,12360000,10518000,7278000,6270000,6636000,8808000,8454000,9096000,4092000,16050000,6834000,5964000,7362000,7626000,17016000,5136000,10566000,5964000,10008000,4254000,3576000,2934000,6642000,5118000,6474000,5850000,4320000,12870000,5820000,4452000,6276000,3846000,8412000,5850000,2394000,4836000,4698000,3126000,6852000,7686000,10824000,6798000,5442000,6456000,4344000,5004000,6288000,4620000,6168000,13896000,5088000,7236000,3276000,6594000,4176000,6642000,4572000,2082000,3276000,2826000,7236000,5514000,2082000,4428000,2928000,2946000,3630000,7848000,6336000,5040000,4164000,2322000,3900000,5604000,4746000,2976000,5214000,5022000,2712000,3810000,4728000,3150000,1938000,3504000,4140000,4620000,3594000,5094000,6684000,3366000,7314000,4920000,2052000,4362000,2088000,2718000,4722000,7344000,4176000,3546000,2796000,4404000,2556000,2616000,5268000,8208000,5568000,6768000,4092000,5472000,3648000,6252000,8844000,8034000,4476000,6654000,5076000,3480000,7428000,6804000,4200000,7758000,7098000,4908000,6120000,8586000,5844000,7818000,5424000,4584000,5178000,5064000,4512000,6354000,5082000,3162000,4836000,8346000,7014000,3366000,3126000,3978000,1980000,2088000,2508000,5796000,3678000,4002000,8142000,6624000,6588000,7470000,9888000,6858000,8124000,5778000,4116000,9546000,8106000,7266000,6804000,15960000,9858000,5208000,7512000,11070000,9384000,5760000,6870000,5334000,10782000,6312000,5940000,2610000,6888000,12810000,7662000,3888000,4680000,4398000,4212000,2844000,2064000,3090000,7788000,2988000,9942000,4584000,3846000,8310000,3402000,4440000,3666000,4350000,4740000,7674000,6498000,4740000,3030000,2382000,3918000,6246000,4044000,6264000,6654000,6924000,4128000,4884000,6840000,6210000,7470000,6432000,9090000,7944000,4170000,6738000,9162000,6300000,5352000,2694000,4662000,9978000,5664000,3942000,8154000,10506000,6528000,6774000,3882000,7164000,6828000,5760000,12642000,5280000,3408000,4308000,12192000,9876000,10626000,8148000,5832000,5922000,9606000,9360000,4602000,6888000,8052000,7098000,6456000,7698000,5640000,5910000,4776000,7260000,6054000,4548000,4878000,4374000,6348000,6822000,3456000,3738000,3102000,5214000,4158000,3906000,6786000,8496000,5826000,4278000,7584000,4134000,5574000,7626000,6174000,8154000,6774000,6696000,8310000,5520000,4500000,8892000,5322000,4182000,5490000,13020000,17538000,10464000,7080000,6960000,11916000,11388000,57942000,18840000,30090000,41124000,31764000,43908000,16344000,22548000,32538000,17814000,15600000,24660000,18132000,24510000,17796000,30552000,12402000,8046000,13212000,11454000,16014000,3756000,4548000,3774000,7716000,9924000,10320000,10830000,8220000,8310000,12906000,9054000,6144000,10092000,6168000,13002000,8928000,10110000,11634000,6846000,15150000,12642000,11838000,9138000,10422000,16956000,16812000,15510000,21252000,15420000,10992000,16380000,3030000,3072000,5970000,5286000,8412000,15978000,12648000,13386000,8574000,13884000,11070000,10962000,12708000,9324000,6774000,8616000,9438000,9642000,12336000,9594000,6576000,15486000,13218000,15474000,10230000,14562000,10800000,8946000,6324000,11220000,6336000,10446000,9228000,8820000,8976000,5856000,5652000,5124000,6198000,5010000,8376000,5766000,6090000,4236000,10602000,11424000,7704000,5172000,6402000,3822000,10950000,5814000,5214000,5982000,6324000,6150000,8148000,4704000,6618000,6318000,6552000,21066000,24066000,16368000,16764000,6942000,12366000,10686000,8514000,5790000,3948000,7356000,4248000,7758000,8010000,8970000,3702000,9108000,4416000,6054000,9702000,11388000,18216000,8376000,4686000,7008000,6360000,17382000,7014000,11862000,9012000,7686000,10140000,7164000,6732000,5100000,10308000,4164000,6348000,6744000,2923500,2389500,2566500,4063500,13917000,6607500,5224500,6366000,5436000,4191000,8517000,6295500,10593000,10443000,8491500,5124000,3468000,3541500,3762000,4078500,7689000,4377000,4977000,5640000,4566000,3018000,10182000,11571000,11799000,10522500,3387000,8164500,8449500,7170000,11626500,10768500,7369500,5853000,8317500,9607500,5380500,4542000,6831000,14968500,8224500,7174500,9583500,12343500,9057000,5058000,5568000,3805500,6415500,7600500,7930500,6246000,8170500,7215000,9519000,7285500,5598000,4459500,8851500,7707000,13956000,12129000,29239500,14115000,21187500,24174000,10723500,9834000,13606500,5200500,7801500,7768500,11443500,17734500,8355000,6459000,5242500,5133000,6328500,10005000,9004500,7872000,10623000,5457000,11694000,14334000,19645500,8577000,11164500,11292000,11044500,11214000,10017000,13086000,10491000,9637500,3466500,5832000,12873000,7219500,3847500,3388500,3612000,7911000,9553500,12801000,7888500,5899500,7332000,7363500,4933500,4515000,3586500,4272000,6928500,7741500,4533000,6873000,6765000,5874000,8245500,4926000,5721000,7293000,4227000,4059000,4002000,6042000,2290500,1800000,4113000,8346000,9337500,6945000,6492000,3729000,6631500,6715500,5155500,7531500,8115000,5202000,5487000,5890500,5401500,3751500,2517000,3277500,1558500,3654000,5613000,3543000,2239500,6852000,7008000,8817000,8475000,9717000,9301500,8331000,6531000,8373000,12220500,9246000,11091000,13318500,12348000,7657500,7986000,9180000,6303000,11986500,8037000,8760000,9664500,13746000,16936500,10143000,6549000,13690500,18111000,14359500,19578000,18730500,11878500,7744500,8479500,5545500,14658000,9294000,11154000,15354000,12424500,8562000,9262500,17245500,13198500,13114500,10950000,10504500,10131000,10215000,10891500,12388500,10372500,9391500,6912000,6469500,7260000,10165500,8259000,8484000,8788500,6111000,8401500,6859500,4804500,7842000,4113000,5931000,4776000,6948000,8346000,7392000,4174500,5779500,7656000,6774000,3598500,4846500,3564000,5229000,7045500,8776500,10438500,4453500,4360500,4780500,5563500,3399000,3502500,4980000,7488000,8350500,6027000,8338500,4624500,10564500,5457000,9211500,6511500,9954000,10669500,4302000,3603000,4935000,4663500,3682500,4863000,4572000,5604000,4368000,5599500,5686500,5010000,6199500,3606000,7249500,3912000,5973000,2568000,3489000,5671500,11479500,11446500,14646000,9870000,5794500,4080000,4137000,6273000,6213000,9957000,9292500,6894000,5205000,6063000,4302000,5875500,3187500,6294000,5059500,5407500,4806000,15642000,8205000,5161500,5205000,3016500,7983000,4182000,5209500,5161500,3063000,3786000,5244000,2359500,4086000,4903500,2446500,3484500,3172500,4912500,3501000,4677000,4705500,3475500,3075000,5029500,4834500,2962500,5970000,4899000,2661000,4519500,4620000,7638000,7582500,4434000,5754000,11305500,5265000,5494500,3736500,3955500,4545000,2404500,2850000,4380000,4860000,12943500,7447500,3537000,4381500,3516000,4366500,4740000,4125000,11005500,4563000,7308000,8758500,3201000,3852000,4539000,4458000,3619500,4044000,4288500,4497000,4950000,5382000,2971500,5791500,6438000,5181000,2907000,3789000,4149000,8143500,11700000,8976000,3526500,5700000,6178500,4744500,3157500,4183500,5646000,3952500,1351500,2221500,1993500,1819500,10963500,6096000,6199500,4474500,6499500,7072500,5371500,3918000,6130500,5143500,7221000,4263000,4107000,5374500,2376000,3078000,1362000,4866000,8050500,5998500,5214000,6211500,3565500,3568500,4870500,5397000,3775500,3205500,5007000,4092000,4072500,3651000,2694000,4134000,4033500,4725000,5010000,3685500,3610500,7095000,6417000,5668500,4839000,2787000,4750500,4060500,3667500,5070000,5946000,4624500,3199500,3541500,2700000,3577500,4737000,2751000,7501500,5176500,3328500,4711500,4848000,4126500,3142500,3381000,4263000,4267500,2389500,4827000,4614000,4156500,4375500,2938500,2268000,3282000,8511000,4558500,3840000,5841000,7363500,4147500,3456000,5355000,3334500,4821000,3976500,5608500,5905500,2850000,3631500,7803000,8232000,4864500,5293500,3120000,3657000,5005500,5757000,7372500,4311000,5542500,5331000,7579500,5449500,4305000,2863500,2571000,2940000,1861500,4875000,6981000,3789000,3030000,3984000,4143000,14551500,12283500,6928500,5236500,4482000,3240000,3831000,4323000,4041000,6340500,3088500,5817000,4200000,5025000,6444000,7707000,32179500,22534500,14511000,11181000,8821500,8154000,11425500,8809500,6385500,7081500,5433000,11284500,13833000,9801000,18418500,8343000,6811500,9180000,8092500,7816500,6774000,7659000,14623500,13311000,9894000,8266500,5998500,6400500,5653500,6243000,5100000,6889500,7546500,19879500,4975500,6486000,4021500,8943000,5614500,3673500,6843000,6391500,4788000,10722000,5586000,6805500,3964500,4659000,8376000,5275500,6723000,4810500,4038000,3655500,3156000,2274000,3357000,6849000,6339000,4966500,7698000,3603000,2992500,4530000,6217500,4447500,3481500,4311000,6129000,7929000,4869000,12088500,4734000,3871500,10708500,7134000,7663500,4728000,6090000,6615000,4030500,4509000,4539000,2910000,4219500,5818500,4752000,4723500,4167000,4827000,2974500,6814500,7495500,4353000,7243500,5085000,12625500,5766000,9070500,7716000,5248500,7902000,6831000,11805000,10276500,8470500,5565000,17956500,6489000,5070000,6117000,8970000,7363500,6295500,6471000,9874500,6756000,6757500,10698000,9736500,36519000,14869500,19072500,23742000,16374000,10795500,9966000,9871500,5599500,5977500,4125000,5094000,10255500,15397500,8127000,8721000,6909000,3942000,4524000,2980500,3168000,4132500,9237000,9871500,8502000,7713000,6538500,9009000,13269000,5524500,5019000,9804000,11496000,9171000,9315000,5620500,6738000,18628500,13167000,12733500,9184500,11923500,6891000,6895500,13788000,16929000,20614500,12523500,17155500,20676000,14100000,7440000,11127000,12339000,7677000,11586000,9901500,5809500,8178000,8653500,10837500,10170000,14397000,9610500,8790000,12933000,9990000,8625000,12120000,12079500,22048500,13102500,7572000,4693500,17712000,8823000,9939000,15714000,16557000,18847500,23146500,20061000,17752500,19338000,15993000,16759500,13840500,13326000,16462500,18669000,10633500,13927500,14283000,8299500,12387000,12802500,33981000,16249500,16278000,21633000,20535000,17655000,13656000,11466000,13552500,10189500,15442500,19219500,14211000,10398000,12400500,12277500,11790000,13374000,10774500,10854000,8755500,9588000,13068000,12891000,9612000,10362000,9672000,10375500,12159000,9567000,17115000,11950500,9339000,8950500,9597000,9820500,6118500,7593000,8608500,8094000,10308000,12819000,14991000,7033500,9858000,5146500,16000500,7869000,12337500,10029000,8799000,8422500,7272000,10789500,14602500,10915500,11608500,16504500,13414500,6973500,6094500,10303500,9042000,7416000,6780000,8800500,10236000,14748000,16359000,12807000,10194000,7806000,6054000,7603500,4069500,5463000,5655000,4932000,6726000,16897500,9745500,5463000,12493500,8014500,12708000,8164500,10276500,8587500,7741500,8875500,16623000,11250000,7524000,9526500,4807500,8767500,6303000,13224000,8241000,5392500,8391000,19008000,13285500,9342000,6747000,6496500,4318500,9111000,5826000,5310000,10809000,5340000,3802500,7743000,6400500,8142000,7701000,15123000,22242000,12891000,7024500,26956500,20209500,13690500,8487000,10891500,9156000,15177000,14745000,8202000,20764500,29644500,15933000,19084500,15058500,18321000,14517000,19780500,18301500,12534000,7428000,13149000,8494500,8788500,15409500,10953000,10629000,14431500,12009000,13630500,21753000,10492500,5686500,10636500,7797000,11701500,6813000,9060000,18288000,18252000,21013500,19045500,14008500,23953500,17592000,13446000,10413000,15946500,13204500,29062500,19387500,19287000,13795500,17737500,12370500,17269500,12660000,13147500,28599000,17604000,16641000,14445000,17928000,12975000,12399000,10731000,14590500,10257000,15876000,15720000,18655500,15681000,32491500,17100000,14305500,9061500,14400000,10894500,10723500,4450500,9172500,17931000,18687000,10705500,8164500,13083000,12480000,11575500,10102500,7548000,9694500,11476500,12757500,12519000,8319000,15036000,7447500,10362000,14767500,7974000,14940000,15607500,12711000,12825000,10372500,8331000,6633000,22909500,10273500,13689000,13167000,21321000,18607500,23959500,17310000,19968000,11520000,12793500,18229500,8290500,30327000,14100000,7863000,7659000,16965000,13528500,9259500,12208500,9196500,19468500,16183500,9463500,4671000,8796000,11011500,12978000,13794000,4995000,6696000,12915000,13312500,8863500,17829000,24256500,12007500,18993000,20788500,24391500,17139000,14703000,21981000,24265500,26760000,19236000,15225000,20860500,13459500,13249500,20284500,19113000,18478500,23410500,32151000,25533000,14176500,14091000,21726000,18606000,11925000,11455500,14856000,8601000,26061000,13185000,19162500,12225000,9433500,12205500,19284000,13567500,11226000,21082500,12142500,9478500,9699000,8194500,9168000,16626000,8664000,12400500,8479500,9934500,7201500,13081500,9180000,13075500,10419000,23553000,14809500,8842500,7939500,5961000,21309000,25618500,16612500,22728000,20334000,19701000,18787500,17550000,12654000,19845000,27957000,14976000,16189500,15972000,8716500,9754500,9760500,31515000,11319000,11251500,10600500,18906000,10582500,12528000,19119000,17769000,7131000,9319500,7002000,9793500,11793000,6118500,6535500,5451000,8751000,7227000,11719500,8188500,18163500,11985000,10096500,17278500,7299000,14653500,19338000,17961000,13695000,9079500,25107000,15838500,18492000,27876000,7069500,19419000,15471000,12418500,14661000,11613000,9618000,15555000,14469000,18265500,15250500,10779000,8559000,9952500,10477500,12294000,9777000,11104500,12427500,7299000,6657000,13849500,12061500,11265000,14211000,8130000,12429000,17808000,15439500,10084500,14046000,10887000,7248000,4399500,13189500,14646000,8785500,7833000,9769500,4908000,7432500,11976000,20947500,21313500,10213500,9778500,7486500,7558500,10882500,11043000,3774000,5878500,7303500,9241500,5722500,10438500,14713500,11313000,10441500,10024500,11472000,11304000,8160000,9610500,11518500,10807500,11839500,6961500,10747500,9354000,19885500,19500000,14221500,12270000,17106000,22954500,13681500,15466500,19452000,12234000,16014000,11137500,16857000,11917500,13008000,11269500,16186500,13075500,20755500,25333500,30187500,38751000,33132000,38827500,45580500,36516000,32919000,20538000,23968500,26310000,31191000,33006000,33735000,47734500,43620000,47341500,73488000,67953000,67534500,63204000,63927000,67669500,65236500,55215000,51672000,39718500,50964000,47541000,43654500,43627500,51997500,79462500,50287500,75898500,36957000,51487500,37128000,47277000,47445000,35502000,60042000,37150500,42906000,34429500,42303000,55147500,42030000,55264500,65224500,35217000,47706000,46401000,32518500,38311500,27099000,34702500,53503500,54496500,55647000,42394500,40813500,39808500,37935000,25134000,41682000,41941500,33565500,38440500,21564000,34992000,30483000,31461000,26946000,25800000,22317000,23647500,47562000,35401500,29254500,30856500,21156000,13989000,29616000,19461000,18909000,31200000,21685500,21492000,17931000,32251500,21469500,24289500,21822000,17728500,14014500,25341000,16764000,24480000,25491000,20254500,13903500,12028500,16717500,16822500,13956000,22534500,19546500,17731500,20592000,19687500,25672500,26299500,16984500,12100500,12822000,10840500,17872500,11625000,15201000,18397500,12742500,12001500,11739000,11410500,10309500,16498500,10789500,11776500,11626500,11527500,17893500,13989000,12093000,10255500,18729000,37044000,26686500,21556500,19171500,19227000,14871000,11850000,11725500,10791000,14704500,17329500,25779000,13864500,14178000,24952500,15505500,15123000,19848000,20143500,18271500,24060000,14751000,16638000,13549500,11172000,18609000,15901500,14068500,11320500,10518000,8916000,11283000,6909000,8161500,9789000,6975000,13960500,7834500,15634500,10749000,11187000,10897500,12472500,17590500,20565000,15370500,16741500,16570500,11782500,11928000,10963500,12468000,9009000,10455000,8220000,11338500,11436000,9943500,6964500,8937000,10632000,12735000,7210500,7801500,10473000,8889000,6286500,19231500,11490000,13248000,10854000,7351500,6372000,6106500,8797500,11620500,6235500,4338000,2637000,7542000,7833000,7807500,5871000,17731500,8538000,16782000,10443000,13090500,9625500,10501500,6897000,11373000,16302000,13351500,11220000,11056500,12573000,12499500,7641000,25056000,16110000,15256500,13749000,10789500,14184000,8400000,8242500,17278500,8659500,15432000,20781000,15841500,14367000,19341000,15594000,23602500,22419000,27033000,17964000,35817000,29536500,24520500,19687700,21749000,34294300,30945800,28761200,19994900,19953500,19094300,17047600,15325300,27404900,21743500,25749000,20615000,23763800,26947000,26195900,30291400,35670300,28422700,17926000,25362500,27795500,26445800,17961500,12421800,12957100,10748500,14926000,14056400,12838600,13642000,11016200,20268200,13892000,15160200,20962100,13212600,13528500,12557200,12753600,14812500,19385800,13899900,24428000,16034800,15387300,16784600,25439800,29951300,34045700,25520000,21881300,19224800,15262600,29208700,28593200,25100300,21577500,19468200,13436700,16449400,15891400,18159400,12370500,16945800,15960500,11453800,13475800,11721000,17601900,7971500,18513300,13301400,18089300,18466200,21346600,12722000,10500400,8615400,12716800,9244100,18209300,13090200,9830900,11578200,10933300,10020300,10623800,14764300,9799600,9021800,9289300,15361500,14968000,14425600,17527800,12487200,12599700,8148900,8740400,7703500,17917400,12983000,15318400,13599200,17018600,10801400,13768900,8580700,6202000,5943700,9994500,10016600,9746100,7655800,6658600,13983700,10760100,14855300,10732300,12229000,8557100,10125800,9529400,12358300,10291100,9620800,7246900,7168600,7374000,5660800,11787400,8643000,14399600,11356400,10129200,9321800,9094400,14478900,19454600,9972400,11093200,11819600,7465000,10241300,23988000,19889700,14470200,16368700,20555400,15194100,16403200,13234300,10297000,9446400,19847400,11660600,14800900,10988500,8498200,11476200,9908200,10019700,12691700,9706700,12067800,13076300,15904400,12735000,14647400,12421100,11472200,20539200,19536100,15603900,16385900,17648300,13055700,13052700,11837400,12693000,11636600,14102700,14527400,16809800,16233700,14762200,14919700,18352700,22246300,24798700,21014200,18842800,13816300,21654500,12500700,14533000,12329100,13561500,13311200,19005700,27692100,17729000,15681400,20477000,13011600,14507000,15598000,14401800,10702000,11188200,10152000,15794800,21988000,20821000,19343100,22625900,25112700,22053900,19392000,28866500,23880600,29055200,28683300,32438800,45826500,53548700,40326300,46405000,50033700,43946700,39362500,37795600,40548600,32875300,30575600,28382000,33686800,35302800,51371000,51212800,43218400,39910800,35357600,41858900,46904100,49765600,52830600,68362100,40949000,43350600,46635000,41485400,45902800,46799000,50665800,68456500,46482400,43831500,34118300,49351500,42082900,55754000,37147500,39797700,38312100,34654100,38313200,44687200,36316000,35741000,40148500,38435700,38547400,57428500,28200500,57649600,69146900,55657300,71608900,60558200,66793200,50484000,51193200,49251700,45358800,51891900,53808500,57459200,58210600,55039200,52406400,63555800,48104400,57669900,53115700,77054200,64302700,73607500,72482100,72934500,76546000,79889100,65885900,49300800,65619700,61497800,62522000,86718200,54498700,57291400,54536300,60520000,54680400,48671900,52378500,49439000,42093200,40514000,37067500,38501600,37937200,58924000,77061300,52253400,77001800,90753100,64012800,57522800,49362200,47625300,60548200,43426900,56957600,61516700,70274900,92067100,82942200,77177800,75926300,77437200,52520600,53368400,70014100,78227900,74112400,83926600,78348500,85890600,80210800,65689500,43336800,48959700,78797600,69548100,61313500,61205100,60816500,57214600,56294600,60067800,59477700,65153600,69125300,70069200,57238400,48991600,48777200,67988800,50790800,49700800,51389400,49723200,42087500,58659800,84676900,61062700,77063100,86870500,113345600,100737200,79919100,79632700,103258300,81908900,67153300,85975600,65846900,94630600,87622100,75532200,70577400,125021300,112096100,120047000,96464800,115839400,119412700,128122600,109534300,126786100,114533100,110030200,117138000,134873300,163448700,186475200,110516500,284532700,177216100,113321500,185506400,134272400,170614600,178616600,147205700,127146900,143571600,129662300,129291600,118351000,108638200,174985600,135668700,173041700,105846700,147373300,107444900,196270300,166468400,108739600,159797700,112310400,128795400,117064100,84238200,86949600,113790600,41754500,87803100,75056000,133385800,112133900,98017700,71095100,86923400,86276700,101888300,88787400,73482200,180078900,139612300,107181700,88813800,82876800,88304000,83240400,135617300,92378600,78142100,83917300,90966000,64369800,97509800,114576600,83312800,123492600,136968300,90401400,80469400,135343400,74389800,74500500,82050400,99618400,89921600,125178200,75816000,93424800,111443300,101402600,81286700,97363300,150219900,116420900,94867600,77254800,119100900,72392900,84793400,78447700,60332300,111460800,74638200,81774100,82871000,68114400,70471500,94198000,74689200,61896900,59300500,63832600,73485400,72055200,56252700,66744300,71670200,87945700,128656300,121199400,107012500,126199700,108646600,79179200,62536400,76051300,95075000,97514400,90583300,64605200,75621600,90012500,80622200,68287500,57147300,64093400,86953300,65901100,63177700,52220200,76962300,59431400,56858500,56761700,56833200,53185600,65191000,68276000,48740200,89382800,68911200,87997600,65456800,57191000,61126500,71240700,62383900,62636200,41012800,57414300,78346700,54962200,46243600,64054000,54294600,77302900,91302200,49521200,43944400,41287200,87475800,124768700,112964600,99439100,73938700,74757400,65015000,35747700,49445200,65066100,43045900,50142100,52761000,82626800,84622000,64797200,55392600,43349100,59099400,44637500,44294000,47524300,54471000,55584500,45213700,47598800,25289900,38292000,49420400,41284000,39943500,44231000,54237000,42645500,47910200,50068600,45800100,49085500,67340600,43146400,29911500,39288500,54225500,83083300,60636000,37007400,36908400,81886500,51031600,59250900,40030800,52987700,49811500,65350400,66258400,55110100,45574800,54398900,50769000,63687900,60272400,59640500,67010200,87095000,73315300,57976500,62384100,58519900,57584100,50183300,39873800,45032300,61690800,40693000,55474600,49005100,56098900,54201500,77383000,41631100,50047300,58695600,68048000,65378900,56510100,70947400,80980900,88909800,75732800,65982800,77741000,74018800,63584100,92805900,62652500,67622800,62660000,83392100,88671200,65688500,90214600,81406400,115930900,83690500,89594500,79093400,107436500,101804700,91507300,104353000,75873100,100044400,89974100,88065900,52668800,56719500,50269100,75784400,95598900,57461900,94381100,78026200,61404400,54090800,56824400,63297900,64858200,21933500,40671500,53548300,69262600,58913500,54913400,55773300,51980900,60117400,77337000,69286800,80772700,55752100,80992700,86502800,66922000,46100400,39361100,59562600,62019200,42657600,48619700,47991500,34883800,53294900,79763800,62304900,75067000,73944700,73206500,67616000,62528400,77551200,48992100,77707000,77075400,99590300,91848600,73322100,50847400,97248200,82851400,70933100,54398800,55768200,85888800,60671300,67828900,65899800,62828900,63261800,59516900,65860900,72207900,86489300,62424100,60937300,77150800,80980100,64615200,96865500,68430000,49475100,48124600,46281900,67431600,90615500,81255500,76835800,91762300,91590800,129037200,76456400,89505900,79513600,77822900,72496500,65139200,83450200,79396800,82495700,57152800,54917700,55697600,56643600,45684700,63270000,57411500,54158200,82719300,71151400,42780900,66283900,74894000,64703800,79978400,62077800,62696200,85426600,91529700,105240100,65096900,66511500,80370100,80677600,59041700,51120700,56304200,97290300,56653400,58599400,48404800,51508400,53735100,39132700,47048400,30565400,41581500,58063500,46325500,40965800,55103200,36437200,55487800,81175900,48477400,50658400,42965600,38260500,72522600,53127300,46692500,66560100,43947600,50248700,43759400,37695700,73759300,45660700,39112000,54196500,47069100,60852900,50012300,54326400,43610200,41093400,35417000,55584600,43335000,45011700,40242700,38395400,42861600,41789800,48280800,75368500,51046400,48228700,39846400,99429800,94172600,75969100,73675300,50181600,90534800,143325900,82759200,80788400,108596000,96880500,163864400,198233900,220042200,137309500,146256500,149988600,96949800,89135100,103380000,112421600,107522700,82364600,77684200,83644600,83611500,107889900,87128100,86603000,74033300,101998500,97333200,85280800,140077900,108759900,100075900,156147600,84474500,81557500,143140900,98895800,78147300,79670100,86913700,113735500,123984300,108589600,59731600,83369600,73587500,138171800,85253500,74316700,124928300,81729100,86857200,100846900,73150200,66629700,67182800,79999000,58434500,69661800,131664200,70233000,97549000,56704300,59115800,51493100,81658300,60128300,82300500,51661100,72288200,89440100,135437800,80726000,60422400,63174900,97893100,77945800,62666300,99155700,75694800,92269200,68994200,113560200,70256700,57030600,90911700,106013200,52604100,70536000,73204200,84235700,54303400,89389800,59730300,67498800,59282100,49152300,54963000,77681700,77277400,59937600,103693900,85469700,64499000,102912200,86520100,108080200,79330900,39963700,45184100,59316300,64859000,61199500,80996300,72119600,95159500,79205700,69523500,85395000,68286400,79759400,69461300,78881100,69688900,60897500,57709400,44900600,60111500,198431800,103185300,94141700,87140400,102136600,103914300,60520500,70330700,59735100,87930800,53330500,43880500,57999300,61026300,43089600,60222200,58412700,50903200,61966500,63724100,90907500,75869500,144841600,110939400,141822100,154119800,117702400,164277600,139349200,169215200,161267000,137654500,117160200,99718700,82794200,79140900,83249700,80380600,84348300,91671300,57784400,94328400,103112800,138232400,111345600,106085000,141655200,302517400,499158100,723467300,488735500,787748800,686331800,412972900,358849500,230001400,362439300,233659100,255318100,249211900,368456100,339636700,274438500,203468900,184045100,229393200,203349500,223410600,127572300,158548700,189249300,203277000,149644500,263806000,212931800,179343100,141287600,113068600,123632000,84252500,149964800,144981100,179062600,136539700,126785300,179820200,194058700,103937000,158644000,146325300,187397100,114398700,162686000,142811000,160395000,100384500,166989600,121972300,122379500,113893800,137078900,125143700,137608000,107621600,92382200,113655600,78035000,107277300,107157100,62695800,93297600,90457500,86818700,87602500,71855400,99670600,108926200,125700900,85334100,68274300,79860300,118871600,105639200,77503300,68037900,88108400,101714500,96772200,133413800,132665200,85963800,99733400,103447500,117228400,71389900,75943500,125315900,89497100,84286800,93664700,50310400,75595100,117636500,67871100,117140900,55018700,57544300,61375200,74466400,108411300,101906700,79482200,81641200,110749400,72341700,55882300,86721600,69919800,52502600,61268000,54148200,80483900,104513300,66106100,62948200,63661700,58369900,79969600,60944500,56593700,60696800,67094700,68834400,69252500,99880300,96375900,77149800,63095700,204858900,89274100,100358200,96059800,89397000,92083400,62424500,54386700,110646700,72467000,69872500,72684100,53995000,88268800,76956300,75650400,52610600,87734300,76488900,106419600,143013500,74223300,80862700,77730900,126123700,125398600,101936600,153515800,120458900,228883600,205537900,108832500,108634700,104203900,57190400,79426200,111736200,94299300,77656900,77049800,69225000,56373300,91153100,88063000,138088200,78218600,94566700,126113900,97164000,92529100,62717400,44455700,30717800,38006400,54612100,40697400,44754800,132719700,94987500,92678600,65698500,79844800,87214400,53193700,61895400,70434900,89664300,58559500,71408300,103027300,62594200,58613600,42592400,61155400,74205500,78058200,83504200,66961000,101338500,139149400,109350300,108594200,66670500,58273900,89724200,90896100,79931300,79420400,69349000,68827500,81017900,66926300,66892100,52929300,97787900,70112700,81699800,131198300,78143300,110055800,125241500,114897700,104717600,83007700,105674400,82441602]});
+export const QQQ_DATA = decodeBars({"v":1,"start":"2010-01-04","days":[0,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,4,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,2,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,5,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,2,1,1,3,2,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,2,1,3,1,2,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,2,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,4,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,4,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,2,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,4,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,2,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,2,1,3,1,1,1,1,3,1,1,1,1,3,2,1,1,3,2,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,2,1,3,1,2,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,4,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,4,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,2,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,4,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,2,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,2,1,3,1,2,1,3,1,1,2,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,4,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,2,3,1,1,2,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1,4,1,1,1,3,1,1,1,1,3,1,1,1,1,3,1,1,1,1],"open":[4633,6,1,-19,-14,54,-53,-16,34,21,-51,30,-21,-71,-91,-17,1,13,-49,-101,43,11,13,-84,18,27,-7,-8,25,80,44,2,19,28,-30,-32,-25,45,37,61,9,-3,46,37,-3,39,24,44,-24,13,22,10,21,-62,69,18,25,-27,9,14,-14,12,-9,23,18,-19,26,30,-3,56,29,8,-60,42,32,-54,75,27,-36,-61,5,56,-76,-13,-140,-7,-163,121,-14,69,43,-92,-47,46,-122,-110,-150,116,-114,133,19,75,-52,1,94,-68,-38,-97,15,-14,25,131,-19,85,58,-11,55,-80,-51,-44,-34,-24,-85,-119,-39,-18,44,-36,157,-13,40,56,28,5,-3,-97,-47,174,-47,19,66,52,-27,-5,-99,106,25,4,3,-39,68,-30,-80,-137,34,-37,62,16,0,-49,41,-123,-63,88,-36,0,-48,72,74,92,6,1,83,-18,48,23,14,33,48,3,69,-24,-25,85,41,-12,-21,24,-6,-61,16,57,-9,-8,35,-9,74,12,49,46,-68,14,55,-21,55,-22,13,65,-11,7,28,18,77,10,-12,37,-43,-61,19,-32,-84,-46,68,20,-10,11,21,20,-8,-52,68,41,23,38,62,-48,39,-12,41,-26,-7,-16,33,8,15,10,-9,-20,30,-6,-3,-20,38,54,-41,70,22,-27,56,12,17,0,-3,69,-99,12,-60,38,44,40,16,-136,61,51,-8,20,44,18,27,-39,30,59,0,21,-6,27,-93,-90,-35,50,70,14,-121,86,58,-4,-109,9,-82,-57,36,-154,39,-2,21,6,30,-38,93,75,21,-69,96,-11,47,-10,-46,40,-32,24,-31,-67,29,-33,7,-45,32,120,84,-5,25,29,11,-2,15,-23,-22,-41,55,-29,29,24,-52,39,-83,-104,38,74,-7,-117,8,-56,12,62,73,25,-102,-65,-33,-18,-37,-26,-18,-56,39,-25,-49,8,-76,62,74,-76,84,-64,93,83,30,58,89,16,70,-15,-27,-46,-1,-3,-18,-20,56,109,-52,30,17,31,-20,-112,-40,98,-124,-112,-34,-128,-254,-83,48,-24,184,36,4,14,-184,-171,81,-68,158,53,-100,200,75,89,-10,-162,-154,201,31,-35,-142,147,80,110,24,-31,101,-25,-268,-84,129,129,-12,-23,-220,-114,-140,144,140,94,59,80,107,-37,133,9,-72,48,-81,33,32,79,-64,98,-12,-9,-191,51,34,45,-6,87,-89,-37,-10,42,-37,39,-69,-118,-119,-45,-9,-105,111,52,117,52,96,13,-18,-37,-21,-45,16,33,-120,-19,-49,20,13,40,-35,46,28,18,-49,19,104,-10,21,60,34,27,-20,26,-21,61,13,94,-16,18,-26,74,43,-60,-20,86,13,34,56,4,13,19,56,-24,48,-3,60,-72,85,-14,-1,-9,52,-31,50,64,-10,18,0,-126,30,57,42,14,40,93,36,-2,-4,1,48,-40,34,33,77,9,-65,38,-50,83,-59,-54,-30,30,-47,-13,40,-46,-79,86,-22,-15,-116,-10,111,37,68,-8,-35,-15,56,-136,-143,4,-58,84,-64,-34,12,-16,-63,-116,-87,176,-78,74,-44,44,-36,-4,-131,-36,8,92,160,-101,118,-125,28,-26,27,34,117,48,-14,-134,-7,-49,42,-33,97,85,14,44,-20,-58,30,-106,-77,8,64,36,-19,143,24,-209,58,-110,97,39,120,-11,34,-114,130,52,44,10,13,-3,26,43,-27,47,70,10,33,-60,12,-41,87,-24,6,-30,10,-17,3,38,93,-12,-70,13,1,112,41,-19,23,-20,42,-91,35,-125,-30,54,-1,-13,9,36,48,-112,-41,-93,18,-72,23,34,50,9,-65,-156,-17,28,-15,-45,11,9,81,-99,53,-69,-67,-115,60,-87,36,-101,-20,90,78,11,42,45,43,-52,122,5,39,-61,-17,-83,94,-89,82,75,-62,-83,-12,113,86,-36,-150,15,9,-56,-65,-20,302,47,-32,-42,18,-2,61,-9,-22,-29,9,45,-15,12,42,-90,21,14,6,21,-29,35,-7,-50,47,8,32,39,-11,1,-27,28,-6,34,-128,-9,72,-117,16,69,-38,29,92,81,-30,33,-24,9,4,6,-12,-87,69,14,-63,13,60,-21,-36,56,22,-19,25,-70,-103,54,51,52,93,-3,-14,-73,-8,-58,-99,103,85,10,32,2,17,51,44,-23,146,28,27,-20,25,19,17,23,22,35,24,19,-1,21,-139,-1,131,-67,-3,8,-39,27,-77,-61,55,83,-84,42,-136,101,9,23,52,-168,-114,-93,55,44,40,-29,80,-7,-20,96,52,3,3,128,72,36,15,7,-5,-83,15,8,4,-14,-18,55,28,28,51,26,38,-1,-58,50,-17,-47,57,30,-112,-43,-3,0,-5,31,95,3,-93,-75,36,63,5,7,60,34,16,102,-59,39,1,63,-70,47,107,-11,-13,-32,-11,-1,-17,-46,64,25,41,-83,-2,4,-134,41,60,33,99,12,17,156,76,31,-60,-5,108,-17,29,15,-58,30,-1,-45,76,-36,-127,68,-26,-16,132,50,12,-85,3,-7,63,61,-8,59,76,27,-41,-37,51,54,25,-14,7,-107,15,-9,5,-7,75,-21,142,22,18,24,-46,16,0,-28,-61,6,42,49,-40,-5,-88,173,27,-19,33,34,-27,-46,-131,-124,-39,86,-43,57,-139,-9,31,131,102,72,99,-66,128,36,12,-39,65,-20,40,1,-68,55,-93,116,31,31,0,-79,35,-102,109,-191,25,32,100,-80,84,-128,-64,27,-170,-9,57,37,149,-6,-21,-349,-18,101,122,-354,51,23,71,6,55,74,39,66,-112,-47,13,3,77,42,-98,84,-82,-74,18,89,99,-29,-21,-57,21,83,-12,78,38,96,69,7,28,10,-50,3,65,103,21,-17,-8,10,-24,-29,17,21,57,-41,6,2,-29,86,-13,51,51,76,41,18,-36,-72,-77,116,80,29,21,-57,-52,81,53,50,45,-78,22,14,16,-96,-136,5,7,-94,96,-59,90,9,45,75,93,42,47,24,13,19,58,3,-2,-35,45,39,32,-63,-17,38,17,-71,26,26,-31,-144,121,48,62,-72,-109,23,64,-146,-26,112,-41,-134,61,70,-98,-88,170,-203,-202,-73,-197,-115,258,-1,257,161,17,69,40,72,70,-49,232,-10,-20,65,-67,51,-22,33,-11,78,22,11,2,57,-80,182,-44,69,10,86,-8,-80,47,-7,22,-43,-170,136,-116,-80,39,-223,-92,321,71,18,81,-62,26,34,-22,-22,-74,-127,-91,-85,149,140,-80,-28,-204,93,-191,191,-11,122,148,12,-164,57,-223,96,-47,102,19,59,79,-119,64,115,94,84,61,-3,21,53,73,3,6,0,40,-23,44,-54,22,-23,-87,-68,-107,-85,67,3,68,17,145,69,-25,-16,-21,-351,49,108,27,-83,-45,-65,142,-8,75,68,56,-46,8,10,-89,-12,168,12,-6,193,74,-61,-91,-70,-68,135,-60,-116,-96,178,30,-113,62,63,98,-46,78,-16,-20,63,-22,-70,122,-11,0,-63,56,-79,-35,-18,-132,45,148,-79,-113,16,88,52,99,21,12,-16,-1,-67,-192,-57,64,10,-96,55,-62,30,-6,114,111,78,82,155,99,19,-185,56,7,-233,20,70,-8,114,-46,-42,46,34,-217,83,-3,-160,125,-55,16,104,-76,-141,-354,-1134,784,-111,356,56,-5,-332,117,143,-234,215,216,-254,77,145,-46,101,47,-175,70,-187,32,-121,174,-243,-224,65,105,-114,398,47,41,-43,87,63,-55,-8,22,158,8,57,18,-25,418,4,-15,70,25,39,-26,75,101,-27,-63,-13,-139,62,-91,-111,-184,188,33,175,56,27,-111,81,18,25,-17,77,-49,-191,237,-180,71,-98,-106,-115,172,41,141,-285,-76,77,72,25,-29,88,100,-133,-342,59,-263,-146,-32,-88,58,64,-367,-168,159,-274,171,170,52,-74,-11,-30,-28,166,30,-110,-144,-10,-500,-96,210,-197,218,183,149,186,-198,174,10,-229,237,159,-102,15,218,6,3,-62,-83,24,72,53,30,20,8,90,19,-28,0,73,-120,85,-65,257,-20,-74,182,-127,-10,104,-27,-29,-79,167,58,-10,-51,112,-89,3,-137,-56,56,-187,36,-142,-29,-3,-87,34,-93,109,67,91,-56,-81,-14,107,-149,21,28,86,33,195,48,28,65,-28,13,24,-11,26,-15,-45,-73,-87,-58,55,-110,34,20,-43,26,51,-317,-130,-25,193,121,100,2,-60,149,80,147,94,14,21,28,-37,28,59,78,-26,30,6,113,1,48,7,36,-80,43,96,58,-10,25,3,-10,43,13,-40,7,-7,1,72,-33,-98,15,16,-6,-37,10,84,0,64,-39,-132,-261,211,-34,46,135,37,-39,30,134,16,-134,-40,139,-15,-35,42,33,-18,-8,20,24,4,-149,-101,96,-54,117,-44,-4,7,111,73,-122,47,-139,3,-34,-116,-104,-122,172,74,-49,248,-297,58,-33,17,118,105,-29,140,-50,5,9,-1,45,-163,-192,76,63,-29,177,60,-4,35,129,-24,-3,-62,75,13,-13,-55,54,62,-123,9,-67,40,43,90,103,35,27,-16,31,4,13,25,30,-35,42,137,64,23,-45,-100,107,-24,24,2,62,3,51,61,53,38,29,93,-31,100,27,37,-128,60,37,46,56,-72,-10,-12,12,12,73,-10,-3,25,79,-45,-25,66,-246,67,26,-108,114,89,47,8,21,-57,78,-60,-10,10,-20,-47,-69,3,27,81,17,69,132,57,58,9,102,15,93,-25,-15,42,22,44,35,-38,33,31,74,-89,-249,173,40,126,15,75,69,15,69,-26,76,111,-19,0,48,0,-494,121,92,-259,34,81,83,-64,128,-42,151,-200,-151,90,-146,29,-165,-14,27,110,61,178,63,77,63,-18,147,79,-71,45,20,47,106,-272,115,-53,77,-40,-38,20,37,-116,18,-208,201,106,10,-67,-231,-19,59,67,53,-19,-42,-121,190,197,133,-82,-51,34,-12,6,94,-31,-12,-32,38,-10,-6,-50,-125,-25,-22,40,18,59,97,10,-16,95,40,89,14,-46,29,55,34,9,39,-120,92,11,-99,-33,-36,209,170,94,69,-83,43,79,52,13,-57,10,-23,23,-68,71,122,-52,50,108,21,36,33,-13,-190,-31,126,-278,-44,125,166,-38,106,49,-6,23,187,-2,-9,-50,-44,-82,4,51,-17,-31,208,194,49,85,95,-103,62,69,243,-78,73,78,-3,236,123,-30,-28,128,-202,110,-155,-80,-423,-726,598,-117,-500,208,26,79,539,102,-78,172,-56,59,283,149,-120,-195,-480,271,344,-140,238,144,260,81,-187,-81,2,-272,-193,4,-260,-200,-89,390,-745,-7,89,-212,-265,711,-245,-90,223,-1,105,177,-52,174,186,-50,-111,-140,-43,-392,196,367,-190,-195,254,-206,10,454,25,48,205,100,43,-144,-32,30,-71,108,41,-227,265,-2,-58,63,60,74,226,153,31,87,-228,70,84,95,53,30,-144,-122,254,89,-140,-257,-173,80,-328,249,-197,341,-154,141,320,100,-159,127,225,20,-237,301,-101,29,-111,295,-103,-4,85,-356,-183,106,-99,400,9,169,-10,36,-123,17,16,-100,60,-126,91,-2,-26,76,66,200,143,10,145,-20,-10,-56,-199,-303,165,-116,186,87,94,-98,-219,138,109,126,-317,176,49,72,29,156,-86,52,-133,-284,-284,-34,-67,-749,315,-46,31,406,-146,-204,-52,-342,243,-516,-271,401,-646,587,145,146,-193,-63,331,248,-193,-251,-321,101,-322,155,25,-833,298,-226,235,56,262,337,39,473,-168,-905,378,-508,465,27,13,-292,-282,-174,-47,-403,-110,-697,-100,529,378,32,-348,161,-26,428,292,60,-54,73,-100,67,265,-82,295,-72,-129,-9,183,-149,18,20,330,63,15,228,131,-204,-227,241,46,202,-125,212,-111,99,-61,20,222,-111,-20,15,139,110,-99,17,-160,-361,237,331,141,53,27,55,123,-12,16,256,-387,169,-28,-96,133,182,73,152,7,41,12,14,22,106,7,-1,70,121,-29,-89,183,207,66,-95,47,-117,130,-191,80,-262,82,-224,-193,41,-382,-77,-17,382,-7,-261,101,-68,-188,27,-55,-227,11,-181,-121,-145,455,-7,205,369,281,-216,20,-62,56,287,75,306,-109,-10,-50,-187,30,49,337,-112,129,-36,-32,-100,301,103,-22,135,-7,-76,-186,245,-230,214,-53,144,4,58,-198,117,-287,-271,-529,-103,-113,381,228,-202,-115,117,-236,121,395,-20,65,37,-224,-260,197,-228,356,154,-271,122,297,169,9,-203,84,261,-66,-165,40,50,66,25,-275,101,-359,205,-10,-194,171,-350,-197,305,119,-121,-7,29,355,1,84,118,134,-100,-49,144,-269,213,-50,346,69,-82,114,37,226,16,-37,78,-69,14,92,-29,-1,182,-6,125,-100,-91,27,50,165,79,38,-41,-490,223,71,116,32,-46,19,41,163,215,99,3,7,222,14,0,26,228,-104,-197,287,-110,-80,314,-14,344,91,-52,151,-64,107,201,-52,165,-67,190,-797,197,304,-230,315,-339,528,479,-142,37,-72,481,13,-74,170,-84,263,33,-285,-1193,157,-654,-581,-1226,1024,823,-379,-63,-802,-1119,763,-176,-1726,498,-1292,132,-386,408,605,-1082,899,451,-55,306,13,466,-695,-353,431,493,1189,-422,420,-235,723,125,321,448,-281,-276,-150,269,-82,522,113,-113,376,-545,-304,598,196,242,173,-6,400,-483,-469,81,750,142,180,194,-299,491,-467,42,127,208,204,176,7,-11,332,112,439,-289,-307,-665,1134,62,-111,344,-305,471,-33,-426,198,-581,280,487,538,243,268,-15,399,6,488,-1098,590,-381,157,49,832,-389,0,-1047,322,205,-91,-66,817,209,86,202,-3,323,-231,-266,-169,524,46,81,249,151,-265,485,512,-242,432,582,-64,74,455,566,-518,-1254,-1334,342,530,-679,21,467,85,-1233,424,-932,752,216,-1076,452,1067,4,-47,564,-577,32,311,-156,451,71,744,584,-104,-815,460,-131,-593,11,38,-28,-239,-88,-349,-501,134,-249,11,1163,994,18,394,-1248,86,473,-59,45,278,-170,-216,276,-89,8,408,274,103,263,28,192,16,138,105,131,-886,160,227,329,133,293,103,-520,339,-4,-134,378,180,11,-129,224,-682,-129,328,706,-136,-152,-27,231,-237,12,589,501,14,362,-6,-259,-559,-109,-147,737,434,-200,340,188,-48,237,-66,-62,356,-480,-224,363,-736,-950,174,265,-554,342,498,-698,-849,-198,132,-65,869,-39,-191,193,530,-364,-58,-500,334,452,-110,-866,114,434,-156,227,691,406,360,-40,423,-88,236,220,261,-138,268,-176,-219,-311,380,-304,382,226,-212,256,-467,153,-567,-131,-349,561,-159,-1308,53,-31,268,203,76,-873,746,631,-106,470,-41,1,45,118,-205,-270,130,320,335,-23,-98,317,132,247,-141,-277,366,-120,172,336,222,74,31,275,130,-76,245,274,319,-671,243,428,-42,280,-185,-158,-735,158,272,342,354,218,73,-262,-35,-281,384,-100,149,141,19,15,74,-112,-245,220,-22,-152,-97,-496,484,374,504,79,-71,-85,378,366,53,93,-275,246,25,-92,22,-224,-113,-213,95,114,-1036,12,-49,367,-11,-45,-453,-450,-20,-237,-8,-481,37,872,128,-450,30,-37,418,419,-27,614,219,-178,182,-42,467,-65,237,-89,550,24,275,493,556,-147,59,-669,10,-80,414,-205,389,198,370,214,-746,-318,118,-22,289,-50,-1248,551,-768,940,514,18,-173,138,-1070,64,1010,-1471,-376,448,486,540,394,615,-265,-42,-167,-61,319,-750,-1232,161,-921,454,910,31,-1370,-103,-189,-236,-1032,-1356,76,624,-351,-637,1017,1123,533,-1123,-445,454,-466,980,-424,-109,-1194,642,91,-108,-633,-792,283,-2248,2247,120,324,-267,685,-1009,-255,-1324,770,-93,350,-1119,-225,1129,620,437,746,39,342,-21,579,-25,956,38,-204,-443,-10,510,-1216,-341,8,-751,95,-596,664,-909,68,906,-190,-1088,-1058,374,-1023,461,185,-1087,567,81,586,-1422,-747,103,-607,-1099,827,443,430,-291,-1225,384,-338,-162,-242,473,1210,653,140,-562,418,172,-694,524,-314,-1226,-1390,-209,176,-383,-341,657,-23,469,453,826,-300,-960,-265,-180,-64,904,228,245,80,-256,-972,239,674,499,-161,562,477,293,-441,-349,51,755,480,226,-73,313,692,-378,350,-392,582,372,-213,324,264,-299,-63,-227,-767,-438,-51,322,345,-1566,148,-211,-727,562,-668,-212,331,598,567,-670,-693,-80,-635,-162,239,110,-759,-445,-252,278,-335,140,-483,-196,992,-71,268,-594,-572,-460,-130,-824,1604,-436,969,-660,-35,-160,771,372,-95,-167,-456,669,258,-642,-1207,252,22,339,-138,825,655,330,635,-482,-651,701,-449,-76,333,122,-229,-196,-210,1285,-515,184,-290,-701,144,90,-59,1443,-860,-572,-613,-233,-531,204,-22,-491,127,-357,-21,66,503,-201,-260,-69,748,-134,443,420,-162,427,234,-689,57,675,377,-354,745,78,93,-262,410,1316,-263,-143,-5,508,30,-936,165,176,201,-52,-331,-381,-264,335,-621,331,-177,-4,-460,673,555,-87,-330,156,-550,-610,758,40,329,872,-246,368,233,-35,-60,228,-343,271,436,67,286,183,-250,-386,83,276,-1,-299,276,56,284,-458,-72,22,47,-209,-85,226,441,198,3,-237,-269,141,395,-42,212,158,104,-123,55,218,328,597,-124,-36,-452,777,162,1195,-434,-64,607,63,-15,85,-601,551,156,710,-2,134,811,-677,-21,-511,158,-21,-275,273,226,331,252,-137,-219,72,-127,83,555,371,354,21,216,486,-421,-343,-256,33,77,535,-233,305,-148,-305,-732,381,-187,-124,-35,-132,-498,-56,393,-349,-191,-870,436,693,-197,806,-1057,492,-43,832,206,346,-363,51,-707,180,365,-39,-224,296,-8,-659,0,163,-1015,-117,-270,6,-161,-127,743,-300,24,-301,397,-409,665,460,304,179,-116,-395,-81,-14,-86,-535,-620,425,-81,-758,-269,140,140,249,982,321,374,178,281,56,-182,497,692,354,-241,37,84,296,156,-92,-64,-60,428,-261,-233,-166,-170,588,-220,60,307,382,406,536,-80,75,261,81,-129,194,25,170,172,-139,-544,-591,-349,1,154,392,416,372,61,-209,-214,435,470,819,-98,501,92,-392,-17,283,-625,-206,501,527,54,80,170,183,300,-966,398,266,97,-634,-400,994,516,-205,7,-224,280,167,571,-467,-62,210,339,-830,222,292,-115,-543,266,-328,433,910,-353,-180,275,14,-166,19,-489,-112,737,-955,463,155,-596,326,84,96,-1116,220,-661,-427,-491,346,743,-896,838,551,-198,-800,215,914,286,340,-303,266,221,145,-134,578,428,-60,-13,106,302,449,-526,389,-370,2,-372,279,-170,511,624,-122,-118,172,845,573,-120,294,555,141,-523,-301,-211,248,157,229,-237,37,581,567,464,234,84,336,-1056,410,101,-934,-275,-638,201,25,-759,-1010,-107,306,14,202,389,-2087,-2618,1252,926,-543,568,465,443,769,525,386,255,518,70,379,-560,21,-576,260,-301,176,-184,-1453,30,136,-727,318,367,874,383,71,310,-159,791,-12,46,151,28,863,-287,-472,192,-734,-62,771,-206,-73,434,185,-11,503,206,-665,526,-238,-81,-52,86,-148,303,332,-274,367,-701,-688,132,79,1295,784,464,233,-160,-137,-49,-897,-481,-71,574,308,-182,548,-182,9,-224,508,294,637,299,-83,307,-193,138,268,278,262,328,-121,-1396,-1075,911,528,349,-231,-1050,139,-260,-95,1067,157,-1051,-360,-1028,754,429,595,387,163,509,-53,398,-2202,422,724,125,321,-1345,516,319,554,278,-292,-126,-366,768,603,372,-116,16,-35,-1050,-864,-371,260,-1800,1139,-1734,202,-251,-653,-371,-1110,681,-291,-252,588,-20,-260,7,-280,1366,365,91,-989,-260,-1789,538,-118,-968,-1830,-2948,2950,-2259,3799,-891,1981,-592,-951,-186,-894,59,1935,-169,1049,606,-286,-304,1628,313,-194,-504,252,645,168,1678,217,761,-25,414,-642,523,-320,-261,-748,997,603,415,-689,-220,632,445,217,-18,14,103,445,-453,-341,282,121,-161,216,-545,1008,517,129,391,400,-153,-357,702,34,-14,110,241,-359,69,626,-297,74,510,-103,221,-196,279,-20,281,302,-258,636,-1571,22,634,-428,1056,-122,424,47,760,-448,152,-336,-5,-806,-398,32,573,-57,176,252,55,-1335,792,151,975,-212,130,407,-50,180,340,417,-151,381,242,41,463,-279,-738,215,476,-68,-126,989,-55,194,57,-361,607,-8,-1172,-437,870,110,-716,919,450,-82,-591,1108,853,584,523,-342,200,94,-1183,-479,330,-1348,1061,165,427,-730,-1799,675,-668,-255,1455,-2415,781,823,900,360,-248,583,16,531,-55,283,-420,84,-3,-174,-371,-1011,480,-326,215,940,-315,379,267,-456,-26,-19,41,-74,-9,381,-1,-162,90,496,-503,436,-110,-1497,-106,1288,-262,348,570,655,-281,-694,-701,960,-1328,-1481,-2,735,777,107,-167,-1428,-205,373,70,-269,649,-421,867,452,-1261,-412,-253,783,324,-709,-608,1355,117,-619,-303],"high":[4649,1,5,-28,28,9,-50,35,3,3,9,-4,-25,-87,-88,29,-4,-42,-41,-74,50,19,-31,-64,16,33,-20,48,9,47,22,36,12,-2,-29,5,-9,16,63,36,-3,-1,73,10,41,23,7,18,-15,23,29,-2,7,16,19,-13,43,-27,7,15,-10,25,2,18,-3,-5,23,15,15,57,27,-7,-46,22,31,17,21,8,-22,-80,70,-4,-12,-85,-82,-18,-152,100,59,27,13,-127,-25,31,-95,-135,36,-31,-57,81,32,10,26,3,49,-48,-83,-98,43,21,42,70,53,37,4,16,34,-54,-67,-48,-33,-11,-109,-79,-71,-14,55,64,37,25,40,47,31,-7,-11,-82,45,50,22,12,36,26,-14,-17,-32,70,-9,29,-7,-7,34,-24,-103,-68,-18,5,67,4,-36,-43,31,-122,14,6,-16,9,-40,106,37,74,1,42,25,-3,70,33,10,18,16,79,24,-15,14,53,6,-21,-1,31,-31,-48,71,-5,-17,33,15,19,54,-11,86,22,-42,27,14,-2,54,-8,8,22,4,26,18,11,82,-5,2,21,-27,-29,-11,-49,-63,-38,92,-20,32,-46,80,-12,-23,-16,72,35,13,1,57,-37,29,11,19,-12,8,-4,2,8,13,7,-9,-1,6,-2,-10,-18,107,-14,21,20,9,13,18,20,17,29,21,3,-91,14,-3,9,43,37,-13,-106,102,-1,-3,28,55,10,5,-2,38,18,-9,47,-7,0,-84,-90,-20,69,33,-3,-51,86,-11,0,-58,-41,-75,14,-7,-77,-48,-10,-2,56,-17,26,95,40,-12,-2,35,5,42,-22,-19,24,-13,-3,-28,-65,36,-17,4,-60,33,134,53,5,51,26,-6,6,5,-34,-13,10,23,-28,36,3,-12,-12,-75,-75,57,20,-13,-106,-8,-1,24,19,87,0,-95,-42,-46,-27,-49,-1,-42,-41,54,-32,-65,10,-37,106,3,5,-24,40,55,33,68,90,27,23,87,-32,-33,-64,27,-16,-33,-6,111,29,13,38,11,2,-54,-36,-32,21,-110,-84,-79,-106,-191,-4,-4,65,21,46,-1,7,-228,-47,-43,104,51,11,41,136,63,44,-10,-103,-124,128,52,-93,-34,79,129,30,37,26,44,-42,-247,-8,50,132,-23,-54,-182,-76,-56,139,76,22,128,52,77,-4,100,-10,20,-44,-93,74,99,-33,-54,142,-19,-37,-73,-75,102,-13,20,73,-115,-41,60,-1,35,-20,-112,-114,-117,-5,-51,-50,112,31,134,49,41,28,-17,-11,-19,4,-18,-3,-139,-17,19,-41,80,-36,-1,45,34,-16,-23,9,107,3,44,28,4,42,-11,18,-27,76,53,48,-17,41,-37,74,22,-29,3,32,38,17,71,-10,23,21,52,-34,49,9,64,-16,-1,20,-21,13,26,19,44,26,2,10,-17,-119,49,73,20,-3,115,48,8,-15,48,3,31,-35,-6,103,38,2,-58,9,32,21,-79,2,-30,-4,-55,39,-8,-64,43,1,17,-66,-133,5,126,50,46,-28,46,-52,4,-80,-128,-33,-6,-5,23,-78,19,-49,-72,-110,61,38,-24,0,-39,83,-60,-14,-109,-36,28,133,61,-23,43,-79,26,-24,47,66,77,6,-26,-88,-58,-15,48,-71,169,22,51,36,-56,-43,25,-105,-77,83,0,22,84,73,-21,-142,-2,-71,78,126,32,-13,10,-26,86,51,53,-16,15,-3,15,38,-9,85,16,10,45,-32,-22,11,22,-8,-2,-44,32,-10,0,120,0,-15,-58,-1,105,57,-19,6,28,-18,14,-68,22,-137,59,-18,21,-35,26,30,26,-108,-38,-91,4,-41,20,94,10,-22,-81,-108,-24,-8,-15,-10,-23,61,21,-48,44,-107,-60,-39,-24,-29,-22,-87,-1,135,6,13,90,30,18,17,57,-17,40,-60,-23,-6,23,-25,88,-2,-16,-108,49,108,11,-35,-113,-14,4,-54,-21,82,198,11,-46,-12,6,13,32,2,-14,-42,40,35,-34,9,56,-51,-9,19,-7,17,-13,43,-32,21,-12,-18,76,-7,-1,18,-18,6,15,-1,-124,14,66,-113,97,9,-24,19,108,14,-11,22,-3,-6,-4,12,-22,-15,6,16,-61,39,32,-23,12,21,3,18,-9,-58,-64,28,72,121,-2,-16,-20,-24,-66,-56,-10,81,66,-3,38,-28,71,25,12,58,91,17,6,20,33,-2,24,42,0,36,23,10,11,41,-125,-27,111,-74,48,-7,-81,42,-78,-63,106,29,-42,-20,-22,-8,56,32,-4,-152,-119,-70,25,48,62,7,61,-12,19,24,38,26,37,141,32,17,7,15,0,-100,24,-2,6,4,32,16,41,26,44,34,9,-9,-42,41,-4,-13,46,-9,-119,-12,26,-10,6,12,56,51,-110,-43,59,-30,40,40,22,28,62,36,-21,14,-11,58,-25,100,22,-15,-13,-16,-25,36,-15,-12,63,4,-4,-21,-16,-54,-137,135,50,50,32,31,45,131,36,36,-70,28,80,-23,21,23,-19,-13,-10,15,18,-27,-57,8,2,89,31,10,15,-62,-6,18,41,36,46,40,60,12,-32,13,-11,52,35,-8,-5,-98,-2,41,-28,69,-21,67,73,10,30,9,-39,45,-38,-23,-59,49,30,9,-24,8,24,82,-3,-14,22,41,-48,-34,-129,-95,-20,106,-12,-18,-125,-26,89,148,48,113,20,53,31,41,-13,-7,25,35,-10,12,-31,43,-105,107,24,12,2,-70,40,-45,32,-155,53,73,2,-10,9,-126,-14,-10,-151,37,25,101,41,0,-27,-278,-17,141,1,-244,-22,32,64,45,21,91,-19,65,-104,-6,21,16,67,-4,-14,-11,-78,45,-67,140,35,-26,-39,-20,70,14,29,59,42,112,8,21,14,-1,-11,34,79,36,16,-2,6,-23,-24,12,3,40,7,-30,-5,75,-12,-9,41,37,105,5,46,1,-41,-23,-2,22,79,7,17,-33,20,-1,60,58,17,-64,15,18,12,-98,-100,35,-48,-10,3,-13,75,-9,80,48,68,61,52,14,5,30,43,-7,3,-11,38,19,24,-12,-27,38,13,-35,-7,-11,-33,-3,43,29,27,-81,-53,67,-24,-69,-4,38,-69,-110,106,15,-94,98,-19,-174,-184,-82,-141,-18,131,58,240,43,106,33,18,133,-8,14,149,22,-35,41,-31,19,18,19,29,71,-6,-1,61,-25,19,93,4,42,43,67,-33,-50,15,21,-8,-13,-53,-1,1,-105,-41,-111,-38,217,48,-13,36,-27,56,-1,-29,-5,-71,-159,-86,-15,190,15,-72,69,-214,11,-64,93,74,152,44,-25,-177,62,-110,50,-51,96,52,28,34,-88,125,48,102,89,15,14,54,71,8,18,13,8,-3,51,-26,-49,30,-26,-72,-101,-97,-9,20,62,30,137,-3,69,-30,4,-61,-250,7,105,-17,-103,-16,81,43,9,56,41,62,-70,39,-19,-93,84,62,42,72,114,47,-61,-48,-90,-5,79,-91,-105,-30,127,6,-65,48,86,34,27,7,32,6,14,-49,70,-7,-22,-7,-11,20,-33,-79,-36,-93,141,34,-85,-92,60,47,143,-30,45,-14,24,-37,-53,-157,-94,63,-3,0,-25,-74,27,45,158,93,25,115,163,80,-19,-103,-7,-10,-205,40,44,48,22,-21,-53,125,-50,-193,124,-40,-67,42,-49,79,-9,-26,-165,-299,-394,21,49,248,29,-39,-232,63,110,-217,232,114,-63,-11,41,84,37,154,-213,-5,-213,24,-47,82,-246,-129,61,36,178,177,-18,26,37,50,26,27,-63,105,50,63,-3,6,96,344,-17,17,78,1,5,67,67,5,-7,-48,-41,-112,75,-91,-154,-25,85,145,49,34,37,-62,4,18,11,51,59,-79,37,-4,-29,-24,-60,-177,-71,160,89,31,-260,-81,87,75,21,-35,200,-31,-116,-348,58,-129,-160,-100,-123,102,15,-125,-304,43,-54,52,146,18,-40,-60,-70,188,63,-83,-114,-37,-113,-428,73,91,-137,80,211,241,20,-90,144,-42,-28,88,81,-27,169,6,-10,60,-61,-53,-37,102,63,43,-17,111,-9,-13,25,48,-38,-70,29,132,114,-35,71,4,-94,121,-48,-21,0,-30,136,25,-27,21,17,-29,-10,-133,-73,40,-156,50,-183,37,-43,-96,18,-6,77,101,11,-75,-29,76,-17,-61,-72,119,7,162,98,13,44,37,9,-1,-17,33,-12,-3,-29,-91,-47,-51,2,-30,-46,56,-52,47,60,-229,-290,91,202,108,87,-82,69,51,150,98,45,3,37,11,44,-26,117,9,4,-9,51,68,23,43,59,-36,-42,43,126,-17,42,-27,35,-16,76,-48,-19,16,6,3,46,-37,-67,57,-29,-16,-53,32,68,29,27,-52,-109,-2,-40,38,135,-41,54,-47,84,90,-22,-120,76,21,-5,35,-37,46,1,-19,3,47,-34,-132,-50,73,-75,111,-39,-5,25,143,1,-63,-4,-88,-58,-32,-91,-93,-83,193,117,20,54,-233,-11,68,37,79,32,55,54,-55,21,23,43,-38,-166,-131,90,2,143,36,67,-33,190,-11,11,-53,25,-6,-9,-18,-25,127,-33,-106,-18,4,42,54,130,30,42,-4,-11,55,-34,13,49,18,-30,84,109,36,10,-54,-78,108,2,11,4,70,13,56,32,70,28,81,28,19,71,6,11,-44,17,2,123,-25,-37,-11,13,7,-13,58,4,-28,105,-6,-31,7,32,-161,6,41,-22,96,27,31,13,7,-28,95,-109,-2,20,-47,-56,-3,-1,16,63,59,-12,153,108,14,24,59,104,11,-32,26,11,30,79,-18,-12,30,49,52,-87,-105,70,65,35,43,148,-5,23,33,6,159,19,5,-19,26,10,-442,108,37,-165,-50,181,-9,31,41,20,87,-207,-8,-70,-77,-24,-53,-84,107,86,23,164,49,95,39,48,102,25,-33,76,-13,21,101,-188,35,-67,76,-35,-20,59,91,-128,-79,-99,174,15,66,-102,-174,-67,182,-34,16,1,-44,47,168,132,38,-71,-42,38,-49,77,29,3,-15,30,-22,-36,-10,-65,-73,-70,-3,120,-44,100,61,-11,28,120,12,35,13,-7,28,16,38,17,15,-88,71,-1,-73,-12,-47,381,67,18,46,-84,130,56,23,46,-77,3,27,-57,-50,189,-20,-49,137,27,47,25,13,-24,-100,-21,39,-108,-81,72,107,42,20,34,17,116,95,-27,-22,-3,-82,-71,24,11,-17,163,164,62,124,60,41,-83,109,136,176,-38,16,41,151,154,58,-61,132,-4,-149,57,-26,-203,-195,-324,104,-275,-356,271,6,292,277,106,-8,104,-130,175,223,33,-93,-173,-179,198,85,-4,91,318,132,73,-247,-21,-33,-298,-118,72,-299,-247,130,102,-584,193,-197,-182,231,135,-112,42,85,27,77,49,-7,327,54,-101,-138,-88,-82,-360,322,188,-93,-68,77,-117,285,153,-35,157,174,12,96,-232,87,24,-135,124,-5,17,23,48,-41,56,72,164,150,79,76,4,-105,46,66,114,75,-56,-68,-61,194,-10,-151,-238,-93,52,-181,115,-7,60,-39,268,149,49,-65,239,44,5,70,-21,-56,29,-53,241,88,-201,39,-358,-60,52,209,35,110,95,21,28,-141,79,-35,-108,41,-68,2,111,-17,78,58,171,68,182,68,-34,-78,-85,-180,-108,-42,117,-44,190,7,-114,-8,-43,167,51,-152,32,171,50,-21,125,-35,-21,-165,-235,-233,38,-240,-522,146,-82,361,61,-158,-61,-82,-112,-77,-128,-212,-10,-382,521,99,31,-289,153,439,-28,-205,-261,-116,-78,-16,-23,-141,-552,59,-113,213,88,485,56,21,384,-140,-500,21,-334,199,183,-78,-301,-214,-172,77,-485,-178,-611,456,64,241,-61,77,-249,374,186,125,141,-15,-51,-90,264,118,58,166,-188,-63,-7,221,-253,12,304,271,-39,93,170,14,-192,-86,99,156,102,-33,73,24,28,-82,75,165,-41,-45,1,84,114,-70,-34,-157,-192,359,129,179,-59,154,11,101,86,197,-56,-343,185,-97,-74,85,243,65,201,-42,27,51,-17,42,25,17,12,84,102,-14,20,255,17,51,-53,63,-147,147,-147,140,-105,-153,-150,-176,48,-463,37,192,252,-49,-440,115,-26,-305,83,-19,-266,27,-198,-134,102,164,143,373,308,55,-212,59,-76,114,347,-19,223,1,-105,-58,-81,-39,21,342,-54,141,-4,-153,103,219,25,20,65,-10,-60,-70,104,-89,87,135,-64,103,-37,-64,-11,55,-599,-548,29,71,381,-32,-210,378,-373,-236,236,288,-19,59,23,-101,-358,155,-102,306,51,-179,131,384,-16,10,-153,179,218,-131,-132,52,0,144,-73,-224,72,-121,-58,-17,-72,148,-456,18,287,66,-188,22,135,320,-93,227,-44,97,-83,-15,90,-216,195,153,209,-29,-22,33,123,165,2,-55,172,-47,-21,117,-43,-22,135,48,45,-39,-138,25,194,61,118,-22,-65,-369,142,24,200,44,-71,31,213,59,162,18,42,80,159,-37,-6,172,75,-93,-87,340,-69,12,55,200,127,46,111,23,-1,112,124,28,131,-46,119,-660,268,97,-23,86,-67,497,239,0,19,154,204,36,55,-7,31,230,-52,-294,-976,-26,-371,-386,-925,940,304,-128,-197,-721,-799,314,-355,-997,370,-980,-29,-517,427,-62,-866,962,568,321,-221,198,276,-759,244,-303,1058,501,-149,205,20,908,-67,254,214,-63,-472,119,209,-14,233,69,265,7,-337,-122,469,90,169,227,293,17,-349,-274,146,535,117,191,38,-227,370,-316,306,13,85,124,178,32,251,138,250,364,-423,-319,-95,494,111,-97,247,-13,428,-182,-299,-38,-311,531,336,275,466,195,-86,285,136,556,-900,190,-291,53,712,98,-252,-65,-831,359,-67,81,105,424,420,33,104,346,-10,-290,-154,240,199,-143,244,262,56,141,191,366,6,616,163,-67,357,329,346,-488,-969,-1071,183,215,-698,200,323,-9,-596,-231,-444,543,-74,-364,370,480,51,338,179,-64,-175,70,-45,173,332,1167,-41,-70,-564,256,-179,-386,-30,-134,-107,39,-179,-487,85,-425,-172,330,1195,662,-3,378,-1248,359,182,-50,194,23,-37,-67,37,-32,223,196,323,-20,517,-94,168,-21,196,97,-24,-468,-170,407,124,250,145,74,-251,124,-53,-16,315,152,-20,-25,105,-315,-26,396,355,-220,-161,128,67,-241,181,781,239,-67,386,-56,-349,15,-570,282,533,133,13,207,134,107,65,-46,162,157,-253,-179,12,-619,-460,125,-42,-492,483,39,-609,-620,-243,45,367,274,339,-163,77,520,-35,-597,-315,601,35,-242,-578,344,66,-208,583,397,713,99,-35,279,205,-22,398,-10,103,22,-65,-206,-4,42,87,115,23,-130,195,-254,-26,-611,-75,-147,498,-369,-683,-351,-22,493,-96,28,-375,681,115,281,114,-20,-7,103,22,-145,-248,420,60,263,-32,149,79,327,-5,-63,254,-157,-12,334,89,254,-74,313,117,21,-14,388,151,228,-311,185,139,258,2,-230,-78,-723,510,128,240,453,40,-67,-77,23,-251,171,5,139,159,-54,-10,29,-91,-75,126,-14,-187,-53,-94,246,580,105,40,-77,194,420,-18,213,-40,-33,80,-85,22,-18,-254,-82,-20,49,-103,-862,-44,226,297,-28,-251,-95,-693,-69,-143,-239,83,26,574,-137,-112,-287,36,616,221,381,265,105,90,-50,190,384,44,133,180,128,198,407,559,179,-137,-5,-421,-261,250,99,169,179,255,303,341,-848,-118,-151,319,46,-71,-874,60,-474,1086,136,38,-192,5,-824,733,106,-929,-769,803,463,427,505,110,-153,52,-251,88,34,-639,-854,-159,-512,535,421,-73,-912,-413,-153,-82,-1169,-820,-295,585,-561,75,1163,254,391,-817,-53,-35,-81,657,-32,-642,-909,539,72,-363,-665,-277,-186,-114,494,256,-46,51,145,-873,-283,-527,317,-387,213,-805,236,1149,406,729,69,537,-19,204,97,434,682,-85,-338,-399,570,-77,-1176,-43,-326,-734,194,-26,-46,-593,581,71,31,-1231,-566,-224,-478,701,-266,-851,245,912,-504,-1016,-574,-359,-167,-834,725,-74,430,-431,-786,-59,7,-501,453,753,833,208,132,191,-409,188,-168,105,-267,-1418,-1253,-368,817,-1077,113,626,173,54,932,154,-93,-1031,-140,-141,455,387,475,105,-364,-83,-423,-49,442,418,244,564,320,111,-605,-371,975,186,599,242,-26,518,99,-89,264,-744,720,413,23,298,85,-299,-94,-365,-810,-174,-13,373,91,-1429,-49,-182,-513,397,-715,339,188,573,348,-806,-609,-40,-681,149,-14,288,-1092,-518,164,72,104,-500,-106,-3,769,96,37,-903,-545,-207,-227,481,164,-157,697,-353,116,113,343,520,-62,-570,342,-194,231,-386,-1371,211,153,471,-429,1449,559,57,405,-378,-316,167,-341,153,335,-155,-95,-361,1012,228,-230,-177,-406,-505,227,80,0,1124,-547,-840,-524,-381,-264,346,-427,-247,-119,-138,193,-99,374,-270,-324,573,535,-235,472,244,112,163,184,-731,564,719,-66,-119,516,474,-388,34,871,1025,-129,-648,512,-153,-51,-742,353,262,155,-84,-650,-320,-237,177,-516,352,-37,-219,50,549,408,-299,-258,255,-663,12,346,134,791,197,-285,450,445,-110,-316,171,-450,515,297,485,-75,121,-257,-51,-63,-3,53,123,71,-116,222,-163,-52,-187,34,-277,-3,592,179,98,-118,2,-424,553,28,-116,313,74,42,-14,187,281,578,72,46,-161,-415,810,824,468,-333,276,247,167,-168,130,-350,404,293,352,208,558,108,-453,-214,15,-145,-4,-27,195,-163,560,44,108,-410,257,-343,158,556,580,287,64,363,85,-388,-418,-234,289,-123,547,-19,36,-132,-430,-331,215,-281,-263,-21,191,-636,247,-30,-274,-312,-490,518,197,366,252,-700,197,742,232,227,111,-152,-168,-478,200,264,-54,-111,243,-195,-453,-111,63,-971,20,-210,-216,-56,319,278,-27,-167,-40,-46,576,120,417,13,233,-258,-68,-56,-201,-189,-598,-78,65,-303,-681,-123,170,71,628,615,534,76,380,21,101,374,-26,798,149,-156,88,434,-218,384,-282,90,-37,336,-359,-1,-394,190,187,90,135,317,300,557,194,24,145,129,119,-233,183,159,23,113,-128,-555,-509,-141,-3,568,145,283,168,5,-13,-353,599,776,339,-103,615,-81,-283,214,-67,-481,-49,786,-63,61,261,73,429,129,-787,238,133,1,-491,-438,1342,147,-199,-61,-132,342,649,-54,-509,104,473,192,-998,536,-135,-64,-316,217,-206,513,523,-185,-123,97,-69,-90,189,-610,257,295,-378,-67,74,-400,709,-409,-9,-839,-64,-488,-549,-157,510,345,-441,723,121,-120,-242,-233,867,386,163,-49,12,271,-22,238,668,154,-197,286,41,83,376,-135,51,-150,-260,-316,310,0,803,93,120,-55,295,836,189,87,760,-96,94,-430,-261,-25,124,218,410,-471,455,413,543,130,210,352,-24,-366,139,-257,-964,-309,-402,166,108,-1024,-625,-201,198,-135,623,276,-2198,-1128,478,193,-1,307,231,848,226,971,159,490,163,143,117,-280,-236,-254,-82,91,-103,-357,-888,91,-414,-576,371,1020,467,249,-267,374,123,740,-254,45,219,146,591,-306,-223,-41,-412,67,333,-131,342,374,74,-8,444,-33,-681,480,-92,66,122,-320,-125,728,-176,283,-100,-792,-168,-137,350,1353,792,59,66,-92,32,-219,-946,-119,181,-47,348,-43,492,-131,-190,210,592,89,637,52,268,-37,-97,523,-165,421,598,-167,-60,-1512,306,-157,680,119,-479,-709,-170,-102,301,827,-193,-907,-534,-556,414,769,121,501,190,785,-106,103,-1580,501,-41,351,542,-1067,426,190,280,229,-174,-44,-73,703,262,116,81,-171,-70,-933,-975,34,-59,-1029,426,-930,-11,-505,-530,-931,-516,225,-478,428,528,-623,572,-78,-294,990,211,-46,-658,-606,-1066,377,593,-1949,-1970,277,0,2469,-1224,20,926,-267,-976,-487,-867,850,1580,428,543,172,161,78,998,373,-188,-398,75,690,-116,1635,950,184,270,-23,83,-160,207,-529,-587,987,197,280,-580,277,529,110,321,-125,55,255,188,-214,-277,350,-204,-78,101,-139,853,261,336,332,281,-209,29,620,-286,-33,362,-33,-151,116,385,-59,210,242,133,-171,-50,239,146,134,307,-149,401,-1561,530,224,120,556,145,203,355,297,-144,-204,-207,-121,-811,-196,750,-70,-37,149,359,-297,-906,573,390,552,-28,10,283,111,298,393,107,-111,639,191,282,-30,-267,-478,118,575,-134,308,337,17,203,35,204,-14,157,-1023,-26,401,161,-280,729,-8,-131,-4,705,1013,613,233,-351,70,162,-887,-35,-456,-1209,1436,-159,214,-674,-477,-87,-1017,385,787,-1705,970,358,593,313,12,431,47,72,398,-8,-297,334,-343,-224,-512,-491,14,-72,469,403,76,187,124,-274,-60,-222,289,-204,321,392,-452,447,96,62,-602,655,-392,-1102,536,204,294,221,443,456,-293,-541,23,149,-1488,-1029,660,505,56,50,-171,-933,-253,582,-395,453,-234,98,784,-124,-727,160,-596,892,-12,-676,327,402,-86,-829,-54],"low":[4627,-11,-9,-15,1,19,-59,8,61,-57,30,-52,-13,-126,8,-7,-4,-69,-69,25,15,39,-80,-50,52,12,-1,1,40,69,41,19,17,-6,-61,37,-49,57,55,50,-2,-3,59,45,-4,40,18,12,-19,32,30,7,-28,-7,52,14,-1,-16,36,-4,1,-28,35,25,-2,-13,39,31,-8,64,37,-67,-30,53,29,-46,83,21,-109,-23,63,-41,23,-135,-44,-500,164,303,-11,70,-17,-135,-31,15,-67,-130,-76,115,-141,89,97,11,-7,0,95,-114,-72,-63,10,55,37,80,4,105,14,22,-53,-18,-46,-49,-25,-14,-174,-43,-87,32,16,45,98,40,38,34,44,-25,-69,-20,-24,70,68,14,53,30,-33,-63,-18,114,4,25,2,-47,74,-51,-107,-76,26,-41,73,8,-55,-2,-8,-99,-20,23,-53,63,-42,89,66,82,8,19,50,-7,69,14,11,35,21,36,50,-19,-10,83,20,-76,52,-36,3,-58,80,-9,9,8,54,-36,102,-11,46,67,-88,45,-8,42,64,-43,24,18,33,-19,60,-22,114,1,-6,-24,-11,-44,-55,18,-144,50,78,1,3,-40,79,11,-57,-22,96,37,29,18,14,-13,26,14,18,-4,-20,3,35,-25,46,17,-18,-40,34,18,-18,-34,74,-3,15,61,-36,26,37,25,21,5,3,-17,-64,-3,3,37,40,47,-145,-8,97,48,-44,50,50,16,19,-26,28,61,-15,40,-8,-4,-157,-81,1,98,31,-73,9,88,-8,-92,10,-5,-81,-9,4,-139,-70,36,28,9,78,-46,100,91,-23,-27,85,7,14,-27,-2,-7,-12,-16,-9,-41,25,-17,5,-96,78,143,63,12,23,15,22,10,-16,-49,-22,-3,23,3,44,-42,-12,15,-112,-29,43,44,-16,-104,-9,-9,14,58,48,-63,-15,-62,-41,-11,-52,0,-64,-14,58,-85,-56,1,1,39,79,-76,21,5,97,61,57,45,91,11,80,-37,-61,-30,9,-68,44,-33,111,41,-16,58,10,30,-138,-5,-45,-41,-82,-86,-118,-185,-173,-66,87,54,154,65,-35,-16,-254,-49,7,28,137,-6,-50,249,47,49,-14,-147,-108,199,31,-136,-28,123,52,107,70,-66,80,-86,-262,34,12,177,-58,-143,-51,-135,-101,156,155,51,117,81,86,-13,108,-54,-31,2,-89,99,53,-9,-101,182,47,-59,-179,26,33,51,-5,80,-134,-40,97,8,-2,-20,-158,-18,-152,9,-61,-39,127,8,145,68,22,35,-3,-54,-34,23,-34,-37,-95,8,11,-60,100,-68,68,41,35,-49,6,32,93,-19,24,60,3,21,17,5,-18,81,19,97,-9,-12,-3,42,10,13,-40,48,52,31,71,-2,1,24,41,-7,40,4,-2,-4,52,6,2,-14,71,-47,70,17,26,20,-67,-76,54,53,52,-10,55,81,27,1,9,1,57,-35,-12,77,80,-59,-34,8,8,49,-94,22,-37,-84,36,20,-32,-92,39,78,-79,-4,-109,-4,152,38,42,-6,-12,-21,-20,-149,-40,-81,3,44,-4,-43,-22,-45,-121,-84,9,114,-62,32,20,39,-60,-9,-120,-35,59,89,70,-26,-19,-9,24,-12,56,27,122,-4,-119,11,-78,11,63,-115,167,66,42,19,-83,3,-56,-62,-64,70,39,-32,76,133,-51,-170,4,-40,82,67,96,14,-39,-44,128,61,48,9,12,-8,9,36,13,40,62,-1,-12,-7,-12,-9,65,-14,0,-51,-13,-5,42,58,81,-74,-17,-11,41,117,17,6,4,-19,21,-66,-69,-88,40,26,-26,-12,46,41,-20,-61,-109,-30,-13,-12,-2,72,43,-64,-144,-10,-31,-13,-9,-32,8,44,-6,-7,42,-156,-74,0,9,-47,-64,-34,-49,165,23,41,65,29,31,-60,133,3,3,-44,-65,-2,18,4,77,13,-62,-56,19,104,52,-29,-133,32,-63,-69,15,-17,290,17,-18,-22,-8,38,0,45,-33,-34,27,46,-29,-4,73,-90,18,19,-30,24,-6,26,-61,15,43,-48,107,15,-12,11,-15,-6,30,-68,-95,36,-34,-29,51,62,-55,53,101,34,3,5,-3,-8,0,32,-37,-61,-11,77,-62,36,-12,44,-31,50,-33,46,-53,-18,-87,50,40,79,89,-36,-93,33,-110,-83,32,88,74,30,47,-32,49,28,21,20,146,28,-10,11,27,16,23,27,7,35,18,16,0,-65,-41,-7,90,-54,43,-38,-74,27,-71,-52,105,74,-82,-70,-19,62,43,46,-38,-189,-95,-69,66,78,54,-34,85,-29,7,44,52,27,33,127,57,35,1,17,-10,-88,21,-38,13,13,9,48,32,28,58,17,40,-53,-38,43,-3,-8,3,48,-141,6,-2,10,-29,57,69,15,-159,9,25,-10,34,39,80,-68,118,69,-33,26,-21,3,31,35,103,-41,-49,11,-17,45,-26,-59,85,21,-76,35,2,-148,-84,144,61,28,70,41,16,140,72,-14,-38,33,62,5,15,-12,-10,-8,24,-27,36,-136,14,63,-2,-12,114,47,-63,-22,-30,52,64,36,5,70,74,-12,-27,-30,39,42,61,-8,-106,-16,-19,50,-22,-94,147,21,122,32,17,-3,-27,38,-50,-40,-62,56,39,-23,-14,-90,62,164,22,-49,14,71,-66,-115,-146,6,-55,112,-43,-138,39,-72,118,108,121,68,81,-40,103,41,-29,-14,51,22,-2,-15,-14,-19,-67,169,21,-12,-58,-4,-8,-47,-61,-24,56,34,-8,13,-75,-142,36,-41,-96,41,81,9,133,-82,-208,-119,40,108,-157,-95,8,-71,181,54,37,99,-28,-6,-67,-87,120,23,77,-3,-52,1,-124,52,-20,139,88,-50,-104,6,66,34,47,69,32,108,45,21,-3,-19,16,1,48,116,5,6,-6,-77,19,4,22,-20,51,4,-2,-8,5,14,57,48,53,71,24,8,-136,37,-61,98,93,-71,96,-147,68,55,80,42,21,-75,-21,50,8,-172,-84,48,-37,-23,-3,8,123,-27,83,67,5,129,55,21,7,12,44,11,4,-23,19,39,-36,-16,-11,59,-56,4,14,-7,-95,-17,88,80,-15,-96,-4,-4,-84,19,-14,57,-142,-93,147,22,-110,-50,65,-229,-154,-17,-247,15,207,34,252,99,86,47,38,106,2,4,193,36,-76,35,-10,15,31,32,17,55,11,-11,57,-26,-4,85,52,51,26,90,-131,28,6,17,22,-107,-104,8,47,-93,-134,-136,-4,306,73,39,-1,18,30,31,-70,-108,-66,-130,-152,87,162,-9,-73,-59,-63,-54,-17,93,67,68,208,-11,-251,-20,-94,100,-121,193,63,56,-11,-21,66,111,98,80,54,10,32,22,83,-6,4,5,9,36,-41,-32,33,-105,5,-147,-65,-11,-28,94,54,-13,184,64,-23,-37,-249,-118,68,124,-59,-120,41,-44,146,3,40,80,33,-80,76,8,-185,95,143,-29,62,177,-1,-91,-36,-169,97,114,-177,-140,60,170,-11,-139,104,64,83,1,44,-33,23,72,-162,53,108,-58,-27,-5,66,-92,-58,-66,-77,106,120,-86,-129,74,38,101,37,64,-12,-14,-37,-96,-222,10,68,20,-58,-121,6,13,103,152,106,44,100,158,83,10,-141,-26,-98,-99,-15,115,-32,110,-86,7,95,-193,-55,160,-147,-131,188,-24,10,75,-122,-242,-467,-1766,1327,92,435,157,-80,-342,107,140,-151,210,-10,3,59,64,26,103,50,-147,-44,-160,51,-137,1,-259,-94,175,9,-11,407,-37,11,-8,160,54,-35,-51,69,120,36,7,-33,69,390,20,25,-18,104,-8,9,82,33,-43,-35,-89,-24,32,-99,-218,-30,173,62,166,65,-48,-82,107,1,-27,69,-6,-244,78,145,-69,-118,61,-209,-134,279,-28,41,-247,22,100,111,38,-103,162,12,-141,-372,68,-139,-260,-91,-117,135,-234,-107,-116,37,-263,257,271,-39,-38,-161,11,168,129,-139,-196,56,-272,-288,34,144,-143,154,212,185,50,-58,186,-97,-174,207,134,-68,66,185,-14,10,-70,-30,-1,-65,215,60,-11,39,53,-7,32,4,-17,-46,39,-19,240,-10,-64,129,-94,25,-38,1,-3,-57,219,-21,36,-11,-37,29,-2,-203,33,-33,-143,-62,-119,67,-10,-66,2,-41,114,53,26,-119,15,27,-36,-16,-50,113,56,66,179,41,52,17,13,-38,-19,73,6,-17,-25,-115,-67,-65,30,-104,-26,84,2,5,47,-356,-231,155,193,90,132,-61,-27,154,91,164,68,-13,49,-15,30,8,67,27,4,37,-6,88,30,47,30,-95,58,23,110,15,39,-36,47,1,52,-28,-60,52,-19,11,64,-110,-5,-28,71,-63,-21,-4,77,38,41,-55,-266,-63,110,65,48,85,-16,25,1,191,-56,-99,-2,94,-76,70,6,-17,75,-52,-26,114,-203,6,-112,113,-40,113,-16,-61,38,148,12,-98,-36,-93,19,-183,-21,-97,-47,185,66,-36,-140,64,-81,130,34,94,60,36,104,-71,52,-1,-11,-84,-217,-7,55,62,-10,189,82,-53,85,54,22,-72,19,78,-14,-54,16,60,-61,-47,-119,75,77,44,59,126,15,-8,-42,120,-37,23,6,20,-35,81,147,49,5,-126,-28,101,0,47,2,62,-9,68,46,70,2,63,55,12,95,12,-62,-11,42,-14,94,2,-28,-13,7,18,-32,68,45,-51,38,57,-9,-16,-173,-5,46,-1,-73,115,104,49,5,-57,31,-15,-2,-20,16,-116,28,-40,34,23,36,51,40,158,68,38,33,58,61,64,-40,-6,32,45,60,-2,-53,85,30,46,-294,-18,179,44,68,39,84,80,25,-49,41,113,112,-58,-5,19,-468,-64,181,-66,-113,15,164,3,28,75,-19,12,-225,-28,-149,94,-109,6,-36,94,76,44,202,64,59,73,-28,186,2,-17,57,9,52,-223,57,5,20,-51,52,-7,65,19,-111,-190,1,229,45,16,-247,-68,-47,158,62,-91,31,17,-89,194,198,63,-201,48,86,-88,124,23,20,-26,-18,-18,20,-108,-28,-10,-175,57,90,21,54,61,52,2,94,55,34,-35,39,28,16,61,18,7,-137,126,-100,-9,-111,59,228,179,64,-13,-73,107,126,24,28,-151,95,4,-53,-79,155,47,-19,88,85,42,7,-13,-258,103,-189,30,-46,-4,127,113,30,60,40,-5,52,184,-81,-35,46,-42,-100,44,15,-84,47,244,147,69,109,21,-95,109,73,59,47,114,40,55,247,-112,37,115,78,-192,52,-92,-295,-647,-290,510,-675,-332,633,126,28,444,224,-37,41,-34,107,337,-61,-111,-410,-104,263,289,-52,199,187,246,-201,-34,-3,4,-530,97,-42,-360,-416,73,-148,-164,59,-275,56,-40,544,-360,158,161,103,106,-49,81,243,140,-97,-261,-71,-363,-92,371,99,-63,-40,149,-241,176,453,-65,92,251,43,75,-249,103,-50,-30,47,20,-100,96,137,-125,126,41,124,220,100,7,-59,-37,110,68,47,107,-39,-117,-123,294,-128,-68,-488,156,-176,-44,223,-173,96,40,197,282,89,-91,128,187,-7,-160,210,-56,-3,-105,182,73,-48,-321,-233,55,128,-31,329,66,152,-20,58,-180,40,-20,-192,135,-120,73,113,-38,75,86,175,111,64,93,19,-113,-203,-224,-14,29,-21,49,263,-38,-209,23,11,201,-4,-218,188,73,101,5,73,-38,34,-460,-263,-150,182,-725,-369,312,63,214,177,-303,-5,20,-377,-378,212,-293,-414,192,653,24,-56,-114,164,315,176,-347,-398,-18,-175,-79,232,-424,-441,210,-14,167,42,229,335,72,197,-399,-375,-91,-145,282,273,-93,-333,-453,87,-370,-295,-367,-326,63,299,464,99,-183,-139,225,437,109,227,-77,109,-120,132,238,-72,225,-306,-44,174,189,-220,-76,190,358,52,34,236,6,-280,-38,141,135,149,-99,131,24,-6,-61,119,150,-59,-105,94,48,-71,122,-41,-249,-145,251,292,158,31,62,31,70,-5,96,-83,-144,121,-154,64,135,218,101,143,-56,137,-39,46,43,17,37,-44,131,67,-31,14,170,152,-20,-86,175,-213,59,-193,246,-257,-225,45,-287,-106,-297,80,45,364,-7,-354,158,-17,-361,80,-47,-238,68,-190,-460,210,301,135,260,388,57,-78,74,-80,90,259,14,159,101,-11,-341,84,50,8,231,28,163,-90,-46,-28,282,34,64,99,-88,-38,-149,12,63,85,74,-10,150,-104,-40,-367,-9,-302,-701,187,-118,468,46,-153,52,-160,-126,294,340,-58,104,-142,-498,152,63,-80,377,-27,-138,187,344,83,-95,-131,165,241,-68,-118,18,-118,236,-231,-44,-257,-94,177,-223,165,-44,-394,-120,506,103,-264,116,69,360,-7,91,87,38,-210,143,-35,-64,159,31,350,-54,-72,65,169,124,68,-76,106,-31,40,88,-11,-49,178,-23,82,-197,45,-33,193,138,84,11,-322,-255,291,-30,231,-17,-54,60,45,147,252,56,29,29,165,36,-19,79,81,-188,4,278,-70,-104,261,31,255,33,94,76,-29,135,132,54,93,-89,-103,-449,188,177,-114,-140,170,466,220,113,56,-16,302,140,-44,119,-30,260,-397,-256,-906,-552,16,-940,-733,777,168,375,-127,-719,-1080,157,-95,-1579,119,-897,62,-298,483,-153,-517,1302,203,363,105,168,286,-834,11,32,790,681,17,286,-28,767,70,257,239,49,-894,470,177,-60,500,-329,393,221,-567,-56,573,126,231,206,77,-116,-538,-72,234,714,124,277,-114,-84,129,-485,511,-29,324,1,334,-167,195,228,256,404,-1055,-222,-27,763,363,-24,-4,93,444,-566,-102,-146,-233,523,450,463,372,87,20,113,163,-157,-493,473,-187,155,162,434,-58,-600,-523,513,6,140,-136,430,702,22,187,23,-94,-258,-204,274,414,-79,148,271,66,-71,460,181,110,346,288,222,169,317,110,-1248,-1261,-214,334,-244,-366,606,217,-88,-757,-405,-252,643,-329,-203,308,737,370,50,397,-640,279,-198,303,303,240,676,364,-285,-372,161,-536,16,74,-287,96,-502,344,-882,114,-545,-10,387,1103,1013,-217,-171,-750,276,387,62,212,162,-159,-117,144,-222,156,496,331,-312,605,-48,318,10,189,-57,-474,-212,38,454,110,251,277,-178,-401,325,119,35,197,167,30,-57,-658,311,-231,427,483,-133,-255,237,29,-328,254,339,722,98,-330,581,-986,267,-727,326,929,101,14,307,188,120,-311,262,51,171,-417,-181,161,-774,-1123,496,-472,-36,706,20,-904,-899,-266,206,741,325,468,-346,271,500,-342,-411,-191,555,117,-466,-433,228,280,-93,427,700,407,314,-65,437,-82,181,329,-235,55,386,-318,-252,-41,4,184,305,27,-84,-143,15,-132,-952,202,-178,524,-614,-653,-302,90,518,-63,49,-564,759,275,26,486,119,-28,93,-217,27,-342,350,256,69,162,8,296,77,106,-407,247,194,-171,369,304,229,-33,188,195,116,-115,360,21,245,-452,315,326,71,68,-376,-122,-520,176,432,365,215,268,-644,308,201,-284,146,-187,363,182,-54,48,-177,-78,-54,308,-368,-47,-136,-191,478,405,457,50,-189,60,426,153,201,-122,5,129,-204,77,-297,-203,6,-91,133,-194,-1183,406,97,414,17,-254,-838,-71,-154,-272,-406,316,-33,910,-164,-231,-182,95,558,381,17,571,76,39,-146,117,435,140,185,-46,372,233,173,544,324,24,-348,-639,271,-11,197,156,298,81,513,-339,-627,-38,-277,537,-339,-511,-230,-544,40,1369,323,-269,-17,-148,-825,25,133,-344,-430,273,803,591,408,249,-160,64,-241,-46,-359,-926,-390,-209,-873,791,779,-831,-184,-509,-356,-504,-977,-1725,753,-90,-73,-210,1357,762,515,-1183,-49,187,-104,932,-558,-1074,-191,793,-111,-569,-588,-479,-525,-1084,1913,393,-242,134,11,-543,-1027,-471,915,-238,-281,-645,178,917,864,451,403,462,157,-18,335,313,799,-49,-389,-309,385,-251,-937,-187,-19,-796,-250,102,-85,-242,119,298,-676,-824,-253,-557,-186,252,-492,-295,633,-209,-427,-451,-939,85,-562,-601,914,305,342,-1070,-227,-737,708,-504,325,465,1227,191,-60,-33,152,70,-293,408,-754,-1085,-1385,-119,327,-733,123,813,-73,240,719,379,-794,-251,-506,125,-28,884,404,149,-298,-353,-459,-22,828,12,327,646,285,-66,-190,-468,492,429,718,260,-69,415,478,-238,82,-379,664,130,174,430,-24,-280,43,-471,-855,-20,-34,277,-841,-407,-484,72,-621,57,-265,240,218,507,766,-1539,27,-360,-384,42,34,-296,-460,-680,154,-145,84,-411,-174,43,1146,-357,401,-1169,-410,-261,92,-769,588,660,200,-67,-15,-110,515,593,-47,-509,-28,393,-125,-913,-551,-102,449,195,-249,1082,734,325,153,-137,-388,160,-128,-58,533,63,-466,-259,80,1091,-252,-221,-589,-148,101,180,-43,475,-272,-752,-306,-412,-154,279,-728,107,-50,-330,252,4,-16,40,-127,-92,958,-95,415,62,242,342,-191,-378,182,702,405,-560,734,336,-199,31,210,1443,-219,-232,10,135,-347,-295,268,98,329,-105,-505,-421,-133,-1,-250,329,-38,-276,-183,650,495,-410,-84,-305,-445,-219,826,-21,395,618,-136,439,-45,106,-6,94,-312,528,276,279,182,41,-376,-125,43,206,-274,106,198,43,160,-136,-131,-87,-36,-385,145,371,391,213,-348,-43,-206,109,511,0,28,252,-118,102,206,102,446,393,81,-324,-344,711,399,787,-202,15,535,184,-92,-475,71,414,217,483,39,356,350,-359,-293,-74,60,-323,92,339,24,509,174,-31,-414,149,-260,121,568,516,272,113,69,430,-858,-53,-85,259,-175,13,491,212,-165,-756,-136,-24,-2,-269,-168,-10,-235,1,104,-330,-428,-345,444,353,168,-335,-243,567,198,763,301,-79,-25,-313,-355,245,206,-116,-62,201,-403,-83,-223,-234,-677,-10,-166,-272,-185,188,378,90,-464,202,-16,-29,593,561,180,-69,-364,261,-281,-164,-286,-479,-325,467,-604,-740,173,237,17,500,868,422,239,214,157,-105,171,396,794,106,-68,73,176,65,234,-54,-22,-23,141,-364,25,-341,155,49,226,152,305,288,443,150,323,103,275,-445,157,201,267,93,86,-336,-734,-235,-183,-72,250,387,346,-93,391,-132,-391,624,547,649,-55,476,-135,-83,46,77,-759,102,498,221,22,387,233,172,151,-932,355,245,-148,-635,-187,1208,208,57,-133,-73,72,482,393,-1012,324,397,-252,-290,102,266,-273,-365,450,-391,473,761,-118,-195,55,-116,172,-63,-499,92,-384,85,324,-176,-116,168,-108,-667,-51,-480,-207,-976,87,493,533,-606,878,306,-547,-385,-3,1199,390,306,-203,91,204,115,81,444,491,-227,225,105,24,-123,172,312,-135,-513,-715,484,323,328,778,-35,-31,50,926,313,163,209,529,-381,-95,-485,130,301,117,-84,-220,402,594,537,391,74,215,-766,131,205,-94,-1145,-543,-233,377,243,-1763,-688,414,185,-747,1226,-1043,-1151,-2102,1111,-19,278,846,294,713,272,998,327,172,518,77,-551,147,-204,-153,-382,148,114,-1110,-168,21,-975,163,241,-95,1557,540,-236,108,-14,966,-219,330,-143,439,124,-24,-264,-552,32,127,340,-152,298,410,158,64,509,-658,-111,362,211,-199,66,-692,439,499,67,-125,204,-1214,145,-95,327,1208,874,407,-149,-109,12,-218,-1328,224,35,-52,100,522,148,297,-530,338,531,275,623,182,93,-113,-206,543,143,128,570,113,-1912,-118,-454,684,806,212,-845,-603,-157,-455,682,950,-875,-271,-665,-422,189,987,149,16,695,920,-81,-30,-1800,163,512,131,298,-1014,718,239,512,-355,456,-92,-388,724,648,37,42,-400,-675,-618,-1009,193,-1132,-312,-335,-584,352,-506,-567,-1187,-165,478,-536,669,468,-539,246,131,-327,1149,602,-760,-257,-1220,-1072,709,144,-1572,-2747,-2028,740,564,1720,870,1130,352,-1839,360,-1343,969,1526,295,956,64,356,-716,1831,409,-73,-591,-141,739,203,1528,694,733,-58,193,-286,242,-542,106,-672,901,380,-107,-539,404,672,328,-331,555,80,-12,122,73,-511,472,-254,-51,-252,-123,1262,311,214,302,447,-435,146,706,-360,152,200,-35,-70,-42,503,-510,565,277,208,-345,97,371,98,260,-34,-148,-118,-1219,727,78,90,448,504,142,92,645,-103,-234,-33,-699,-941,214,229,589,-36,157,209,-392,-900,719,230,250,624,-73,151,307,248,419,220,-612,859,289,187,-74,-362,-486,256,635,-131,24,659,-154,458,-294,223,222,-1843,818,-710,580,-43,87,1070,225,-958,478,1061,890,522,100,-431,75,316,-1139,-125,-691,-1163,1822,63,29,-1173,-891,270,-853,325,-984,-401,1442,216,1307,503,-290,507,44,151,417,-202,-69,-1,-327,-636,-204,-241,-663,664,495,590,1,394,142,-441,49,-517,-390,657,182,402,-476,126,320,144,-914,619,-187,-1183,81,992,87,347,522,447,-1354,103,-64,-770,-1049,-571,401,630,594,-332,-812,-315,-308,738,3,-152,-18,68,1127,-702,-179,-420,-612,1156,-117,-393,-700,1409,-39,-798,-448],"close":[4642,0,-28,3,38,-19,-58,57,4,-54,74,-67,-43,-133,15,4,35,-115,-76,47,39,24,-127,36,-31,44,-9,65,9,56,25,28,-2,-9,-58,45,-1,16,65,14,5,15,69,9,26,38,18,1,-12,30,13,16,-34,43,33,-23,-7,5,23,16,-23,0,45,14,-12,11,29,4,25,59,22,-60,-3,25,28,28,21,-11,-107,3,86,-99,69,-150,-25,-161,-116,236,-5,90,-77,-92,15,-65,-37,-171,49,-18,4,-50,167,-27,-42,107,44,-160,-82,-8,-37,125,43,-1,122,19,15,-5,-40,-36,-19,-70,-8,-16,-174,-66,-12,-12,13,136,24,42,13,58,23,4,-126,38,54,-62,113,29,38,-2,-37,-34,10,86,-20,47,-11,-7,32,-41,-127,-36,-32,8,57,18,-69,6,-44,-83,42,-53,53,-46,-15,130,50,75,-31,55,18,17,65,20,30,19,5,84,-1,-13,-2,99,-27,-2,-8,-22,-6,-53,118,-43,18,34,2,34,41,-10,107,-19,-48,37,10,35,25,14,16,11,-12,4,56,24,65,0,7,-29,27,-34,-87,-20,-86,15,83,4,44,-84,105,-35,-4,-64,110,54,14,-2,3,20,5,36,-19,10,-24,42,-6,4,33,-1,-14,3,-10,12,-13,-20,85,-4,47,18,-5,21,8,40,2,42,16,-65,-40,-43,77,8,30,35,-145,27,105,-9,10,32,27,38,-10,9,42,14,-8,38,-2,-13,-170,-47,30,79,12,-93,30,113,-30,-78,23,-39,-89,35,-20,-80,-134,50,-20,105,-10,31,99,14,-31,55,27,8,3,-19,-15,14,-4,-27,-19,-39,48,-10,-10,-40,35,128,46,15,33,40,-9,-5,-11,-28,-9,-32,19,22,50,-43,35,-70,-101,16,48,17,-44,-85,-35,22,35,29,93,-127,12,-86,-46,-10,-40,10,-85,0,70,-105,-21,-29,28,116,-40,51,-96,87,82,23,75,86,29,19,80,-16,-107,-44,24,-67,76,-31,131,-25,39,61,-12,15,-154,10,-19,-27,-146,54,-264,-34,-324,244,-217,224,47,79,-46,-32,-263,-92,18,207,41,-86,130,148,36,9,-50,-128,1,135,-25,-121,68,72,78,82,41,2,-25,-98,-180,57,63,57,-82,-65,-139,-135,105,134,90,-36,187,38,28,52,106,-90,71,-112,-28,71,119,-115,-7,158,9,-99,-151,48,118,-30,41,67,-207,-3,107,-36,64,-96,-134,-43,-106,18,-123,-41,184,-34,201,39,-16,62,-16,0,-96,90,-64,-62,-87,-15,12,-54,161,-80,47,48,16,-65,40,-16,107,24,47,20,-19,42,12,23,-21,53,78,37,-9,2,-11,75,-21,18,5,8,49,19,84,-5,13,33,45,-44,58,16,-44,86,-20,18,-29,42,22,9,65,-29,51,-5,-67,-63,49,69,27,3,121,23,19,-16,47,12,1,-14,-4,117,10,-27,-26,-13,70,-2,-93,42,-51,-108,32,76,-102,-74,133,-17,-75,-18,-60,-35,172,39,40,-48,11,19,-71,-165,6,-24,-20,-13,-1,-60,-21,-43,-133,-80,170,-7,12,-41,-8,79,-53,-27,-165,46,25,140,-25,60,-106,75,-43,23,63,59,66,5,-160,66,-122,39,38,-70,196,19,54,4,-81,-12,-63,-35,-59,95,-18,33,86,71,-86,-78,-50,-42,83,150,-5,-2,-19,-23,122,50,55,-3,20,4,16,3,17,80,30,10,-27,28,-56,42,11,0,0,-69,45,-7,-7,151,-10,-89,-11,20,93,62,3,6,13,-7,-18,-41,-98,-56,94,-57,-10,20,44,24,-37,-63,-109,-34,-21,-3,49,95,-4,-79,-161,34,-63,-23,0,19,-40,92,-70,43,12,-155,-101,27,-1,-44,-74,-21,27,148,2,13,97,28,-22,56,39,-11,-13,-4,-73,42,-39,19,85,-14,-52,-62,86,100,-29,0,-106,-13,-57,-10,-62,135,207,-35,-22,2,-13,25,40,9,-30,-33,27,32,-15,11,41,-93,34,15,1,-14,-15,79,-118,98,-22,6,69,2,-28,24,-2,-20,49,-105,-72,67,-83,25,68,-14,28,30,100,-17,18,8,20,-25,-9,23,-35,-15,-13,48,-78,66,-25,37,9,17,-47,54,-63,2,-57,36,46,134,-3,-5,-138,91,-136,-94,92,70,66,-3,37,-22,64,51,-33,89,84,28,-4,35,-10,44,9,38,15,-8,71,-11,8,-65,-17,-4,48,-35,39,-68,13,-38,-95,35,99,3,-73,-84,91,-48,70,60,-82,-173,-60,-70,51,63,30,10,44,3,29,55,7,44,42,146,33,17,-10,19,-19,-78,22,-55,24,47,40,-14,40,14,77,43,5,-46,-14,38,-31,18,43,-29,-130,-3,-13,33,-26,74,51,4,-157,29,53,-49,43,81,13,9,90,38,-15,-5,5,-21,52,94,19,-51,-16,0,-27,61,-10,-19,80,-3,-93,68,-66,-152,-24,163,62,56,-31,90,46,131,18,12,-50,36,59,2,14,-8,-19,2,12,9,-2,-156,110,-13,13,100,26,16,-82,-24,-20,84,45,20,44,59,51,-25,-7,8,-11,62,35,-6,-111,-22,-11,47,-17,99,-24,60,91,4,29,-22,-13,57,-69,-63,-32,80,19,-29,28,-129,164,72,1,-50,67,23,-30,-174,-84,-5,-92,157,-23,-198,62,-22,108,153,50,100,17,66,18,44,-62,42,-12,48,-10,-8,21,-10,-67,114,25,-8,-45,8,-39,34,-128,-61,78,108,-49,25,-129,-78,29,-114,-49,17,62,154,23,-71,-236,-82,79,148,-272,-99,66,28,113,2,64,69,-77,83,-140,28,69,23,26,-16,46,-114,-25,-8,32,143,6,-46,-69,57,61,-32,84,39,65,112,-28,58,1,-9,-4,34,77,53,-7,16,-2,-84,27,8,5,52,-6,-14,2,-9,59,5,41,16,103,16,60,-29,-115,70,-30,61,57,-33,38,-127,150,-12,61,62,-11,-38,3,-17,38,-196,-35,65,-73,-7,-30,68,56,-4,101,50,47,75,55,0,20,15,35,10,2,-11,37,29,-59,-9,50,19,-83,82,-8,-51,-96,86,15,75,-30,-93,-27,106,-210,104,-13,14,-158,0,96,-21,-139,188,-159,-242,-148,1,-60,-58,121,139,248,-50,145,80,7,149,-37,21,138,30,-34,1,32,-9,36,32,18,44,32,-31,77,-47,46,20,81,16,68,49,-120,42,19,-5,1,-75,33,-165,49,-113,-106,-163,182,245,7,26,-37,9,74,-2,-70,-107,-31,-151,-136,129,194,-68,-107,-3,-56,-131,117,80,52,189,23,-12,-270,-52,97,-79,88,98,-9,89,-63,-33,160,38,122,91,10,15,53,72,11,8,-27,55,-48,98,-51,-42,19,-123,31,-200,-61,69,-46,136,17,105,16,45,-21,-39,-247,-36,42,121,-113,-55,7,86,-18,84,67,44,-27,-31,67,-15,-168,159,46,59,41,148,-28,-22,-69,-172,142,18,-178,-74,64,134,-42,-49,22,158,0,48,-12,7,57,-11,-127,176,-25,-66,37,-35,33,-84,-26,-111,-18,148,16,-90,-54,59,30,159,-80,81,9,-57,-22,-73,-258,38,85,3,-25,27,-188,-6,162,189,72,12,156,165,39,-7,-129,-42,-110,-92,95,42,53,-13,-35,-21,86,-180,-14,126,-143,38,-18,17,92,-57,-73,-305,-468,-394,-37,494,261,-2,-131,-326,285,-51,-123,288,-118,113,58,-32,124,60,4,-178,33,-158,8,-38,-88,-293,-52,229,46,179,149,-50,63,42,48,26,-69,-17,174,45,62,-56,-66,219,307,7,23,94,-18,-51,128,40,1,-31,8,-122,-29,-14,-110,-220,158,7,214,8,77,-33,-10,10,16,-29,114,-71,-194,263,-52,1,-174,51,-261,84,68,167,-166,-249,122,73,83,-2,-6,177,-103,-141,-236,-19,-105,-339,-86,32,121,-364,217,-323,22,-31,10,292,-154,92,-257,142,213,28,-226,-49,-1,-353,-150,-30,37,-14,147,221,227,-117,30,165,-170,97,101,-13,-93,329,4,-20,4,-65,-87,67,-16,183,18,-4,95,-6,-15,42,33,-89,3,-15,172,53,-16,116,-42,-106,179,-159,-8,-40,91,140,1,-28,59,-68,9,1,-167,0,-53,-87,-130,-56,100,-99,-68,-3,56,30,145,-97,-47,-39,132,-134,38,-55,116,-14,213,78,32,57,21,1,23,-52,40,-28,19,-18,-125,-91,0,-31,32,-155,67,34,-26,153,-448,-207,224,185,123,54,-66,88,32,168,63,56,-27,76,-18,74,-41,131,-26,47,1,13,79,40,25,61,-88,38,33,111,-13,27,-30,50,8,50,-65,21,3,-3,9,21,-76,-19,17,16,-38,-12,30,38,73,7,-69,-295,205,-104,55,180,-35,-51,22,115,94,-76,-99,116,20,-86,88,-17,-18,42,-6,-26,75,-170,-10,-42,14,-32,104,-1,-14,44,142,-38,-81,-54,-74,-11,-88,-93,-113,-40,270,76,54,-190,5,-117,159,69,85,-44,122,36,-48,38,-27,41,-144,-203,23,90,28,148,21,93,-54,150,-25,19,-80,49,46,-9,-34,8,62,-94,-17,-123,106,65,68,106,40,27,33,-19,42,-37,25,-6,27,10,83,125,13,24,-98,-25,86,-11,36,15,46,21,46,42,72,43,76,-4,56,64,5,-49,25,16,-40,142,-66,24,-29,-22,23,10,55,22,-32,81,-9,-32,12,-200,88,-33,27,21,80,61,22,-9,-8,21,-54,7,-7,5,-57,-53,-52,108,-20,21,110,-3,160,97,-19,81,24,121,23,-44,5,50,30,48,8,-11,31,44,58,-355,119,58,116,14,64,119,25,12,-5,55,162,-3,-57,56,15,-359,-75,113,-61,-62,-98,231,-110,138,-4,54,-66,-255,199,-243,5,-145,134,-124,147,90,39,165,31,111,7,95,84,19,-6,66,-37,47,-91,-12,-61,33,39,-56,26,91,-25,-19,-309,107,183,10,25,-295,-10,-18,215,-51,-42,-30,44,56,168,155,-20,-131,44,34,-126,166,35,20,-86,50,-51,25,-45,-89,-14,-152,37,129,-5,104,13,31,14,143,20,-17,11,44,-27,57,51,19,-18,-55,40,-97,25,-56,-47,428,34,57,-5,-29,146,52,9,62,-81,-1,19,-56,-72,195,-59,-12,167,19,57,-7,40,-273,129,-66,-178,10,69,52,68,120,-21,30,-11,177,99,-94,-17,2,-18,-85,2,19,-97,273,154,28,161,63,1,-38,111,120,-47,177,3,52,178,139,-110,-6,258,-83,-140,70,-144,-335,-649,419,-210,-676,265,277,82,299,302,-74,33,-47,-2,337,223,-211,-108,-273,151,184,71,39,93,330,92,-237,-3,-15,-51,-392,55,-73,-412,-429,589,-532,-183,288,-462,175,248,91,-402,110,348,-93,193,-84,123,350,34,-153,-261,-41,-343,19,334,10,-115,184,-96,-2,307,137,-17,181,174,-16,29,-188,111,-65,-87,94,-22,142,-5,17,-75,121,-11,267,156,54,102,-143,1,47,92,-1,178,-62,-48,-50,125,-154,-39,-395,70,-234,146,46,115,-200,212,269,158,13,-90,304,15,-43,109,-34,-90,-4,57,74,252,-277,-243,-251,134,67,241,55,106,66,22,-11,-139,-20,113,-222,59,4,-16,66,70,-26,168,186,27,213,-33,24,-80,-240,-164,-70,61,140,-54,195,-54,-265,150,-14,202,-101,18,25,13,156,-4,38,-42,20,-357,-223,-110,58,-790,-213,472,-211,501,7,-411,-16,89,-64,-793,572,-440,-343,269,390,224,-268,-42,128,534,-112,-294,-519,14,-127,289,-59,-544,-290,121,-116,368,55,526,-55,122,296,-661,117,-551,169,54,144,5,-402,-365,99,-389,-224,-472,-407,896,59,-8,129,62,-506,641,186,143,130,46,-59,-142,311,-3,128,162,-331,21,105,195,-204,-154,411,248,-71,208,150,-51,-229,33,-16,249,12,21,72,34,-3,-63,127,63,18,-11,-40,120,3,13,-99,-213,-26,356,96,132,-30,164,10,60,71,281,-401,-34,83,-115,41,135,238,69,105,-7,95,47,-65,99,-44,80,3,64,65,24,53,239,-60,77,17,37,-148,-61,-82,300,-117,-370,-47,-100,23,-642,196,255,184,-189,-309,188,-81,-277,-9,-67,-146,74,-282,-383,479,130,140,343,211,25,-106,108,-78,110,267,70,174,-28,-41,-323,86,71,24,252,75,143,-39,-134,95,190,-14,111,62,-100,-95,22,-141,152,126,136,-185,199,-67,-84,-268,-95,-280,-662,253,99,401,-177,-214,404,-563,-21,293,295,-146,166,-61,-595,275,-39,66,283,-45,-182,268,345,-19,-40,-55,179,80,-69,-86,92,-8,32,-204,-30,-253,211,-70,-235,178,-154,-322,202,274,-57,-282,181,145,243,-2,243,-48,51,-186,170,-154,37,187,155,193,-153,95,9,179,123,11,-45,67,80,-27,58,5,-16,148,16,30,-122,-45,13,239,39,143,-94,-210,-159,102,40,217,-93,-17,108,153,68,208,12,16,131,85,10,11,187,-18,-140,40,355,-198,138,-3,162,184,-56,252,-87,9,211,110,-10,59,72,-189,-460,335,36,79,-353,331,509,75,197,-99,277,4,226,-30,67,9,225,-220,-451,-888,-602,111,-1084,16,1062,-694,874,-663,-357,-1445,1054,-889,-1790,1502,-2304,1284,-554,106,-696,-24,1320,-136,960,-660,674,-164,-809,370,-264,1311,-8,417,29,217,883,-243,382,204,-255,-785,608,-45,332,172,-406,750,-9,-617,248,244,134,282,304,201,-475,-278,249,144,416,-57,453,-252,79,-62,125,-30,337,70,157,106,-166,466,186,175,292,-1220,186,287,410,77,66,-4,250,210,-513,232,-581,262,476,289,170,620,-178,338,219,179,-543,183,53,-178,30,736,-278,93,-692,-245,456,-331,296,136,466,359,100,67,359,-317,-116,-512,667,62,-32,316,265,-187,383,194,176,223,610,-91,148,235,504,284,-1535,-383,-1363,793,-554,-189,471,390,-445,-429,-345,64,497,-832,123,617,564,-125,189,441,-794,585,-500,476,149,430,882,-1,-246,-196,-159,-471,61,-22,-1,56,-427,219,-1102,475,-701,60,467,1226,748,22,-602,-517,634,-136,253,227,-93,-216,227,-200,1,408,181,273,61,384,39,43,124,173,104,-698,121,-67,219,325,169,202,-94,-114,84,-156,136,312,28,1,77,-443,255,-432,744,405,-461,-50,212,-169,-249,455,736,259,-94,269,48,-916,189,-676,786,526,-130,386,112,222,-7,-76,183,187,-91,-161,-146,-145,-858,-96,265,-1130,131,945,-519,-924,-506,458,-874,1183,-89,716,-258,337,175,132,-986,110,547,-139,-535,-54,467,-9,-159,481,544,648,-23,80,346,203,-44,393,-409,510,40,-313,-247,288,-409,422,221,-148,-115,122,-223,-180,-605,-111,248,269,-844,-45,-842,245,705,-198,-219,37,624,-182,550,46,116,-125,105,-111,65,-347,560,100,16,8,351,89,327,-225,-125,433,-271,173,321,17,215,-43,425,128,-56,14,407,155,76,-218,224,141,0,65,-255,-292,-293,412,277,239,425,29,-406,140,65,-191,3,221,53,233,-162,68,-189,-63,132,129,16,-325,-352,175,377,550,114,43,-238,362,422,-31,63,-18,117,54,-133,-131,-288,-26,-107,279,26,-448,-813,45,342,341,35,-298,-1048,-59,-132,222,-756,476,229,330,-181,-277,-125,286,663,231,371,282,-49,229,-317,383,119,88,422,189,132,162,413,504,38,-54,-274,-581,108,411,-9,281,21,412,224,-469,-182,128,-756,849,-587,-670,279,-678,307,1163,178,-588,428,-575,-406,885,-1021,-193,-422,852,474,297,656,-187,-6,-120,-250,383,-521,-1218,-27,-416,25,571,153,-969,235,-946,-407,-476,-1003,161,-819,-54,-347,1070,1125,247,297,-1494,446,-288,399,761,-830,-1137,43,864,-9,-1059,-394,-343,-866,1107,528,103,-531,573,-496,-496,-1244,-151,1164,-372,-687,-623,998,1217,412,705,-141,688,-513,782,-30,556,628,-410,-455,-69,745,-820,-784,84,-495,-826,-144,690,-792,26,757,-505,-706,-875,418,-1244,-38,1125,-1476,523,34,1078,-1660,-375,-1210,361,-892,-69,1079,-350,773,-1503,-156,-90,480,-624,402,807,977,-82,-228,838,-818,102,265,-223,-824,-1056,-1343,50,689,-1141,330,639,-41,418,976,-216,-891,26,-352,185,483,184,618,37,-631,-280,-59,102,520,-247,890,473,435,-539,-172,-590,1244,300,565,-19,-94,856,151,-265,-104,-363,885,-185,631,267,-78,-379,79,-642,-850,-26,91,557,-1314,-303,-339,-175,13,-423,-212,592,155,657,365,-1704,233,-493,-178,173,-232,-517,-349,-456,-114,11,546,-807,-461,627,860,-15,-222,-1066,-269,-366,-9,616,-808,861,213,-99,-138,631,303,576,-628,-506,835,-327,-284,-943,-519,419,291,195,-622,1943,521,-252,395,-395,-63,1,-293,406,287,-190,-421,-214,1279,36,-117,-491,-596,-115,332,-181,354,307,-214,-962,-264,-450,-21,391,-669,60,-378,-348,634,-16,-180,126,-416,722,174,229,472,150,192,57,-366,-273,753,628,-59,-64,561,292,-599,435,630,1080,-554,-259,629,-551,-269,-198,480,225,235,-580,-214,-713,22,257,-497,209,-38,-236,241,607,34,-368,148,-516,-411,214,668,156,788,-145,61,437,-422,363,114,-213,-164,560,296,525,-78,-108,-315,213,-18,-204,-279,613,-60,27,2,-15,-243,33,-66,-596,188,848,221,-37,-281,-209,-112,672,80,-205,350,106,-117,176,37,396,615,-76,113,-428,-171,807,868,158,-199,402,264,25,-6,-602,433,135,599,277,264,436,-233,-103,-500,427,-363,-486,615,71,-73,561,87,-1,-282,-122,12,181,465,633,-8,354,313,-9,-889,-113,60,255,-126,-90,686,20,-89,-840,-60,-175,315,-319,-409,68,-235,411,-393,-388,-396,-45,577,-52,573,-789,280,274,801,209,113,-40,48,-333,-268,52,439,-418,142,306,-646,-15,-79,-533,-668,5,170,-540,83,297,26,299,-634,483,-106,601,186,203,263,-129,-465,413,-121,-483,-340,-537,107,346,-879,-668,165,389,167,609,648,427,150,349,24,-287,832,-118,812,29,33,9,470,-227,159,-55,-34,102,-38,-98,111,-362,97,-224,538,174,335,315,507,-35,195,174,208,-608,469,61,250,62,-20,-178,-693,-426,-205,47,820,80,275,85,21,-4,-231,578,819,55,175,235,52,-254,434,-285,-833,491,713,-56,-86,440,80,426,-171,-679,467,129,-394,-325,-171,1246,-129,-23,105,-233,373,661,-159,-797,274,666,-643,-163,627,-341,-111,-522,356,109,520,210,51,-162,-144,151,-82,94,-384,99,-676,513,13,163,-386,700,-710,-721,4,-526,-243,-876,417,625,144,-206,655,175,-816,-307,538,858,477,7,-26,96,104,102,285,697,-92,-22,315,89,-9,-205,429,173,-324,-489,-84,242,124,916,-16,-41,187,319,613,257,247,587,15,-374,-129,-622,542,99,124,-250,281,506,406,512,118,43,519,-1103,289,133,19,-1457,-228,-425,708,-170,-1724,-511,470,93,-637,1354,-1141,-1091,-1338,416,-476,1330,234,97,1120,15,1169,61,624,-101,224,-765,515,-466,142,-541,-69,561,-1446,-120,43,-1235,577,420,996,460,212,-210,25,-205,1192,-92,60,233,45,365,-272,132,-680,68,-36,573,-522,720,385,-56,77,414,-665,6,34,322,95,54,-760,396,300,8,476,-378,-1253,358,-142,620,1337,796,60,-30,-93,-66,-356,-1212,345,344,-29,181,81,80,272,-401,444,555,158,639,-145,467,-410,-178,932,-342,403,764,-237,-1933,-230,449,421,709,-36,-704,-695,-438,-100,835,596,-936,9,-808,-163,-48,1162,-362,866,306,671,113,-301,-1542,760,-98,222,-76,-418,636,238,275,-668,633,-126,31,760,225,122,15,-229,-1115,-621,-655,124,-1429,790,-1112,-150,646,-1381,359,-1906,-113,532,-858,1132,311,-823,635,-163,158,982,280,-908,-276,-1268,-2,378,345,-2549,-2799,102,-763,4994,-1982,822,308,51,-1381,-8,-1099,1137,1008,1279,521,-15,312,-6,621,715,-290,-452,189,499,-32,1988,774,309,57,226,50,-174,-723,96,-476,1198,-231,102,-82,410,409,147,-398,513,78,351,-180,125,-670,733,-521,-9,-216,482,813,138,506,187,355,-465,381,542,-419,31,391,-80,-125,201,51,57,451,-54,291,-292,256,120,136,177,-88,76,-301,-1113,1022,-383,705,192,531,-170,720,29,-45,-255,-23,-783,-338,-262,869,-165,229,88,359,-668,-478,445,516,83,281,164,19,338,258,502,-50,-118,532,403,285,-400,-210,-257,244,276,164,288,248,-255,453,-320,693,-74,-2120,1251,-401,422,-223,394,761,-16,-589,509,652,1099,483,285,-972,302,301,-1283,403,-1161,-193,1349,-166,-49,-1268,46,-520,-735,356,-1420,440,1509,373,538,498,-208,483,152,-58,254,-120,77,256,-203,-1196,-308,121,-1134,870,794,216,290,182,-4,-302,-144,-512,-119,487,543,60,-355,618,52,-93,-669,223,-52,-1320,822,448,196,274,567,209,-379,-756,427,-962,-1077,-872,1262,467,-285,164,-1247,128,-62,449,-232,534,-740,646,881,-744,-195,80,-651,917,-184,-916,801,1,-8,-1043,-354],"volume":[62822800,62935600,96033000,77094100,88886600,104673400,90673900,100661000,75209000,126849300,84388200,145680000,204939600,171098700,154218700,140816500,161632700,221439800,212099600,136827100,110727700,93581600,151652500,213618600,94354400,118956000,94102900,93050800,93938500,83861400,82691700,65752600,80416500,72055000,95814400,86591000,97961300,66222400,77290100,76368500,65735500,54470900,68136300,58712400,98002800,102578900,67510300,64068300,60150500,74950600,75643500,77829400,86337100,71902800,59182600,62995700,76294800,78067900,57993300,49437300,59947400,83728600,56220300,54097100,77211500,68314300,54227300,44280600,59376000,69004800,72254200,127388000,98251700,69543700,74748700,110477200,77205200,67361000,112608000,130082100,84180200,110897000,74169700,141136500,128560200,274356800,288200400,136041600,113016100,85462400,102844300,147386100,120969600,153072100,159000300,189289800,190631100,113038000,155643000,140203200,110671600,128535300,104242700,97249300,98928400,112849900,88436600,133030100,101949200,76892300,74346800,68085000,76332600,78399700,77111900,75921400,95488100,94493400,92397600,114145900,88740300,71350000,136384200,101313200,158695000,78565300,88591900,72448400,78264600,47851200,60927500,93310500,87687100,95992500,98831900,81800800,89061200,83577000,82890300,81056100,64850900,67655600,51988200,85669500,98958100,68706800,60856600,43820600,39150200,71339200,26927600,86694500,92219700,66000200,46387300,55472900,56927100,61835400,82969500,65806700,69612200,79095800,87247900,91199000,109568800,49373200,72066900,83523100,41816800,64041100,51195200,66879800,61476400,66995700,64523400,91405800,67108200,66885800,76372600,84475000,82272000,88315900,85040000,79495900,43859800,104922900,81679200,122458600,77675400,71359900,99301300,81831200,75693300,83223900,46880000,88571700,71122900,68464000,104654000,72399400,105739800,80861400,85885400,47406900,51413900,60498300,57483400,61220000,46668700,60555600,48137500,126225800,84201000,77937100,39623500,66828700,83553700,85163600,99164300,56723400,101097000,77836200,71488300,54506100,69918900,76818300,53444200,23640300,89269100,118862100,81758800,56844600,38014200,39312000,59067300,48066900,51679800,44696200,53110200,69884800,76951900,65519400,36844200,48159600,35775400,35766500,21664800,29263700,24160500,24132700,27553300,38540100,90994300,43851500,43787400,46139600,72261700,55551800,56663800,51979300,47364500,43867400,65805600,67767200,92357800,59673300,64103300,55305100,60547700,53656100,123359900,70571300,76952900,48661000,45341900,47647800,45627100,38099900,62540800,70194700,47853500,48506100,39723800,53061700,38361900,44334300,92598100,97842900,98716100,54094600,51402800,91993900,61552900,64146600,62328400,98470000,62399100,84764200,102894400,81679400,73565800,101276500,176507700,94434500,94887200,57423000,36162100,60365100,69502400,74131100,37824000,47994800,44935900,50004300,68031800,48659100,55349400,49532100,60697000,42782200,42451700,50422800,49979800,53544100,68530000,69065000,38608400,67397500,43666800,25376800,49400000,56465500,48100000,44831200,48149400,38100000,53097200,72200000,72507000,40022000,38053600,61900000,66100000,63506600,73115300,63136000,42351100,35015800,44703300,43700000,39314800,41369000,40564100,30127200,47590100,51795000,50198100,57773700,50175600,46311100,46426400,45307500,53740600,37736800,40565300,59022400,66316200,70337000,37402900,55892800,36833300,80743300,56298300,49968900,47028800,65407300,50347200,53203900,43128800,49282700,54799800,69519500,52080800,84000700,82378100,98774200,68281500,59512200,73904600,57085500,70148800,43620400,48916100,40918900,83969500,61031900,82860500,85421100,90853300,103612300,132830000,214111800,204804500,193707100,205917900,143825300,90483300,73554300,89219200,84416600,130019400,96674600,77107700,75688400,80197700,93623700,91573300,45985800,61617900,60900400,57158400,58185700,52992200,48952200,61422800,63663500,65973000,59020000,90757300,83536100,91902100,73042900,66570100,79938000,151885500,85940600,96261400,81148600,76757100,116900200,104870100,99149500,137013700,108825700,71939200,72525200,48230200,66449100,85627600,63443700,65643600,65161300,91434600,67639400,80378300,60455800,61449500,65299200,98193800,104455500,42950000,60520200,99933000,65003800,78994200,61527800,65559000,62906900,69539000,66052400,54471000,44617600,52203900,68342800,101706900,60417000,52283700,51940100,48437300,25448100,46710700,52056700,66918600,45362200,36938900,40492200,38670000,44576200,51692600,55757900,55411700,68557700,63682800,58732900,60978900,46733900,81758800,78552300,40334100,26594600,21443500,38180100,28077900,21832400,39514100,29403400,41260600,46325200,39195500,35949900,37144100,26188300,35980400,41790800,48692700,47774500,41041700,40958300,38440200,61591800,37852700,45532300,42797800,51449600,46146700,46373600,36453800,28541300,37935700,41171100,46856400,58090500,36810200,51648200,105709100,83642300,76112300,38141300,43174700,54250000,41364900,42678500,43717500,59784400,67558900,33358200,45788800,54638600,42741800,43711100,43117200,32687300,61559100,59926900,65531200,53023100,60966200,47290600,39648100,56953900,45541700,40855300,37278200,44421900,53975300,39480900,40031600,45539900,54088100,42979900,36908200,69254200,62950000,57407400,55227500,57588000,47362400,42536100,81110900,59906900,70514400,49661500,57526900,41799500,46003800,37787700,37643800,38299300,51297600,107554000,50267800,72659700,85715300,49448900,47099900,46360000,66908600,52825900,62253900,79496500,61473000,62954800,56951100,83131200,32078900,44216700,56431800,55260100,71430800,74119500,47916900,58781800,38414800,39730800,51008900,48802600,50840100,65170600,41536100,32191200,36476500,51389700,42492700,29504200,33136400,30611100,35705800,49793400,44761300,33425600,15895100,37016200,40684100,35628300,47365700,43432000,57680400,32357200,27621400,42467800,44489700,53017800,40573100,48657800,57269700,46264400,41928200,42621000,37821300,34588300,30920200,40534900,42117400,23523600,28223300,20723500,20726200,20312000,19890300,24218700,29100400,35699900,22584800,26924000,41391000,44555700,28800400,38384800,20671400,27337900,26672400,24425400,42128000,32017200,26129300,43100000,32958600,25490000,29810100,42203400,45417800,38880300,31798400,27169800,36484600,42520200,23678500,32341600,41299600,32770400,25339500,30112600,37715300,33254300,38236000,26128600,25207900,30911500,67974000,45134300,30469400,24891200,22220100,33960600,33439400,61707600,75362600,38621500,52591200,39872400,52688700,54213100,38524500,26945000,44083000,28094700,29608400,70737800,58585800,51542100,32663700,43288300,82655300,55124200,70873100,55306400,52012700,19611700,16462900,26430900,25828600,37295800,41136100,33497400,28240000,49584500,54076200,47512300,30089400,33219600,40750800,45917700,45467700,39630300,42302900,55596000,34832500,40754300,51152900,11418300,21751300,52933200,33082100,57544000,70695900,47366500,33972500,26766200,28734900,25600300,37528000,21158600,36768500,31675300,33822300,32024200,31992000,32123100,31975700,42596300,39240100,32926100,35554700,34445000,34870500,53120800,48483700,35120300,43593200,46017900,39837200,17650400,22057900,23494700,24478800,25333600,23436500,38200300,45855600,21968000,40927600,42088800,36339500,28557300,31617200,19380500,35581900,29071100,21775900,26159900,23187900,27575400,34297300,31530800,30752600,36163000,33125100,28035400,30050800,28837200,24909800,19725200,22539500,23662800,28112800,29431900,35131200,32287400,55610800,17891600,30931400,55271300,37233600,32783700,48795800,27682600,60204800,56798200,43062800,34412100,53078300,44500700,26437100,24079800,31664000,30135800,28537200,31744200,34061700,19244300,25838100,24252100,29337200,20663700,29730100,36009800,27214400,27253400,31114500,25132400,25900000,59843200,48222100,26430300,27057100,32090300,32390500,38347600,47613100,35251900,48654200,62524100,31969800,25390000,40278900,42081900,28221500,27690700,32441900,24853100,43145100,60908400,51558900,41492300,28897400,23742300,23545000,28301100,24942800,23067900,18847500,28795900,20558500,26108600,25598900,47768900,31412600,19783600,31747100,24631500,36278800,37732400,21135900,24739500,24426900,23162200,20885600,20958400,24104600,25007600,16880000,18105300,15462800,23675400,20281200,19994000,18558500,20515900,23917000,29921000,39406600,23825000,29586900,18842800,30705100,17269500,20697300,27525500,40068900,20490400,27287900,26228500,27241500,27142900,17809700,27715100,25161900,27619400,28132900,18332700,16932500,25704300,27174300,31714700,26435700,26328900,30319400,21871300,22746400,22421700,25151600,28031900,33129700,25503800,42998200,22852700,20227100,43660700,64526700,48062700,25214100,31471900,38684000,46735900,32193500,39628200,31176900,43944800,38021300,23155100,35824500,28618400,36878100,33535500,31309900,30867800,16834000,27975600,25576800,52173200,31470500,24822900,20108500,31345900,31101200,20511300,31679600,25545300,32177400,28125000,25361300,21695100,26621000,21638100,16708900,26354600,37147000,37193200,39829300,36842900,22590000,26965900,36830600,33662600,34072000,24902500,24454900,68387200,44964100,40475400,28181800,13852500,15241100,15827400,18983700,24890500,29177500,35723700,32073100,25860600,27197400,23674700,38008900,48842300,37178900,39835600,31630100,36895800,26412700,29376900,35011900,63974600,63519300,44378800,51939300,65833600,45187000,65596900,37675500,41721800,32308600,38359400,30205400,38635500,32507200,40454500,33212400,29546600,41749900,41814800,31192200,31500400,26771700,42953700,28742400,48609800,38885700,33189000,27203300,24063900,31167800,18131700,27484300,27977200,48542000,38732300,28467200,31250200,40869400,31634500,62754000,77735300,41723300,40930400,64784500,39895100,33924300,38683800,34631600,30319100,131213200,83995800,51495700,45685200,73659600,93657400,46500700,84631500,46970900,53719500,25947900,38593400,34376700,48926300,44334000,58623800,36742700,38689400,37127200,40074200,27924400,33698500,67489100,46556900,35081500,38951100,30311900,26483600,59680300,66804100,32017000,33716000,36837700,30617100,22687300,29725200,30468100,33036100,29906400,30409900,21774500,20118300,35583100,22680600,23399500,20626000,22878200,35275900,39447100,25212300,19977900,34514000,38422200,25897500,20837900,31945800,32818600,22563900,22877800,19751900,31862500,18777300,15291700,23266400,40612400,29919000,44245300,19566300,19579000,39467500,22052600,43111500,36682200,29750700,25770400,28947500,24707200,29898900,25603400,27022200,35348500,50047900,60708000,33230500,50331100,34431900,33274700,40236900,28277500,28152300,27996500,25006600,55205500,38938300,21363400,23435600,19339500,24692000,24124700,20100400,15589100,23563900,17906300,18326800,25950700,24663500,30798200,25571300,36449200,31080100,28691900,30444400,32972200,38166900,37196500,30196700,46918000,48658000,33989600,35959000,68642500,56106200,33342700,41834300,58164900,54501300,41627800,36038700,45154000,64931600,62497100,77579400,80835900,71814500,108847800,93165800,69546700,41479300,53609800,39178000,48123800,43157600,29545700,34495100,40552800,35935800,54254100,33481000,22773300,25818600,24671900,20931700,20360000,15454000,22050300,28027800,19251300,23361600,26336800,23760200,22874000,34049100,17928300,17526000,18973800,17360400,35969500,26031300,32974300,31008800,25622200,32685800,46035100,39330100,47576000,46889400,52968400,65348600,79715300,49840900,51419900,33869200,30156900,14291300,13924300,17073800,18604000,24367100,31314600,36521300,66205500,37577400,40212600,41410100,34129800,56162300,51354200,51005400,35362200,30964100,40128800,40887200,34783000,19960900,45253200,43591700,46539700,42927600,43624700,30750400,34073200,23605500,34169300,22604700,23686500,20303600,22520300,29030200,17675300,15149600,19828100,28336700,17868000,19745000,19472300,22255500,27757600,22988600,20788900,21007400,15381000,30990400,26237100,34234500,25459700,21473200,42021100,25674100,19603800,40622200,31314000,31761400,17268500,22445300,41581400,47846300,33878400,30570200,30488100,32970500,19164200,24451100,19379400,25866900,23114700,17164300,17783500,23755700,21128600,16195300,46514000,28945900,22759800,21429200,29473200,32508100,31121300,36849200,34043900,44080500,32874300,23507300,47843300,42687200,29335800,33023300,19679300,33665000,20738400,23904200,23937400,17631100,14212900,21131900,16771800,13543800,25488400,30572700,17302400,30383000,24570200,19449600,20507200,31374600,22641700,24549200,27554600,30297900,17593500,27201800,31238800,16456900,23296700,43032400,27877600,19120900,18127900,15815900,18326700,32311700,50874900,34809900,21293000,20499400,24311000,44230800,39691500,28381000,26415800,25780700,21977200,28631500,29838900,35926800,26539000,35468900,35575000,25698300,30844700,35994800,33553500,26714100,25438100,22081700,25001800,22132300,28989900,42125400,30006800,21500800,36123300,41889000,22510500,17924900,21224900,13984400,42511400,57747300,97763400,150829900,75088300,104103800,69377700,49919600,39549400,73155500,43963600,45131800,49379600,37343500,47146700,47686700,29106100,19718800,30020200,31329100,56139800,48384000,35772600,47359700,21775100,38284300,44700000,44077500,49315500,41411400,39339100,59370900,32853500,33051500,37389300,50188900,23916200,16162000,26999600,30902600,38393800,27091100,23776300,23404700,30195200,42778700,53170900,25918000,31390500,42221900,24913300,27199200,22176900,20418400,28633000,25004100,29924900,33479800,35452100,22748800,31196900,52836000,33980600,30579500,32966500,26188100,22727600,20696200,26374400,14159900,8828000,25041600,28639400,22395500,42754300,40037300,25892100,30792600,48509200,30154600,56022200,53098500,48428000,44944100,45668800,53746100,26432800,26540300,25656900,11468600,19183600,27725700,19520100,29886800,50807600,38795200,41891100,61386300,69344000,50024100,46734200,69870700,78445700,91443900,56563800,86675000,61660100,42229800,38881500,36143900,54524700,47641500,54245100,32750300,44928100,61572900,49321600,70749900,91673100,73778400,59421700,76839200,49186500,40565900,41766500,38991500,28257900,23979100,29869700,40739100,29389300,30925000,27553900,37699800,29209800,25474600,31655400,25861200,28898500,31047400,44236100,31454000,25374900,26524600,31693100,29623700,37682300,17288600,18840300,20912900,19017300,13892300,29963900,23807200,21447200,26389000,17163000,20107900,25056000,28567200,22898000,25772100,28564100,25356700,17199700,21353300,17126100,42481400,18078300,20216000,39074000,14351900,19118300,33059800,29818200,67502800,24813800,38569400,27474500,20788100,30758500,19289600,21178900,20966300,29196300,21059300,18311900,29932700,27524400,27334600,29549600,15729800,29931300,37951700,21885900,19870000,24366100,19571500,15696600,20269900,12502400,12184300,14568700,17571600,32965000,25154700,24588500,24605700,32079900,29208800,20562800,22804100,22724200,18714200,68012700,48222600,28260600,31356700,36300800,19902800,21167900,24579300,19161700,29457900,20218500,21906100,21107800,20871000,17999300,20713900,18936700,24997900,18885400,20003400,12968100,21223800,27646100,16939700,22385300,13990100,21278400,15011300,12835300,23196600,12358200,13276500,14688400,12969800,19379000,11777800,14161400,15980300,10036300,18743000,14500600,11997900,17728700,24266300,23896000,11184900,19843300,16169800,20944700,18088200,18525200,17546900,20125300,50813300,39646000,45863900,28221800,38521400,27596500,16222900,18078600,31546800,22614400,22213400,16403900,20238400,14794300,27207500,25543200,19216400,21239700,14481300,11987100,19984200,19687300,27774400,14267800,22821000,21313300,14182700,19276700,13702900,18132200,15707800,19143000,20341800,20463700,19099800,35369300,18749400,23498700,26960100,36205200,26997500,26591200,20777900,70234400,72825400,41115200,35906000,31796600,16538100,20598600,16428700,20268500,18850600,22926000,7162800,13479000,18553000,30405300,39796600,32876800,21419700,27293300,26622400,18578400,21863100,23259300,54477900,28746000,22762300,26283900,21138700,11461800,7079300,16645000,9007500,16110600,17975200,13267500,41749000,22307600,19749100,20644300,24074300,18909200,16176600,20686000,19622500,16930800,14538500,12499700,12710700,22091000,17434200,17640900,15036200,16052200,15053000,25006700,19091100,22861900,15101400,16957200,11630100,17541100,12569100,17542700,13915700,19120200,16333500,17891400,15098300,15563700,18479600,12110900,17489000,18624500,12008700,16598600,25813800,19951400,13722700,12026200,15500900,15776000,20855300,21922600,10731600,14019700,22709100,18457300,21234500,10105200,35841900,29177900,20311700,22967600,18472400,23721900,13710000,16092400,19841400,23700300,13400000,32011200,18832200,16743100,15619300,33778400,15955200,23683000,13325500,12841100,17764800,21977900,22454900,22469900,19384400,25398500,16136500,22771900,24815500,18345100,23827600,14630100,19330700,13279900,28426100,20499400,27232100,19738600,20481300,21786000,55642200,41319900,36730100,19509700,19687500,15891900,23928600,13851600,20306400,33229400,20120700,37222900,15727500,22393000,18842400,25417400,109783700,104454000,51193000,60093800,55145200,48087400,39626500,40935100,35743400,24099100,21654300,34411100,65957800,57427200,88769400,68898300,32797000,42116600,48430500,36970400,24853500,31517700,36045800,31073600,34544800,25343200,25748500,33752300,36139400,39697100,26712700,28120900,18610600,80665900,38013200,33848600,20149400,41769700,27112800,29472900,17933900,30810400,36169500,63331700,45862500,34161000,25509200,31913000,70191000,60751900,37111500,36294200,25702300,38160800,26380400,15362100,24498300,33642700,38480700,22293600,44794300,30722700,22721100,27890100,27126300,30256700,28450900,35296400,46422400,24858200,20871200,34236200,28841800,21702400,54947700,29628800,33249400,24149400,43102400,27351300,19715200,26381100,31562400,23561100,13704800,19223100,12439100,14513500,18409900,21809400,13138200,17218200,27680300,30173300,29297100,20289500,36179100,28230200,60165100,31733400,26319300,29481600,31017400,26199200,28693900,21333100,17373500,40594500,20150800,12522400,25173800,24808000,34790600,28725800,21143900,20147800,17299000,8280600,22653400,25227300,71986300,56595500,59015800,51319100,40604200,28647800,32666200,28081700,20821500,20310300,24418500,24594700,49816200,26844500,31415000,38972600,18638700,23330400,21918700,22388200,25393800,33186000,32573300,29383600,24776100,26992300,23159100,24782400,34004000,20473500,37762700,41231800,33849900,26432200,38937600,26081400,37989700,54287400,28925000,32038200,37277800,44987700,42449200,38037900,68478100,105372200,118537900,91028300,94184800,113836600,63050600,31785600,52107400,51633900,62256300,36785600,41161800,37074400,50096900,39266700,42209900,42936300,76809900,57445100,38540200,29480900,34609400,25828400,38310500,37635000,55638900,40536400,28810400,31176700,71395100,34075700,43863500,66607300,80110400,57481500,78889100,89369700,68692600,85549400,64090000,65768700,43054900,59870900,41810400,48296800,41622100,30467900,44604900,28180800,35536100,29573900,34705700,49197100,33040600,70256800,52089300,43005500,51043400,35615300,36513500,38646800,60337100,41543200,32500200,26040200,29122700,27067600,24688800,21821700,49361600,22941200,27480200,26217900,22954600,19477700,26557800,27696500,27460500,41220500,22665800,35670900,45543300,20459600,24779300,25036600,39600300,31780300,22319700,22511800,37858600,35916000,49615700,31633200,38236000,33038000,43469400,30073200,77799700,39008100,52843500,46407700,36408500,31770000,25512700,31626200,37005600,27362100,23902500,30280600,27930100,28049800,21405300,31034100,23220800,31094100,35897300,22184700,36900300,35026600,40873500,59456100,60193000,47285100,37101900,47178200,28934400,24808800,29895700,22680700,18852900,33818500,26089200,20913000,58528000,27711800,36092600,24939000,26258700,18042400,25776200,23136100,29343600,20277000,29175600,29315500,28653200,29063500,42623300,46091400,46629500,26132000,30116500,36204000,31133200,31224100,33071200,31877300,31843400,33295800,38605400,34945600,25277500,36210600,33113300,28076800,27371300,25618600,29128700,80557300,83325600,66864500,49097900,114471100,143084500,102078400,64885300,71979700,66987600,82486200,82923700,52909300,77567000,102997400,83481100,130970900,111871900,92584000,73828600,52706800,75966800,39573500,34410400,51169600,40296500,50602700,62578400,64128100,75270700,73254300,65390700,67280500,102652800,42965800,23503700,42012600,36608100,70141000,44885700,36722800,50771700,70594700,71715500,80432200,73960800,59058300,53780000,46378500,56547400,74834100,63642100,81856500,99002100,141129400,56163300,98982100,85824300,77856600,53015300,58576700,74820200,74709300,52059300,49388700,46491700,38943400,30176600,30710200,40874200,33812200,39329000,57183200,56711700,38106100,32417800,36515900,33491200,30784200,41346500,37258400,32143700,26718800,28156400,27970000,42036200,29020700,21434100,29722100,26094100,30326800,32521700,19487700,32593000,25207400,27735400,32608800,21939700,25162000,25085500,31431200,38063500,22319900,27194600,39407400,39303200,30518400,33953500,42426100,23751500,38192000,32935100,36893300,50105000,42428500,70794500,46336500,33248100,37096700,30368200,35205500,30969500,22645200,31633500,28530800,25674700,22697500,25631900,24563000,20654100,24989100,21073000,27195700,29651600,28580900,17936000,33665600,24977100,29517500,26359500,21716200,31495300,34797100,44110100,30386200,38371800,58818100,37165300,55351700,58526400,67185800,43360600,40944500,39281200,44702300,38608300,31613800,24332600,45351300,25903300,24763800,42178800,30354800,45446200,75842300,47797800,34412700,29913200,45888300,41385300,41260300,27758100,23715800,22844100,20379500,48177300,31672900,40922000,39980400,19375200,33921100,22595700,19709200,21179200,31025600,18035800,15792100,21415600,17598800,19193500,28374500,23736100,20211900,15606100,20190900,16765100,28877000,29387900,18954900,23786700,20422900,23434700,20431200,20451700,18705000,41627500,63251600,55214000,75040000,41897200,49990600,38418100,33608900,24642900,40241900,51000500,36685000,32781400,22494100,19902900,20418500,24243700,55372400,27598900,28012800,21792400,25358900,26319800,27964200,21592100,33932600,19487800,24407600,23744700,25063600,28689900,27669800,20319000,20953400,29781300,26039400,29086100,22485900,40820700,34704900,26826000,40773500,26307700,32367600,48544300,39392500,31887600,21216000,32379300,20147400,25177700,40976700,14975000,23234200,20457100,19045200,27700800,15801200,22392300,14828400,18998500,21507100,18818700,18569700,21764300,26801800,22131900,19015900,15048900,19725500,17832400,15258800,10147600,14778300,15774600,16945400,18427900,18365900,16923300,36629000,17883600,17189600,17752800,14780600,16963100,9854600,28007000,31104100,15300100,14962300,16555300,13984100,21799800,18780800,32612000,32519400,21296600,15996100,15443300,17865900,27672600,23774700,7089000,17067500,18134100,21815500,18170900,30969400,27518900,21655300,22139300,26397300,23547000,21898500,22756900,24418100,25742100,18805000,24325200,21146300,20736400,26496100,37436500,42264400,26731900,28924500,39568100,52015800,25408600,30691200,38534800,22467100,25884900,21478900,30198000,24471300,22773200,23438500,24394500,22230500,42604000,66017200,84522600,97743000,79537700,121822600,148173700,112933900,131953500,73086200,78705500,89828400,116424000,100599200,89168800,137820700,134882000,92054400,121257100,114156300,120896500,118983900,124639800,94881800,88754900,79887600,58845000,49356900,62659300,53715400,56465300,47487600,64763500,69904500,45940400,68252600,42853900,63959600,47036000,64657400,62863200,38249100,72932800,40089100,43278500,34231900,36451700,46862800,48716400,43359500,48795000,32841000,37783100,36455200,38624800,31852300,35714100,41054100,65521200,51549300,55747200,42398100,36237300,37417000,43642900,28762400,33055300,55665600,42784300,50691800,25776000,33383400,37228700,38716100,47365600,32937300,35046300,58084400,72919400,72034800,45307400,48890100,34749300,30578600,49422100,24068700,32767400,46032400,36940800,52824600,34377800,38909200,34689200,31956500,34589000,36578200,30426300,40312900,32885300,64108100,72230500,54523900,47594100,35137900,40610100,43243800,29865500,51363500,54054500,36445700,31302400,27556900,41774500,53686300,32081600,24911300,21612100,28048200,44969400,35088400,43104300,38773400,31895700,30799500,24803000,23529500,31999400,27723400,34748900,36418500,34866600,42216700,49482700,28021000,36321000,36216200,50836800,110083300,123959000,99568600,64837900,69667500,71809000,38525200,41849900,42321000,81570800,86251100,57168600,41128900,48837300,70631700,55242400,58438300,27050000,49380800,50020200,75497400,28184600,49704200,27539700,25443300,30201100,79370700,64240000,36949100,42514200,40570700,36756800,32195400,29306100,32196200,24658500,38421100,30559100,53413500,43246300,65838300,39987400,43604100,75728200,52054200,40959800,86537100,69024900,36102900,34414600,24806900,30168400,21843500,28069600,22718400,25907300,26875600,24516800,23326800,17163100,27836200,27521300,23620000,22828700,19332100,20851000,18341500,48839300,27519500,26760400,28804800,25709000,25461900,23730500,41173400,37095500,26176300,21201300,16785000,22497700,25871900,18138100,21611400,45305900,29323400,52809600,30394800,33955800,32746400,29266800,22898400,23500100,35118700,24537000,30728100,25130600,21609400,39080600,25498100,55264000,42836300,55259000,35646000,33930800,24824500,22350900,22732000,20462800,17597500,28068700,22046100,20346800,27080800,31360300,32236200,39157700,47256900,97241900,58206300,110182600,104739800,49164500,48370000,86301100,139131600,121523700,88409800,80391100,76798100,53484800,69315600,42955700,54925900,78258700,82718100,78446200,56194800,53455400,64803700,78729000,63519600,54608000,44635700,55032500,55685600,42172500,33537200,32046400,29940800,36664900,25833000,30374000,42564300,36342800,40860100,34533100,38081800,36598100,45936100,36381900,30812000,33187200,33615700,37708900,38263400,29729700,65147000,46219300,46814300,53324500,60700500,71963600,91164900,69877800,44370000,39395000,36528500,66319100,46466100,50330400,32475800,31280300,25444900,27931700,29927400,31145400,22047900,37057800,38736500,32611900,27282800,21485300,33702100,21222800,27827700,35963800,55399500,59722700,55414900,32992600,28941600,27188500,32581600,28682800,39130300,29426000,32724000,29290000,32727200,38842400,35265200,50890000,35184500,25717700,39723000,35336400,53391600,47262000,64404600,42183700,30259900,30252200,31960800,28438100,57933100,42066200,25672500,36484600,27334100,35558500,29602200,21443900,33332100,25960200,35130800,34249800,25969200,19336200,34856900,44793900,38541900,48499400,39486000,34034700,21732900,20441900,29133300,27104700,27295700,29628200,28138300,25453400,24605400,23970200,32949200,29399000,40249400,48741800,41826600,34097900,35193100,60912300,76203200,41927500,46972900,44652000,36056800,43338100,97701600,58076600,61384600,56375500,76766000,47232900,56806500,39411200,41822300,34847200,43905100,40120800,43433900,40419900,34513500,29091000,31390300,25469300,36275800,32597800,47191300,45760500,38007000,37310100,30765300,25135300,33748900,40265300,43383800,29256300,50490700,54937400,32243000,34730600,33716900,27872900,28703300,45721500,45191700,61715400,70098700,46954400,51533300,54447100,81332700,77766500,84416600,105349100,67588800,56005300,39204000,49973700,52545800,50166400,75199200,73858000,82591400,80492500,65336800,48899500,37042200,29595500,32820700,33113700,32248500,23850100,34752900,40575900,58027200,75739800,70814300,72652300,91770500,68295700,54576400,77994000,80121200,75450900,81791500,88610700,143388900,198685800,124398400,146559500,95255700,108167900,94326400,74433000,78777100,95384800,86318300,58198100,64720900,55766400,112468500,101569100,80254400,55128800,58947100,61801400,80001500,85967100,86215400,130614100,78842100,77515500,67407000,70609000,71089400,76936300,89933800,116153900,64723400,69362700,66228400,79802600,76471000,105243000,67810000,85446300,73799100,63345900,70615500,53555300,57584200,56833900,68073000,68757700,67011400,54527800,45950200,62738700,90077100,63777400,61956100,66107400,72790200,61367800,73519400,58560600,56515700,65500000,75801000,82562100,101755900,105819600,111204200,99450000,91977900,115511800,78185500,116083400,154607400,139572800,113387300,124124600,140326100,120910900,83684900,59190400,62715300,79477100,79920700,91764200,63648400,73491100,67144500,59462200,66985600,60968300,65341700,59291300,60914700,51785000,44900300,38342100,55900500,85963500,94442000,64697500,86051400,81910300,82703400,51633700,67472900,57457800,58422300,54151500,61609800,57302700,79313600,56675100,61829300,63194700,56620100,59895500,55273900,55797100,73939400,63741800,63818100,59519600,55172600,67769400,55049400,57127700,40582400,50074100,69304400,55139900,57501000,46358800,48676500,53735700,38973700,53894000,43878500,39764200,51459600,45897700,40928400,38266600,41186900,47842200,41937200,51770600,51098900,39497100,38057100,38098300,69047700,48321900,51184500,50044000,57990700,64666800,57005400,49260400,55649800,56125200,45905700,79562200,54907200,65299400,79920400,52613800,51271100,82931000,62757100,74815200,71176700,69780100,79652100,81216000,78482400,61267400,66696900,55766300,53489400,71354700,60393000,66522500,50580200,112894100,77244300,64576500,69781000,53115400,60605500,77897700,63963600,59014500,63492400,57760300,62651300,47742000,45895900,79803100,70038900,78313200,47333800,63213800,64862100,99256700,66961800,55290700,73985400,48859800,55462100,53588600,40083500,41873400,46390000,15498800,38714200,35618900,74718100,51547300,53583200,41482100,53937600,45614300,42594900,47860500,35732500,80667700,64984400,60554100,68300400,44167900,51064200,46394700,60278400,39373600,38009000,47139000,45893600,37858300,42335300,47754900,45396700,54659700,45568700,35247800,44077000,60600000,44802900,36269700,47754500,44150400,60613600,52799900,44875100,50872000,51596300,56441900,49405800,46705100,67562200,83070600,76170800,40802300,67584000,56720900,49137800,50050100,39636700,64079100,43100600,59498600,58230700,46526700,51389200,69294400,74332000,48995000,48243100,58287000,53565900,60511500,56736300,65955800,50876300,71456700,98593600,97123600,73602500,83631500,98198100,89923700,56359500,49757000,75791900,74576000,57195200,50287400,48585900,53274300,58354800,62138100,47126800,45875400,62795700,46916500,45134700,40113600,62813300,54613800,56278300,43007000,46746900,38960100,62462100,59002300,44043100,57121600,55400500,65430400,59712600,41013400,56519400,59882100,50224500,51806100,36465800,31768800,60446600,44278500,48432800,33375600,40019200,47486100,64213500,61554900,43015900,48216700,62891200,66862800,63007000,72652200,65105400,50488600,53372100,47266200,41390400,69225900,47153900,53196900,44606500,57097800,69525600,71138800,80932000,49204700,53378300,47603000,48922900,52685500,49428100,46498000,46151000,58712500,19432900,34460900,49374700,47133700,48498800,38214100,61975400,46960000,55148500,40868900,55262000,54093000,71941700,60499600,40380100,38894400,47075700,63940200,56902900,44019900,41060600,72687100,47666400,61702800,37230400,44726500,51150900,72035300,48707200,42130800,45539900,53190500,62604300,61191400,50696500,44530200,51770600,66842500,69960500,40910000,58492400,41731500,35730700,39801200,32344200,42998700,52060700,35800100,39936600,41391000,46300700,48039400,69811200,36903500,37621700,45514200,69734800,51589700,39168000,53657700,56066000,56453300,64829600,51625100,60478500,54786700,45897400,75049100,45304800,46968800,38215100,49587900,52469900,44201100,50999100,54280500,72274200,72559700,60665200,47082100,71190500,78621400,63476700,55298500,47671900,58992700,58162400,53280500,38848700,50777400,35663400,53859400,58309800,40733500,67792600,54141400,45343500,46571900,44429600,43337000,44121000,15718800,34139700,35491100,38811700,52834400,40490100,51186900,42933000,41994100,49593500,46687500,41198000,39221200,55408100,55447800,62896600,46610000,35711900,54042400,45568900,34314000,22722500,31980500,27029200,42662100,58026900,47002800,39432800,44922800,42473800,39132900,33962800,54536200,39595000,43903000,54386000,59562500,70325100,44880600,33003800,46948000,44367200,37137000,38694700,36739000,64010600,51008600,59602400,39889200,35846100,37712700,29889900,36943900,33203300,64491700,45092700,38796100,53716500,53999500,49779000,53887800,39853900,33043200,33713200,32938800,42495200,43853000,34325700,57917100,46234500,44526700,72096000,45860000,55300900,37928700,52195200,73069800,47323800,43004100,43653500,39345700,28253900,27789200,34142000,41359200,36839600,38729000,44259700,39949800,57267700,54744600,28144900,39443600,61502200,45474600,53665000,63453600,47619000,56880500,46549400,75231000,47807700,44384700,48440300,57392200,41874900,30022200,43665900,52251700,36559000,48515300,30227200,30996100,24896700,24580100,27116600,22994200,34478300,41464700,34780400,35803700,24474200,23167700,25120000,40899200,29669500,26216800,29739200,30536800,55941300,32997500,23767400,33817400,21966800,25829700,20660800,22053300,34532600,25859000,23372600,37054500,24438600,33918700,37456800,37751000,29014700,22737100,26222100,34881600,24898300,26723600,18064900,28495900,22109400,25614500,28046900,49966600,37109400,31151400,25950600,56268800,49347400,42042900,40300000,23282500,58818600,59256800,39992100,28218500,41317200,44552100,56653900,66323200,87483500,63164400,54929200,47890100,33574000,27795000,40084500,34733700,38280600,38383600,23737700,29209300,25658800,37739600,36061500,27452600,27510000,37372400,41081500,33466500,44985200,32505100,34452400,50624400,32981200,29680300,57843000,40067800,29111800,22585600,30084400,39909200,52782500,34577700,24843000,25952600,26549900,32020200,22851100,30281100,42735400,23744000,25337200,30686600,24975100,28272000,24995000,25750400,20644500,26060100,34784500,22996800,27210700,25335000,30336500,26685800,39346600,22024900,38762100,20477800,28014100,29756000,41245200,33655800,23291600,24353600,43082200,32853100,22924500,24167500,25835300,24567400,28679500,51461100,27080800,24523000,29565500,34526700,23826600,26375200,26557100,24957400,15334000,25147200,18597900,26086200,18169600,23762600,20674400,24350000,32168600,23577500,28780400,31979900,28579100,54703200,46441800,60530000,29672800,17558200,19090500,33839600,34584000,29117000,36389800,29059500,36109700,36690300,30777800,40532500,31694200,33737200,34957600,28229000,51837900,23628000,33593000,23096600,19878300,60771700,33194200,26649000,27431300,38755200,40580800,26046800,21134100,19434500,29605500,20852800,19325500,25009400,28714800,17862600,20565000,19666900,26550800,47093800,39268400,48940000,34457600,52448000,47654000,44587200,67875400,46323700,57574300,54714700,76668000,68760800,46971100,46563300,43563000,41744400,39072300,40430300,36780500,42234900,34567200,26035200,34627100,33469800,46363800,53000300,41156200,49894500,70456300,117088400,161557000,101248100,142876900,108384100,52483800,43941200,35404200,48980600,44837000,44149300,52304400,55801100,45956100,38697100,33550800,30613100,46810600,43316500,39218100,28309500,32786300,38006300,39577600,27767400,45090600,53269600,47014500,50153300,48394600,52536200,42517600,71292800,55607200,58368100,47226300,46637200,58513300,67662800,44762800,44070300,41359300,61031200,42467000,33688700,40664800,53701000,34104900,55814400,37622100,42180900,43983500,61643500,50666100,45442000,44804200,43811400,57577100,45548700,56166700,36538300,26443500,45349300,36153300,43045500,34710900,39618600,36453300,43277700,52314700,40423800,50484700,39595200,43270600,40215300,42275500,30630800,31498700,45463300,43433800,64613600,69400800,47669800,48666600,41823700,44463000,35255500,33112900,42143300,41209300,45425000,49480200,29831000,53752600,76781100,46436900,51502100,34044700,34103000,36927100,46787900,56030400,65876800,54230200,47526300,68342500,46371400,44007600,49308000,44745800,50745900,44360300,36942100,69384800,61069300,58196100,57154800,64635500,49850300,70920200,54337400,48332900,46533800,46899600,43765400,46482100,41962100,58209500,50629800,45551000,97614800,65872600,69203200,62805500,70982000,72024900,45761700,44538200,61478800,42844300,47632500,54098600,61195700,67422800,61628600,66305100,37154300,63830800,48688500,72115100,81835400,55919900,44868800,47444400,71333600,80087300,63850400,83327300,73111500,117743200,103344200,60168100,57560900,42393600,23034400,40957600,54541800,47841600,47067800,53614200,43462400,37156000,55031400,58272800,75158700,49538200,55152800,70654300,78875800,60369800,43703100,41120400,18468700,28959800,32458300,31226800,40746500,61859200,46828400,43137500,44880300,50435900,49688700,37388700,44481400,72598700,53934900,61058100,81988900,79837900,42254800,43645800,35983000,38997200,50691700,79944000,65650700,49020300,81234000,81850700,89354500,78019300,56797600,53938900,58575100,81378900,69237500,69013800,64250700,60960800,74127300,63859100,55023700,55710700,96178900,68125200,75264600,97015500,70943900,89602400,86302300,93068200,64078900,60114800,71836600,62259655]});
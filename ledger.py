@@ -0,0 +1,232 @@
+
+import csv
+import os
+
+import numpy as np
+
+# Ledger columns, named after the row fields of runSimulation() in js/logic.js.
+# Floats use NaN where the JS row holds null. "mode" is stored as an
+# offensive flag, "mocSell" as a flag and "sellDate" as a day index (-1 = open);
+# they are written out as "Offensive"/"Safe", "MOC" and dates.
+FLOAT_FIELDS = (
+    "close", "changePct", "fundRefresh", "locTarget", "targetAllocation", "targetQty",
+    "buyPrice", "buyQty", "buyAmount", "targetSell", "mocPrice", "sellPrice", "sellQty",
+    "sellAmount", "fee", "netPnL", "netPnLPct", "accumPnL", "totalSeed", "totalAsset",
+    "cash", "drawdown",
+)
+FIELDS = ("date", "mode", "tier") + FLOAT_FIELDS[:10] + ("mocSell", "sellDate") + FLOAT_FIELDS[10:]
+
+LEDGER_MODES = ("summary", "columnar", "streaming")
+CHUNK_ROWS = 5000   # ledger rows (days x paths) per streamed chunk
+
+
+class ColumnarLedger:
+    """
+    Ledger held as preallocated (n_paths, n_days) arrays, one per field.
+    simulate() writes each day's row and, when a holding is sold, settles the
+    sell columns back onto the row of the day it was bought (buyRow in JS).
+    """
+    def __init__(self, dates=None):
+        self.dates = dates
+        self.data = None
+        self.base = 1       # simulated day stored in buffer column 0
+        self.last_day = 0
+
+    def _alloc(self, n_paths, n_cols):
+        data = {name: np.full((n_paths, n_cols), np.nan) for name in FLOAT_FIELDS}
+        data["mode"] = np.zeros((n_paths, n_cols), dtype=bool)
+        data["tier"] = np.zeros((n_paths, n_cols), dtype=np.int64)
+        data["mocSell"] = np.zeros((n_paths, n_cols), dtype=bool)
+        data["sellDate"] = np.full((n_paths, n_cols), -1, dtype=np.int64)
+        # Defaults of a fresh JS row
+        for name in ("fee", "netPnL", "netPnLPct"):
+            data[name][:] = 0
+        return data
+
+    def begin(self, n_paths, n_days, slots):
+        self.data = self._alloc(n_paths, n_days - 1)
+
+    def record(self, t, fields):
+        self.last_day = t
+        col = t - self.base
+        for name, values in fields.items():
+            self.data[name][:, col] = values
+
+    def settle(self, t, sell, buy_day, close, qty, revenue, fee, net, pct, moc):
+        # Write today's sells onto their buy rows (fee = buy + sell fee of the trade)
+        p, k = np.nonzero(sell)
+        cols = buy_day[p, k] - self.base
+        d = self.data
+        d["sellDate"][p, cols] = t
+        d["sellPrice"][p, cols] = close[p]
+        d["sellQty"][p, cols] = qty[p, k]
+        d["sellAmount"][p, cols] = revenue[p, k]
+        d["fee"][p, cols] = fee[p, k]
+        d["netPnL"][p, cols] = net[p, k]
+        d["netPnLPct"][p, cols] = pct[p, k]
+        d["mocSell"][p, cols] = moc[p, k]
+        d["mocPrice"][p, cols] = np.where(moc[p, k], close[p], np.nan)
+
+    def release(self, oldest_open):
+        # Rows before `oldest_open` can no longer change; nothing to do in memory
+        pass
+
+    def finish(self):
+        return self.data
+
+
+class StreamingLedger(ColumnarLedger):
+    """
+    Ledger written to CSV or Parquet in chunks. Only the rows that an open
+    holding can still settle into (at most max timeCut days) plus one chunk
+    are kept in memory, so memory does not grow with the backtest length.
+    """
+    def __init__(self, path, dates=None, chunk_rows=CHUNK_ROWS, fmt=None):
+        super().__init__(dates)
+        self.path = path
+        self.chunk_rows = chunk_rows
+        self.fmt = fmt or ("parquet" if path.endswith(".parquet") else "csv")
+        self.rows_written = 0
+        self._writer = None
+        self._file = None
+        if self.fmt == "parquet":
+            try:
+                import pyarrow  # noqa: F401
+            except ImportError:
+                raise ImportError("Parquet ledgers need pyarrow (pip install pyarrow); use a .csv path instead")
+
+    def begin(self, n_paths, n_days, slots):
+        # A holding is sold after at most `slots` days, so chunk + slots columns suffice
+        self.n_paths = n_paths
+        self.chunk_days = max(1, self.chunk_rows // n_paths)
+        self.data = self._alloc(n_paths, self.chunk_days + slots + 1)
+
+    def release(self, oldest_open):
+        if oldest_open - self.base >= self.chunk_days:
+            self._flush(oldest_open)
+
+    def finish(self):
+        self._flush(self.last_day + 1)
+        if self._file is not None:
+            self._file.close()
+        elif self._writer is not None:
+            self._writer.close()
+        return {"path": self.path, "format": self.fmt, "rows": self.rows_written}
+
+    def _flush(self, upto):
+        n = upto - self.base
+        if n <= 0:
+            return
+        columns = _output_columns({k: v[:, :n] for k, v in self.data.items()}, self.base, self.dates)
+        if self.fmt == "parquet":
+            self._write_parquet(columns)
+        else:
+            self._write_csv(columns)
+        self.rows_written += len(columns["date"])
+
+        # Shift the still-open rows to the front and reset the freed columns
+        fresh = self._alloc(self.n_paths, n)
+        for name, arr in self.data.items():
+            arr[:, :-n] = arr[:, n:].copy()
+            arr[:, -n:] = fresh[name]
+        self.base = upto
+
+    def _write_csv(self, columns):
+        if self._file is None:
+            self._file = open(self.path, "w", newline="", encoding="utf-8")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(list(columns))
+        cells = [[_csv_cell(v) for v in col.tolist()] for col in columns.values()]
+        self._writer.writerows(zip(*cells))
+
+    def _write_parquet(self, columns):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        table = pa.table({k: pa.array(v, from_pandas=True) for k, v in columns.items()})
+        if self._writer is None:
+            self._writer = pq.ParquetWriter(self.path, table.schema)
+        self._writer.write_table(table)
+
+
+def _csv_cell(value):
+    return "" if isinstance(value, float) and value != value else value
+
+
+def _output_columns(data, base, dates):
+    # (n_paths, n) field arrays -> flat day-major columns with display values
+    n_paths, n = data["tier"].shape
+    days = np.repeat(np.arange(base, base + n), n_paths)
+    paths = np.tile(np.arange(n_paths), n)
+    flat = {k: v.T.reshape(-1) for k, v in data.items()}
+
+    out = {}
+    if n_paths > 1:
+        out["path"] = paths
+    out["date"] = days if dates is None else np.datetime_as_string(dates[days])
+    for name in FIELDS[1:]:
+        col = flat[name]
+        if name == "mode":
+            col = np.where(col, "Offensive", "Safe")
+        elif name == "mocSell":
+            col = np.where(col, "MOC", "")
+        elif name == "sellDate":
+            if dates is not None:
+                col = np.where(col >= 0, np.datetime_as_string(dates[np.maximum(col, 0)]), "")
+        out[name] = col
+    return out
+
+
+def ledger_columns(data, dates=None):
+    """Columnar ledger (from simulate(..., ledger=ColumnarLedger())) as display columns."""
+    return _output_columns(data, 1, dates)
+
+
+def make_ledger(mode, path=None, dates=None, chunk_rows=CHUNK_ROWS):
+    # 'summary' -> None (simulate keeps no ledger at all)
+    if mode == "summary":
+        return None
+    if mode == "columnar":
+        return ColumnarLedger(dates)
+    if mode == "streaming":
+        if not path:
+            raise ValueError("streaming ledger needs an output path (.csv or .parquet)")
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        return StreamingLedger(path, dates, chunk_rows)
+    raise ValueError(f"unknown ledger mode {mode!r}; expected one of {LEDGER_MODES}")
+
+
+def main():
+    import argparse
+
+    import backtest_engine as be
+
+    parser = argparse.ArgumentParser(description="Run the SOXL strategy once and write its ledger")
+    parser.add_argument("--params", default=os.path.join(be.BASE_DIR, "users", "stock-bot-2.json"))
+    parser.add_argument("--start", default=be.START_DATE)
+    parser.add_argument("--end", default=be.END_DATE)
+    parser.add_argument("--mode", default="streaming", choices=LEDGER_MODES)
+    parser.add_argument("--out", default="ledger.csv", help=".csv or .parquet (streaming mode)")
+    parser.add_argument("--chunk-rows", type=int, default=CHUNK_ROWS)
+    args = parser.parse_args()
+
+    try:
+        ledger = make_ledger(args.mode, args.out, chunk_rows=args.chunk_rows)
+    except ImportError as e:
+        parser.error(str(e))
+
+    params = be.load_user_params(args.params)
+    params["startDate"] = args.start
+    params["endDate"] = args.end
+
+    result = be.run_simulation(be.load_market_data(), params, ledger=ledger)
+    print(f"Final Balance: {result['finalBalance']:,.0f}  MDD: {result['maxDrawdown']:.2f}%  "
+          f"CAGR: {result['summary']['cagr']:.2f}%")
+    if args.mode == "streaming":
+        print(f"Ledger: {result['ledger']['rows']} rows -> {result['ledger']['path']}")
+    elif args.mode == "columnar":
+        print(f"Ledger: {result['ledger']['tier'].shape[1]} rows held in memory")
+
+
+if __name__ == "__main__":
+    main()
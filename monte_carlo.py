@@ -0,0 +1,223 @@
+
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+import backtest_engine as be
+
+# --- CONFIGURATION ---
+N_PATHS = 2000
+MEAN_BLOCK = 20           # Expected block length (trading days) of the stationary bootstrap
+RUIN_LEVEL = 0.5          # Equity at or below 50% of initial capital counts as ruin
+MEMORY_BUDGET_MB = 512    # Shared by all workers
+PERCENTILES = (5, 25, 50, 75, 95)
+
+# Rough peak bytes held per (path, day) while a batch is generated and simulated:
+# bootstrap indices/randoms, SOXL+QQQ returns and prices, regime flags.
+BYTES_PER_PATH_DAY = 96
+
+DEFAULT_PARAMS_FILE = os.path.join(be.BASE_DIR, "users", "stock-bot-2.json")
+
+
+# --- RESAMPLING ---
+def aligned_returns(market):
+    """
+    Daily log returns of SOXL and QQQ on their common trading days.
+    Both series are resampled with the same indices so the SOXL/QQQ
+    co-movement that drives the regime is preserved.
+    """
+    soxl, qqq = market["SOXL"], market["QQQ"]
+    dates, si, qi = np.intersect1d(soxl["date"], qqq["date"], return_indices=True)
+    closes = np.vstack([soxl["close"][si], qqq["close"][qi]])
+    return dates, closes[:, 0], np.diff(np.log(closes), axis=1)
+
+
+def stationary_bootstrap(rng, n_paths, n_steps, n_obs, mean_block=MEAN_BLOCK):
+    """
+    Politis-Romano stationary bootstrap indices, shape (n_paths, n_steps).
+    Blocks start at random observations and have geometric lengths with mean
+    `mean_block`, wrapping circularly, which keeps volatility clusters intact.
+    """
+    steps = np.arange(n_steps)
+    new_block = rng.random((n_paths, n_steps)) < 1.0 / mean_block
+    new_block[:, 0] = True
+    block_start = np.maximum.accumulate(np.where(new_block, steps, 0), axis=1)
+    origin = rng.integers(0, n_obs, size=(n_paths, n_steps))
+    start = np.take_along_axis(origin, block_start, axis=1)
+    return (start + steps - block_start) % n_obs
+
+
+def synthetic_prices(rng, first_close, returns, n_paths, mean_block=MEAN_BLOCK):
+    # (2, n_paths, n_days) SOXL/QQQ closes, rounded to cents like js/data.js
+    n_obs = returns.shape[1]
+    idx = stationary_bootstrap(rng, n_paths, n_obs, n_obs, mean_block)
+    log_paths = np.cumsum(returns[:, idx], axis=2)
+    prices = np.empty((2, n_paths, n_obs + 1))
+    prices[:, :, 0] = first_close[:, None]
+    prices[:, :, 1:] = first_close[:, None, None] * np.exp(log_paths)
+    return np.maximum(np.round(prices, 2), 0.01)
+
+
+# --- WORKERS ---
+_ctx = {}
+
+
+def _init_worker(ctx):
+    _ctx.update(ctx)
+
+
+def _run_batch(task):
+    seed, n_paths = task
+    c = _ctx
+    rng = np.random.default_rng(seed)
+    soxl, qqq = synthetic_prices(rng, c["first_close"], c["returns"], n_paths, c["mean_block"])
+    offensive = be.regime_offensive(c["dates"], c["dates"], qqq)
+    del qqq
+
+    lo, hi = c["window"]
+    result = be.simulate(soxl[:, lo:hi], offensive[:, lo:hi], c["params"])
+    summary = be.summarize(result, c["params"])
+    n_days = hi - lo - 1
+    return {
+        "cagr": summary["cagr"],
+        "max_drawdown": result["max_drawdown"],
+        "longest_underwater": result["longest_underwater"],
+        "underwater_pct": result["underwater_days"] / n_days * 100,
+        "win_rate": summary["winRate"],
+        "sqn": summary["sqn"],
+        "ruined": result["min_equity"] <= c["params"]["initialCapital"] * c["ruin_level"],
+    }
+
+
+def batch_size(n_days, workers, memory_mb):
+    per_path = n_days * BYTES_PER_PATH_DAY
+    return max(1, int(memory_mb * 1024 * 1024 / workers / per_path))
+
+
+# --- MAIN ENTRY ---
+def run_monte_carlo(market, params, n_paths=N_PATHS, mean_block=MEAN_BLOCK, workers=None,
+                    memory_mb=MEMORY_BUDGET_MB, seed=None, ruin_level=RUIN_LEVEL, on_progress=None):
+    """
+    Resample SOXL/QQQ history into `n_paths` synthetic markets and run the
+    strategy on each. Paths are generated and simulated in batches sized to
+    `memory_mb`, spread over a process pool; only per-path metrics are kept.
+    """
+    dates, first_close, returns = aligned_returns(market)
+    workers = workers or os.cpu_count() or 1
+    ctx = {
+        "dates": dates,
+        "first_close": first_close,
+        "returns": returns,
+        "params": params,
+        "mean_block": mean_block,
+        "ruin_level": ruin_level,
+        "window": be.window(dates, params),
+    }
+
+    size = batch_size(len(dates), workers, memory_mb)
+    counts = [min(size, n_paths - i) for i in range(0, n_paths, size)]
+    seeds = np.random.SeedSequence(seed).spawn(len(counts))
+    tasks = list(zip(seeds, counts))
+
+    if workers == 1:
+        _init_worker(ctx)
+        parts = be.collect(map(_run_batch, tasks), counts, on_progress)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(ctx,)) as pool:
+            parts = be.collect(pool.map(_run_batch, tasks), counts, on_progress)
+
+    return {k: np.concatenate([p[k] for p in parts]) for k in parts[0]}
+
+
+def distribution(values):
+    stats = {"mean": float(np.mean(values))}
+    for q, v in zip(PERCENTILES, np.percentile(values, PERCENTILES)):
+        stats[f"p{q}"] = float(v)
+    return stats
+
+
+def build_report(metrics, params, n_paths, mean_block, ruin_level):
+    return {
+        "paths": n_paths,
+        "mean_block": mean_block,
+        "startDate": params["startDate"],
+        "endDate": params["endDate"],
+        "ruin_level": ruin_level,
+        "probability_of_ruin": float(np.mean(metrics["ruined"]) * 100),
+        "cagr": distribution(metrics["cagr"]),
+        "max_drawdown": distribution(metrics["max_drawdown"]),
+        "longest_underwater_days": distribution(metrics["longest_underwater"]),
+        "underwater_pct": distribution(metrics["underwater_pct"]),
+        "win_rate": distribution(metrics["win_rate"]),
+        "sqn": distribution(metrics["sqn"]),
+    }
+
+
+def print_report(report):
+    print("\n" + "=" * 72)
+    print(f"MONTE CARLO RISK ({report['paths']} paths, mean block {report['mean_block']}d, "
+          f"{report['startDate']} ~ {report['endDate']})")
+    print("=" * 72)
+    header = "".join(f"{'p' + str(q):>10}" for q in PERCENTILES)
+    print(f"{'':<26}{'mean':>10}{header}")
+    labels = [
+        ("cagr", "CAGR %"),
+        ("max_drawdown", "Max Drawdown %"),
+        ("longest_underwater_days", "Longest Underwater (d)"),
+        ("underwater_pct", "Time Underwater %"),
+        ("win_rate", "Win Rate %"),
+        ("sqn", "SQN"),
+    ]
+    for key, label in labels:
+        d = report[key]
+        cells = "".join(f"{d['p' + str(q)]:>10.2f}" for q in PERCENTILES)
+        print(f"{label:<26}{d['mean']:>10.2f}{cells}")
+    print("-" * 72)
+    print(f"Probability of Ruin (equity <= {report['ruin_level'] * 100:.0f}% of seed): "
+          f"{report['probability_of_ruin']:.2f}%")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Block-bootstrap Monte Carlo over the SOXL strategy")
+    parser.add_argument("--params", default=DEFAULT_PARAMS_FILE, help="users/*.json with strategy params")
+    parser.add_argument("--start", default=be.START_DATE)
+    parser.add_argument("--end", default=be.END_DATE)
+    parser.add_argument("--paths", type=int, default=N_PATHS)
+    parser.add_argument("--block", type=float, default=MEAN_BLOCK, help="mean block length in trading days")
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--memory-mb", type=float, default=MEMORY_BUDGET_MB)
+    parser.add_argument("--ruin", type=float, default=RUIN_LEVEL, help="ruin threshold as fraction of seed")
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--out", default=None, help="optional JSON report path")
+    args = parser.parse_args()
+
+    params = be.load_user_params(args.params)
+    params["startDate"] = args.start
+    params["endDate"] = args.end
+
+    market = be.load_market_data()
+    print(f"Running {args.paths} bootstrap paths...")
+    started = time.time()
+
+    def progress(done, total):
+        print(f" [{done * 100 // total:3d}%] {done}/{total} paths")
+
+    metrics = run_monte_carlo(market, params, args.paths, args.block, args.workers,
+                              args.memory_mb, args.seed, args.ruin, progress)
+    print(f"Completed in {time.time() - started:.1f}s")
+
+    report = build_report(metrics, params, args.paths, args.block, args.ruin)
+    print_report(report)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"\nReport saved to '{args.out}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,336 @@
+
+import argparse
+import json
+import os
+
+import numpy as np
+
+import backtest_engine as be
+
+# --- CONFIGURATION ---
+# Each sleeve runs the tiered LOC strategy on its own ticker with its own regime
+# source; all sleeves draw from one cash balance and share one rebalance cycle.
+DEFAULT_ASSETS = [
+    {"ticker": "SOXL", "regime": "QQQ", "allocation": 40},
+    {"ticker": "TQQQ", "regime": "QQQ", "allocation": 30},
+    {"ticker": "TECL", "regime": "QQQ", "allocation": 30},
+]
+DEFAULT_PARAMS_FILE = os.path.join(be.BASE_DIR, "users", "stock-bot-2.json")
+
+
+def load_portfolio(config_path=None, params_path=DEFAULT_PARAMS_FILE):
+    """
+    Portfolio config: {"initialCapital", "startDate", "endDate", "feeRate",
+    "rebalance", "assets": [{"ticker", "regime", "allocation", "params"?}]}.
+    Sleeve "params" (safe / offensive blocks merged key by key, useRealTier,
+    feeRate) override the strategy params from `params_path`; the top-level
+    feeRate is each sleeve's default. The rebalance cycle is shared, so it is
+    only configured at the top level (merged key by key).
+    """
+    base = be.load_user_params(params_path)
+    portfolio = {
+        "initialCapital": base["initialCapital"],
+        "startDate": be.START_DATE,
+        "endDate": be.END_DATE,
+        "feeRate": base["feeRate"],
+        "rebalance": base["rebalance"],
+        "assets": DEFAULT_ASSETS,
+    }
+    if config_path:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+        rebalance = dict(portfolio["rebalance"], **config.pop("rebalance", {}))
+        portfolio.update(config, rebalance=rebalance)
+
+    assets = []
+    for asset in portfolio["assets"]:
+        override = asset.get("params", {})
+        if "rebalance" in override:
+            raise ValueError(f"{asset['ticker']}: rebalance is shared by all sleeves; "
+                             "set it at the top level of the portfolio config")
+        p = dict(base, feeRate=portfolio["feeRate"])
+        p.update(override)
+        for block in ("safe", "offensive"):
+            if block in override:
+                p[block] = dict(base[block], **override[block])
+        assets.append({
+            "ticker": asset["ticker"],
+            "regime": asset.get("regime", "QQQ"),
+            "allocation": float(asset.get("allocation", 1)),
+            "params": p,
+        })
+    portfolio["assets"] = assets
+    return portfolio
+
+
+# --- PORTFOLIO ENGINE ---
+def simulate_portfolio(cache, portfolio):
+    """
+    Advance every sleeve in one date-aligned pass over the memory-mapped close
+    matrix. Sells of all sleeves settle first, then sleeves buy in config order
+    against the shared cash balance (same cash check as runSimulation).
+    """
+    assets = portfolio["assets"]
+    n_assets = len(assets)
+    cols = [cache["col"][a["ticker"]] for a in assets]
+    dates, close = cache["dates"], cache["close"]
+    offensive = be.regime_table(cache, assets)
+    lo, hi = be.window(dates, portfolio)
+    n_days = hi - lo - 1
+
+    tb = be.path_table([a["params"] for a in assets], n_assets)
+    fee_rate = tb["fee_rate"]          # per sleeve
+    profit_add = portfolio["rebalance"].get("profitAdd", 0) / 100
+    loss_sub = portfolio["rebalance"].get("lossSub", 0) / 100
+
+    share = np.array([a["allocation"] for a in assets])
+    share = share / share.sum()
+    capital = float(portfolio["initialCapital"])
+    seed = capital * share
+    balance = capital
+    pending = 0.0
+    period_pnl = 0.0
+    timer = 0
+
+    shape = (n_assets, tb["slots"])
+    pos = {
+        "qty": np.zeros(shape),
+        "buy_price": np.zeros(shape),
+        "cost": np.zeros(shape),          # cash paid incl. buy fee
+        "days_held": np.zeros(shape, dtype=np.int64),
+        "day_limit": np.zeros(shape, dtype=np.int64),
+        "target": np.zeros(shape),
+    }
+    count = np.zeros(n_assets, dtype=np.int64)
+    slot_idx = np.arange(tb["slots"])
+    rows = np.arange(n_assets)
+
+    realized = np.zeros(n_assets)
+    fees = np.zeros(n_assets)
+    trades = np.zeros(n_assets, dtype=np.int64)
+    wins = np.zeros(n_assets, dtype=np.int64)
+
+    equity = np.zeros(n_days)
+    cash = np.zeros(n_days)
+    exposure = np.zeros((n_days, n_assets))
+    sleeve_pnl = np.zeros((n_days, n_assets))
+
+    for i, t in enumerate(range(lo + 1, hi)):
+        c = close[t, cols]
+        y = close[t - 1, cols]
+        live = ~(np.isnan(c) | np.isnan(y))
+        c = np.where(live, c, 0)
+        m = offensive[t].astype(np.int64)
+
+        seed += pending * share
+        pending = 0.0
+
+        # --- SELL (all sleeves) ---
+        start_count = count.copy()
+        active = (slot_idx < count[:, None]) & live[:, None]
+        pos["days_held"] += active
+        sell = active & ((c[:, None] >= pos["target"]) | (pos["days_held"] >= pos["day_limit"]))
+        keep = (slot_idx < count[:, None]) & ~sell
+        value = pos["qty"] * c[:, None]
+        holdings_value = np.zeros(n_assets)
+        sold = sell.any()
+        if sold:
+            revenue = np.where(sell, value, 0)
+            buy_cost = np.where(sell, pos["qty"] * pos["buy_price"], 0)
+            sell_fee = revenue * fee_rate[:, None]
+            buy_fee = buy_cost * fee_rate[:, None]
+            pnl = revenue - buy_cost - sell_fee - buy_fee
+            cash_in = revenue - sell_fee
+            realized += pnl.sum(axis=1)
+            fees += sell_fee.sum(axis=1)
+            trades += sell.sum(axis=1)
+            wins += (sell & (revenue > buy_cost)).sum(axis=1)
+
+        for k in range(int(count.max(initial=0)) - 1, -1, -1):
+            if sold:
+                balance += np.where(sell[:, k], cash_in[:, k], 0).sum()
+                period_pnl += np.where(sell[:, k], pnl[:, k], 0).sum()
+            holdings_value += np.where(keep[:, k], value[:, k], 0)
+
+        if sold:
+            order = np.argsort(~keep, axis=1, kind="stable")
+            for name in pos:
+                pos[name] = np.take_along_axis(pos[name], order, axis=1)
+            count = keep.sum(axis=1)
+
+        # Suspended sleeves keep last day's mark
+        if not live.all():
+            prev = exposure[i - 1] if i > 0 else np.zeros(n_assets)
+            holdings_value = np.where(live, holdings_value, prev)
+
+        # --- BUY (config order, shared cash) ---
+        for a in rows[live]:
+            tier = count[a] if tb["real_tier"][a] else start_count[a]
+            weights = tb["weights"][a, m[a]]
+            weight = weights[min(tier, len(weights) - 1)]
+            loc = y[a] * (1 + tb["buy_limit"][a, m[a]])
+            if c[a] > loc:
+                continue
+
+            allocation = seed[a] * weight
+            bought = 0.0
+            if allocation > 0:
+                target_qty = np.floor(allocation / loc)
+                need = target_qty * c[a] + target_qty * c[a] * fee_rate[a]
+                bought = target_qty if balance >= need else np.floor(balance / (c[a] * (1 + fee_rate[a])))
+            cost = bought * c[a]
+            if bought > 0:
+                balance -= cost + cost * fee_rate[a]
+                fees[a] += cost * fee_rate[a]
+            holdings_value[a] += cost
+
+            k = count[a]
+            pos["qty"][a, k] = bought
+            pos["buy_price"][a, k] = c[a]
+            pos["cost"][a, k] = cost + cost * fee_rate[a] if bought > 0 else 0
+            pos["days_held"][a, k] = 0
+            pos["day_limit"][a, k] = tb["time_cut"][a, m[a]]
+            pos["target"][a, k] = be.round2(c[a] * (1 + tb["target"][a, m[a]]))
+            count[a] += 1
+
+        # --- SHARED REBALANCE ---
+        timer += 1
+        if timer >= be.REBALANCE_DAYS:
+            if period_pnl > 0:
+                pending = period_pnl * profit_add
+            elif period_pnl < 0:
+                pending = period_pnl * loss_sub
+            else:
+                pending = 0.0
+            period_pnl = 0.0
+            timer = 0
+
+        open_cost = np.where(slot_idx < count[:, None], pos["cost"], 0).sum(axis=1)
+        equity[i] = np.floor(holdings_value.sum() + balance)
+        cash[i] = balance
+        exposure[i] = holdings_value
+        sleeve_pnl[i] = realized + holdings_value - open_cost
+
+    return {
+        "dates": np.array(dates[lo + 1:hi]),
+        "equity": equity,
+        "cash": cash,
+        "exposure": exposure,
+        "sleeve_pnl": sleeve_pnl,
+        "realized": realized,
+        "unrealized": exposure[-1] - open_cost if n_days else np.zeros(n_assets),
+        "fees": fees,
+        "trades": trades,
+        "wins": wins,
+    }
+
+
+# --- REPORTING ---
+def drawdown(curve):
+    # Percent drawdown from the running peak (peak floor 0 as in logic.js)
+    peak = np.maximum.accumulate(np.maximum(curve, 0), axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(peak > 0, (curve - peak) / peak * 100, 0)
+
+
+def build_report(result, portfolio):
+    assets = portfolio["assets"]
+    equity, pnl = result["equity"], result["sleeve_pnl"]
+    dd = drawdown(equity)
+    worst = int(np.argmin(dd))
+    peak_day = int(np.argmax(equity[:worst + 1]))
+    peak_equity = np.maximum.accumulate(np.maximum(equity, 1))
+    years = (np.datetime64(portfolio["endDate"]) - np.datetime64(portfolio["startDate"])).astype(np.int64) / 365
+
+    # Cross-asset drawdown: cash is shared, so equity = seed + sum of sleeve PnL and
+    # the portfolio drawdown splits exactly into each sleeve's PnL change over it.
+    contribution = (pnl[worst] - pnl[peak_day]) / equity[peak_day] * 100
+    own_dd = ((pnl - np.maximum.accumulate(pnl, axis=0)) / peak_equity[:, None] * 100).min(axis=0)
+
+    total_pnl = result["realized"] + result["unrealized"]
+    pnl_sum = total_pnl.sum()
+    daily = np.diff(pnl, axis=0)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        corr = np.corrcoef(daily.T) if len(daily) > 1 and len(assets) > 1 else np.ones((1, 1))
+
+    return {
+        "startDate": portfolio["startDate"],
+        "endDate": portfolio["endDate"],
+        "initialCapital": portfolio["initialCapital"],
+        "finalBalance": float(equity[-1]),
+        "cagr": float(be.cagr(equity[-1], portfolio["initialCapital"], years)),
+        "maxDrawdown": float(dd[worst]),
+        "maxDrawdownPeak": str(result["dates"][peak_day]),
+        "maxDrawdownDate": str(result["dates"][worst]),
+        "correlation": np.round(np.nan_to_num(corr), 3).tolist(),
+        "assets": [
+            {
+                "ticker": a["ticker"],
+                "regime": a["regime"],
+                "allocation": a["allocation"],
+                "realizedPnL": round(float(result["realized"][j]), 2),
+                "unrealizedPnL": round(float(result["unrealized"][j]), 2),
+                "pnlShare": round(float(total_pnl[j] / pnl_sum * 100), 2) if pnl_sum else 0,
+                "fees": round(float(result["fees"][j]), 2),
+                "trades": int(result["trades"][j]),
+                "winRate": round(float(result["wins"][j] / result["trades"][j] * 100), 2) if result["trades"][j] else 0,
+                "mddContribution": round(float(contribution[j]), 2),
+                "worstDrawdown": round(float(own_dd[j]), 2),
+                "avgExposure": round(float(np.mean(result["exposure"][:, j] / np.maximum(equity, 1)) * 100), 2),
+            }
+            for j, a in enumerate(assets)
+        ],
+        "equity": {"dates": [str(d) for d in result["dates"]], "values": equity.tolist()},
+    }
+
+
+def print_report(report):
+    print("\n" + "=" * 72)
+    print(f"PORTFOLIO BACKTEST ({report['startDate']} ~ {report['endDate']})")
+    print("=" * 72)
+    print(f"Final Balance:        ${report['finalBalance']:,.0f} (seed ${report['initialCapital']:,.0f})")
+    print(f"CAGR:                 {report['cagr']:.2f}%")
+    print(f"Max Drawdown:         {report['maxDrawdown']:.2f}% on {report['maxDrawdownDate']}")
+    print(f"  peak {report['maxDrawdownPeak']}; contribution by sleeve (%p), worst own drawdown (% of peak equity)")
+    print("-" * 72)
+    print(f"{'Ticker':<8}{'Alloc':>7}{'PnL Share':>11}{'Realized':>15}{'Trades':>8}{'Win%':>8}{'MDD %p':>9}{'Worst':>9}{'Expo%':>8}")
+    for a in report["assets"]:
+        print(f"{a['ticker']:<8}{a['allocation']:>7.1f}{a['pnlShare']:>10.2f}%{a['realizedPnL']:>15,.0f}"
+              f"{a['trades']:>8}{a['winRate']:>8.2f}{a['mddContribution']:>9.2f}{a['worstDrawdown']:>9.2f}"
+              f"{a['avgExposure']:>8.2f}")
+    print("-" * 72)
+    print("Daily sleeve PnL correlation:")
+    for a, row in zip(report["assets"], report["correlation"]):
+        print(f"  {a['ticker']:<6}" + "".join(f"{v:>8.3f}" for v in row))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Multi-asset tiered LOC backtest with shared cash")
+    parser.add_argument("--config", default=None, help="portfolio JSON (assets, seed, dates)")
+    parser.add_argument("--params", default=DEFAULT_PARAMS_FILE, help="users/*.json that sleeve params override")
+    parser.add_argument("--start", default=None)
+    parser.add_argument("--end", default=None)
+    parser.add_argument("--out", default=None, help="optional JSON report path")
+    args = parser.parse_args()
+
+    portfolio = load_portfolio(args.config, args.params)
+    if args.start:
+        portfolio["startDate"] = args.start
+    if args.end:
+        portfolio["endDate"] = args.end
+
+    tickers = [a["ticker"] for a in portfolio["assets"]] + [a["regime"] for a in portfolio["assets"]]
+    cache = be.open_market_cache(list(dict.fromkeys(tickers)))
+
+    result = simulate_portfolio(cache, portfolio)
+    report = build_report(result, portfolio)
+    print_report(report)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"\nReport saved to '{args.out}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,13 +1,16 @@
 
-import yfinance as yf
-import pandas as pd
-import numpy as np
-import google.generativeai as genai
+import argparse
+import json
 import os
 import sys
 
+import numpy as np
+
+# yfinance, pandas and google.generativeai are imported inside the functions
+# that need them, so cached subcommands (search/export) start instantly.
+
 # --- CONFIGURATION ---
-TICKER = "SOXL" # Primary Ticker
+TICKER = os.getenv("RPM_TICKER", "SOXL") # Primary Ticker
 START_DATE = "2011-03-01"
 
 # API KEY CONFIGURATION
@@ -15,9 +18,43 @@ START_DATE = "2011-03-01"
 # os.environ["GOOGLE_API_KEY"] = "YOUR_KEY_HERE"
 API_KEY = os.getenv("GOOGLE_API_KEY")
 
-def fetch_data(ticker):
+# Bar interval: '1d' (default) or an intraday interval ('5m', '1m')
+INTERVAL = os.getenv("RPM_INTERVAL", "1d")
+TOP_N = int(os.getenv("RPM_TOP_N", "20"))
+DAILY_HORIZONS = (5, 30)  # forward-return bars reported for daily matches
+
+FEATURES = ['rsi', 'disparity_20', 'roc_10', 'macd_hist', 'volatility_width', 'atr_pct', 'disparity_60', 'stoch_k']
+
+# --- SEQUENCE MATCHING CONFIGURATION ---
+# 'snapshot' compares the single-day indicator vector; 'features' / 'price'
+# compare the last SEQUENCE_WINDOW bars of z-scored features / log price path.
+MATCH_MODE = os.getenv("RPM_MATCH", "snapshot")
+SEQUENCE_WINDOW = int(os.getenv("RPM_WINDOW", "20"))
+POOL_TICKERS = [t.strip() for t in os.getenv("RPM_POOL", "").split(",") if t.strip()]  # e.g. "TQQQ,TECL"
+
+# --- INTRADAY CONFIGURATION ---
+# Yahoo only serves a short window of intraday bars per request, so bars are
+# appended to a local archive on every run and history grows over time.
+INTRADAY_PERIODS = {"1m": "7d", "5m": "60d"}
+INTRADAY_BARS_PER_DAY = {"1m": 390, "5m": 78}
+INTRADAY_HORIZONS = {"1m": (60, 390), "5m": (12, 78)}  # forward-return bars: 1 hour, 1 session
+INTRADAY_BAR_MINUTES = {"1m": 1, "5m": 5}
+BAR_SETTLE_SECONDS = 60       # grace period before a just-closed bar is archived
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cache", "rpm")
+CHUNK_ROWS = 200_000          # bars per indicator chunk
+SEARCH_BLOCK_ROWS = 500_000   # feature rows per similarity block
+WARMUP_ROWS = 64              # >= longest rolling window (MA60) + prev close
+FEATURE_STORE_VERSION = 2     # bump when the store layout changes (2: timestamps in ns)
+
+def fetch_data(ticker, interval='1d'):
+    import pandas as pd
+    import yfinance as yf
+
     print(f"Fetching data for {ticker}...")
-    df = yf.download(ticker, start=START_DATE, progress=False, auto_adjust=False, interval='1d')
+    if interval in INTRADAY_PERIODS:
+        df = yf.download(ticker, period=INTRADAY_PERIODS[interval], progress=False, auto_adjust=False, interval=interval)
+    else:
+        df = yf.download(ticker, start=START_DATE, progress=False, auto_adjust=False, interval='1d')
     
     # Handle MultiIndex if present (yfinance update)
     if isinstance(df.columns, pd.MultiIndex):
@@ -38,7 +75,22 @@ def fetch_data(ticker):
     return df
 
 # --- INDICATOR CALCULATIONS ---
-def calculate_indicators(df):
+def _ema(series, span, seed=None):
+    # EMA (adjust=False); `seed` is the EMA value on the bar before `series`
+    import pandas as pd
+
+    if seed is None:
+        return series.ewm(span=span, adjust=False).mean()
+    values = np.concatenate([[seed], series.to_numpy(dtype=float)])
+    ema = pd.Series(values).ewm(span=span, adjust=False).mean().to_numpy()[1:]
+    return pd.Series(ema, index=series.index)
+
+def calculate_indicators(df, warmup=0, ema_seed=None):
+    # warmup/ema_seed continue a previous chunk (see IndicatorStream):
+    # the first `warmup` rows are only history for the rolling windows and
+    # ema_seed = (ema_12, ema_26, macd_signal) on the last of those rows.
+    import pandas as pd
+
     df = df.copy()
     close = df['close']
     high = df['high']
@@ -68,11 +120,15 @@ def calculate_indicators(df):
 
     # 4. MACD Histogram
     # EMA 12, EMA 26
-    ema12 = close.ewm(span=12, adjust=False).mean()
-    ema26 = close.ewm(span=26, adjust=False).mean()
+    seed = ema_seed or (None, None, None)
+    ema12 = _ema(close.iloc[warmup:], 12, seed[0])
+    ema26 = _ema(close.iloc[warmup:], 26, seed[1])
     macd_line = ema12 - ema26
-    signal_line = macd_line.ewm(span=9, adjust=False).mean()
+    signal_line = _ema(macd_line, 9, seed[2])
     df['macd_hist'] = macd_line - signal_line
+    df['ema_12'] = ema12
+    df['ema_26'] = ema26
+    df['macd_signal'] = signal_line
 
     # 5. Volatility Width (Bandwidth)
     # (Upper - Lower) / Middle
@@ -110,8 +166,10 @@ def calculate_indicators(df):
 
 # --- SIMILARITY SEARCH ---
 def find_similar_patterns(df, target_date=None, top_n=20):
+    import pandas as pd
+
     # Features to compare
-    features = ['rsi', 'disparity_20', 'roc_10', 'macd_hist', 'volatility_width', 'atr_pct', 'disparity_60', 'stoch_k']
+    features = FEATURES
     
     # Debug: Check last row
     last_row = df.iloc[-1]
@@ -168,61 +226,364 @@ def find_similar_patterns(df, target_date=None, top_n=20):
     
     return target_row, top_matches, df
 
+# --- SEQUENCE MATCHING ---
+def find_similar_sequences(stores, window=SEQUENCE_WINDOW, mode='features', top_n=20, index_path=None, index_key=None):
+    """
+    Match the trajectory of the last `window` bars instead of a single-day
+    snapshot. `stores` maps ticker -> feature store (see open_features); the first
+    ticker is the target and every store is pooled into one LSH index
+    (rpm_sequence), whose shortlist is re-ranked by exact distance.
+    With `index_path`, the index is saved there and reused while `index_key`
+    (tickers, mode, window, store versions) is unchanged.
+    Returns (target_idx, [(ticker, idx, distance), ...]).
+    """
+    from rpm_sequence import SequenceIndex, feature_windows, price_windows
+
+    tickers = list(stores)
+    index = None
+    if index_path and index_key and os.path.exists(index_path):
+        index = SequenceIndex.load(index_path)
+        if str(index.extra.get("key")) != index_key:
+            index = None
+
+    if index is None:
+        vectors, owner, rows = [], [], []
+        for k, ticker in enumerate(tickers):
+            store = stores[ticker]
+            if mode == 'price':
+                vec, end = price_windows(store["close"], window)
+            else:
+                # Z-score per ticker so pooled histories share one scale
+                features = np.asarray(store["features"], dtype=np.float64)
+                mean, std = feature_stats(features)
+                vec, end = feature_windows((features - mean) / std, window)
+            vectors.append(vec)
+            owner.append(np.full(len(end), k))
+            rows.append(end)
+        vectors, owner, rows = np.concatenate(vectors), np.concatenate(owner), np.concatenate(rows)
+        index = SequenceIndex(vectors.shape[1]).build(vectors)
+        if index_path and index_key:
+            index.save(index_path, owner=owner, rows=rows, key=np.array(index_key))
+    else:
+        owner, rows = index.extra["owner"], index.extra["rows"]
+
+    primary = np.flatnonzero(owner == 0)
+    if len(primary) == 0:
+        raise ValueError(f"Not enough valid data for a {window}-bar window.")
+    target = primary[-1]
+    print(f"[DEBUG] {window}-bar {mode} window, {len(rows)} pooled windows from {len(tickers)} tickers")
+
+    # Windows overlapping the target's own window (on any ticker) would trivially
+    # match: drop every window ending at or after the target window's first bar
+    end_ts = np.empty(len(rows), dtype=np.int64)
+    for k, ticker in enumerate(tickers):
+        mine = owner == k
+        end_ts[mine] = stores[ticker]["ts"][rows[mine]]
+    window_start = stores[tickers[0]]["ts"][rows[target] - window + 1]
+    match_ids, match_dist = index.query(index.vectors[target], top_n, end_ts >= window_start)
+
+    # Per-bar RMS distance, comparable across window lengths
+    matches = [(tickers[owner[i]], int(rows[i]), float(d) / np.sqrt(window)) for i, d in zip(match_ids, match_dist)]
+    return int(rows[target]), matches
+
+# --- CHUNKED INDICATORS / FEATURE STORE ---
+class IndicatorStream:
+    """
+    calculate_indicators() over a bar stream, one chunk at a time.
+    Carries the last WARMUP_ROWS bars (rolling windows) and the EMA/MACD
+    states across chunk boundaries, so results match a single full pass.
+    """
+    def __init__(self):
+        self.tail = None
+        self.ema_seed = None
+
+    def update(self, chunk):
+        import pandas as pd
+
+        warmup = 0 if self.tail is None else len(self.tail)
+        frame = chunk if self.tail is None else pd.concat([self.tail, chunk])
+        ind = calculate_indicators(frame, warmup=warmup, ema_seed=self.ema_seed)
+
+        last = ind.iloc[-1]
+        self.ema_seed = (last['ema_12'], last['ema_26'], last['macd_signal'])
+        self.tail = frame[['open', 'high', 'low', 'close', 'volume']].iloc[-WARMUP_ROWS:]
+        return ind.iloc[warmup:]
+
+
+def _cache_paths(ticker, interval):
+    # Artifacts shared by the CLI subcommands (fetch -> indicators -> search -> report)
+    base = os.path.join(CACHE_DIR, f"{ticker}_{interval}")
+    return {
+        "archive": base + ".csv",
+        "ts": base + "_ts.i8",          # bar timestamps, int64 ns UTC
+        "close": base + "_close.f32",
+        "features": base + "_features.f32",  # (n, len(FEATURES)) float32
+        "meta": base + "_features.json",     # store version / row count, written last
+        "index": base + "_lsh.npz",          # pooled sequence index (rpm_sequence.SequenceIndex)
+        "search": base + "_search.json",
+        "report": base + "_report.md",
+    }
+
+
+def _last_archived(path):
+    # Timestamp of the last archived bar, read from the file tail only
+    import pandas as pd
+
+    if not os.path.exists(path) or os.path.getsize(path) == 0:
+        return None
+    with open(path, "rb") as f:
+        f.seek(max(0, os.path.getsize(path) - 4096))
+        last_line = f.read().decode("utf-8").strip().splitlines()[-1]
+    stamp = last_line.split(",")[0]
+    return None if stamp == "datetime" else pd.Timestamp(stamp)
+
+
+def update_archive(ticker, interval):
+    # Daily history is re-downloaded in full; intraday bars are appended
+    import pandas as pd
+
+    paths = _cache_paths(ticker, interval)
+    os.makedirs(CACHE_DIR, exist_ok=True)
+
+    df = fetch_data(ticker, interval)
+    df.index = df.index.tz_convert('UTC') if df.index.tz is not None else df.index.tz_localize('UTC')
+    df.index.name = "datetime"
+    if interval not in INTRADAY_PERIODS:
+        df[['open', 'high', 'low', 'close', 'volume']].to_csv(paths["archive"])
+        print(f" Saved {len(df)} {interval} bars -> {paths['archive']}")
+        return paths["archive"]
+
+    # Yahoo includes the still-forming bar during market hours; archiving it
+    # would freeze a partial bar, since later runs only append newer ones
+    now = pd.Timestamp.now(tz='UTC')
+    closes = df.index + pd.Timedelta(minutes=INTRADAY_BAR_MINUTES[interval], seconds=BAR_SETTLE_SECONDS)
+    df = df[closes <= now]
+
+    last = _last_archived(paths["archive"])
+    if last is not None:
+        df = df[df.index > last]
+
+    new_file = not os.path.exists(paths["archive"]) or os.path.getsize(paths["archive"]) == 0
+    df[['open', 'high', 'low', 'close', 'volume']].to_csv(paths["archive"], mode="a", header=new_file)
+    print(f" Archived {len(df)} new {interval} bars -> {paths['archive']}")
+    return paths["archive"]
+
+
+def iter_bar_chunks(path, chunk_rows=CHUNK_ROWS):
+    import pandas as pd
+
+    for chunk in pd.read_csv(path, index_col=0, chunksize=chunk_rows):
+        chunk.index = pd.to_datetime(chunk.index, utc=True)
+        yield chunk.astype(float)
+
+
+def build_features(ticker, interval, chunk_rows=CHUNK_ROWS):
+    """Stream the bar archive through IndicatorStream into float32 files on disk."""
+    paths = _cache_paths(ticker, interval)
+    stream = IndicatorStream()
+    rows = 0
+    tmp = {k: paths[k] + ".tmp" for k in ("ts", "close", "features")}
+    with open(tmp["ts"], "wb") as f_ts, open(tmp["close"], "wb") as f_close, open(tmp["features"], "wb") as f_feat:
+        for chunk in iter_bar_chunks(paths["archive"], chunk_rows):
+            ind = stream.update(chunk)
+            ind.index.values.astype("datetime64[ns]").view(np.int64).tofile(f_ts)
+            ind['close'].to_numpy(dtype=np.float32).tofile(f_close)
+            ind[FEATURES].to_numpy(dtype=np.float32).tofile(f_feat)
+            rows += len(ind)
+            print(f" [{rows:,} bars] indicators computed")
+
+    for k, path in tmp.items():
+        os.replace(path, paths[k])
+    with open(paths["meta"], "w", encoding="utf-8") as f:
+        json.dump({"version": FEATURE_STORE_VERSION, "rows": rows, "features": FEATURES}, f)
+    return open_features(ticker, interval)
+
+
+def _store_ok(paths):
+    # Stores from an older layout (or an interrupted build) are rebuilt
+    try:
+        with open(paths["meta"], "r", encoding="utf-8") as f:
+            meta = json.load(f)
+    except (OSError, ValueError):
+        return False
+    rows = meta.get("rows", -1)
+    return (meta.get("version") == FEATURE_STORE_VERSION and meta.get("features") == FEATURES
+            and os.path.exists(paths["ts"]) and os.path.getsize(paths["ts"]) == rows * 8
+            and os.path.exists(paths["features"]) and os.path.getsize(paths["features"]) == rows * len(FEATURES) * 4)
+
+
+def open_features(ticker, interval):
+    paths = _cache_paths(ticker, interval)
+    return {
+        "ts": np.memmap(paths["ts"], dtype=np.int64, mode="r"),
+        "close": np.memmap(paths["close"], dtype=np.float32, mode="r"),
+        "features": np.memmap(paths["features"], dtype=np.float32, mode="r").reshape(-1, len(FEATURES)),
+    }
+
+
+# --- STREAMING SIMILARITY SEARCH ---
+def feature_stats(features, block_rows=SEARCH_BLOCK_ROWS):
+    # Mean / sample std of complete rows, merged block by block (Chan et al.)
+    count, mean, m2 = 0, np.zeros(features.shape[1]), np.zeros(features.shape[1])
+    for start in range(0, len(features), block_rows):
+        blk = np.asarray(features[start:start + block_rows], dtype=np.float64)
+        blk = blk[~np.isnan(blk).any(axis=1)]
+        if len(blk) == 0:
+            continue
+        n_b, mean_b = len(blk), blk.mean(axis=0)
+        m2_b = ((blk - mean_b) ** 2).sum(axis=0)
+        delta = mean_b - mean
+        total = count + n_b
+        mean = mean + delta * n_b / total
+        m2 = m2 + m2_b + delta ** 2 * count * n_b / total
+        count = total
+    return mean, np.sqrt(m2 / max(count - 1, 1))
+
+
+def stream_similar_patterns(store, target_idx=None, top_n=20, exclude_bars=0, block_rows=SEARCH_BLOCK_ROWS):
+    """
+    find_similar_patterns() over the memory-mapped feature matrix, one block
+    at a time. Keeps only the running top_n, so memory does not grow with
+    history length. Bars within `exclude_bars` of the target are skipped.
+    """
+    features = store["features"]
+    n = len(features)
+    mean, std = feature_stats(features, block_rows)
+
+    if target_idx is None:
+        tail_start = max(0, n - block_rows)
+        complete = ~np.isnan(np.asarray(features[tail_start:])).any(axis=1)
+        target_idx = tail_start + int(np.flatnonzero(complete)[-1])
+    target_norm = (np.asarray(features[target_idx], dtype=np.float64) - mean) / std
+
+    best_idx = np.empty(0, dtype=np.int64)
+    best_dist = np.empty(0)
+    for start in range(0, n, block_rows):
+        blk = (np.asarray(features[start:start + block_rows], dtype=np.float64) - mean) / std
+        dist = np.sqrt(((blk - target_norm) ** 2).sum(axis=1))
+        idx = np.arange(start, start + len(blk))
+        dist[np.isnan(dist) | (np.abs(idx - target_idx) <= exclude_bars)] = np.inf
+
+        cand_idx = np.concatenate([best_idx, idx])
+        cand_dist = np.concatenate([best_dist, dist])
+        keep = np.argpartition(cand_dist, min(top_n, len(cand_dist) - 1))[:top_n]
+        best_idx, best_dist = cand_idx[keep], cand_dist[keep]
+
+    order = np.argsort(best_dist)
+    found = np.isfinite(best_dist[order])
+    return target_idx, best_idx[order][found], best_dist[order][found]
+
+
+def forward_returns(close, idx, horizon):
+    # % return `horizon` bars after each index; NaN past the end of history
+    idx = np.asarray(idx)
+    ok = idx + horizon < len(close)
+    out = np.full(len(idx), np.nan)
+    now = close[idx[ok]].astype(np.float64)
+    out[ok] = (close[idx[ok] + horizon] - now) / now * 100
+    return out
+
+
+def _bar_label(ts, interval):
+    # int64 ns UTC -> 'YYYY-MM-DD' (daily) or 'YYYY-MM-DD HH:MM' (intraday)
+    unit = 'D' if interval == '1d' else 'm'
+    return np.datetime_as_string(np.datetime64(int(ts), 'ns'), unit=unit).replace('T', ' ')
+
+
+def _json_float(value):
+    return None if value is None or np.isnan(value) else float(value)
+
+
+def search_patterns(ticker, interval, mode='snapshot', window=SEQUENCE_WINDOW, pool=(), top_n=TOP_N):
+    """
+    Similarity search over the cached feature stores. Returns a JSON-ready
+    dict (target indicators, matches with forward returns, average returns)
+    that the report and export steps consume.
+    """
+    if mode == 'snapshot':
+        stores = {ticker: open_features(ticker, interval)}
+        exclude_bars = INTRADAY_BARS_PER_DAY.get(interval, 0)
+        target_idx, match_idx, match_dist = stream_similar_patterns(stores[ticker], top_n=top_n, exclude_bars=exclude_bars)
+        matches = [(ticker, int(i), float(d)) for i, d in zip(match_idx, match_dist)]
+    else:
+        stores = {t: open_features(t, interval) for t in [ticker, *pool]}
+        metas = [_cache_paths(t, interval)["meta"] for t in stores]
+        index_key = json.dumps({"tickers": list(stores), "mode": mode, "window": window,
+                                "stores": [os.path.getmtime(p) if os.path.exists(p) else None for p in metas]})
+        target_idx, matches = find_similar_sequences(stores, window, mode, top_n,
+                                                     _cache_paths(ticker, interval)["index"], index_key)
+
+    short_h, long_h = INTRADAY_HORIZONS.get(interval, DAILY_HORIZONS)
+    rsi_col = FEATURES.index('rsi')
+    rows = []
+    for t, i, dist in matches:
+        store = stores[t]
+        rows.append({
+            "ticker": t,
+            "date": _bar_label(store["ts"][i], interval),
+            "distance": dist,
+            "rsi": float(store["features"][i, rsi_col]),
+            # Pooled matches come from other tickers, so returns use the match's own closes
+            "ret_short": _json_float(forward_returns(store["close"], [i], short_h)[0]),
+            "ret_long": _json_float(forward_returns(store["close"], [i], long_h)[0]),
+        })
+
+    def average(key):
+        values = [r[key] for r in rows if r[key] is not None]
+        return float(np.mean(values)) if values else None
+
+    target = stores[ticker]
+    return {
+        "ticker": ticker,
+        "interval": interval,
+        "mode": mode,
+        "window": window if mode != 'snapshot' else 1,
+        "pool": list(pool) if mode != 'snapshot' else [],
+        "top_n": top_n,
+        "date": _bar_label(target["ts"][target_idx], interval),
+        "indicators": dict(zip(FEATURES, map(float, target["features"][target_idx]))),
+        "matches": rows,
+        "avg_short": average("ret_short"),
+        "avg_long": average("ret_long"),
+    }
+
 # --- GEMINI ANALYSIS ---
-def generate_gemini_report(target_row, top_matches, df, api_key):
+def generate_gemini_report(result, api_key):
     if not api_key:
         return "Error: No API Key provided."
-        
+
+    import google.generativeai as genai
+
     genai.configure(api_key=api_key)
     model = genai.GenerativeModel('gemini-1.5-flash') 
     # Or gemini-pro if available/preferred
     
     # Prepare prompt data
     # 1. Current Indicators
+    ind = result["indicators"]
     current_data_str = f"""
-    [Analysis Date]: {target_row.name.strftime('%Y-%m-%d')}
+    [Analysis Date]: {result['date']}
     [Current 8 Major Indicators]
-    1. RSI (14): {target_row['rsi']:.2f}
-    2. Disparity 20: {target_row['disparity_20']:.2f}%
-    3. ROC 10: {target_row['roc_10']:.2f}%
-    4. MACD Hist: {target_row['macd_hist']:.4f}
-    5. Volatility Width (BW): {target_row['volatility_width']:.4f}
-    6. ATR %: {target_row['atr_pct']:.2f}%
-    7. Disparity 60: {target_row['disparity_60']:.2f}%
-    8. Stochastic K: {target_row['stoch_k']:.2f}%
+    1. RSI (14): {ind['rsi']:.2f}
+    2. Disparity 20: {ind['disparity_20']:.2f}%
+    3. ROC 10: {ind['roc_10']:.2f}%
+    4. MACD Hist: {ind['macd_hist']:.4f}
+    5. Volatility Width (BW): {ind['volatility_width']:.4f}
+    6. ATR %: {ind['atr_pct']:.2f}%
+    7. Disparity 60: {ind['disparity_60']:.2f}%
+    8. Stochastic K: {ind['stoch_k']:.2f}%
     """
     
-    # 2. Top Matches Data (Date, Price, +5d return, +30d return)
+    # 2. Top Matches Data (Date, Dist, RSI, +5d return, +30d return) from the search step
     matches_str = "Top 20 Similar Past Patterns:\n"
-    future_returns_5d = []
-    future_returns_30d = []
-    
-    for date, row in top_matches.iterrows():
-        # Find future returns
-        # date is the index
-        idx_loc = df.index.get_loc(date)
-        
-        # Check bounds
-        if idx_loc + 5 < len(df):
-            price_now = df.iloc[idx_loc]['close']
-            price_5d = df.iloc[idx_loc + 5]['close']
-            ret_5d = ((price_5d - price_now) / price_now) * 100
-            future_returns_5d.append(ret_5d)
-        else:
-            ret_5d = np.nan
-            
-        if idx_loc + 30 < len(df):
-            price_now = df.iloc[idx_loc]['close']
-            price_30d = df.iloc[idx_loc + 30]['close']
-            ret_30d = ((price_30d - price_now) / price_now) * 100
-            future_returns_30d.append(ret_30d)
-        else:
-            ret_30d = np.nan
-            
-        matches_str += f"- {date.strftime('%Y-%m-%d')}: Dist={row['distance']:.2f}, RSI={row['rsi']:.1f}, 5d_Ret={ret_5d:.2f}%, 30d_Ret={ret_30d:.2f}%\n"
+    for m in result["matches"]:
+        label = m['date'] if m['ticker'] == result['ticker'] else f"{m['ticker']} {m['date']}"
+        ret_5d = np.nan if m['ret_short'] is None else m['ret_short']
+        ret_30d = np.nan if m['ret_long'] is None else m['ret_long']
+        matches_str += f"- {label}: Dist={m['distance']:.2f}, RSI={m['rsi']:.1f}, 5d_Ret={ret_5d:.2f}%, 30d_Ret={ret_30d:.2f}%\n"
 
-    avg_5d = np.nanmean(future_returns_5d)
-    avg_30d = np.nanmean(future_returns_30d)
+    avg_5d = np.nan if result['avg_short'] is None else result['avg_short']
+    avg_30d = np.nan if result['avg_long'] is None else result['avg_long']
     
     prompt = f"""
     You are the "RPM (Real-Time Pattern Machine) AI Analyst". Your job is to analyze stock market data based on 8 specific technical indicators and historical similarity patterns.
@@ -254,80 +615,215 @@ def generate_gemini_report(target_row, top_matches, df, api_key):
     response = model.generate_content(prompt)
     return response.text
 
-# --- MAIN EXECUTION ---
-def main():
-    # Check for API Key
-    user_key = input("Enter your Google AI Studio API Key (Press Enter to skip if using env var): ").strip()
-    if user_key:
-        global API_KEY
-        API_KEY = user_key
-        
-    if not API_KEY:
-        print("WARNING: No API Key found. AI Report will be skipped.")
-    
-    # 1. Fetch
-    print(f"Fetching data for {TICKER} (Start: {START_DATE})...")
-    df = fetch_data(TICKER)
-    print(" [100%] Data Fetch Completed.")
-    
-    # 2. Calculate
-    print("Calculating Indicators...")
-    df_ind = calculate_indicators(df)
-    print(" [100%] Indicator Calculation Completed.")
-    
-    # 3. Find Similar
+# --- CACHED PIPELINE ---
+# Each step reuses its artifact in CACHE_DIR while it is newer than its inputs,
+# so e.g. `search` after a `fetch` only recomputes what changed.
+def _is_fresh(path, *sources):
+    if not os.path.exists(path):
+        return False
+    mtime = os.path.getmtime(path)
+    return all(os.path.exists(src) and os.path.getmtime(src) <= mtime for src in sources)
+
+
+def _tickers(args):
+    # Pooled tickers only take part in sequence matching
+    return [args.ticker] + (args.pool if args.mode != 'snapshot' else [])
+
+
+def ensure_archive(ticker, interval, refresh=False):
+    path = _cache_paths(ticker, interval)["archive"]
+    if refresh or not os.path.exists(path):
+        print(f"Fetching data for {ticker} ({interval})...")
+        update_archive(ticker, interval)
+        print(" [100%] Data Fetch Completed.")
+    return path
+
+
+def ensure_features(ticker, interval, refresh=False):
+    paths = _cache_paths(ticker, interval)
+    ensure_archive(ticker, interval)
+    if refresh or not _is_fresh(paths["meta"], paths["archive"]) or not _store_ok(paths):
+        print(f"Calculating Indicators for {ticker} ({interval})...")
+        build_features(ticker, interval)
+        print(" [100%] Indicator Calculation Completed.")
+    return paths["features"]
+
+
+def ensure_search(args, refresh=False):
+    path = _cache_paths(args.ticker, args.interval)["search"]
+    sources = [ensure_features(t, args.interval) for t in _tickers(args)]
+
+    settings = {"mode": args.mode, "window": args.window if args.mode != 'snapshot' else 1,
+                "pool": _tickers(args)[1:], "top_n": args.top_n}
+    if not refresh and _is_fresh(path, *sources):
+        with open(path, "r", encoding="utf-8") as f:
+            cached = json.load(f)
+        if all(cached.get(k) == v for k, v in settings.items()):
+            return cached
+
     print("Finding Similar Patterns...")
-    target_row, top_matches, full_df = find_similar_patterns(df_ind)
+    result = search_patterns(args.ticker, args.interval, args.mode, args.window, args.pool, args.top_n)
     print(" [100%] Similarity Search Completed.")
-    
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(result, f, indent=4)
+    return result
+
+
+def ensure_report(args, result, refresh=False):
+    # Returns the cached or freshly generated report, or None when it cannot be made
+    paths = _cache_paths(args.ticker, args.interval)
+    if not refresh and _is_fresh(paths["report"], paths["search"]):
+        with open(paths["report"], "r", encoding="utf-8") as f:
+            return f.read()
+    if args.interval != '1d' or not args.api_key:
+        return None
+
+    report = generate_gemini_report(result, args.api_key)
+    with open(paths["report"], "w", encoding="utf-8") as f:
+        f.write(report)
+    return report
+
+
+def _skipped_report(args):
+    return "AI Analysis Skipped (Intraday Mode)" if args.interval != '1d' else "AI Analysis Skipped (No Key)"
+
+
+# --- SUBCOMMANDS ---
+def cmd_fetch(args):
+    for ticker in _tickers(args):
+        ensure_archive(ticker, args.interval, refresh=True)
+
+
+def cmd_indicators(args):
+    for ticker in _tickers(args):
+        ensure_features(ticker, args.interval, refresh=args.refresh)
+
+
+def cmd_search(args):
+    result = ensure_search(args, refresh=args.refresh)
+    print_indicators(result)
+    print(f"Top {len(result['matches'])} matches ({result['mode']}):")
+    for m in result["matches"]:
+        ret_short = "n/a" if m['ret_short'] is None else f"{m['ret_short']:+.2f}%"
+        ret_long = "n/a" if m['ret_long'] is None else f"{m['ret_long']:+.2f}%"
+        print(f"  {m['ticker']:<6} {m['date']:<17} dist={m['distance']:.4f}  rsi={m['rsi']:6.2f}  {ret_short:>9} {ret_long:>9}")
+
+
+def cmd_report(args):
+    result = ensure_search(args)
+    report = ensure_report(args, result, refresh=args.refresh)
+    print(report if report is not None else _skipped_report(args))
+
+
+def cmd_export(args):
+    result = ensure_search(args)
+    report = ensure_report(args, result)
+    export_data(result, report if report is not None else _skipped_report(args))
+
+
+def cmd_run(args):
+    # The original one-shot flow: fresh data, then everything through export
+    cmd_fetch(args)
+    result = ensure_search(args)
+    print_indicators(result)
+    report = ensure_report(args, result)
+    export_data(result, report if report is not None else _skipped_report(args))
+
+
+COMMANDS = {
+    "fetch": (cmd_fetch, "download bars into the local cache"),
+    "indicators": (cmd_indicators, "compute the indicator feature store from cached bars"),
+    "search": (cmd_search, "find similar past patterns (cached per settings)"),
+    "report": (cmd_report, "generate the Gemini report for the cached search"),
+    "export": (cmd_export, "write js/rpm_data.js from the cached search and report"),
+    "run": (cmd_run, "fetch + export in one go (default)"),
+}
+
+
+# --- MAIN EXECUTION ---
+def build_parser():
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--ticker", default=TICKER, help="target ticker (env RPM_TICKER)")
+    common.add_argument("--interval", default=INTERVAL, help="1d, 5m or 1m (env RPM_INTERVAL)")
+    common.add_argument("--mode", default=MATCH_MODE, choices=["snapshot", "features", "price"], help="env RPM_MATCH")
+    common.add_argument("--window", type=int, default=SEQUENCE_WINDOW, help="sequence window in bars (env RPM_WINDOW)")
+    common.add_argument("--pool", default=",".join(POOL_TICKERS), help="comma-separated tickers pooled into sequence search (env RPM_POOL)")
+    common.add_argument("--top-n", type=int, default=TOP_N, help="env RPM_TOP_N")
+    common.add_argument("--api-key", default=API_KEY, help="Google AI Studio key (env GOOGLE_API_KEY)")
+    common.add_argument("--refresh", action="store_true", help="recompute this step even if its cached artifact is fresh")
+
+    parser = argparse.ArgumentParser(description="RPM (Real-Time Pattern Machine)")
+    sub = parser.add_subparsers(dest="command")
+    for name, (_, help_text) in COMMANDS.items():
+        sub.add_parser(name, parents=[common], help=help_text)
+    return parser
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else list(argv)
+    if not argv or argv[0].startswith("-") and argv[0] not in ("-h", "--help"):
+        argv = ["run"] + argv
+
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    args.pool = [t.strip() for t in args.pool.split(",") if t.strip()]
+    if args.mode != 'snapshot' and args.interval != '1d':
+        parser.error("sequence matching (--mode features/price) is only available for --interval 1d")
+
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    COMMANDS[args.command][0](args)
+
+def print_indicators(result):
+    ind = result["indicators"]
     print("\n" + "="*50)
-    print(f"RPM ANALYSIS FOR {TICKER} on {target_row.name.strftime('%Y-%m-%d')}")
+    print(f"RPM ANALYSIS FOR {result['ticker']} on {result['date']}")
     print("="*50)
-    print(f"RSI (14):          {target_row['rsi']:.2f}")
-    print(f"Disparity 20:      {target_row['disparity_20']:.2f}%")
-    print(f"ROC 10:            {target_row['roc_10']:.2f}%")
-    print(f"MACD Hist:         {target_row['macd_hist']:.4f}")
-    print(f"Volatility Width:  {target_row['volatility_width']:.4f}")
-    print(f"ATR %:             {target_row['atr_pct']:.2f}%")
-    print(f"Disparity 60:      {target_row['disparity_60']:.2f}%")
-    print(f"Stochastic K:      {target_row['stoch_k']:.2f}")
+    print(f"RSI (14):          {ind['rsi']:.2f}")
+    print(f"Disparity 20:      {ind['disparity_20']:.2f}%")
+    print(f"ROC 10:            {ind['roc_10']:.2f}%")
+    print(f"MACD Hist:         {ind['macd_hist']:.4f}")
+    print(f"Volatility Width:  {ind['volatility_width']:.4f}")
+    print(f"ATR %:             {ind['atr_pct']:.2f}%")
+    print(f"Disparity 60:      {ind['disparity_60']:.2f}%")
+    print(f"Stochastic K:      {ind['stoch_k']:.2f}")
     print("-" * 50)
-    
-    
-    # 5. Export to JS
-    export_data(target_row, top_matches, report if API_KEY else "AI Analysis Skipped (No Key)", avg_5d, avg_30d)
 
-def export_data(target_row, top_matches, ai_report, avg_5d, avg_30d):
-    import json
-    
+def export_data(result, ai_report):
+    # Intraday bars carry a time of day; avg_return_5d/30d then hold the
+    # INTRADAY_HORIZONS returns (1 hour / 1 session) under the same keys.
+    ind = result["indicators"]
+    matches = result["matches"]
+
     # Prepare data dictionary
     data = {
-        "ticker": TICKER, # Export Ticker
-        "date": target_row.name.strftime('%Y-%m-%d'),
-        "similarity_score": round(1000 - (top_matches.iloc[0]['distance'] * 100), 2), # Mock score based on distance
+        "ticker": result["ticker"], # Export Ticker
+        "interval": result["interval"],
+        "date": result["date"],
+        "similarity_score": round(1000 - (matches[0]['distance'] * 100), 2) if matches else 0, # Mock score based on distance
         "indicators": {
-            "rsi": round(target_row['rsi'], 2),
-            "disparity_20": round(target_row['disparity_20'], 2),
-            "roc_10": round(target_row['roc_10'], 2),
-            "macd_hist": round(target_row['macd_hist'], 4),
-            "volatility_width": round(target_row['volatility_width'], 4),
-            "atr_pct": round(target_row['atr_pct'], 2),
-            "disparity_60": round(target_row['disparity_60'], 2),
-            "stoch_k": round(target_row['stoch_k'], 2)
+            "rsi": round(ind['rsi'], 2),
+            "disparity_20": round(ind['disparity_20'], 2),
+            "roc_10": round(ind['roc_10'], 2),
+            "macd_hist": round(ind['macd_hist'], 4),
+            "volatility_width": round(ind['volatility_width'], 4),
+            "atr_pct": round(ind['atr_pct'], 2),
+            "disparity_60": round(ind['disparity_60'], 2),
+            "stoch_k": round(ind['stoch_k'], 2)
         },
         "stats": {
-            "avg_return_5d": round(avg_5d, 2) if not np.isnan(avg_5d) else 0,
-            "avg_return_30d": round(avg_30d, 2) if not np.isnan(avg_30d) else 0
+            "avg_return_5d": round(result['avg_short'], 2) if result['avg_short'] is not None else 0,
+            "avg_return_30d": round(result['avg_long'], 2) if result['avg_long'] is not None else 0
         },
         "ai_report": ai_report,
         "top_matches": []
     }
     
-    for date, row in top_matches.iterrows():
+    for m in matches:
         data["top_matches"].append({
-            "date": date.strftime('%Y-%m-%d'),
-            "distance": round(row['distance'], 4),
-            "rsi": round(row['rsi'], 2)
+            "date": m['date'],
+            "ticker": m['ticker'],
+            "distance": round(m['distance'], 4),
+            "rsi": round(m['rsi'], 2)
         })
 
     # Write to file - Use Absolute Path to be safe
@@ -0,0 +1,145 @@
+
+import numpy as np
+
+# --- CONFIGURATION ---
+# p-stable LSH (E2LSH): each table hashes a window vector to N_HASHES
+# quantized random projections. Nearby windows share buckets in at least one
+# table with high probability; candidates are then re-ranked exactly.
+N_TABLES = 16
+N_HASHES = 6
+BUCKET_WIDTH = 1.0      # bucket size in units of the projected std
+N_PROBES = 2            # extra buckets probed per table (nearest boundaries)
+
+
+# --- WINDOW VECTORS ---
+def feature_windows(z, window):
+    """
+    Flattened trajectories of the last `window` rows of z-scored features.
+    Returns (vectors (n_win, window * n_features), end_row of each window);
+    windows touching a NaN row are dropped.
+    """
+    z = np.asarray(z, dtype=np.float32)
+    if len(z) < window:
+        return np.empty((0, window * z.shape[1]), dtype=np.float32), np.empty(0, dtype=np.int64)
+    view = np.lib.stride_tricks.sliding_window_view(z, window, axis=0)   # (n_win, d, window)
+    vectors = view.transpose(0, 2, 1).reshape(len(view), -1)
+    ok = ~np.isnan(vectors).any(axis=1)
+    return vectors[ok], np.flatnonzero(ok) + window - 1
+
+
+def price_windows(close, window):
+    # Log price path relative to the window's last close (scale-free across tickers)
+    log_close = np.log(np.asarray(close, dtype=np.float64))
+    if len(log_close) < window:
+        return np.empty((0, window), dtype=np.float32), np.empty(0, dtype=np.int64)
+    view = np.lib.stride_tricks.sliding_window_view(log_close, window)
+    vectors = (view - view[:, -1:]).astype(np.float32)
+    ok = np.isfinite(vectors).all(axis=1)
+    return vectors[ok], np.flatnonzero(ok) + window - 1
+
+
+# --- LSH INDEX ---
+class SequenceIndex:
+    """
+    Random-projection LSH over fixed-length window vectors with exact
+    Euclidean re-ranking. Each table keeps its bucket keys sorted, so a lookup
+    is a binary search plus the bucket contents instead of a full scan.
+    """
+    def __init__(self, dim, n_tables=N_TABLES, n_hashes=N_HASHES, bucket_width=BUCKET_WIDTH, seed=0):
+        rng = np.random.default_rng(seed)
+        self.dim = dim
+        self.proj = rng.standard_normal((n_tables, n_hashes, dim)).astype(np.float32)
+        self.offset = rng.random((n_tables, n_hashes))
+        self.mix = rng.integers(1, 2 ** 62, size=n_hashes, dtype=np.uint64) | np.uint64(1)
+        self.bucket_width = bucket_width
+        self.width = None
+        self.vectors = None
+        self.sorted_keys = None
+        self.sorted_ids = None
+        self.extra = {}     # caller arrays stored alongside the index (see save)
+
+    def _project(self, vectors):
+        # (n_tables, n, n_hashes) projections in bucket units
+        p = np.einsum('thd,nd->tnh', self.proj, vectors, optimize=True)
+        return p / self.width + self.offset[:, None, :]
+
+    def _hash(self, codes):
+        # Combine n_hashes integer codes into one uint64 key (wrapping multiply-add)
+        return (codes.astype(np.int64).view(np.uint64) * self.mix).sum(axis=-1, dtype=np.uint64)
+
+    def build(self, vectors):
+        self.vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        sample = self.vectors[:: max(1, len(self.vectors) // 5000)]
+        raw = np.einsum('thd,nd->tnh', self.proj, sample, optimize=True)
+        self.width = max(float(raw.std()), 1e-9) * self.bucket_width
+
+        keys = self._hash(np.floor(self._project(self.vectors)))   # (n_tables, n)
+        order = np.argsort(keys, axis=1, kind="stable")
+        self.sorted_keys = np.take_along_axis(keys, order, axis=1)
+        self.sorted_ids = order
+        return self
+
+    def candidates(self, vec, probes=N_PROBES):
+        scaled = self._project(np.asarray(vec, dtype=np.float32)[None, :])[:, 0, :]   # (n_tables, n_hashes)
+        base = np.floor(scaled)
+        frac = scaled - base
+
+        # Multi-probe: also visit the neighbouring bucket across the closest boundaries
+        codes = [base]
+        boundary = np.minimum(frac, 1 - frac)
+        step = np.where(frac < 0.5, -1.0, 1.0)
+        nearest = np.argsort(boundary, axis=1)[:, :probes]
+        for j in range(nearest.shape[1]):
+            shifted = base.copy()
+            rows = np.arange(len(base))
+            shifted[rows, nearest[:, j]] += step[rows, nearest[:, j]]
+            codes.append(shifted)
+
+        found = []
+        for code in codes:
+            keys = self._hash(code)
+            for t, key in enumerate(keys):
+                lo = np.searchsorted(self.sorted_keys[t], key, side="left")
+                hi = np.searchsorted(self.sorted_keys[t], key, side="right")
+                found.append(self.sorted_ids[t, lo:hi])
+        return np.unique(np.concatenate(found))
+
+    def query(self, vec, top_n=20, exclude=None, probes=N_PROBES):
+        """
+        Top-n nearest stored windows to `vec`: LSH candidates re-ranked by
+        exact distance. `exclude` is a bool mask (len = n stored) of ids to skip.
+        Falls back to an exact scan when the buckets return too few candidates.
+        """
+        vec = np.asarray(vec, dtype=np.float32)
+        cand = self.candidates(vec, probes)
+        if exclude is not None:
+            cand = cand[~exclude[cand]]
+        if len(cand) < top_n:
+            cand = np.arange(len(self.vectors))
+            if exclude is not None:
+                cand = cand[~exclude]
+
+        dist = np.sqrt(((self.vectors[cand] - vec) ** 2).sum(axis=1, dtype=np.float64))
+        order = np.argsort(dist)[:top_n]
+        return cand[order], dist[order]
+
+    def save(self, path, **extra):
+        # `extra` arrays (e.g. window owners, a cache key) come back as index.extra
+        self.extra = dict(extra)
+        np.savez(path, proj=self.proj, offset=self.offset, mix=self.mix, width=self.width,
+                 bucket_width=self.bucket_width, vectors=self.vectors,
+                 sorted_keys=self.sorted_keys, sorted_ids=self.sorted_ids,
+                 extra_keys=np.array(list(extra), dtype=str), **extra)
+
+    @classmethod
+    def load(cls, path):
+        data = np.load(path)
+        index = cls.__new__(cls)
+        index.proj, index.offset, index.mix = data["proj"], data["offset"], data["mix"]
+        index.dim = index.proj.shape[2]
+        index.width = float(data["width"])
+        index.bucket_width = float(data["bucket_width"])
+        index.vectors = data["vectors"]
+        index.sorted_keys, index.sorted_ids = data["sorted_keys"], data["sorted_ids"]
+        index.extra = {k: data[k] for k in data["extra_keys"]} if "extra_keys" in data else {}
+        return index
@@ -7,6 +7,8 @@ import pytz
 import requests
 import sys
 
+from data_codec import write_packed
+
 # 데이터 다운로드 (최대 기간) - Ticker.history 사용 (더 안정적)
 def fetch_data(ticker_symbol):
     print(f"Fetching {ticker_symbol}...")
@@ -110,4 +112,7 @@ if not os.path.exists("js"):
 with open("js/data.js", "w", encoding="utf-8") as f:
     f.write(js_content)
 
+# 압축 포맷 (컬럼 + 센트 델타 인코딩) - daily_bot.js / 웹앱이 사용
+write_packed({"SOXL": soxl_data, "QQQ": qqq_data}, "js/data_packed.js")
+
 print(f"Update Complete: {datetime.now()}")
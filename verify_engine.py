@@ -0,0 +1,334 @@
+import json
+import math
+import os
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+
+import backtest_engine as be
+import ledger as lg
+import monte_carlo as mc
+import portfolio as pf
+import walk_forward as wf
+
+# Re-runnable checks for the Python engine against js/logic.js and its own
+# fast paths. Needs node for the JS comparisons (skipped when missing).
+#   python verify_engine.py
+
+N_CONFIGS = 6
+INJECTIONS = [{"date": "2015-06-01", "amount": 5000}, {"date": "2020-03-16", "amount": 12345.67}]
+PARAMS_FILE = os.path.join(be.BASE_DIR, "users", "stock-bot-2.json")
+
+failures = []
+
+
+def check(name, ok, detail=""):
+    print(f"  [{'OK' if ok else 'FAIL'}] {name}" + (f"  ({detail})" if detail else ""))
+    if not ok:
+        failures.append(name)
+
+
+def make_configs(n):
+    # stock-bot-2 plus randomized params (tier mode, fees, rebalance) over the full span
+    rng = random.Random(1)
+    base = be.load_user_params(PARAMS_FILE)
+    configs = []
+    for k in range(n):
+        p = json.loads(json.dumps(base))
+        p["startDate"], p["endDate"] = be.START_DATE, be.END_DATE
+        if k:
+            for side in ("safe", "offensive"):
+                p[side]["buyLimit"] = round(rng.uniform(0.5, 6), 1)
+                p[side]["target"] = round(rng.uniform(0.5, 6), 1)
+                p[side]["timeCut"] = rng.randint(2, 40)
+                p[side]["weights"] = [rng.randint(0, 30) for _ in range(8)]
+            p["useRealTier"] = k % 2 == 0
+            p["feeRate"] = 0.07 if k % 3 == 0 else 0
+            p["rebalance"] = {"profitAdd": rng.randint(0, 100), "lossSub": rng.randint(0, 100)}
+        configs.append(p)
+    return configs
+
+
+def run_node(script, payload):
+    # Run an ES module with the repo's js/ modules; payload in, JSON out
+    tmp = tempfile.mkdtemp()
+    try:
+        js_dir = Path(be.BASE_DIR, "js").as_uri()
+        path = os.path.join(tmp, "check.mjs")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(script.replace("JS_DIR", js_dir))
+        with open(os.path.join(tmp, "in.json"), "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+        subprocess.run(["node", path], cwd=tmp, check=True)
+        with open(os.path.join(tmp, "out.json"), "r", encoding="utf-8") as f:
+            return json.load(f)
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+JS_SIMULATION = """
+import fs from 'fs';
+import { SOXL_DATA, QQQ_DATA } from 'JS_DIR/data.js';
+import { runSimulation } from 'JS_DIR/logic.js';
+const { configs, injections } = JSON.parse(fs.readFileSync('in.json'));
+const out = configs.map((params, i) => {
+    const r = runSimulation(SOXL_DATA, QQQ_DATA, params, i % 2 ? injections : []);
+    const trades = r.ledger.filter(x => x.sellDate && x.netPnLPct !== undefined).map(x => x.netPnLPct);
+    return { final: r.finalBalance, mdd: r.maxDrawdown, mddDate: r.maxDrawdownDate,
+             trades: trades.length, wins: trades.filter(p => p > 0).length,
+             curve: r.dailyLog.map(d => d.totalAsset), ledger: r.ledger };
+});
+fs.writeFileSync('out.json', JSON.stringify(out));
+"""
+
+JS_PACKED = """
+import fs from 'fs';
+import * as plain from 'JS_DIR/data.js';
+import * as packed from 'JS_DIR/data_packed.js';
+const out = {};
+for (const name of ['SOXL_DATA', 'QQQ_DATA']) {
+    const a = plain[name], b = packed[name];
+    let bad = a.length === b.length ? 0 : 1;
+    for (let i = 0; i < Math.min(a.length, b.length); i++)
+        for (const f of ['date', 'open', 'high', 'low', 'close', 'volume'])
+            if (!Object.is(a[i][f], b[i][f])) bad++;
+    out[name] = bad;
+}
+fs.writeFileSync('out.json', JSON.stringify(out));
+"""
+
+
+def same_cell(js, py):
+    if isinstance(py, np.generic):
+        py = py.item()
+    if isinstance(py, float) and math.isnan(py):
+        py = None
+    if py == "":
+        py = None
+    if js == py:
+        return True
+    return isinstance(js, (int, float)) and isinstance(py, (int, float)) and abs(js - py) < 1e-6 * max(1, abs(js))
+
+
+def ledger_mismatches(js_rows, cols):
+    if len(js_rows) != len(cols["date"]):
+        return -1
+    return sum(not same_cell(row.get(f), cols[f][k]) for f in lg.FIELDS for k, row in enumerate(js_rows))
+
+
+def verify_js_parity(market, configs):
+    print("\n--- js/logic.js runSimulation vs backtest_engine.run_simulation ---")
+    if shutil.which("node") is None:
+        print("  node not found, skipped")
+        return
+    js = run_node(JS_SIMULATION, {"configs": configs, "injections": INJECTIONS})
+    soxl_dates = market["SOXL"]["date"]
+    for i, (p, j) in enumerate(zip(configs, js)):
+        inj = INJECTIONS if i % 2 else ()
+        r = be.run_simulation(market, p, inj, ledger=lg.make_ledger("columnar"))
+        raw = r["raw"]
+        diff = float(np.abs(np.array(j["curve"]) - r["equity"]).max())
+        same = (diff == 0 and j["final"] == r["finalBalance"] and abs(j["mdd"] - r["maxDrawdown"]) < 1e-9
+                and j["mddDate"] == r["maxDrawdownDate"] and j["trades"] == raw["trades"][0] and j["wins"] == raw["wins"][0])
+        check(f"config {i}{' +injections' if inj else ''}: equity/MDD/trades", same,
+              f"final {r['finalBalance']:,.0f}, max curve diff {diff}, trades {raw['trades'][0]}")
+
+        lo, hi = be.window(soxl_dates, p)
+        bad = ledger_mismatches(j["ledger"], lg.ledger_columns(r["ledger"], soxl_dates[lo:hi]))
+        check(f"config {i}: ledger field by field", bad == 0, f"{len(j['ledger'])} rows, {bad} mismatches")
+
+
+def verify_packed(market):
+    print("\n--- js/data_packed.js vs js/data.js ---")
+    plain = be.load_market_data(be.DATA_JS)
+    for name, bars in market.items():
+        same = all(np.array_equal(bars[f], plain[name][f], equal_nan=f != "date") for f in plain[name])
+        check(f"{name}: data_codec.decode_bars == plain rows", same, f"{len(bars['date'])} bars")
+    if shutil.which("node") is None:
+        print("  node not found, JS decoder skipped")
+        return
+    for name, bad in run_node(JS_PACKED, {}).items():
+        check(f"{name}: decodeBars == data.js rows", bad == 0, f"{bad} mismatches")
+
+
+def verify_vectorized(market, configs):
+    print("\n--- simulate() with per-path params vs one run per path ---")
+    soxl, qqq = market["SOXL"], market["QQQ"]
+    offensive = be.regime_offensive(soxl["date"], qqq["date"], qqq["close"])
+    lo, hi = be.window(soxl["date"], configs[0])
+    close = be.round2(soxl["close"][lo:hi])[None, :]
+    together = be.simulate(close, offensive[None, lo:hi], configs, record_equity=True)
+    diff = max(float(np.abs(be.simulate(close, offensive[None, lo:hi], p, record_equity=True)["equity"][0]
+                            - together["equity"][i]).max()) for i, p in enumerate(configs))
+    check(f"{len(configs)} candidates in one pass", diff == 0, f"max curve diff {diff}")
+
+
+def verify_streaming_ledger(market, params):
+    print("\n--- StreamingLedger CSV / Parquet vs ColumnarLedger ---")
+    dates = market["SOXL"]["date"]
+    lo, hi = be.window(dates, params)
+    columnar = be.run_simulation(market, params, INJECTIONS, ledger=lg.make_ledger("columnar"))
+    columns = lg.ledger_columns(columnar["ledger"], dates[lo:hi])
+    expected = [list(row) for row in zip(*[[str(lg._csv_cell(v)) for v in col.tolist()] for col in columns.values()])]
+
+    tmp = tempfile.mkdtemp()
+    try:
+        path = os.path.join(tmp, "ledger.csv")
+        be.run_simulation(market, params, INJECTIONS, ledger=lg.make_ledger("streaming", path, chunk_rows=97))
+        with open(path, "r", encoding="utf-8") as f:
+            streamed = [line.rstrip("\r\n").split(",") for line in f][1:]
+        check("CSV rows == columnar rows", streamed == expected, f"{len(streamed)} rows, 97-row chunks")
+
+        try:
+            import pyarrow.parquet as pq
+        except ImportError:
+            print("  pyarrow not installed, Parquet round trip skipped")
+            return
+        path = os.path.join(tmp, "ledger.parquet")
+        be.run_simulation(market, params, INJECTIONS, ledger=lg.make_ledger("streaming", path, chunk_rows=97))
+        table = pq.read_table(path).to_pydict()
+        same = list(table) == list(columns) and all(
+            [None if isinstance(v, float) and math.isnan(v) else v for v in col.tolist()] == table[name]
+            for name, col in columns.items())
+        check("Parquet rows == columnar rows", same, f"{len(table.get('date', []))} rows, 97-row chunks")
+    finally:
+        shutil.rmtree(tmp, ignore_errors=True)
+
+
+def verify_portfolio(params):
+    print("\n--- portfolio.py single 100% SOXL sleeve vs run_simulation ---")
+    cache = be.open_market_cache(["SOXL", "QQQ"])
+    portfolio = {
+        "initialCapital": params["initialCapital"], "startDate": params["startDate"], "endDate": params["endDate"],
+        "feeRate": params["feeRate"], "rebalance": params["rebalance"],
+        "assets": [{"ticker": "SOXL", "regime": "QQQ", "allocation": 100.0, "params": params}],
+    }
+    result = pf.simulate_portfolio(cache, portfolio)
+    single = be.run_simulation(be.load_market_data(), params)
+    diff = float(np.abs(result["equity"] - single["equity"]).max())
+    check("equity curve", diff == 0, f"max diff {diff}")
+
+
+def verify_chunked_indicators():
+    print("\n--- rpm_calculator IndicatorStream (chunked) vs calculate_indicators (full pass) ---")
+    try:
+        import pandas as pd
+    except ImportError:
+        print("  pandas not installed, skipped")
+        return
+    import rpm_calculator as rc
+
+    n = 20_000
+    rng = np.random.default_rng(0)
+    close = 50 * np.exp(np.cumsum(rng.normal(0, 0.002, n)))
+    idx = pd.date_range("2020-01-02 14:30", periods=n, freq="5min", tz="UTC")
+    bars = pd.DataFrame({"open": close * (1 + rng.normal(0, 0.0005, n)), "high": close * 1.002,
+                         "low": close * 0.998, "close": close,
+                         "volume": rng.integers(1_000, 100_000, n).astype(float)}, index=idx)
+
+    full = rc.calculate_indicators(bars)[rc.FEATURES].to_numpy()
+    stream = rc.IndicatorStream()
+    chunked = np.concatenate([stream.update(bars.iloc[i:i + 3_001])[rc.FEATURES].to_numpy()
+                              for i in range(0, n, 3_001)])
+    same_nan = np.array_equal(np.isnan(full), np.isnan(chunked))
+    rel = float(np.nanmax(np.abs(full - chunked) / (np.abs(full) + 1e-3)))
+    check("features match across 3,001-bar chunks", same_nan and rel < 1e-7, f"max rel diff {rel:.1e}")
+
+
+def verify_bootstrap():
+    print("\n--- monte_carlo.stationary_bootstrap indices ---")
+    n_paths, n_steps, n_obs = 500, 2_000, 3_000
+    idx = mc.stationary_bootstrap(np.random.default_rng(0), n_paths, n_steps, n_obs, mc.MEAN_BLOCK)
+    check("indices within [0, n_obs)", idx.shape == (n_paths, n_steps) and idx.min() >= 0 and idx.max() < n_obs,
+          f"range {idx.min()}..{idx.max()}")
+
+    # A block continues while the index advances by one (circularly); the last
+    # block of each path is cut short, so allow a few percent below the mean
+    starts = n_paths + int((idx[:, 1:] != (idx[:, :-1] + 1) % n_obs).sum())
+    mean_block = idx.size / starts
+    check(f"mean block length ~ MEAN_BLOCK ({mc.MEAN_BLOCK})", abs(mean_block / mc.MEAN_BLOCK - 1) < 0.05,
+          f"{mean_block:.2f} over {starts:,} blocks")
+
+
+def verify_sequence_index():
+    print("\n--- rpm_sequence.SequenceIndex / rpm_calculator sequence matching ---")
+    import rpm_calculator as rc
+    from rpm_sequence import SequenceIndex
+
+    rng = np.random.default_rng(0)
+    vectors = rng.standard_normal((5_000, 40)).astype(np.float32)
+    index = SequenceIndex(vectors.shape[1]).build(vectors)
+    exclude = np.zeros(len(vectors), dtype=bool)
+    exclude[:100] = True
+
+    def exact(vec, top_n):
+        dist = np.sqrt(((vectors - vec) ** 2).sum(axis=1, dtype=np.float64))
+        dist[exclude] = np.inf
+        order = np.argsort(dist)[:top_n]
+        return order, dist[order]
+
+    # top_n above the shortlist size forces the exact-scan fallback
+    fallback_ok = True
+    for q in range(200, 220):
+        top_n = len(index.candidates(vectors[q])) + 1
+        ids, dist = index.query(vectors[q], top_n, exclude)
+        want_ids, want_dist = exact(vectors[q], top_n)
+        fallback_ok &= np.array_equal(ids, want_ids) and np.allclose(dist, want_dist)
+    check("query == exact scan when the shortlist falls back", fallback_ok, "20 queries")
+
+    # Pool a near-copy of the target ticker on the same dates: its windows over
+    # the target's dates must be excluded like the target's own
+    n, window = 1_500, 20
+    ts = (np.datetime64("2015-01-02") + np.arange(n)).astype("datetime64[ns]").view(np.int64)
+    features = rng.standard_normal((n, len(rc.FEATURES))).astype(np.float32)
+    close = np.exp(np.cumsum(rng.normal(0, 0.01, n))).astype(np.float32)
+    stores = {
+        "BASE": {"ts": ts, "close": close, "features": features},
+        "COPY": {"ts": ts, "close": close, "features": features + rng.normal(0, 1e-3, features.shape).astype(np.float32)},
+    }
+    target, matches = rc.find_similar_sequences(stores, window, "features", top_n=20)
+    window_start = ts[target - window + 1]
+    leaked = [(t, i) for t, i, _ in matches if stores[t]["ts"][i] >= window_start]
+    check("overlapping windows excluded on every pooled ticker", not leaked and len(matches) == 20,
+          f"{len(leaked)} overlapping of {len(matches)} matches")
+
+
+def verify_walk_forward(market, params):
+    print("\n--- walk_forward.py folds vs run_simulation ---")
+    # End date on a weekend: the trailing calendar fold has no bars and must be dropped
+    folds = wf.run_walk_forward(params, start="2011-03-15", end="2025-03-16", n_candidates=5, workers=1, seed=0)
+    report = wf.build_report(folds, params, "cagr")
+    check("weekend-only trailing fold dropped", folds[-1]["test"] == ("2024-03-15", "2025-03-14"),
+          f"{len(folds)} folds, last test {folds[-1]['test'][0]} ~ {folds[-1]['test'][1]}")
+
+    diff = 0.0
+    for f in folds:
+        for key, p in (("equity", f["params"]), ("baseline_equity", params)):
+            single = be.run_simulation(market, dict(p, startDate=f["test"][0], endDate=f["test"][1]))
+            diff = max(diff, float(np.abs(single["equity"] - f[key]).max()))
+    n_bars = sum(len(f["dates"]) for f in folds)
+    check("fold winners / baseline == run_simulation on the test window", diff == 0,
+          f"max curve diff {diff}, stitched {len(report['equity']['walk_forward'])} of {n_bars} bars")
+
+
+if __name__ == "__main__":
+    market = be.load_market_data()
+    configs = make_configs(N_CONFIGS)
+
+    verify_js_parity(market, configs)
+    verify_bootstrap()
+    verify_packed(market)
+    verify_vectorized(market, configs)
+    verify_streaming_ledger(market, configs[1])
+    verify_portfolio(configs[0])
+    verify_chunked_indicators()
+    verify_sequence_index()
+    verify_walk_forward(market, be.load_user_params(PARAMS_FILE))
+
+    print(f"\n{'All checks passed.' if not failures else f'{len(failures)} check(s) FAILED.'}")
+    sys.exit(1 if failures else 0)
@@ -0,0 +1,374 @@
+
+import argparse
+import calendar
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date, timedelta
+
+import numpy as np
+
+import backtest_engine as be
+
+# --- CONFIGURATION ---
+TICKER = "SOXL"
+REGIME = "QQQ"
+TRAIN_YEARS = 3
+TEST_YEARS = 1            # also the step between folds
+N_CANDIDATES = 500        # random-search iterations per train window (dmIterations)
+TOP_K = 10                # runDeepMind returns its top 10
+RANK_KEYS = ("cagr", "sqn", "pf", "winRate")
+
+# Default DeepMind search ranges (index.html dm* inputs), same shape as runDeepMind's config
+SEARCH_SPACE = {
+    "safe": {"buyLimit": [0, 10], "target": [0, 10], "timeCut": [5, 60]},
+    "offensive": {"buyLimit": [0, 10], "target": [0, 10], "timeCut": [5, 60]},
+    "rebalance": {"profitAdd": [40, 100], "lossSub": [0, 40]},
+}
+SEARCHED = [
+    ("safe", "buyLimit"), ("safe", "target"), ("safe", "timeCut"),
+    ("offensive", "buyLimit"), ("offensive", "target"), ("offensive", "timeCut"),
+    ("rebalance", "profitAdd"), ("rebalance", "lossSub"),
+]
+
+DEFAULT_PARAMS_FILE = os.path.join(be.BASE_DIR, "users", "stock-bot-2.json")
+
+
+# --- CANDIDATES (same sampling as js/deep_mind.js) ---
+def random_range(rng, lo, hi, step=1.0):
+    steps = (hi - lo) / step
+    return round(lo + int(rng.random() * (steps + 1)) * step, 2)
+
+
+def random_weights(rng):
+    # 8 tiers, each 3..40%, summing to 100
+    w = [3] * 8
+    remaining = 76
+    while remaining > 0:
+        idx = int(rng.integers(0, 8))
+        if w[idx] < 40:
+            w[idx] += 1
+            remaining -= 1
+    return w
+
+
+def sample_candidates(rng, base, space, n):
+    """
+    runDeepMind's random search, keeping the non-searched fields (capital,
+    fee, tier mode) of `base` so candidates compare fairly with it.
+    """
+    candidates = []
+    for _ in range(n):
+        p = json.loads(json.dumps(base))
+        for side in ("safe", "offensive"):
+            s = space[side]
+            p[side] = {
+                "buyLimit": random_range(rng, *s["buyLimit"], 0.1),
+                "target": random_range(rng, *s["target"], 0.1),
+                "timeCut": int(rng.integers(s["timeCut"][0], s["timeCut"][1] + 1)),
+                "weights": random_weights(rng),
+            }
+        p["rebalance"] = {
+            "profitAdd": random_range(rng, *space["rebalance"]["profitAdd"], 5),
+            "lossSub": random_range(rng, *space["rebalance"]["lossSub"], 5),
+        }
+        candidates.append(p)
+    return candidates
+
+
+# --- SHARED DATA ---
+def regime_path(cache, cache_dir=be.MARKET_CACHE_DIR):
+    # Regime flags on the cache calendar, saved next to close.npy so workers can memory-map them
+    path = os.path.join(cache_dir, f"regime_{TICKER}_{REGIME}.npy")
+    close_path = os.path.join(cache_dir, "close.npy")
+    if not os.path.exists(path) or os.path.getmtime(path) < os.path.getmtime(close_path):
+        np.save(path, be.regime_table(cache, [{"ticker": TICKER, "regime": REGIME}])[:, 0])
+    return path
+
+
+def _add_months(d, months):
+    y, m = divmod(d.month - 1 + months, 12)
+    y += d.year
+    return date(y, m + 1, min(d.day, calendar.monthrange(y, m + 1)[1]))
+
+
+def fold_schedule(first, last, train_months, test_months):
+    # Rolling [train][test] windows; each fold steps forward by one test window
+    if train_months < 1 or test_months < 1:
+        raise ValueError(f"train/test windows must be at least 1 month (got {train_months}/{test_months})")
+    folds = []
+    start = first
+    while True:
+        test_start = _add_months(start, train_months)
+        if test_start > last:
+            break
+        test_end = min(_add_months(test_start, test_months) - timedelta(days=1), last)
+        folds.append({
+            "train": (start.isoformat(), (test_start - timedelta(days=1)).isoformat()),
+            "test": (test_start.isoformat(), test_end.isoformat()),
+        })
+        start = _add_months(start, test_months)
+    return folds
+
+
+def _has_bars(dates, span):
+    # Calendar windows can miss every bar (e.g. a weekend-only tail); a span
+    # needs the bar before it plus at least one simulated day
+    lo, hi = be.window(dates, {"startDate": span[0], "endDate": span[1]})
+    return hi - lo >= 2
+
+
+# --- WORKERS ---
+_ctx = {}
+
+
+def _own_rows(cache):
+    # TICKER's bars form one contiguous run of the cache calendar (NaN only before listing)
+    rows = np.flatnonzero(~np.isnan(cache["close"][:, cache["col"][TICKER]]))
+    if len(rows) == 0 or rows[-1] - rows[0] + 1 != len(rows):
+        raise ValueError(f"{TICKER} bars are not contiguous in the market cache")
+    return slice(int(rows[0]), int(rows[-1]) + 1)
+
+
+def _init_worker(ctx):
+    # Slices of the memory-mapped cache / regime table stay views, so workers share the pages
+    cache = be.open_market_cache([TICKER, REGIME], ctx["cache_dir"])
+    rows = _own_rows(cache)
+    _ctx.update(ctx)
+    _ctx["dates"] = cache["dates"][rows]
+    _ctx["close"] = cache["close"][rows, cache["col"][TICKER]]
+    _ctx["offensive"] = np.load(ctx["regime_path"], mmap_mode="r")[rows]
+
+
+def _evaluate(params, span, record_equity=False):
+    c = _ctx
+    lo, hi = be.window(c["dates"], {"startDate": span[0], "endDate": span[1]})
+    close = be.round2(c["close"][lo:hi])[None, :]
+    offensive = np.asarray(c["offensive"][lo:hi])[None, :]
+    result = be.simulate(close, offensive, params, record_equity=record_equity)
+    summary = be.summarize(result, {"startDate": span[0], "endDate": span[1],
+                                    "initialCapital": c["capital"]})
+    return result, summary, c["dates"][lo + 1:hi]
+
+
+def _run_fold(task):
+    c = _ctx
+    candidates = task["candidates"]
+
+    # Train: every candidate in one vectorized pass, ranked like runDeepMind
+    _, train, _ = _evaluate(candidates, task["train"])
+    score = np.nan_to_num(train[c["rank"]], nan=-np.inf)
+    order = np.argsort(-score, kind="stable")
+    best = int(order[0])
+
+    # Test: all candidates (for IS/OOS rank agreement) plus the baseline params
+    result, test, dates = _evaluate(candidates + [c["base"]], task["test"], record_equity=True)
+    n = len(candidates)
+    is_score, oos_score = train[c["rank"]], test[c["rank"]][:n]
+    ranks = [np.argsort(np.argsort(v)) for v in (is_score, oos_score)]
+    spearman = float(np.corrcoef(*ranks)[0, 1]) if n > 2 and np.std(ranks[1]) > 0 else 0.0
+
+    pick = lambda stats, i: {k: float(v[i]) for k, v in stats.items()}
+    return {
+        "fold": task["fold"],
+        "train": task["train"],
+        "test": task["test"],
+        "params": candidates[best],
+        "top": [candidates[i] for i in order[:c["top_k"]]],
+        "train_stats": pick(train, best),
+        "test_stats": pick(test, best),
+        "baseline_stats": pick(test, n),
+        "oos_percentile": float((oos_score < oos_score[best]).mean() * 100),
+        "rank_correlation": spearman,
+        "dates": dates,
+        "equity": result["equity"][best],
+        "baseline_equity": result["equity"][n],
+    }
+
+
+# --- MAIN ENTRY ---
+def run_walk_forward(base, space=SEARCH_SPACE, start=be.START_DATE, end=be.END_DATE,
+                     train_years=TRAIN_YEARS, test_years=TEST_YEARS, n_candidates=N_CANDIDATES,
+                     rank="cagr", top_k=TOP_K, workers=None, seed=None,
+                     cache_dir=be.MARKET_CACHE_DIR, on_progress=None):
+    """
+    Rolling walk-forward: random-search each train window, score the winner on
+    the next test window. Folds run on a process pool; every worker memory-maps
+    the same price cache and saved regime table instead of receiving copies.
+    """
+    cache = be.open_market_cache([TICKER, REGIME], cache_dir)
+    ctx = {
+        "cache_dir": cache_dir,
+        "regime_path": regime_path(cache, cache_dir),
+        "base": base,
+        "capital": float(base["initialCapital"]),
+        "rank": rank,
+        "top_k": top_k,
+    }
+
+    dates = cache["dates"][_own_rows(cache)]
+    first = max(date.fromisoformat(start), date.fromisoformat(str(dates[0])))
+    last = min(date.fromisoformat(end), date.fromisoformat(str(dates[-1])))
+    folds = [f for f in fold_schedule(first, last, round(train_years * 12), round(test_years * 12))
+             if _has_bars(dates, f["train"]) and _has_bars(dates, f["test"])]
+    if not folds:
+        raise ValueError(f"{start} ~ {end} is too short for a {train_years}y train window")
+
+    seeds = np.random.SeedSequence(seed).spawn(len(folds))
+    tasks = [dict(f, fold=i, candidates=sample_candidates(np.random.default_rng(s), base, space, n_candidates))
+             for i, (f, s) in enumerate(zip(folds, seeds))]
+
+    workers = min(workers or os.cpu_count() or 1, len(tasks))
+    if workers == 1:
+        _init_worker(ctx)
+        results = be.collect(map(_run_fold, tasks), [1] * len(tasks), on_progress)
+    else:
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(ctx,)) as pool:
+            results = be.collect(pool.map(_run_fold, tasks), [1] * len(tasks), on_progress)
+    return results
+
+
+def stitch(folds, key="equity", capital=1.0):
+    # Chain each fold's test curve onto the previous fold's ending value
+    dates, curve, level = [], [], capital
+    for f in folds:
+        dates.append(f["dates"])
+        curve.append(level * f[key] / f["capital"])
+        level = curve[-1][-1]
+    return np.concatenate(dates), np.concatenate(curve)
+
+
+def curve_stats(dates, curve, capital):
+    years = (dates[-1] - dates[0]).astype(np.int64) / 365 if len(dates) > 1 else 0
+    peak = np.maximum.accumulate(curve)
+    return {
+        "cagr": float(be.cagr(curve[-1], capital, years)) if years > 0 else 0.0,
+        "mdd": float(((curve - peak) / peak * 100).min()),
+        "final": float(curve[-1]),
+    }
+
+
+def parameter_stability(folds):
+    """
+    Spread of each searched parameter across fold winners, and within each
+    fold's top-K (a narrow top-K means the optimum sits on a plateau).
+    """
+    stats = {}
+    for side, name in SEARCHED:
+        winners = np.array([f["params"][side][name] for f in folds], dtype=float)
+        top_std = [np.std([p[side][name] for p in f["top"]]) for f in folds]
+        mean = winners.mean()
+        stats[f"{side}.{name}"] = {
+            "mean": float(mean),
+            "std": float(winners.std()),
+            "cv": float(winners.std() / abs(mean)) if mean else 0.0,
+            "min": float(winners.min()),
+            "max": float(winners.max()),
+            "topk_std": float(np.mean(top_std)),
+        }
+    return stats
+
+
+def build_report(folds, base, rank):
+    capital = float(base["initialCapital"])
+    for f in folds:
+        f["capital"] = capital
+    dates, curve = stitch(folds, "equity", capital)
+    _, baseline = stitch(folds, "baseline_equity", capital)
+
+    is_cagr = np.mean([f["train_stats"]["cagr"] for f in folds])
+    oos_cagr = np.mean([f["test_stats"]["cagr"] for f in folds])
+    return {
+        "rank": rank,
+        "folds": [{
+            "train": f["train"],
+            "test": f["test"],
+            "params": {f"{s}.{n}": f["params"][s][n] for s, n in SEARCHED},
+            "weights": {s: f["params"][s]["weights"] for s in ("safe", "offensive")},
+            "is": f["train_stats"],
+            "oos": f["test_stats"],
+            "baseline_oos": f["baseline_stats"],
+            "oos_percentile": f["oos_percentile"],
+            "rank_correlation": f["rank_correlation"],
+        } for f in folds],
+        "oos": curve_stats(dates, curve, capital),
+        "baseline_oos": curve_stats(dates, baseline, capital),
+        "walk_forward_efficiency": float(oos_cagr / is_cagr) if is_cagr else 0.0,
+        "mean_rank_correlation": float(np.mean([f["rank_correlation"] for f in folds])),
+        "stability": parameter_stability(folds),
+        "equity": {"dates": [str(d) for d in dates], "walk_forward": curve.tolist(), "baseline": baseline.tolist()},
+    }
+
+
+def print_report(report):
+    print("\n" + "=" * 96)
+    print(f"WALK-FORWARD ({len(report['folds'])} folds, ranked by {report['rank']})")
+    print("=" * 96)
+    print(f"{'Test Window':<25}{'IS CAGR':>10}{'OOS CAGR':>10}{'OOS MDD':>10}"
+          f"{'Base CAGR':>11}{'OOS pct':>9}{'IS/OOS rho':>12}")
+    for f in report["folds"]:
+        print(f"{f['test'][0] + ' ~ ' + f['test'][1]:<25}{f['is']['cagr']:>10.2f}{f['oos']['cagr']:>10.2f}"
+              f"{f['oos']['mdd']:>10.2f}{f['baseline_oos']['cagr']:>11.2f}{f['oos_percentile']:>9.1f}"
+              f"{f['rank_correlation']:>12.2f}")
+    print("-" * 96)
+    wf, base = report["oos"], report["baseline_oos"]
+    print(f"Stitched OOS   CAGR {wf['cagr']:7.2f}%  MDD {wf['mdd']:7.2f}%   "
+          f"(baseline params: CAGR {base['cagr']:7.2f}%  MDD {base['mdd']:7.2f}%)")
+    print(f"Walk-forward efficiency (mean OOS / IS CAGR): {report['walk_forward_efficiency']:.2f}   "
+          f"mean IS/OOS rank correlation: {report['mean_rank_correlation']:.2f}")
+
+    print("\nPARAMETER STABILITY (fold winners)")
+    print(f"{'':<22}{'mean':>9}{'std':>9}{'cv':>7}{'min':>9}{'max':>9}{'top-K std':>11}")
+    for name, s in report["stability"].items():
+        print(f"{name:<22}{s['mean']:>9.2f}{s['std']:>9.2f}{s['cv']:>7.2f}{s['min']:>9.2f}{s['max']:>9.2f}"
+              f"{s['topk_std']:>11.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Walk-forward optimization of the SOXL strategy")
+    parser.add_argument("--params", default=DEFAULT_PARAMS_FILE, help="baseline users/*.json (fixed fields + benchmark)")
+    parser.add_argument("--space", default=None, help="JSON search ranges in runDeepMind config shape")
+    parser.add_argument("--start", default=be.START_DATE)
+    parser.add_argument("--end", default=be.END_DATE)
+    parser.add_argument("--train-years", type=float, default=TRAIN_YEARS)
+    parser.add_argument("--test-years", type=float, default=TEST_YEARS)
+    parser.add_argument("--candidates", type=int, default=N_CANDIDATES)
+    parser.add_argument("--rank", default="cagr", choices=RANK_KEYS)
+    parser.add_argument("--top-k", type=int, default=TOP_K)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--out", default=None, help="optional JSON report path")
+    args = parser.parse_args()
+    if round(args.train_years * 12) < 1 or round(args.test_years * 12) < 1:
+        parser.error("--train-years and --test-years must each cover at least 1 month")
+
+    base = be.load_user_params(args.params)
+    space = SEARCH_SPACE
+    if args.space:
+        with open(args.space, "r", encoding="utf-8") as f:
+            space = json.load(f)
+
+    print(f"Walk-forward: {args.train_years:g}y train / {args.test_years:g}y test, "
+          f"{args.candidates} candidates per fold...")
+    started = time.time()
+
+    def progress(done, total):
+        print(f" [{done * 100 // total:3d}%] {done}/{total} folds")
+
+    folds = run_walk_forward(base, space, args.start, args.end, args.train_years, args.test_years,
+                             args.candidates, args.rank, args.top_k, args.workers, args.seed,
+                             on_progress=progress)
+    print(f"Completed in {time.time() - started:.1f}s")
+
+    report = build_report(folds, base, args.rank)
+    print_report(report)
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=4)
+        print(f"\nReport saved to '{args.out}'")
+
+
+if __name__ == "__main__":
+    main()